@@ -37,15 +37,20 @@ modules = [
     'scripts/weights/eVTOL_Weights_Buildup_Regression.py',
     'scripts/aerodynamics/aerodynamics.py',
     #'scripts/aerodynamics_super/aerodynamics_super.py',
+    'scripts/aerodynamics_super/compressibility_drag.py',
+    'scripts/aerodynamics_super/wave_drag_cache.py',
     #'scripts/regression/test_mission_AS2.py',
     'scripts/atmosphere/atmosphere.py',
     'scripts/atmosphere/constant_temperature.py',
     'scripts/AVL/test_AVL.py',
+    'scripts/AVL/avl_parallel.py',
     'scripts/B737/mission_B737.py',
+    'scripts/batch_mission/batch_mission.py',
     'scripts/battery/battery.py',
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',    
     'scripts/concorde/concorde.py',
+    'scripts/data_structures/data_fast_path.py',
     'scripts/DC_10_noise/DC_10_noise.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/dynamic_stability/dynamicstability.py',
@@ -59,11 +64,22 @@ modules = [
     'scripts/industrial_costs/industrial_costs.py',
     'scripts/landing_field_length/landing_field_length.py',
     'scripts/lifting_line/lifting_line.py',
+    'scripts/lifting_line/lifting_line_stations.py',
     'scripts/noise_optimization/Noise_Test.py',
+    'scripts/parallel_mission/parallel_mission.py',
     'scripts/payload_range/payload_range.py',
+    'scripts/profiler/profiler.py',
     'scripts/propeller/propeller.py',
+    'scripts/propeller/propeller_warm_start.py',
+    'scripts/propeller/propeller_map.py',
+    'scripts/engine_deck/engine_deck.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
+    'scripts/surrogates/grid_surrogate.py',
+    'scripts/surrogates/surrogate_prediction.py',
+    'scripts/surrogates/training_store.py',
     'scripts/ramjet_network/ramjet_network.py',
+    'scripts/nozzle_relations/nozzle_relations.py',
+    'scripts/component_cache/component_cache.py',
     'scripts/Regional_Jet_Optimization/Optimize2.py',
     'scripts/scramjet_network/scramjet_network.py',
     'scripts/rocket_network/Rocketdyne_F1.py',
@@ -72,12 +88,19 @@ modules = [
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
     'scripts/solar_radiation/solar_radiation.py',
+    'scripts/solver_jacobian/solver_jacobian.py',
     'scripts/SU2_surrogate/BWB-450.py',   
+    'scripts/SU2_surrogate/SU2_cases.py',
     'scripts/sweeps/test_sweeps.py',
     'scripts/take_off_field_length/take_off_field_length.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',    
+    'scripts/vortex_lattice/vortex_lattice_batch.py',
+    'scripts/vortex_lattice/vortex_lattice_surrogate.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
+    'scripts/warm_start/warm_start.py',
+    'scripts/adaptive_control_points/adaptive_control_points.py',
+    'scripts/chebyshev/chebyshev_operators.py',
     'scripts/weights/weights.py',        
 ]
 
@@ -0,0 +1,159 @@
+# avl_parallel.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the concurrent AVL runner with a stub executable that answers every case
+    with a canned result, the lift and moment coefficients of each result are its Mach
+    number
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Utilities.run_jobs import run_jobs
+
+import numpy as np
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Stub AVL
+# ----------------------------------------------------------------------
+
+stub_template = '''#!{python}
+import os, sys, time
+mode = '{mode}'
+if mode == 'slow':
+    time.sleep(30)
+if mode == 'flaky' and not os.path.exists('failed_once'):
+    open('failed_once','w').close()
+    sys.exit(1)
+lines = []
+for line in iter(sys.stdin.readline,''):
+    if line.strip() == 'QUIT':
+        break
+    lines.extend(line.split())
+mach  = None
+for line in open(lines[1]):
+    if line.strip().startswith('Mach'):
+        mach = float(line.split('=')[1])
+        break
+canned = open('{canned}').read().replace('CLtot =  -0.21173','CLtot = %9.5f' % mach)
+canned = canned.replace('Cmtot =   0.22657','Cmtot = %9.5f' % mach)
+for i, line in enumerate(lines):
+    if line == 'st':
+        open(lines[i+1],'w').write(canned)
+'''
+
+def write_stub(folder,mode):
+    canned   = os.path.join(os.path.dirname(os.path.abspath(__file__)),'avl_files','results_case_001_01.txt')
+    filename = os.path.join(folder,'avl_' + mode)
+    with open(filename,'w') as stub:
+        stub.write(stub_template.format(python=sys.executable,mode=mode,canned=canned))
+    os.chmod(filename,os.stat(filename).st_mode | stat.S_IEXEC)
+    return filename
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    folder  = tempfile.mkdtemp()
+    vehicle = vehicle_setup()
+    configs = configs_setup(vehicle)
+
+    def analysis(mode,workers):
+        avl = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+        avl.geometry = configs.cruise
+        avl.settings.filenames.avl_bin_name = write_stub(folder,mode)
+        avl.settings.filenames.run_folder   = os.path.join(folder,mode + '_%i' % workers)
+        avl.settings.filenames.log_filename = os.path.join(folder,'log.txt')
+        avl.settings.filenames.err_filename = os.path.join(folder,'err.txt')
+        avl.settings.number_of_workers      = workers
+        avl.training.angle_of_attack        = np.array([-2.,0.,2.,4.]) * Units.deg
+        avl.training.Mach                   = np.array([0.1,0.3,0.5,0.7])
+        return avl
+
+    try:
+        # the serial and concurrent runs give the same table
+        serial = analysis('ok',1)
+        serial.sample_training()
+
+        parallel = analysis('ok',3)
+        parallel.sample_training()
+
+        CL = parallel.training.coefficients[:,0]
+        print(CL)
+        assert( np.all(serial.training.coefficients == parallel.training.coefficients) )
+        assert( np.allclose(np.unique(CL), [0.1,0.3,0.5,0.7]) )
+
+        # each Mach number ran in its own folder
+        run_folder = parallel.settings.filenames.run_folder
+        assert( len([name for name in os.listdir(run_folder) if name.startswith('avl_job_')]) == 4 )
+
+        # failed runs are retried
+        flaky = analysis('flaky',2)
+        flaky.settings.job_retries = 1
+        flaky.sample_training()
+        assert( np.all(flaky.training.coefficients == parallel.training.coefficients) )
+
+        flaky = analysis('flaky',2)
+        try:
+            flaky.sample_training()
+            raise AssertionError('a failed run was not reported')
+        except RuntimeError as error:
+            assert( 'exit status 1' in str(error) )
+
+        # runs that hang are stopped
+        slow = analysis('slow',4)
+        slow.settings.job_timeout = 0.5
+        try:
+            slow.sample_training()
+            raise AssertionError('a hung run was not stopped')
+        except RuntimeError as error:
+            assert( 'timed out' in str(error) )
+
+        # a stability table with more angles of attack than Mach numbers
+        for workers in [1,3]:
+            stability = SUAVE.Analyses.Stability.AVL()
+            stability.geometry = configs.cruise
+            stability.settings.filenames.avl_bin_name = write_stub(folder,'ok')
+            stability.settings.filenames.run_folder   = os.path.join(folder,'stability_%i' % workers)
+            stability.settings.filenames.log_filename = os.path.join(folder,'log.txt')
+            stability.settings.filenames.err_filename = os.path.join(folder,'err.txt')
+            stability.settings.number_of_workers      = workers
+            stability.training.angle_of_attack        = np.array([-2.,0.,2.]) * Units.deg
+            stability.training.Mach                   = np.array([0.3,0.5])
+            stability.sample_training()
+
+            grid = stability.training.grid_points
+            assert( np.allclose(grid[:,0], np.tile([-2.,0.,2.],2) * Units.deg) )
+            assert( np.all(grid[:,1] == np.repeat([0.3,0.5],3)) )
+            assert( np.all(stability.training.coefficients[:,0] == grid[:,1]) )
+
+        # nothing to run
+        assert( run_jobs([],3) == [] )
+
+    finally:
+        shutil.rmtree(folder)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+# SU2_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the concurrent SU2 runs with a fake SU2 binary: each case runs in its own
+    folder, the processors are shared between the cases, and the forces are stored as
+    each case finishes. One case at a time runs with the same command
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Input_Output.SU2.run_SU2_cases import SU2_partition
+
+import numpy as np
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+
+# ----------------------------------------------------------------------
+#   Fake SU2
+# ----------------------------------------------------------------------
+
+# CL = 0.1*AoA + Mach and CD = 0.01*Mach, from the cfg, after a pause so cases overlap
+fake_SU2 = '''#!{python}
+import os, sys, time
+settings = {{}}
+for line in open(sys.argv[-1]):
+    if '=' in line:
+        name, value = line.split('=',1)
+        settings[name.strip()] = value.strip()
+mach = float(settings['MACH_NUMBER'])
+AoA  = float(settings['AOA'])
+if mach == {fail_mach}:
+    sys.exit(2)
+running = os.path.join('{folder}','running')
+marker  = os.path.join(running,str(os.getpid()))
+open(marker,'w').close()
+time.sleep(0.3)
+with open(os.path.join('{folder}','overlap.txt'),'a') as overlap:
+    overlap.write('%i\\n' % len(os.listdir(running)))
+os.remove(marker)
+assert os.path.exists(settings['MESH_FILENAME'])
+with open(settings['CONV_FILENAME'] + '.dat','w') as history:
+    history.write('"Iteration","CL","CD"\\n')
+    history.write('0, 0.0, 0.0\\n')
+    history.write('100, %.8f, %.8f\\n' % (0.1*AoA + mach, 0.01*mach))
+'''
+
+# records the process count and starts the case
+fake_mpirun = '''#!{python}
+import sys, subprocess
+with open('{folder}/mpirun.txt','a') as log:
+    log.write(sys.argv[2] + '\\n')
+sys.exit(subprocess.call(sys.argv[3:]))
+'''
+
+def write_script(filename,template,**values):
+    with open(filename,'w') as script:
+        script.write(template.format(python=sys.executable,**values))
+    os.chmod(filename,os.stat(filename).st_mode | stat.S_IEXEC)
+    return filename
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the processors are shared between the cases
+    settings = Data(concurrent_cases=4,processors=2,parallel=False)
+    assert( SU2_partition(settings) == (2,1) )
+    settings = Data(concurrent_cases=3,processors=8,parallel=True)
+    assert( SU2_partition(settings) == (3,2) )
+    settings = Data(concurrent_cases=1,processors=1,parallel=True)
+    assert( SU2_partition(settings) == (1,1) )
+
+    folder = tempfile.mkdtemp()
+    origin = os.getcwd()
+
+    try:
+        os.chdir(folder)
+        os.makedirs('running')
+        with open('cases_test.su2','w') as mesh:
+            mesh.write('NDIME= 3\n')
+
+        def analysis(concurrent_cases,processors,parallel=False,fail_mach=-1.):
+            su2 = SUAVE.Analyses.Aerodynamics.SU2_inviscid()
+            su2.geometry.tag                = 'cases_test'
+            su2.geometry.reference_area     = 100.
+            su2.settings.concurrent_cases   = concurrent_cases
+            su2.settings.processors         = processors
+            su2.settings.parallel           = parallel
+            su2.settings.SU2_binary         = write_script(os.path.join(folder,'SU2_CFD'),fake_SU2,folder=folder,fail_mach=fail_mach)
+            su2.settings.mpi_command        = [write_script(os.path.join(folder,'mpirun'),fake_mpirun,folder=folder),'-np']
+            su2.settings.run_folder         = os.path.join(folder,'cases_%i_%i' % (concurrent_cases,processors))
+            su2.training.angle_of_attack    = np.array([-2.,3.,8.]) * Units.deg
+            su2.training.Mach               = np.array([0.3,0.7,0.85])
+            return su2
+
+        # three cases at a time, each in its own folder
+        su2 = analysis(3,3)
+        su2.sample_training()
+        xy = su2.training.grid_points
+        CL = su2.training.coefficients[:,0]
+        CD = su2.training.coefficients[:,1]
+        assert( np.allclose(CL, 0.1*xy[:,0]/Units.deg + xy[:,1]) )
+        assert( np.allclose(CD, 0.01*xy[:,1]) )
+        assert( len(os.listdir(su2.settings.run_folder)) == 9 )
+
+        overlap = np.loadtxt('overlap.txt')
+        print('cases at once:', overlap.max())
+        assert( overlap.max() <= 3 )
+
+        # with MPI the processors are split between the cases
+        mpi = analysis(2,4,True)
+        mpi.sample_training()
+        assert( np.all(mpi.training.coefficients == su2.training.coefficients) )
+        assert( np.all(np.loadtxt('mpirun.txt') == 2) )
+        assert( len(np.loadtxt('mpirun.txt')) == 9 )
+
+        # one case at a time runs with the same binary and MPI command
+        serial = analysis(1,4,True)
+        serial.sample_training()
+        assert( np.all(serial.training.coefficients == su2.training.coefficients) )
+        assert( np.all(np.loadtxt('mpirun.txt')[9:] == 4) )
+        assert( len(np.loadtxt('mpirun.txt')) == 18 )
+
+        # results are stored as each case finishes, so a failed case loses only itself
+        failing = analysis(2,2,fail_mach=0.85)
+        failing.settings.training_cache_directory = os.path.join(folder,'store')
+        try:
+            failing.sample_training()
+            raise AssertionError('a failed case was not reported')
+        except RuntimeError as error:
+            assert( 'exit status 2' in str(error) )
+
+        rerun = analysis(2,2)
+        rerun.settings.training_cache_directory = failing.settings.training_cache_directory
+        rerun.settings.run_folder = os.path.join(folder,'rerun')
+        rerun.sample_training()
+        assert( len(os.listdir(rerun.settings.run_folder)) < 9 )
+        assert( np.allclose(rerun.training.coefficients, su2.training.coefficients) )
+
+    finally:
+        os.chdir(origin)
+        shutil.rmtree(folder)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# adaptive_control_points.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" solves the B737 mission with the number of control points of each segment chosen
+    by its truncation error and checks it against the fixed 16 point solution
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, chebyshev_interpolate
+
+import numpy as np
+import copy
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    # interpolation between control points
+    x_5  = chebyshev_data(5)[0]
+    x_17 = chebyshev_data(17)[0]
+    f    = np.vstack([np.sin(3.*x_17),np.exp(x_17)]).T
+    back = chebyshev_interpolate(chebyshev_interpolate(f,33),17)
+    assert( np.max(np.abs(back - f)) < 1e-12 )
+    cubic = chebyshev_interpolate(x_5**3,17)
+    assert( np.max(np.abs(cubic - x_17**3)) < 1e-12 )
+    
+    configs, analyses = mission_B737.full_setup()
+    
+    mission_B737.simple_sizing(configs, analyses)
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    mission  = analyses.missions.base
+    adaptive = copy.deepcopy(mission)
+    
+    # fixed number of points
+    fixed_results = mission.evaluate()
+    
+    # adaptive number of points
+    tolerance = 1e-3
+    for segment in adaptive.segments.values():
+        segment.state.numerics.adaptive.enabled   = True
+        segment.state.numerics.adaptive.tolerance = tolerance
+    adaptive_results = adaptive.evaluate()
+    
+    points = np.array([segment.state.numerics.number_control_points for segment in adaptive_results.segments.values()])
+    errors = np.array([segment.state.numerics.adaptive.truncation_error for segment in adaptive_results.segments.values()])
+    print('control points   :', points)
+    print('truncation error :', errors)
+    
+    fixed_evaluations    = sum([segment.state.numerics.residual_evaluations for segment in fixed_results.segments.values()])
+    adaptive_evaluations = sum([segment.state.numerics.residual_evaluations for segment in adaptive_results.segments.values()])
+    print('fixed evaluations    :', fixed_evaluations)
+    print('adaptive evaluations :', adaptive_evaluations)
+    
+    fixed_mass    = fixed_results.segments[-1].conditions.weights.total_mass[-1,0]
+    adaptive_mass = adaptive_results.segments[-1].conditions.weights.total_mass[-1,0]
+    error = np.abs(adaptive_mass - fixed_mass)/fixed_mass
+    print('landing mass error :', error)
+    
+    # only the segments that need them get more points
+    assert( np.all(errors <= tolerance) )
+    assert( np.min(points) == 5 )
+    assert( np.max(points) <= 16 )
+    assert( np.all([segment.state.numerics.converged for segment in adaptive_results.segments.values()]) )
+    assert( error < 1e-5 )
+    assert( adaptive_evaluations < fixed_evaluations )
+    
+    # the states follow the refined points
+    for segment in adaptive_results.segments.values():
+        N = segment.state.numerics.number_control_points
+        assert( segment.conditions.frames.inertial.time.shape[0] == N )
+    
+    return
+
+# ----------------------------------------------------------------------        
+#   Call Main
+# ----------------------------------------------------------------------    
+
+if __name__ == '__main__':
+    main()
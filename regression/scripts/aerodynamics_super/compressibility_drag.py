@@ -0,0 +1,99 @@
+# compressibility_drag.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the Supersonic_Zero compressibility drag across the Mach regimes and the
+    cached wave drag at Mach 1.05
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.compressibility_drag_total import \
+     wave_drag_anchors, clear_wave_drag_anchors
+
+import numpy as np
+import sys
+sys.path.append('../Vehicles')
+
+from Concorde import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Supersonic_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+
+    # points on both sides of the ends of the transonic interpolation
+    eps  = 1e-9
+    mach = np.array([0.5,0.99-eps,0.99,0.99+eps,1.02,1.05-eps,1.05,1.05+eps,2.02])[:,None]
+    state = evaluate(aerodynamics,mach)
+    drag  = state.conditions.aerodynamics.drag_breakdown.compressible
+    wing  = drag.main_wing
+
+    # the Mach numbers are left as they were
+    assert( np.all(state.conditions.freestream.mach_number == mach) )
+
+    # continuous where the regimes meet, below Mach 0.99 the drag isn't split into wave drags
+    for total in [drag.total,wing.compressibility_drag,wing.volume_wave_drag,wing.lift_wave_drag]:
+        print(total[:,0])
+        assert( np.allclose(total[5:8], total[6], rtol=1e-6, atol=1e-10) )
+    for total in [drag.total,wing.compressibility_drag,wing.lift_wave_drag]:
+        assert( np.allclose(total[1:4], total[2], rtol=1e-6, atol=1e-10) )
+    assert( wing.lift_wave_drag[0] == 0. and wing.lift_wave_drag[-1] > 0. )
+
+    # all subsonic, all supersonic and all transonic rows give the same values as mixed ones
+    for rows in [[0,1,2],[6,7,8],[3,4,5]]:
+        part = evaluate(aerodynamics,mach[rows]).conditions.aerodynamics.drag_breakdown.compressible
+        assert( np.allclose(part.total, drag.total[rows], rtol=1e-12, atol=0.) )
+
+    # the wave drag at Mach 1.05 follows the geometry
+    main_wing = vehicle.wings.main_wing
+    anchors   = wave_drag_anchors(aerodynamics.settings,main_wing,vehicle.reference_area)
+    main_wing.total_length = main_wing.total_length*1.1
+    longer    = evaluate(aerodynamics,mach)
+    assert( wave_drag_anchors(aerodynamics.settings,main_wing,vehicle.reference_area) != anchors )
+    assert( np.all(longer.conditions.aerodynamics.drag_breakdown.compressible.total[6:] !=
+                   drag.total[6:]) )
+
+    # and is the same when it is recomputed
+    clear_wave_drag_anchors()
+    recomputed = evaluate(aerodynamics,mach)
+    assert( np.all(recomputed.conditions.aerodynamics.drag_breakdown.compressible.total ==
+                   longer.conditions.aerodynamics.drag_breakdown.compressible.total) )
+
+    return
+
+def evaluate(aerodynamics,mach):
+
+    n = len(mach)
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    conditions = state.conditions
+    conditions.freestream.mach_number       = mach
+    conditions.freestream.density           = np.ones((n,1))*0.4
+    conditions.freestream.dynamic_viscosity = np.ones((n,1))*1.4e-5
+    conditions.freestream.temperature       = np.ones((n,1))*217.
+    conditions.freestream.pressure          = np.ones((n,1))*2.e4
+    conditions.aerodynamics.angle_of_attack = np.ones((n,1))*0.05
+
+    aerodynamics.evaluate(state)
+
+    return state
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# wave_drag_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the in-memory OpenVSP volume wave drag with a stand-in vsp module: the model
+    is read once, missing Mach numbers are computed together, close stations are
+    interpolated and the table written to disk is read back
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.OpenVSP_Wave_Drag import wave_drag_volume, wave_drag_cache, \
+     clear_wave_drag_cache
+
+import numpy as np
+
+import os
+import sys
+import types
+import shutil
+import tempfile
+
+# ----------------------------------------------------------------------
+#   Stand-in vsp
+# ----------------------------------------------------------------------
+
+def stub_vsp():
+
+    vsp = types.ModuleType('vsp')
+    vsp.calls = Data(read=0,execute=0)
+    vsp.mach  = [None]
+
+    def ReadVSPFile(filename):
+        assert( os.path.exists(filename) )
+        vsp.calls.read += 1
+
+    def SetDoubleAnalysisInput(analysis,name,values):
+        vsp.mach[0] = values[0]
+
+    def ExecAnalysis(analysis):
+        vsp.calls.execute += 1
+        return vsp.mach[0]
+
+    def GetDoubleResults(result,name):
+        return [exact(result)*50./100.]
+
+    vsp.ClearVSPModel          = lambda : None
+    vsp.ReadVSPFile            = ReadVSPFile
+    vsp.SetIntAnalysisInput    = lambda analysis,name,values : None
+    vsp.SetDoubleAnalysisInput = SetDoubleAnalysisInput
+    vsp.ExecAnalysis           = ExecAnalysis
+    vsp.GetDoubleResults       = GetDoubleResults
+
+    return vsp
+
+def exact(mach):
+    return 0.002/np.sqrt(mach**2 - 0.9)
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vsp    = stub_vsp()
+    folder = tempfile.mkdtemp()
+    origin = os.getcwd()
+    sys.modules['vsp'] = vsp
+
+    try:
+        os.chdir(folder)
+        open('stub_jet.vsp3','w').close()
+        geometry = Data(tag='stub_jet',reference_area=50.)
+
+        # the model is read once and each Mach number above 1.05 is computed once
+        mach = np.array([[0.8],[1.05],[1.2],[1.2],[1.5]])
+        cd_w = wave_drag_volume(conditions(mach),geometry,False,mach_tolerance=0.01)
+        assert( cd_w[0,0] == 0. )
+        assert( np.allclose(cd_w[1:,0], exact(mach[1:,0]), rtol=1e-14) )
+        assert( vsp.calls.read == 1 and vsp.calls.execute == 3 )
+
+        cd_w = wave_drag_volume(conditions(mach),geometry,False,mach_tolerance=0.01)
+        assert( vsp.calls.read == 1 and vsp.calls.execute == 3 )
+        assert( wave_drag_volume(conditions(mach),geometry,True) == cd_w[1,0] )
+
+        # between close stations the values are interpolated
+        wave_drag_volume(conditions(np.array([[1.21]])),geometry,False,mach_tolerance=0.01)
+        assert( vsp.calls.execute == 4 )
+        between = wave_drag_volume(conditions(np.array([[1.205]])),geometry,False,mach_tolerance=0.01)
+        assert( vsp.calls.execute == 4 )
+        assert( np.isclose(between[0,0], exact(1.205), rtol=1e-3) )
+
+        # but not further apart than the tolerance
+        between = wave_drag_volume(conditions(np.array([[1.3]])),geometry,False,mach_tolerance=0.01)
+        assert( vsp.calls.execute == 5 )
+        assert( between[0,0] == exact(1.3) )
+
+        # the table is written in the background and read by a new cache
+        cache = wave_drag_cache(geometry)
+        cache.flush(wait=True)
+        table = np.load('volume_drag_data_stub_jet.npy')
+        assert( np.all(table[:,0] == [1.05,1.2,1.21,1.3,1.5]) )
+
+        clear_wave_drag_cache()
+        cd_w = wave_drag_volume(conditions(mach),geometry,False)
+        assert( np.allclose(cd_w[1:,0], exact(mach[1:,0]), rtol=1e-14) )
+        assert( vsp.calls.read == 1 and vsp.calls.execute == 5 )
+
+    finally:
+        clear_wave_drag_cache()
+        del sys.modules['vsp']
+        os.chdir(origin)
+        shutil.rmtree(folder)
+
+    return
+
+def conditions(mach):
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.freestream.mach_number = mach
+
+    return conditions
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
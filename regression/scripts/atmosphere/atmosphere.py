@@ -2,6 +2,7 @@
 # 
 # Created:  Mike Colonno, Dec 2013
 # Modified: Trent Lukaczyk, Jun 2014
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -86,6 +87,26 @@ def main():
     assert( T_err   < 1e-5 )
     assert( rho_err < 1e-5 )
     assert( a_err   < 1e-5 )    
+    
+    # ------------------------------------------------------------------
+    #   Lookup Table and Single Points
+    # ------------------------------------------------------------------    
+    
+    # one point at a time gives the same values
+    single = np.array([atm.compute_values(zi).temperature[0,0] for zi in z[::10]])
+    assert( np.all(single == T[::10,0]) )
+    
+    # the interpolated table is close to the layer equations
+    table = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    table.use_lookup_table = True
+    conditions = table.compute_values(z,10.)
+    exact      = atm.compute_values(z,10.)
+    p_table_err = np.max( np.abs(conditions.pressure    - exact.pressure)/exact.pressure )
+    T_table_err = np.max( np.abs(conditions.temperature - exact.temperature) )
+    print('Max Table Pressure Difference    = %.4e' % p_table_err)
+    print('Max Table Temperature Difference = %.4e' % T_table_err)
+    assert( p_table_err < 1e-4 )
+    assert( T_table_err < 1e-2 )
  
     return
 
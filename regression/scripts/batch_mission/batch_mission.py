@@ -0,0 +1,88 @@
+# batch_mission.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" solves several variants of the B737 mission as a batch and checks them
+    against solving each mission on its own
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    configs, analyses = mission_B737.full_setup()
+    
+    mission_B737.simple_sizing(configs, analyses)
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    mission = analyses.missions.base
+    
+    # the variants: cruise distance and takeoff weight
+    distances = np.array([2500., 3000., 3500.]) * Units.km
+    takeoffs  = np.array([72000., 76000., 79015.8]) * Units.kg
+    
+    batch = SUAVE.Analyses.Mission.Batch()
+    batch.mission = mission
+    
+    for distance,takeoff in zip(distances,takeoffs):
+        variant = Data()
+        variant['segments.cruise.distance'] = distance
+        variant['segments.climb_1.analyses.weights.vehicle.mass_properties.takeoff'] = takeoff
+        batch.append_variant(variant)
+    
+    batch_results = batch.evaluate()
+    
+    # the base mission is left as it was
+    assert( mission.segments.cruise.distance == (3933.65 + 770 - 92.6) * Units.km )
+    
+    # solve each variant on its own
+    weights = mission.segments.climb_1.analyses.weights
+    for i,(distance,takeoff) in enumerate(zip(distances,takeoffs)):
+        
+        mission.segments.cruise.distance = distance
+        weights.vehicle.mass_properties.takeoff = takeoff
+        results = mission.evaluate()
+        
+        batch_result = batch_results['variant_%i' % i]
+        
+        for tag,segment in results.segments.items():
+            batch_segment = batch_result.segments[tag]
+            
+            assert( batch_segment.state.numerics.converged )
+            
+            mass       = segment.conditions.weights.total_mass[:,0]
+            batch_mass = batch_segment.conditions.weights.total_mass[:,0]
+            error_mass = np.max(np.abs((mass - batch_mass)/mass))
+            
+            time       = segment.conditions.frames.inertial.time[:,0]
+            batch_time = batch_segment.conditions.frames.inertial.time[:,0]
+            error_time = np.max(np.abs(time - batch_time))
+            
+            print(i, tag, error_mass, error_time)
+            assert( error_mass < 1e-6 )
+            assert( error_time < 1e-3 )
+    
+    return
+    
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# chebyshev_operators.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" checks that the discretization operators are built once for each number of points
+    and that the time operators are only scaled again when the duration changes
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, linear_data, cached_operators, clear_operator_cache
+from SUAVE.Methods.Missions.Segments.Common.Numerics import initialize_differentials_dimensionless, update_differentials_time
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    clear_operator_cache()
+    
+    # the same operators are returned, and they can't be changed
+    x,D,I = chebyshev_data(16)
+    assert( chebyshev_data(16)[1] is D )
+    assert( chebyshev_data(8)[1].shape == (8,8) )
+    assert( not D.flags.writeable and not I.flags.writeable )
+    
+    # they match a fresh build
+    x_0,D_0,I_0 = chebyshev_data.__wrapped__(16)
+    assert( np.all(D == D_0) and np.all(I == I_0) )
+    assert( chebyshev_data(16,integration=False)[2] is None )
+    assert( linear_data(16)[1] is not D )
+    
+    # other discretizations are cached when a segment uses them
+    calls = []
+    def uniform_data(N,integration=True,**options):
+        calls.append(N)
+        return linear_data.__wrapped__(N,integration)
+    
+    segment = SUAVE.Analyses.Mission.Segments.Aerodynamic()
+    segment.state.numerics.number_control_points = 6
+    segment.state.numerics.discretization_method = uniform_data
+    initialize_differentials_dimensionless(segment)
+    initialize_differentials_dimensionless(segment)
+    assert( calls == [6] )
+    
+    # the time operators follow the duration
+    segment.state.conditions.frames.inertial.time = np.linspace(0.,100.,6)[:,None]
+    update_differentials_time(segment)
+    D_t = segment.state.numerics.time.differentiate
+    update_differentials_time(segment)
+    assert( segment.state.numerics.time.differentiate is D_t )
+    
+    segment.state.conditions.frames.inertial.time = np.linspace(0.,50.,6)[:,None]
+    update_differentials_time(segment)
+    D_0 = segment.state.numerics.dimensionless.differentiate
+    assert( np.allclose(segment.state.numerics.time.differentiate, D_0/50.) )
+    assert( np.allclose(segment.state.numerics.time.control_points[-1], 50.) )
+    
+    return
+
+# ----------------------------------------------------------------------        
+#   Call Main
+# ----------------------------------------------------------------------    
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# component_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that gas turbine networks give the same results with a component cache as
+    without one, that only the thrust is computed again when only the throttle changes,
+    and that a change to the flight conditions, the working fluid or a component runs
+    the cycle again
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Propulsion import engine_state
+from SUAVE.Components.Energy import Component_Cache
+
+import numpy as np
+import copy
+import sys
+import time
+
+sys.path.append('../Vehicles')
+sys.path.append('../ramjet_network')
+
+import Boeing_737
+import Concorde
+import ramjet_network
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n        = 16
+    turbofan = Boeing_737.vehicle_setup().propulsors.turbofan
+    turbojet = Concorde.vehicle_setup().propulsors.turbojet
+    ramjet   = ramjet_network.energy_network()
+
+    for network, altitude, mach in [(turbofan,np.linspace(0.,10000.,n),np.linspace(0.3,0.8,n)),
+                                    (turbojet,np.linspace(0.,15000.,n),np.linspace(0.3,2.0,n)),
+                                    (ramjet  ,np.linspace(8000.,12000.,n),np.linspace(1.5,3.0,n))]:
+        check_network(network,altitude,mach)
+
+    # the time of many evaluations where only the throttle changes, the best of a few tries
+    for n in [16,2000]:
+        state     = engine_state(turbofan,np.linspace(0.,10000.,n),np.linspace(0.3,0.8,n),0.5)
+        reference = copy.deepcopy(turbofan)
+        cached    = copy.deepcopy(turbofan)
+        cached.component_cache = Component_Cache()
+        times     = [np.inf,np.inf]
+        for attempt in range(5):
+            for j, network in enumerate([reference,cached]):
+                start = time.time()
+                for i in range(50):
+                    state.conditions.propulsion.throttle[:] = 0.5 + 0.01*i
+                    network(state)
+                times[j] = min(times[j],time.time() - start)
+        print(n, 'points, without the cache:', times[0], 's, with it:', times[1], 's, speedup:', times[0]/times[1])
+
+    return
+
+def check_network(network,altitude,mach):
+
+    reference  = copy.deepcopy(network)
+    cached     = copy.deepcopy(network)
+    cache      = Component_Cache()
+    cached.component_cache = cache
+    state      = engine_state(network,altitude,mach,0.5)
+    conditions = state.conditions
+
+    # the same results, with the throttle changed in place
+    for throttle in [0.5,0.6,0.8,1.0,0.7]:
+        conditions.propulsion.throttle[:] = throttle
+        check_results(reference(state),cached(state))
+    if hasattr(network,'engine_out'):
+        check_results(reference.engine_out(state),cached.engine_out(state))
+
+    # only the thrust, which isn't cached, was computed after the first evaluation
+    assert( network.thrust.tag not in cache.stats )
+    for tag, stats in cache.stats.items():
+        print(network.tag, tag, stats.hits, stats.misses)
+        assert( stats.misses == 1 )
+
+    # the cycle again for other flight conditions
+    cache.reset()
+    cached(state)
+    conditions.freestream.temperature[0] += 5.
+    check_results(reference(state),cached(state))
+    assert( max(cache.hit_rates().values()) == 0. )
+
+    # or for another working fluid
+    cache.reset()
+    cached(state)
+    for engine in [reference,cached]:
+        engine.working_fluid = copy.deepcopy(engine.working_fluid)
+    check_results(reference(state),cached(state))
+    assert( max(cache.hit_rates().values()) == 0. )
+
+    # and from the component changed onwards for another component
+    cache.reset()
+    cached(state)
+    for engine in [reference,cached]:
+        engine.core_nozzle.pressure_ratio *= 0.99
+    check_results(reference(state),cached(state))
+    rates = cache.hit_rates()
+    assert( rates[network.core_nozzle.tag] == 0. )
+    assert( rates[network.ram.tag] == 0.5 )
+
+    return
+
+def check_results(reference,cached):
+
+    assert( np.all(reference.thrust_force_vector == cached.thrust_force_vector) )
+    assert( np.all(reference.vehicle_mass_rate == cached.vehicle_mass_rate) )
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
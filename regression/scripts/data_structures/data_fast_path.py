@@ -0,0 +1,201 @@
+# data_fast_path.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks attribute access and vector packing of Data(), and prints their speedup
+    over the plain implementations
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, DataOrdered
+from SUAVE.Analyses.Mission.Segments.Conditions import Unknowns, Residuals
+
+import numpy as np
+import time
+
+dictgetitem  = dict.__getitem__
+objgetattrib = object.__getattribute__
+
+# ----------------------------------------------------------------------
+#   Reference Data
+# ----------------------------------------------------------------------
+
+class Reference_Data(Data):
+    """ attribute access that tries the object after a failed key lookup """
+
+    def __getattribute__(self, k):
+        try:
+            return dictgetitem(self,k)
+        except:
+            return objgetattrib(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            objgetattrib(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+def reference_pack(D,M):
+    """ walks the tree on every call """
+    for v in D.values():
+        if isinstance(v,dict):
+            reference_pack(v,M)
+        elif isinstance(v,float):
+            M.append(np.array([v]))
+        elif isinstance(v,np.ndarray):
+            M.append(v.ravel(order='F'))
+    return M
+
+def reference_unpack(D,M,index=0):
+    """ walks the tree on every call """
+    for k,v in D.items():
+        if isinstance(v,dict):
+            index = reference_unpack(v,M,index)
+        elif isinstance(v,float):
+            D[k] = M[index]
+            index += 1
+        elif isinstance(v,np.ndarray) and np.ndim(v) == 1:
+            v[:] = M[index:index+len(v)]
+            index += len(v)
+        elif isinstance(v,np.ndarray) and np.ndim(v) == 2:
+            n,m = v.shape
+            v[:,:] = np.reshape(M[index:index+n*m],[n,m],order='F')
+            index += n*m
+    return index
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_behavior()
+    check_packing()
+
+    attribute_speedup = time_attributes()
+    packing_speedup   = time_packing()
+
+    print('attribute access speedup : %.2f' % attribute_speedup)
+    print('pack/unpack speedup      : %.2f' % packing_speedup)
+
+    return
+
+def check_behavior():
+    """ keys, methods and attributes are resolved as before """
+
+    d = Data()
+    d.x = 1.
+    d['y'] = 2.
+    assert d.x == 1. and d.y == 2.
+    assert 'x' in d.keys()
+
+    # methods are not shadowed by setting them
+    d.x = 3.
+    assert dict.__getitem__(d,'x') == 3.
+    assert d.keys is not None
+
+    # missing keys raise AttributeError
+    try:
+        d.z
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('missing key did not raise')
+
+    del d.x
+    assert not 'x' in d.keys()
+
+    # ordered data keeps insertion order
+    o = DataOrdered()
+    o.b = 1.
+    o.a = 2.
+    o.b = 3.
+    assert list(o.keys())[-2:] == ['b','a']
+    assert o.b == 3.
+
+    return
+
+def check_packing():
+    """ the cached layout gives the same vectors as walking the tree """
+
+    u = build_unknowns()
+    M = u.pack_array()
+    R = np.hstack(reference_pack(u,[]))
+    assert np.all(M == R)
+
+    # unpacking updates the arrays in place
+    throttle = u.throttle
+    u.unpack_array(M*2.)
+    assert u.throttle is throttle
+    assert np.all(u.pack_array() == 2.*R)
+
+    # the layout follows changes of the structure
+    u.body_angle = np.ones([4,1])
+    u.extra      = Data()
+    u.extra.a    = np.zeros([4,2])
+    M = u.pack_array()
+    assert len(M) == 16 + 4 + 1 + 48 + 8
+    assert np.all(M == np.hstack(reference_pack(u,[])))
+
+    # scalars, the array output and partial vectors still work
+    u.unpack_array(np.arange(len(M))*1.)
+    assert u.scalar == 20.
+    A = u.pack_array('array')
+    assert A.shape[0] == 16
+
+    return
+
+def build_unknowns():
+    u = Unknowns()
+    u.throttle   = np.linspace(0.5,0.9,16)[:,None]
+    u.body_angle = np.linspace(0.01,0.05,16)[:,None]
+    u.scalar     = 5.
+    u.velocity   = np.ones([16,3])
+    return u
+
+def time_attributes(n=200000):
+    """ reading keys and methods and setting keys """
+
+    timings = []
+    for klass in [Reference_Data,Data]:
+        d = klass()
+        d.mach_number = np.zeros([16,1])
+        d.tag         = 'segment'
+        t0 = time.time()
+        for i in range(n):
+            d.mach_number
+            d.keys
+            d.mach_number = d.mach_number
+        timings.append(time.time()-t0)
+
+    return timings[0]/timings[1]
+
+def time_packing(n=20000):
+    """ packing and unpacking the unknowns of a segment """
+
+    u = build_unknowns()
+    M = u.pack_array()
+
+    t0 = time.time()
+    for i in range(n):
+        np.hstack(reference_pack(u,[]))
+        reference_unpack(u,M)
+    t_reference = time.time()-t0
+
+    t0 = time.time()
+    for i in range(n):
+        u.pack_array()
+        u.unpack_array(M)
+    t_layout = time.time()-t0
+
+    return t_reference/t_layout
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+# engine_deck.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" builds engine decks of a turbofan and a supersonic turbojet and checks that the
+    runtime deck is exact at the nodes, close to the network between them and linear
+    in throttle beyond them, and reads back from the file it is saved to
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Propulsion import build_engine_deck, engine_state, save_engine_deck
+from SUAVE.Components.Energy.Networks import Engine_Deck
+
+import numpy as np
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.append('../Vehicles')
+
+import Boeing_737
+import Concorde
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    turbofan = Boeing_737.vehicle_setup().propulsors.turbofan
+
+    altitude  = np.array([0.,2.,4.,6.,8.,10.,11.,12.]) * Units.km # a node at the tropopause
+    mach      = np.linspace(0.2,0.85,6)
+    throttle  = np.linspace(0.2,1.,5)
+    delta_isa = np.array([-10.,0.,15.])
+
+    start = time.time()
+    deck  = build_engine_deck(turbofan,altitude,mach,throttle,delta_isa)
+    print('deck of', deck.thrust.size, 'points built in', time.time() - start, 's')
+    assert( sorted(deck.exhaust.keys()) == ['core','fan'] )
+
+    engine = Engine_Deck()
+    engine.deck = deck
+
+    # exact at the nodes
+    nodes   = [node.ravel() for node in np.meshgrid(altitude,mach,throttle,delta_isa,indexing='ij')]
+    network = turbofan.evaluate_thrust(engine_state(turbofan,*nodes))
+    state   = engine_state(turbofan,*nodes)
+    results = engine.evaluate_thrust(state)
+    assert( np.allclose(results.thrust_force_vector, network.thrust_force_vector, rtol=1e-10, atol=0.) )
+    assert( np.allclose(results.vehicle_mass_rate, network.vehicle_mass_rate, rtol=1e-10, atol=0.) )
+    assert( np.allclose(state.conditions.propulsion.acoustic_outputs.fan.exit_velocity,
+                        deck.exhaust.fan.exit_velocity.reshape(-1,1), rtol=1e-10, atol=0.) )
+
+    # and close to the network between them
+    rng   = np.random.RandomState(0)
+    n     = 16
+    point = [rng.uniform(0.,12000.,n),rng.uniform(0.2,0.85,n),rng.uniform(0.2,1.,n),rng.uniform(-10.,15.,n)]
+    network_state = engine_state(turbofan,*point)
+    state         = engine_state(turbofan,*point)
+    network       = turbofan.evaluate_thrust(network_state)
+    results       = engine.evaluate_thrust(state)
+    error_F       = np.max(np.abs(results.thrust_force_vector[:,0]/network.thrust_force_vector[:,0] - 1.))
+    error_mdot    = np.max(np.abs(results.vehicle_mass_rate/network.vehicle_mass_rate - 1.))
+    print('largest errors between the nodes, thrust:', error_F, 'fuel flow:', error_mdot)
+    assert( error_F < 0.01 and error_mdot < 0.02 )
+
+    # time of a segment evaluation
+    start = time.time()
+    for i in range(100):
+        turbofan.evaluate_thrust(network_state)
+    network_time = time.time() - start
+    start = time.time()
+    for i in range(100):
+        engine.evaluate_thrust(state)
+    deck_time = time.time() - start
+    print('16 points, network:', network_time/100., 's, deck:', deck_time/100., 's')
+
+    # the deck is read back from its file
+    folder = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(folder,'turbofan_deck.npz')
+        save_engine_deck(deck,filename)
+        stored = Engine_Deck()
+        stored.input_file = filename
+        stored.build_surrogate()
+        assert( stored.number_of_engines == turbofan.number_of_engines )
+        again = stored.evaluate_thrust(engine_state(turbofan,*point))
+        assert( np.all(again.thrust_force_vector == results.thrust_force_vector) )
+        assert( np.all(again.vehicle_mass_rate == results.vehicle_mass_rate) )
+    finally:
+        shutil.rmtree(folder)
+
+    # one engine out is full throttle on the others
+    out  = engine.engine_out(state)
+    full = engine.evaluate_thrust(engine_state(turbofan,point[0],point[1],1.,point[3]))
+    assert( np.allclose(out.thrust_force_vector, full.thrust_force_vector/2., rtol=1e-12, atol=0.) )
+    assert( np.all(state.conditions.propulsion.throttle[:,0] == point[2]) )
+
+    # linear in throttle beyond the deck, like the network it replaces
+    for beyond in [np.array([1.,1.1,1.2]),np.array([0.2,0.15,0.1])]:
+        state   = engine_state(turbofan,5000.,0.6,beyond)
+        results = engine.evaluate_thrust(state)
+        network = turbofan.evaluate_thrust(engine_state(turbofan,5000.,0.6,beyond))
+        F       = results.thrust_force_vector[:,0]
+        print('thrust beyond the throttle range of the deck:', F, 'network:', network.thrust_force_vector[:,0])
+        assert( np.all(np.diff(F)*np.diff(beyond) > 0.) )
+        assert( np.allclose(F[2]-F[1], F[1]-F[0], rtol=1e-10, atol=0.) )
+        assert( np.allclose(F, network.thrust_force_vector[:,0], rtol=0.01, atol=0.) )
+        assert( np.all(state.conditions.propulsion.throttle[:,0] == beyond) )
+
+    # a supersonic turbojet takes its exhaust from the core nozzle
+    turbojet = Concorde.vehicle_setup().propulsors.turbojet
+    mach     = np.linspace(0.3,2.0,18)
+    altitude = np.array([0.,3.,6.,9.,11.,14.,18.]) * Units.km
+    deck     = build_engine_deck(turbojet,altitude,mach,throttle)
+    assert( list(deck.exhaust.keys()) == ['core'] )
+
+    engine = Engine_Deck()
+    engine.deck = deck
+    point   = [rng.uniform(0.,18000.,n),rng.uniform(0.3,2.0,n),rng.uniform(0.2,1.,n)]
+    network = turbojet.evaluate_thrust(engine_state(turbojet,*point))
+    results = engine.evaluate_thrust(engine_state(turbojet,*point))
+    error_F = np.max(np.abs(results.thrust_force_vector[:,0]/network.thrust_force_vector[:,0] - 1.))
+    print('largest error between the nodes of the turbojet deck:', error_F)
+    assert( error_F < 0.02 )
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# lifting_line_stations.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the lifting line solves all angles of attack with one factored matrix
+    per wing, that the matrix follows the geometry, and that segmented wings match
+    the equivalent tapered wing
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Aerodynamics.Lifting_Line import lifting_line, lifting_line_stations, \
+     clear_lifting_line_stations
+
+import numpy as np
+import sys
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    wing     = vehicle.wings.main_wing
+    settings = Data(number_of_stations=50)
+    alpha    = np.linspace(-10.,10.,7)[:,None] * Units.deg
+
+    # all the angles at once match one angle at a time
+    CL, CD = lifting_line(conditions(alpha),settings,wing)
+    for i in range(len(alpha)):
+        CL_i, CD_i = lifting_line(conditions(alpha[i]),settings,wing)
+        assert( np.allclose(CL_i, CL[i], rtol=1e-13, atol=1e-15) )
+        assert( np.allclose(CD_i, CD[i], rtol=1e-13, atol=1e-15) )
+    assert( np.all(np.diff(CL) > 0.) )
+
+    # the matrix is factored once per geometry
+    stations = lifting_line_stations(settings,wing)
+    assert( lifting_line_stations(settings,wing) is stations )
+    wing.spans.projected = wing.spans.projected*1.1
+    assert( lifting_line_stations(settings,wing) is not stations )
+    longer, _ = lifting_line(conditions(alpha),settings,wing)
+    assert( np.all(longer != CL) )
+    clear_lifting_line_stations()
+    assert( np.all(lifting_line(conditions(alpha),settings,wing)[0] == longer) )
+
+    # segments at the root and the tip give the tapered wing
+    wing.twists.root = 0.
+    wing.twists.tip  = 0.
+    tapered = lifting_line(conditions(alpha),settings,wing)
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'root'
+    segment.percent_span_location = 0.
+    segment.root_chord_percent    = 1.
+    wing.Segments.append(segment)
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'tip'
+    segment.percent_span_location = 1.
+    segment.root_chord_percent    = wing.taper
+    wing.Segments.append(segment)
+
+    segmented = lifting_line(conditions(alpha),settings,wing)
+    assert( np.allclose(segmented[0], tapered[0], rtol=1e-12, atol=0.) )
+    assert( np.allclose(segmented[1], tapered[1], rtol=1e-12, atol=0.) )
+
+    # vertical wings carry no lift
+    assert( lifting_line(conditions(alpha),settings,vehicle.wings.vertical_stabilizer) == (0.,0.) )
+
+    return
+
+def conditions(alpha):
+
+    conditions = Data()
+    conditions.aerodynamics = Data()
+    conditions.aerodynamics.angle_of_attack = alpha
+
+    return conditions
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# nozzle_relations.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the area-Mach, Fanno and Rayleigh relations solved one root per element
+    against a scalar root finder, the choked limits, a ramjet evaluated at many points
+    at once, and a dense solve of the same equations, whose time is printed
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Propulsion import fm_solver, rayleigh, mach_area, exit_Mach_shock, engine_state
+
+import numpy as np
+import sys
+import time
+from scipy.optimize import brentq, fsolve
+
+sys.path.append('../ramjet_network')
+
+import ramjet_network
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n     = 200
+    rng   = np.random.RandomState(0)
+    gamma = rng.uniform(1.15,1.67,n)
+
+    # area ratio to a given Mach number, on both sides of sonic
+    M0 = np.concatenate([rng.uniform(0.05,0.9,n//2),rng.uniform(1.1,4.,n//2)])
+    ar = rng.uniform(1.,20.,n)
+    M1 = fm_solver(ar,M0,gamma)
+    for i in range(n):
+        bounds = (1e-9,1.) if M0[i] < 1. else (1.,100.)
+        M1_ref = brentq(lambda M: area(M,gamma[i])/area(M0[i],gamma[i])-ar[i],*bounds,xtol=1e-14)
+        assert( np.abs(M1[i]-M1_ref) < 1e-10*M1_ref )
+
+    # an area ratio below the sonic one chokes the flow
+    assert( np.allclose(fm_solver(0.4,np.array([0.3,2.]),1.4), 1., rtol=0., atol=1e-10) )
+
+    # isentropic area-Mach relation, with the gammas of a column of conditions
+    ar = rng.uniform(1.01,30.,n)[:,None]
+    for subsonic, bounds in [(True,(1e-9,1.)),(False,(1.,100.))]:
+        Me = mach_area(ar,gamma[:,None],subsonic)
+        assert( np.shape(Me) == (n,1) )
+        for i in range(n):
+            Me_ref = brentq(lambda M: area(M,gamma[i])-ar[i,0],*bounds,xtol=1e-14)
+            assert( np.abs(Me[i,0]-Me_ref) < 1e-10*Me_ref )
+
+    # Rayleigh line, heating towards the choked limit
+    M0      = rng.uniform(0.05,0.9,n)
+    choking = 1./(rayleigh_temperature(M0,gamma))
+    TtR     = 1.+rng.uniform(0.,1.,n)*(choking-1.)
+    M1, Ptr = rayleigh(gamma,M0,TtR)
+    for i in range(n):
+        M1_ref = brentq(lambda M: rayleigh_temperature(M,gamma[i])/rayleigh_temperature(M0[i],gamma[i])-TtR[i],1e-9,1.,xtol=1e-14)
+        assert( np.abs(M1[i]-M1_ref) < 1e-10*M1_ref )
+    assert( np.all(Ptr <= 1.) )
+    M1, Ptr = rayleigh(gamma,M0,2.*choking)
+    assert( np.allclose(M1, 1., rtol=0., atol=1e-10) )
+
+    # the Mach number behind a shock in the nozzle
+    Pt_out = np.linspace(2.,6.,n)*1e5
+    Me     = exit_Mach_shock(2.,1.4,Pt_out,1e5)
+    assert( np.allclose(Pt_out/1e5/2., 1.2**3.*Me*np.sqrt(1.+0.2*Me*Me), rtol=1e-12, atol=0.) )
+
+    # a ramjet at many points at once, and one at a time
+    ramjet   = ramjet_network.energy_network()
+    altitude = np.linspace(8000.,12000.,8)
+    mach     = np.linspace(1.5,3.,8)
+    results  = ramjet(engine_state(ramjet,altitude,mach,1.))
+    for i in range(8):
+        result = ramjet(engine_state(ramjet,altitude[i:i+1],mach[i:i+1],1.))
+        assert( np.allclose(results.thrust_force_vector[i], result.thrust_force_vector[0], rtol=1e-10, atol=0.) )
+        assert( np.allclose(results.vehicle_mass_rate[i], result.vehicle_mass_rate[0], rtol=1e-10, atol=0.) )
+
+    # against a dense solve of the same equations
+    n     = 300
+    M0    = rng.uniform(0.1,0.5,n)
+    gamma = 1.4*np.ones(n)
+    start = time.time()
+    M1    = fm_solver(1.5,M0,gamma)
+    elementwise = time.time() - start
+    start = time.time()
+    M1_dense    = fsolve(lambda M: area(M,gamma)/area(M0,gamma)-1.5,0.1*np.ones(n),factor=0.1)
+    dense = time.time() - start
+    print(n, 'points, elementwise:', elementwise, 's, dense:', dense, 's')
+    assert( np.allclose(M1, M1_dense, rtol=1e-6, atol=0.) )
+
+    return
+
+def area(M,gamma):
+
+    return 1./M*((2./(gamma+1.))*(1.+(gamma-1.)/2.*M*M))**((gamma+1.)/(2.*(gamma-1.)))
+
+def rayleigh_temperature(M,gamma):
+
+    return 2.*(gamma+1.)*M*M*(1.+(gamma-1.)/2.*M*M)/(1.+gamma*M*M)**2.
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# parallel_mission.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" solves variants of the B737 mission in worker processes and checks them
+    against solving them in this process
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    configs, analyses = mission_B737.full_setup()
+    
+    mission_B737.simple_sizing(configs, analyses)
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    mission = analyses.missions.base
+    
+    # the variants: cruise distance and takeoff weight
+    distances = np.array([2500., 3000., 3500., 4000.]) * Units.km
+    takeoffs  = np.array([72000., 76000., 79015.8, 79015.8]) * Units.kg
+    
+    parallel = SUAVE.Analyses.Mission.Parallel()
+    parallel.mission = mission
+    
+    for i,(distance,takeoff) in enumerate(zip(distances,takeoffs)):
+        variant = Data()
+        variant.tag = 'range_%i' % i
+        variant['segments.cruise.distance'] = distance
+        variant['segments.climb_1.analyses.weights.vehicle.mass_properties.takeoff'] = takeoff
+        parallel.append_variant(variant)
+        
+    # in worker processes
+    parallel.number_of_workers = 2
+    t0 = time.time()
+    pool_results = parallel.evaluate()
+    print('workers    :', time.time() - t0)
+    
+    # in this process
+    parallel.number_of_workers = 1
+    t0 = time.time()
+    results = parallel.evaluate()
+    print('in process :', time.time() - t0)
+    
+    # the base mission is left as it was
+    assert( mission.segments.cruise.distance == (3933.65 + 770 - 92.6) * Units.km )
+    
+    # the same container as a batch gives
+    assert( isinstance(pool_results,SUAVE.Analyses.Mission.Mission.Container) )
+    assert( isinstance(results,SUAVE.Analyses.Mission.Mission.Container) )
+    
+    # results come back in the order of the variants
+    assert( list(pool_results.keys()) == ['range_%i' % i for i in range(len(distances))] )
+    
+    for tag,result in results.items():
+        pool_result = pool_results[tag]
+        for segment,pool_segment in zip(result.segments.values(),pool_result.segments.values()):
+            mass      = segment.conditions.weights.total_mass[:,0]
+            pool_mass = pool_segment.conditions.weights.total_mass[:,0]
+            error     = np.max(np.abs(mass - pool_mass)/mass)
+            assert( error < 1e-12 )
+        
+        # the cruise distance of the variant was flown
+        cruise = pool_result.segments.cruise.conditions.frames.inertial.position_vector[:,0]
+        print(tag, (cruise[-1] - cruise[0])/Units.km)
+    
+    final_distance = pool_results.range_3.segments.cruise.conditions.frames.inertial.position_vector[:,0]
+    assert( np.abs(final_distance[-1] - final_distance[0] - distances[3]) < 1. )
+    
+    return
+    
+if __name__ == '__main__':
+    main()
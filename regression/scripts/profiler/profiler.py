@@ -0,0 +1,119 @@
+# profiler.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" profiles the B737 mission and checks the timed steps, and that steps that fail
+    don't change the paths of the ones after them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Analyses import Process, Profiler
+
+import numpy as np
+import json
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    configs, analyses = mission_B737.full_setup()
+    
+    mission_B737.simple_sizing(configs, analyses)
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    mission = analyses.missions.base
+    
+    profiler = Profiler()
+    with profiler:
+        results = mission.evaluate()
+    assert( Profiler.active is None )
+        
+    records = dict([(row.path,row) for row in profiler.table()])
+    
+    # the drag steps of the cruise solve are found by their path
+    cruise = 'the_mission.converge.cruise.converge.converge_root.iterate'
+    path   = cruise + '.conditions.aerodynamics.drag.compressibility'
+    assert( path in records )
+    print(path, records[path].calls, records[path].total_time)
+    
+    # one call for each residual evaluation
+    evaluations = results.segments.cruise.state.numerics.residual_evaluations
+    assert( records[cruise].calls == evaluations )
+    assert( records[path].calls == evaluations )
+    
+    # the time of a step includes its sub steps
+    total = records['the_mission'].total_time
+    assert( total >= records['the_mission.converge'].total_time )
+    assert( np.isclose(sum([row.self_time for row in records.values()]),total) )
+    
+    # the exports hold the same steps
+    rows = json.loads(profiler.to_json())
+    assert( len(rows) == len(records) )
+    stacks = profiler.flamegraph().splitlines()
+    assert( len(stacks) == len(records) )
+    assert( path.replace('.',';') + ' ' in '\n'.join(stacks) )
+    
+    # nothing is recorded when the profiler is off
+    profiler.reset()
+    mission.evaluate()
+    assert( len(profiler.records) == 0 )
+    
+    # memory
+    process = Process()
+    process.allocate = lambda state: state.append(np.ones(100000))
+    process.compute  = lambda state: np.sum(state[-1])
+    profiler = Profiler()
+    profiler.memory = True
+    with profiler:
+        process([])
+    records = dict([(row.path,row) for row in profiler.table()])
+    print('memory :', records['allocate'].memory)
+    assert( records['allocate'].memory >= 800000 )
+    assert( records['compute'].calls == 1 )
+    
+    # a step that fails, like a failed design in an optimizer, leaves nothing open
+    def fail(nexus):
+        raise RuntimeError('failed design')
+    nexus = SUAVE.Optimization.Nexus()
+    nexus.procedure = Process()
+    nexus.procedure.fail = fail
+    process.fail = fail
+    profiler = Profiler()
+    with profiler:
+        for evaluate in [nexus._really_evaluate,lambda: process([])]:
+            try:
+                evaluate()
+                raise AssertionError('the failure was not raised')
+            except RuntimeError:
+                pass
+        del process.fail
+        process([])
+    records = dict([(row.path,row) for row in profiler.table()])
+    assert( sorted(records.keys()) == ['allocate','compute','fail','nexus','nexus.fail'] )
+    assert( records['nexus.fail'].calls == 1 )
+    assert( records['fail'].calls == 1 )
+    assert( records['compute'].calls == 2 )
+    
+    return
+
+# ----------------------------------------------------------------------        
+#   Call Main
+# ----------------------------------------------------------------------    
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 # propeller.py
 # 
 # Created:  E. Botero, Sep 2014
+# Modified: Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -63,10 +64,10 @@ def main():
     F, Q, P, Cplast = prop.spin(conditions)
     
     # Truth values
-    F_truth      = 166.41590262
-    Q_truth      = 45.21732911
-    P_truth      = 9470.2952633 # Over 9000!
-    Cplast_truth = 0.00085898
+    F_truth      = 166.08258804
+    Q_truth      = 45.12753404
+    P_truth      = 9451.48862704 # Over 9000!
+    Cplast_truth = 0.00085728
     
     error = Data()
     error.Thrust  = np.max(np.abs(F-F_truth))
@@ -0,0 +1,144 @@
+# propeller_map.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the propeller performance map: the interpolated coefficients against the full
+    solution, the full solution outside the map and the map stored on disk, and prints
+    the time saved over repeated evaluations of a mission sweep
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Propulsion import propeller_design, build_propeller_map, propeller_coefficients, \
+     propeller_map_coefficients
+
+import numpy as np
+import os
+import time
+import shutil
+import tempfile
+
+from propeller_warm_start import conditions
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 50.0
+    prop_attributes.angular_velocity    = 2000.*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = 1.5
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7000.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    prop                 = SUAVE.Components.Energy.Converters.Propeller()
+    prop.prop_attributes = prop_attributes
+
+    J  = np.linspace(0.1,1.3,25)
+    Mt = np.linspace(0.5,1.0,6)
+    Re = np.logspace(6.,8.,3)
+
+    folder = tempfile.mkdtemp()
+    try:
+        # the map is stored and read back
+        start = time.time()
+        performance_map = build_propeller_map(prop,J,Mt,Re,directory=folder)
+        build = time.time() - start
+        assert( len(os.listdir(folder)) == 1 )
+
+        start  = time.time()
+        stored = build_propeller_map(prop,J,Mt,Re,directory=folder)
+        print('map built in', build, 's, read in', time.time() - start, 's')
+        assert( np.all(stored.trusted == performance_map.trusted) )
+        assert( np.allclose(stored.power_coefficient.values, performance_map.power_coefficient.values, rtol=0., atol=0., equal_nan=True) )
+    finally:
+        shutil.rmtree(folder)
+
+    # the windmilling end of the map and the transonic tips fail the accuracy check
+    print('trusted cells:', np.mean(performance_map.trusted))
+    assert( np.all(performance_map.trusted[:10]) )
+    assert( not np.any(performance_map.trusted[-3:]) )
+    assert( not np.all(performance_map.trusted[:,-1]) )
+
+    # the interpolated coefficients against the full solution
+    rng       = np.random.RandomState(0)
+    J_test    = rng.uniform(0.1,0.9,50)
+    Mt_test   = rng.uniform(0.5,1.0,50)
+    Re_test   = 10**rng.uniform(6.,8.,50)
+    Ct, Cp    = propeller_coefficients(prop,J_test,Mt_test,Re_test,inflow_tolerance=1e-8)
+
+    R     = prop_attributes.tip_radius
+    a     = np.ones((50,1))*np.sqrt(1.4*287.0528*288.15)
+    omega = Mt_test[:,None]*a/R
+    V     = J_test[:,None]*omega/np.pi*R
+    mu    = omega*R*2.*R/Re_test[:,None]
+    Ct_map, Cp_map, trusted = propeller_map_coefficients(performance_map,V,omega,np.ones((50,1)),mu,a,R)
+    assert( np.sum(trusted) > 45 )
+
+    # the tolerance is checked at the cell centers, elsewhere the errors can be a little larger
+    Ct_error = np.max(np.abs(Ct_map[:,0]-Ct[trusted]))/np.max(np.abs(Ct))
+    Cp_error = np.max(np.abs(Cp_map[:,0]-Cp[trusted]))/np.max(np.abs(Cp))
+    print('largest map errors:', Ct_error, Cp_error)
+    assert( Ct_error < 0.025 and Cp_error < 0.025 )
+
+    # spin takes the map inside of it and solves the other points in full
+    prop.performance_map = performance_map
+    V     = np.array([20.,40.,60.,80.,120.,150.,200.,250.])
+    omega = np.ones((8,1))*1700.*(2.*np.pi/60.0)
+    prop.inputs.omega = omega
+    F, Q, P, Cp = prop.spin(conditions(V))
+    mapped = prop.outputs.mapped
+    assert( np.all(mapped[:3]) and not np.any(mapped[-2:]) )
+
+    exact = SUAVE.Components.Energy.Converters.Propeller()
+    exact.prop_attributes = prop_attributes
+    exact.inputs.omega    = omega[~mapped]
+    F_exact, Q_exact, P_exact, Cp_exact = exact.spin(conditions(V[~mapped]))
+    assert( np.all(F[~mapped] == F_exact) and np.all(P[~mapped] == P_exact) )
+
+    exact.inputs.omega = omega[mapped]
+    exact.tolerance    = 1e-8
+    F_exact, Q_exact, P_exact, Cp_exact = exact.spin(conditions(V[mapped]))
+    assert( np.allclose(F[mapped], F_exact, rtol=0., atol=0.01*np.max(np.abs(F_exact))) )
+    assert( np.allclose(P[mapped], P_exact, rtol=0., atol=0.01*np.max(np.abs(P_exact))) )
+
+    # the time over the iterations of a mission sweep
+    V     = np.linspace(30.,70.,16)
+    omega = np.ones((16,1))*1700.*(2.*np.pi/60.0)
+    prop.inputs.omega  = omega
+    exact.inputs.omega = omega
+    exact.tolerance    = prop.tolerance
+
+    sweep = [conditions(V*(1.+0.001*i)) for i in range(20)]
+
+    start = time.time()
+    for state in sweep:
+        F_exact = exact.spin(state)[0]
+    exact_time = time.time() - start
+    start = time.time()
+    for state in sweep:
+        F = prop.spin(state)[0]
+    map_time = time.time() - start
+    print('mission sweep, full solution:', exact_time, 's, map:', map_time, 's, speedup:', exact_time/map_time)
+    assert( np.all(prop.outputs.mapped) )
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
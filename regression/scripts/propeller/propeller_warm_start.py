@@ -0,0 +1,147 @@
+# propeller_warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the propeller inflow iteration: warm starts from the last solution for
+    nearby operating points, cold starts for the others, a stalled point, and the
+    iteration cap
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Propulsion import propeller_design
+
+import numpy as np
+import warnings
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 50.0
+    prop_attributes.angular_velocity    = 2000.*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = 1.5
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7000.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    V     = np.linspace(30.,70.,8)
+    # cold starts, where the elements settle at the tolerance about converged
+    cold  = propeller(prop_attributes)
+    F_cold, Q_cold, P_cold, Cp_cold = cold.spin(conditions(V))
+    assert( cold.outputs.converged and 10 < cold.outputs.iterations < 20 )
+    tight = propeller(prop_attributes)
+    tight.tolerance = 1e-9
+    F, Q, P, Cp = tight.spin(conditions(V))
+    assert( np.allclose(F, F_cold, rtol=1e-7, atol=0.) )
+    assert( np.allclose(P, P_cold, rtol=1e-7, atol=0.) )
+
+    # the same operating point again converges at once, with a last step within the
+    # tolerance
+    warm = propeller(prop_attributes)
+    warm.warm_start = True
+    warm.spin(conditions(V))
+    assert( warm.outputs.iterations == cold.outputs.iterations )
+    F, Q, P, Cp = warm.spin(conditions(V))
+    print('warm start iterations:', warm.outputs.iterations, 'cold:', cold.outputs.iterations)
+    assert( warm.outputs.iterations == 1 )
+    assert( np.allclose(F, F_cold, rtol=1e-7, atol=0.) )
+    assert( np.allclose(P, P_cold, rtol=1e-7, atol=0.) )
+
+    # nearby points start from the last solution, and agree with a cold start as the
+    # inflow angles are converged
+    tight = propeller(prop_attributes)
+    tight.tolerance  = 1e-9
+    tight.warm_start = True
+    tight.spin(conditions(V))
+    F_near, _, P_near, _ = tight.spin(conditions(V*1.01))
+    iterations = tight.outputs.iterations
+    tight.warm_start = False
+    F_ref,  _, P_ref,  _ = tight.spin(conditions(V*1.01))
+    print('nearby warm start iterations:', iterations, 'cold:', tight.outputs.iterations)
+    assert( iterations < tight.outputs.iterations )
+    assert( np.allclose(F_near, F_ref, rtol=1e-5, atol=0.) )
+    assert( np.allclose(P_near, P_ref, rtol=1e-5, atol=0.) )
+    F_near, _, _, _ = warm.spin(conditions(V*1.01))
+    assert( warm.outputs.iterations < cold.outputs.iterations )
+
+    # points far from the last solution start cold
+    F_far, _, _, _ = warm.spin(conditions(V*1.5))
+    F_ref, _, _, _ = cold.spin(conditions(V*1.5))
+    assert( np.all(F_far == F_ref) )
+
+    # a stalled point stops the iteration at the stall guard, which a warm start
+    # doesn't start over from cold
+    V_stall = np.append(np.linspace(30.,70.,7),120.)
+    F_cold, _, _, _ = cold.spin(conditions(V_stall))
+    assert( not cold.outputs.converged and cold.outputs.iterations < cold.maximum_iterations )
+    stalled = propeller(prop_attributes)
+    stalled.warm_start = True
+    stalled.spin(conditions(V_stall))
+    F, _, _, _ = stalled.spin(conditions(V_stall))
+    assert( stalled.outputs.iterations == 1 )
+    assert( np.all(F == F_cold) )
+    cold.spin(conditions(V_stall*1.01))
+    stalled.spin(conditions(V_stall*1.01))
+    print('stalled warm start iterations:', stalled.outputs.iterations, 'cold:', cold.outputs.iterations)
+    assert( stalled.outputs.iterations < cold.outputs.iterations )
+
+    # the iteration is capped
+    capped = propeller(prop_attributes)
+    capped.maximum_iterations = 3
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        capped.spin(conditions(V))
+    assert( not capped.outputs.converged and capped.outputs.iterations == 3 )
+    assert( any('did not converge' in str(warning.message) for warning in caught) )
+
+    return
+
+def propeller(prop_attributes):
+
+    prop                 = SUAVE.Components.Energy.Converters.Propeller()
+    prop.prop_attributes = prop_attributes
+    prop.inputs.omega    = np.ones((8,1))*prop_attributes.angular_velocity
+
+    return prop
+
+def conditions(V):
+
+    n = len(V)
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere_conditions = atmosphere.compute_values(0.)
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.propulsion = Data()
+    conditions.frames     = Data()
+    conditions.frames.body     = Data()
+    conditions.frames.inertial = Data()
+    conditions.freestream.density           = np.ones((n,1))*atmosphere_conditions.density
+    conditions.freestream.dynamic_viscosity = np.ones((n,1))*atmosphere_conditions.dynamic_viscosity
+    conditions.freestream.speed_of_sound    = np.ones((n,1))*atmosphere_conditions.speed_of_sound
+    conditions.freestream.temperature       = np.ones((n,1))*atmosphere_conditions.temperature
+    conditions.frames.inertial.velocity_vector   = np.array([V,0.*V,0.*V]).T
+    conditions.propulsion.throttle               = np.ones((n,1))
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(n,1,1))
+
+    return conditions
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
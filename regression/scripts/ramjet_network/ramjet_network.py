@@ -2,6 +2,7 @@
 # 
 # Created:  Sep 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 #        
 
 """ create and evaluate a ramjet network
@@ -241,7 +242,7 @@ def energy_network():
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)    
     
-    return
+    return ramjet
     
 if __name__ == '__main__':
     
@@ -1,6 +1,7 @@
 # test_solar_network.py
 # 
 # Created:  Emilio Botero, Aug 2014
+# Modified: Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -163,7 +164,7 @@ def main():
     F       = results.thrust_force_vector
     
     # Truth results
-    truth_F   = [[ 545.35952329,  545.35952329]]
+    truth_F   = [[ 545.3182082,  545.3182082]]
     truth_i   = [[ 249.31622624], [ 249.31622624]]
     truth_rpm = [[ 6668.4094191], [ 6668.4094191]]
     truth_bat = [[ 36000000.   ], [ 35987534.18868808]]
@@ -0,0 +1,124 @@
+# solver_jacobian.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" checks the colored finite difference jacobian against the default root solve, and the
+    arguments a root finder is called with
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Missions.Segments.converge_root import iterate
+
+import numpy as np
+import scipy.optimize
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    # solve the mission with the default finite differences, the first solve is cold
+    mission = setup('none')
+    results_none = solution(mission.evaluate())
+    mission.evaluate()
+    evals_none   = residual_evaluations(mission)
+    
+    # solve the mission with the colored jacobian
+    mission = setup('colored')
+    results_colored = solution(mission.evaluate())
+    mission.evaluate()
+    evals_colored   = residual_evaluations(mission)
+    
+    print('residual evaluations, none    : ', evals_none)
+    print('residual evaluations, colored : ', evals_colored)
+    
+    # the sparsity pattern is reused, so the second solve must be cheaper
+    assert( evals_colored < evals_none )
+    
+    # the cold solves agree
+    for tag in results_none.keys():
+        converged_none, mass_none, throttle_none          = results_none[tag]
+        converged_colored, mass_colored, throttle_colored = results_colored[tag]
+        
+        assert( converged_none and converged_colored )
+        
+        error_mass     = np.max(np.abs((mass_none - mass_colored)/mass_none))
+        error_throttle = np.max(np.abs(throttle_none - throttle_colored))
+        
+        print(tag, error_mass, error_throttle)
+        assert( error_mass     < 1e-6 )
+        assert( error_throttle < 1e-6 )
+    
+    # a root finder is called as before, with the jacobian only in a jacobian mode,
+    # and a failed solve is tried once more with finite differences
+    calls   = []
+    segment = mission.segments[0]
+    def root_finder(function,unknowns,args=(),xtol=1.49012e-08,full_output=0,fprime=None):
+        calls.append((function,args,fprime))
+        if len(calls) == 1:
+            return unknowns, {}, 5, 'not converged on purpose'
+        return scipy.optimize.fsolve(function,unknowns,args=args,xtol=xtol,full_output=full_output,fprime=fprime)
+    segment.settings.root_finder = root_finder
+    mission.evaluate()
+    
+    assert( len(calls) == 2 )
+    assert( calls[0][0] is iterate and calls[0][1] is segment )
+    assert( calls[0][2] is not None and calls[1][2] is None )
+    assert( segment.state.numerics.converged )
+    
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup(solver_jacobian):
+    
+    configs, analyses = mission_B737.full_setup()
+    
+    mission_B737.simple_sizing(configs, analyses)
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    mission = analyses.missions.base
+    
+    for segment in mission.segments.values():
+        segment.state.numerics.solver_jacobian = solver_jacobian
+    
+    return mission
+
+def solution(results):
+    
+    # copies, as the next solve of the mission changes the arrays in place
+    solution = {}
+    for tag,segment in results.segments.items():
+        solution[tag] = (segment.state.numerics.converged,
+                         segment.conditions.weights.total_mass[:,0]*1.,
+                         segment.conditions.propulsion.throttle[:,0]*1.)
+        
+    return solution
+
+def residual_evaluations(mission):
+    
+    evaluations = 0
+    for segment in mission.segments.values():
+        evaluations += segment.state.numerics.residual_evaluations
+        
+    return evaluations
+    
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# grid_surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the 'grid' surrogates: tensor product interpolation of rectilinear training
+    data, its derivatives, and the radial basis function fallback for scattered data
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Components.Energy.Networks.Propulsor_Surrogate import Propulsor_Surrogate
+from SUAVE.Methods.Utilities.Surrogates import Grid_Surrogate, Rbf_Surrogate, build_grid_surrogate, \
+     rectilinear_grid, predict_surrogate
+
+import numpy as np
+import scipy.interpolate
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # in one dimension pchip is scipy's monotone interpolant
+    x  = np.array([0.,1.,2.5,3.,4.,6.])
+    y  = np.array([0.,0.3,0.35,0.8,1.5,1.6])
+    xs = np.linspace(0.,6.,61)
+    surrogate = Grid_Surrogate().fit([x],y,'pchip')
+    pchip     = scipy.interpolate.PchipInterpolator(x,y)
+    assert( np.allclose(surrogate(xs), pchip(xs), atol=1e-12) )
+    assert( np.allclose(surrogate.gradient(xs)[0], pchip(xs,1), atol=1e-12) )
+    assert( np.all(np.diff(surrogate(xs)) >= 0.) )
+
+    # a lift grid in angle of attack and Mach number, given in any order
+    AoA_data  = np.linspace(-2.,8.,6) * Units.deg
+    mach_data = np.array([0.3,0.5,0.7,0.8,0.85])
+    AoA_grid, mach_grid = np.meshgrid(AoA_data,mach_data,indexing='ij')
+    xy = np.vstack([AoA_grid.ravel(),mach_grid.ravel()]).T
+    CL = 2.*np.pi*xy[:,0]/np.sqrt(1. - xy[:,1]**2)
+    order = np.random.RandomState(0).permutation(len(CL))
+
+    axes, values = rectilinear_grid(xy[order],CL[order])
+    assert( np.all(axes[0] == AoA_data) and np.all(axes[1] == mach_data) )
+    assert( np.all(values == np.reshape(CL,values.shape)) )
+    assert( rectilinear_grid(xy[1:],CL[1:]) is None )
+
+    AoA  = np.linspace(-1.,7.,16)[:,None] * Units.deg
+    mach = np.linspace(0.35,0.82,16)[:,None]
+    CL_truth = 2.*np.pi*AoA/np.sqrt(1. - mach**2)
+
+    for method in ['linear','pchip']:
+        surrogate = build_grid_surrogate(xy[order],CL[order],method)
+        assert( isinstance(surrogate,Grid_Surrogate) )
+
+        # exact at the nodes, close in between
+        assert( np.allclose(surrogate.predict(xy), CL, atol=1e-12) )
+        CL_sur = predict_surrogate(surrogate,[AoA,mach])
+        error  = np.max(np.abs(CL_sur - CL_truth))
+        print(method, error)
+        assert( error < 0.03 )
+
+        # analytic derivatives match finite differences
+        dCL_dAoA, dCL_dM = surrogate.gradient(AoA,mach)
+        step = 1e-7
+        fd_AoA = (surrogate(AoA + step,mach) - surrogate(AoA - step,mach))/(2.*step)
+        fd_M   = (surrogate(AoA,mach + step) - surrogate(AoA,mach - step))/(2.*step)
+        assert( np.allclose(dCL_dAoA, fd_AoA, rtol=1e-5, atol=1e-6) )
+        assert( np.allclose(dCL_dM, fd_M, rtol=1e-5, atol=1e-6) )
+
+        # held at the edges of the grid
+        assert( np.allclose(surrogate(1.,0.9), surrogate(AoA_data[-1],mach_data[-1])) )
+        assert( np.all(surrogate.gradient(1.,0.9)[0] == 0.) )
+
+    # cubic is closer than linear on a smooth function
+    linear = build_grid_surrogate(xy,CL,'linear')
+    pchip  = build_grid_surrogate(xy,CL,'pchip')
+    assert( np.max(np.abs(pchip(AoA,mach) - CL_truth)) < np.max(np.abs(linear(AoA,mach) - CL_truth)) )
+
+    # scattered data falls back to radial basis functions, exact at the data
+    scattered = build_grid_surrogate(xy[1:],CL[1:])
+    assert( isinstance(scattered,Rbf_Surrogate) )
+    assert( np.allclose(scattered.predict(xy[1:]), CL[1:], atol=1e-8) )
+
+    # an analysis trained on a grid
+    analysis = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+    analysis.settings.surrogate_type = 'grid'
+    analysis.training.angle_of_attack = AoA_data
+    analysis.training.Mach            = mach_data
+    analysis.training.grid_points     = xy
+    analysis.training.coefficients    = np.vstack([CL,0.01 + 0.05*CL**2,0.9 + 0.*CL]).T
+    analysis.build_surrogate()
+    assert( isinstance(analysis.surrogates.lift_coefficient,Grid_Surrogate) )
+    assert( np.allclose(predict_surrogate(analysis.surrogates.lift_coefficient,[AoA,mach]),
+                        pchip(AoA,mach)) )
+
+    # the engine deck of the propulsion surrogate regression is scattered
+    propulsion = Propulsor_Surrogate()
+    propulsion.input_file        = '../propulsion_surrogate/deck.csv'
+    propulsion.number_of_engines = 1.
+    propulsion.surrogate_type    = 'grid'
+    propulsion.build_surrogate()
+    assert( isinstance(propulsion.thrust_surrogate,Rbf_Surrogate) )
+
+    state = Data()
+    state.conditions = Data()
+    state.conditions.freestream = Data()
+    state.conditions.propulsion = Data()
+    state.conditions.freestream.mach_number = np.array([[0.2],[0.3]])
+    state.conditions.freestream.altitude    = np.array([[0.],[3000.]])
+    state.conditions.propulsion.throttle    = np.array([[0.4],[0.8]])
+
+    results = propulsion.evaluate_thrust(state)
+    print(results.thrust_force_vector[:,0])
+    assert( np.allclose(results.thrust_force_vector[:,0], [1000.,1000.]) )
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# surrogate_prediction.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that predicting all the points of a segment with one call matches
+    predicting one point at a time, for the regressors used by the analyses
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Utilities.Surrogates import predict_surrogate
+
+import numpy as np
+from sklearn import gaussian_process
+from sklearn.gaussian_process.kernels import RationalQuadratic
+from sklearn import neighbors
+from sklearn import svm
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # training grid in angle of attack and Mach number
+    AoA_data  = np.linspace(-2.,8.,6) * Units.deg
+    mach_data = np.linspace(0.3,0.85,5)
+    AoA_grid, mach_grid = np.meshgrid(AoA_data,mach_data)
+    xy = np.vstack([AoA_grid.ravel(),mach_grid.ravel()]).T
+    CL = 2.*np.pi*xy[:,0]/np.sqrt(1. - xy[:,1]**2)
+
+    # 16 control points off the grid
+    AoA  = np.linspace(-1.,7.,16)[:,None] * Units.deg
+    mach = np.linspace(0.35,0.8,16)[:,None]
+
+    models = [gaussian_process.GaussianProcessRegressor(),
+              gaussian_process.GaussianProcessRegressor(normalize_y=True),
+              gaussian_process.GaussianProcessRegressor(kernel=RationalQuadratic()),
+              neighbors.KNeighborsRegressor(n_neighbors=2,weights='distance'),
+              svm.SVR(gamma='scale')]
+
+    for model in models:
+        model.fit(xy,CL)
+
+        one_at_a_time = np.zeros([16,1])
+        for ii in range(16):
+            one_at_a_time[ii] = model.predict([np.array([AoA[ii][0],mach[ii][0]])])
+
+        CL_sur = predict_surrogate(model,[AoA,mach])
+        print(type(model).__name__, np.max(np.abs(CL_sur - one_at_a_time)))
+        assert( CL_sur.shape == (16,1) )
+        assert( np.allclose(CL_sur, one_at_a_time, rtol=1e-6, atol=1e-8) )
+
+    # single precision inputs are close to double precision
+    model  = models[0]
+    CL_32  = predict_surrogate(model,[AoA,mach],np.float32)
+    CL_64  = predict_surrogate(model,[AoA,mach])
+    assert( CL_32.dtype == np.float64 )
+    assert( np.allclose(CL_32, CL_64, atol=1e-2) )
+
+    # an analysis evaluates every control point at once
+    analysis = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+    analysis.surrogates.lift_coefficient       = models[0]
+    analysis.surrogates.drag_coefficient       = models[1]
+    analysis.surrogates.span_efficiency_factor = models[2]
+
+    state = Data()
+    state.conditions = Data()
+    state.conditions.freestream = Data()
+    state.conditions.aerodynamics = Data()
+    state.conditions.aerodynamics.lift_breakdown = Data()
+    state.conditions.aerodynamics.drag_breakdown = Data()
+    state.conditions.freestream.mach_number       = mach
+    state.conditions.aerodynamics.angle_of_attack = AoA
+
+    geometry = SUAVE.Vehicle()
+    wing = SUAVE.Components.Wings.Main_Wing()
+    wing.tag = 'main_wing'
+    geometry.append_component(wing)
+
+    lift = analysis.evaluate(state,analysis.settings,geometry)
+    assert( lift.shape == (16,1) )
+    assert( np.allclose(lift, predict_surrogate(models[0],[AoA,mach])) )
+    assert( state.conditions.aerodynamics.drag_breakdown.induced.span_efficiency_factor.shape == (16,1) )
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+# training_store.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the persistent training store: per point entries keyed by the exported
+    geometry and settings, so tables resume and grow without rerunning AVL or SU2
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Utilities.Surrogates import Training_Store, training_key
+from SUAVE.Analyses.Aerodynamics.SU2_inviscid import SU2_training_store
+
+import numpy as np
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+sys.path.append('../Vehicles')
+sys.path.append('../AVL')
+
+from Boeing_737 import vehicle_setup, configs_setup
+from avl_parallel import write_stub
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    folder = tempfile.mkdtemp()
+    origin = os.getcwd()
+
+    try:
+        store_directory = os.path.join(folder,'store')
+
+        # a disabled store never has entries
+        store = Training_Store()
+        assert( store.load([0.,0.3]) is None )
+        assert( store.save([0.,0.3],Data(lift_coefficient=1.)) is None )
+
+        # entries are found by their point
+        store.directory = store_directory
+        store.key       = training_key('test')
+        store.save([0.,0.3],Data(lift_coefficient=1.))
+        assert( store.load([0.,0.3]).lift_coefficient == 1. )
+        assert( store.load([0.,0.5]) is None )
+
+        # processes sharing the store only ever see complete entries
+        points = [[AoA,0.5] for AoA in np.linspace(0.,0.1,20)]
+        complete = []
+        def share():
+            for point in points:
+                store.save(point,Data(lift_coefficient=point[0] + np.zeros(1000)))
+                data = store.load(point)
+                complete.append(data is not None and np.all(data.lift_coefficient == point[0]))
+        threads = [threading.Thread(target=share) for _ in range(4)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        assert( len(complete) == 80 and all(complete) )
+        assert( len(os.listdir(store.folder())) == 21 )
+
+        avl_store(folder,store_directory)
+        su2_store(folder,store_directory)
+
+    finally:
+        os.chdir(origin)
+        shutil.rmtree(folder)
+
+    return
+
+def avl_store(folder,store_directory):
+
+    vehicle = vehicle_setup()
+    configs = configs_setup(vehicle)
+    stub    = write_stub(folder,'ok')
+
+    def analysis(mach,workers=1):
+        avl = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+        avl.geometry = configs.cruise
+        avl.settings.filenames.avl_bin_name   = stub
+        avl.settings.filenames.run_folder     = os.path.join(folder,'avl_files')
+        avl.settings.filenames.log_filename   = os.path.join(folder,'log.txt')
+        avl.settings.filenames.err_filename   = os.path.join(folder,'err.txt')
+        avl.settings.training_cache_directory = store_directory
+        avl.settings.number_of_workers        = workers
+        avl.training.angle_of_attack          = np.array([-2.,2.]) * Units.deg
+        avl.training.Mach                     = np.array(mach)
+        return avl
+
+    # the first table runs every Mach number
+    first = analysis([0.1,0.3])
+    first.sample_training()
+    assert( first.current_status.batch_index == 2 )
+
+    # a larger table only runs the new Mach numbers
+    second = analysis([0.1,0.3,0.5,0.7],2)
+    second.sample_training()
+    assert( second.current_status.batch_index == 2 )
+    assert( np.all(second.training.coefficients[:4] == first.training.coefficients) )
+    assert( np.allclose(second.training.coefficients[:,0], [0.1,0.1,0.3,0.3,0.5,0.5,0.7,0.7]) )
+
+    # an interrupted table resumes with the missing points only
+    keys  = os.listdir(store_directory)
+    key   = [k for k in keys if k != training_key('test')][0]
+    os.remove(os.path.join(store_directory,key,Training_Store().point_key([2.*Units.deg,0.5]) + '.npz'))
+
+    resumed = analysis([0.1,0.3,0.5,0.7])
+    resumed.sample_training()
+    assert( resumed.current_status.batch_index == 1 )
+    assert( np.all(resumed.training.coefficients == second.training.coefficients) )
+
+    # a complete table doesn't need AVL at all
+    cached = analysis([0.1,0.3,0.5,0.7])
+    cached.settings.filenames.avl_bin_name = os.path.join(folder,'no_avl')
+    cached.sample_training()
+    assert( cached.current_status.batch_index == 0 )
+
+    # the discretization changes the exported geometry, so the samples are new
+    finer = analysis([0.1])
+    finer.settings.discretization.defaults.wing.spanwise_vortices += 5
+    finer.sample_training()
+    assert( finer.current_status.batch_index == 1 )
+    assert( len(os.listdir(store_directory)) == 3 )
+
+    return
+
+def su2_store(folder,store_directory):
+
+    os.chdir(folder)
+
+    su2 = SUAVE.Analyses.Aerodynamics.SU2_inviscid()
+    su2.geometry.tag            = 'mesh_test'
+    su2.geometry.reference_area = 100.
+    su2.settings.training_cache_directory = store_directory
+
+    # there is no store without the mesh
+    assert( SU2_training_store(su2.settings,su2.geometry).key is None )
+
+    with open('mesh_test.su2','w') as mesh:
+        mesh.write('NDIME= 3\n')
+    store = SU2_training_store(su2.settings,su2.geometry)
+    assert( store.key is not None )
+
+    # the key follows the mesh and the settings
+    su2.settings.maximum_iterations = 100
+    assert( SU2_training_store(su2.settings,su2.geometry).key != store.key )
+    su2.settings.maximum_iterations = 1500
+    with open('mesh_test.su2','a') as mesh:
+        mesh.write('NELEM= 0\n')
+    assert( SU2_training_store(su2.settings,su2.geometry).key != store.key )
+
+    # with every point stored SU2 isn't called
+    store = SU2_training_store(su2.settings,su2.geometry)
+    for AoA in su2.training.angle_of_attack:
+        for mach in su2.training.Mach:
+            store.save([AoA,mach],Data(lift_coefficient=AoA*mach,drag_coefficient=0.01))
+
+    su2.sample_training()
+    xy = su2.training.grid_points
+    assert( np.all(su2.training.coefficients[:,0] == xy[:,0]*xy[:,1]) )
+
+    # the supersonic analysis runs the same cases
+    super_su2 = SUAVE.Analyses.Aerodynamics.SU2_inviscid_Super()
+    super_su2.geometry = su2.geometry
+    super_su2.training.angle_of_attack = su2.training.angle_of_attack
+    super_su2.training.Mach            = su2.training.Mach
+    super_su2.settings.training_cache_directory = store_directory
+    super_su2.sample_training()
+    assert( np.all(super_su2.training.coefficients == su2.training.coefficients) )
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
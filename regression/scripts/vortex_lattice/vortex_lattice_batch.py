@@ -0,0 +1,80 @@
+# vortex_lattice_batch.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" checks that the batched vortex lattice gives the same lift and drag as one angle
+    at a time, for wings with and without segments
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice, weissinger_vortex_lattice_batch
+from SUAVE.Analyses.Aerodynamics.Vortex_Lattice import calculate_lift_vortex_lattice
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup as b737_setup
+from Boeing_BWB_450 import vehicle_setup as bwb_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    angles = np.linspace(-10.,10.,9) * Units.deg
+    
+    for vehicle in [b737_setup(), bwb_setup()]:
+        for n in [5,40]:
+            settings = Data()
+            settings.number_panels_spanwise  = n
+            settings.number_panels_chordwise = 1
+            
+            for wing in vehicle.wings.values():
+                CL, CD = weissinger_vortex_lattice_batch(angles,settings,wing)
+                
+                for i,angle in enumerate(angles):
+                    conditions = Data()
+                    conditions.aerodynamics = Data()
+                    conditions.aerodynamics.angle_of_attack = angle
+                    cl, cd = weissinger_vortex_lattice(conditions,settings,wing)
+                    assert( np.abs(cl - CL[i]) < 1e-12 )
+                    assert( np.abs(cd - CD[i]) < 1e-12 )
+                    
+                print(vehicle.tag, wing.tag, n, CL[-1], CD[-1])
+    
+    # Prandtl-Glauert scaling
+    wing = vehicle.wings.main_wing
+    CL_0, CD_0 = weissinger_vortex_lattice_batch(angles,settings,wing)
+    CL_M, CD_M = weissinger_vortex_lattice_batch(angles,settings,wing,mach=0.6)
+    assert( np.allclose(CL_M, CL_0/0.8) )
+    assert( np.allclose(CD_M, CD_0/0.64) )
+    
+    # the surrogate training matches the lift of one angle at a time
+    analysis = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    analysis.geometry = vehicle
+    analysis.training.angle_of_attack = angles
+    analysis.initialize()
+    for i,angle in enumerate(angles):
+        conditions = Data()
+        conditions.aerodynamics = Data()
+        conditions.aerodynamics.angle_of_attack = angle
+        cl, wing_lifts = calculate_lift_vortex_lattice(conditions,analysis.settings,vehicle)
+        assert( np.abs(cl - analysis.training.lift_coefficient[i]) < 1e-12 )
+    
+    return
+
+# ----------------------------------------------------------------------        
+#   Call Main
+# ----------------------------------------------------------------------    
+
+if __name__ == '__main__':
+    main()
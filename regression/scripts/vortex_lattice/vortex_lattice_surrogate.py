@@ -0,0 +1,163 @@
+# vortex_lattice_surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the (AoA, Mach) vortex lattice surrogate and the reuse of its training
+    samples, in the same run and from the cache directory, and that compressibility
+    is applied once
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+from SUAVE.Methods.Utilities.Surrogates import Grid_Surrogate, training_key
+
+import numpy as np
+
+import os
+import sys
+import shutil
+import tempfile
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the grid surrogate is exact for a bilinear function and holds the edges
+    x = np.array([0.,1.,3.])
+    y = np.array([-1.,2.])
+    X, Y = np.meshgrid(x,y,indexing='ij')
+    surrogate = Grid_Surrogate().fit([x,y],2.*X + 3.*Y + X*Y)
+    xs = np.array([[0.5],[2.],[2.9]])
+    ys = np.array([[0.],[1.5],[-0.5]])
+    assert( np.allclose(surrogate(xs,ys), 2.*xs + 3.*ys + xs*ys) )
+    assert( np.allclose(surrogate(10.,5.), surrogate(3.,2.)) )
+    assert( surrogate(xs,ys).shape == (3,1) )
+
+    # the keys don't depend on the order of the data
+    a = Data(); a.x = 1.; a.y = np.array([1,2])
+    b = Data(); b.y = np.array([1.,2.]); b.x = 1
+    assert( training_key(a) == training_key(b) )
+    b.x = 1.0000001
+    assert( training_key(a) != training_key(b) )
+
+    vehicle   = vehicle_setup()
+    angles    = np.linspace(-10.,10.,9) * Units.deg
+    machs     = np.array([0.,0.3,0.5,0.7,0.8])
+    directory = tempfile.mkdtemp()
+
+    # count the wings sampled with the vortex lattice
+    module  = sys.modules['SUAVE.Analyses.Aerodynamics.Vortex_Lattice']
+    sampler = module.sample_wing_vortex_lattice
+    sampled = []
+    def counted(angles,mach,settings,wing):
+        sampled.append(wing.tag)
+        return sampler(angles,mach,settings,wing)
+    module.sample_wing_vortex_lattice = counted
+
+    try:
+        def build():
+            analysis = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+            analysis.geometry = vehicle
+            analysis.settings.training_cache_directory = directory
+            analysis.training.angle_of_attack = angles
+            analysis.training.Mach            = machs
+            analysis.initialize()
+            return analysis
+
+        # the first build samples every wing, initializing again reuses them
+        analysis = build()
+        assert( len(sampled) == len(vehicle.wings) )
+        analysis.initialize()
+        assert( len(sampled) == len(vehicle.wings) )
+
+        # the Mach columns are Prandtl-Glauert scaled
+        CL = analysis.training.lift_coefficient
+        assert( CL.shape == (len(angles),len(machs)) )
+        assert( np.allclose(CL, CL[:,:1] / np.sqrt(1. - machs**2)) )
+
+        # a new analysis of the same vehicle reads the cache
+        analysis = build()
+        assert( len(sampled) == len(vehicle.wings) )
+        assert( np.all(analysis.training.lift_coefficient == CL) )
+
+        # only the changed wing is sampled again
+        vehicle.wings.main_wing.twists.tip = -2. * Units.deg
+        analysis = build()
+        assert( sampled[len(vehicle.wings):] == ['main_wing'] )
+        assert( len(os.listdir(directory)) == len(vehicle.wings) + 1 )
+
+    finally:
+        module.sample_wing_vortex_lattice = sampler
+        shutil.rmtree(directory)
+
+    # evaluate between the angles of the grid against the vortex lattice
+    state = Data()
+    state.conditions = Data()
+    state.conditions.freestream = Data()
+    state.conditions.aerodynamics = Data()
+    state.conditions.aerodynamics.lift_breakdown = Data()
+    state.conditions.freestream.dynamic_pressure = np.ones((3,1))
+    state.conditions.freestream.mach_number      = np.array([[0.3],[0.5],[0.7]])
+    state.conditions.aerodynamics.angle_of_attack = np.array([[1.],[3.],[4.]]) * Units.deg
+
+    lift = analysis.evaluate(state,analysis.settings,vehicle)
+
+    AoA  = state.conditions.aerodynamics.angle_of_attack[:,0]
+    Mach = state.conditions.freestream.mach_number[:,0]
+    CL_vlm, wing_CLs = module.calculate_lift_vortex_lattice_batch(AoA,analysis.settings,vehicle)
+    CL_vlm = CL_vlm / np.sqrt(1. - Mach**2)
+    print(lift.total[:,0], CL_vlm)
+    assert( lift.total.shape == (3,1) )
+    assert( state.conditions.aerodynamics.lift_breakdown.compressible_wings is lift.total )
+    assert( np.allclose(lift.total[:,0], CL_vlm, rtol=1e-3) )
+
+    # the Mach numbers must be subsonic
+    analysis = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    analysis.geometry = vehicle
+    analysis.training.Mach = np.array([0.5,1.2])
+    try:
+        analysis.initialize()
+        raise AssertionError('a supersonic training Mach number was accepted')
+    except ValueError:
+        pass
+
+    # the low fidelity analysis doesn't correct the surrogate for compressibility again
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+    lift = aerodynamics.process.compute.lift
+    for Mach, correction in [(None,1./np.sqrt(1. - 0.7**2)),(machs,1.),(None,1./np.sqrt(1. - 0.7**2))]:
+        lift.inviscid_wings.training.Mach = Mach
+        aerodynamics.initialize()
+        state.conditions.freestream.mach_number        = np.array([[0.7]])
+        state.conditions.aerodynamics.lift_coefficient = np.array([[0.5]])
+        CL = lift.compressible_wings(state,aerodynamics.settings,vehicle)
+        assert( np.allclose(CL, 0.5*correction) )
+
+    # and the supersonic analyses don't take it
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Supersonic_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.process.compute.lift.inviscid_wings.training.Mach = machs
+    try:
+        aerodynamics.initialize()
+        raise AssertionError('a Mach surrogate was corrected for compressibility again')
+    except ValueError:
+        pass
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
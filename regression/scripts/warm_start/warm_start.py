@@ -0,0 +1,97 @@
+# warm_start.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+""" sweeps the cruise distance of the B737 mission with and without a warm start
+    store and checks that the solutions match with fewer residual evaluations
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import copy
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    configs, analyses = mission_B737.full_setup()
+    
+    mission_B737.simple_sizing(configs, analyses)
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    mission   = analyses.missions.base
+    guesses   = [copy.deepcopy(segment.state.unknowns) for segment in mission.segments.values()]
+    distances = np.array([3000., 3500., 3100.]) * Units.km
+    
+    # cold solves
+    cold_masses, cold_evaluations = sweep(mission,guesses,distances)
+    
+    # warm solves, the design point is the cruise distance
+    store = SUAVE.Analyses.Mission.Segments.Conditions.Warm_Start()
+    for segment in mission.segments.values():
+        segment.state.numerics.warm_start = store
+        
+    warm_masses, warm_evaluations = sweep(mission,guesses,distances,store)
+    
+    print('cold evaluations :', cold_evaluations)
+    print('warm evaluations :', warm_evaluations)
+    
+    error = np.max(np.abs(warm_masses - cold_masses)/cold_masses)
+    print('landing mass error :', error)
+    assert( error < 1e-6 )
+    
+    # the first solve has nothing stored, the rest take far fewer evaluations
+    assert( warm_evaluations[0] == cold_evaluations[0] )
+    assert( np.sum(warm_evaluations[1:]) < 0.5 * np.sum(cold_evaluations[1:]) )
+    
+    # the nearest design point is used
+    store.design_point = np.array([3050. * Units.km])
+    entry = store.nearest('cruise',len(mission.segments.cruise.state.unknowns.pack_array()))
+    assert( entry.design_point[0] == 3000. * Units.km )
+    
+    # entries are kept by design point
+    assert( len(store.entries.cruise) == len(distances) )
+    
+    return
+
+def sweep(mission,guesses,distances,store=None):
+    
+    masses      = []
+    evaluations = []
+    
+    for distance in distances:
+        
+        # every solve starts from the user guesses, like a new mission
+        for segment,guess in zip(mission.segments.values(),guesses):
+            segment.state.unknowns = copy.deepcopy(guess)
+        
+        mission.segments.cruise.distance = distance
+        if store is not None:
+            store.design_point = np.array([distance])
+        
+        results = mission.evaluate()
+        
+        masses.append(results.segments[-1].conditions.weights.total_mass[-1,0])
+        evaluations.append(np.sum([segment.state.numerics.residual_evaluations for segment in results.segments.values()]))
+        
+    return np.array(masses), np.array(evaluations)
+    
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@
 # Created:  Apr 2017, M. Clarke 
 # Modified: Jan 2018, W. Maier
 #           Oct 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,10 +22,13 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_jobs         import run_parallel_analysis
+from SUAVE.Methods.Aerodynamics.AVL.training_store   import avl_training_store
 from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+from SUAVE.Methods.Utilities.Surrogates              import predict_surrogate, build_grid_surrogate
 
 # Package imports
 import time
@@ -83,6 +87,7 @@ class AVL_Inviscid(Aerodynamics):
         self.settings.filenames.err_filename = sys.stderr        
         self.settings.spanwise_vortices      = None 
         self.settings.chordwise_vortices     = None         
+        self.settings.surrogate_type         = 'gaussian' # or 'grid'
         
         # Conditions table, used for surrogate model training
         self.training                        = Data()   
@@ -180,16 +185,10 @@ class AVL_Inviscid(Aerodynamics):
         drag_model    = surrogates.drag_coefficient
         e_model       = surrogates.span_efficiency_factor
         
-        # Inviscid lift
-        data_len        = len(AoA)
-        inviscid_lift   = np.zeros([data_len,1])
-        inviscid_drag   = np.zeros([data_len,1])    
-        span_efficiency = np.zeros([data_len,1]) 
-        
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii]   = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])])  
-            inviscid_drag[ii]   = drag_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            span_efficiency[ii] = e_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
+        # Inviscid lift, all the points at once
+        inviscid_lift   = predict_surrogate(lift_model,[AoA,mach])
+        inviscid_drag   = predict_surrogate(drag_model,[AoA,mach])
+        span_efficiency = predict_surrogate(e_model,[AoA,mach])
         
         # Store inviscid lift results     
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()    
@@ -231,6 +230,8 @@ class AVL_Inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.number_of_workers (concurrent AVL runs)
+        self.settings.training_cache_directory (optional - store of computed points)
         """          
         # Unpack 
         geometry = self.geometry
@@ -246,30 +247,59 @@ class AVL_Inviscid(Aerodynamics):
         # Calculate aerodynamics for table
         table_size = len(AoA)*len(mach)
         xy         = np.zeros([table_size,2])  
-        count      = 0
         time0      = time.time()
         
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
-                xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
+                xy[i*len(AoA)+j,:] = np.array([AoA[j],mach[i]])
+                
+        # Reuse the points already in the training store
+        store   = avl_training_store(self,'inviscid')
+        samples = [store.load(point) for point in xy]
+        
+        all_conditions = []
+        all_rows       = []
         for j,_ in enumerate(mach):
+            rows = [row for row in range(j*len(AoA),(j+1)*len(AoA)) if samples[row] is None]
+            if not rows:
+                continue
+            
             # Set training conditions
             run_conditions = Aerodynamics()
             run_conditions.weights.total_mass           = 0     # Currently set to zero. Used for dynamic analysis which is under development
             run_conditions.freestream.density           = 0     # Density not used in inviscid computation therefore set to zero. Used for dynamic analysis which is under development
             run_conditions.freestream.gravity           = 9.81        
-            run_conditions.aerodynamics.angle_of_attack = AoA 
+            run_conditions.aerodynamics.angle_of_attack = xy[rows,0]
             run_conditions.freestream.mach_number       = mach[j]
+            all_conditions.append(run_conditions)
+            all_rows.append(rows)
             
-            #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions)
+        # Run the Mach numbers concurrently, each in its own folder
+        if self.settings.number_of_workers > 1 and not self.regression_flag:
+            all_results = run_parallel_analysis(self,all_conditions)
+        else:
+            all_results = None
             
-            # Obtain CD , CL and e  
-            CL[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.lift_coefficient[:,0]
-            CD[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.drag_breakdown.induced.total[:,0]      
-            e[count*len(mach):(count+1)*len(mach),0]    = results.aerodynamics.drag_breakdown.induced.efficiency_factor[:,0]  
+        for k, rows in enumerate(all_rows):
+            # Run the missing angles of attack of each Mach number
+            if all_results is None:
+                results = self.evaluate_conditions(all_conditions[k])
+            else:
+                results = all_results[k]
             
-            count += 1
+            # Obtain CD , CL and e  
+            for n, row in enumerate(rows):
+                sample = Data()
+                sample.lift_coefficient  = results.aerodynamics.lift_coefficient[n,0]
+                sample.drag_coefficient  = results.aerodynamics.drag_breakdown.induced.total[n,0]
+                sample.efficiency_factor = results.aerodynamics.drag_breakdown.induced.efficiency_factor[n,0]
+                store.save(xy[row],sample)
+                samples[row] = sample
+                
+        for row, sample in enumerate(samples):
+            CL[row,0] = sample.lift_coefficient
+            CD[row,0] = sample.drag_coefficient
+            e[row,0]  = sample.efficiency_factor
         
         time1 = time.time()
         
@@ -314,7 +344,7 @@ class AVL_Inviscid(Aerodynamics):
           span_efficiency_factor <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.surrogate_type
         """   
         # Unpack data
         training                         = self.training
@@ -325,14 +355,20 @@ class AVL_Inviscid(Aerodynamics):
         e_data                           = training.coefficients[:,2]
         xy                               = training.grid_points 
         
-        # Gaussian Process New
-        regr_cl                          = gaussian_process.GaussianProcessRegressor()
-        regr_cd                          = gaussian_process.GaussianProcessRegressor()
-        regr_e                           = gaussian_process.GaussianProcessRegressor()
-        
-        cl_surrogate                     = regr_cl.fit(xy, CL_data)
-        cd_surrogate                     = regr_cd.fit(xy, CD_data)
-        e_surrogate                      = regr_e.fit(xy, e_data)
+        if self.settings.surrogate_type == 'grid':
+            # Monotone cubic interpolation on the training grid
+            cl_surrogate                 = build_grid_surrogate(xy, CL_data)
+            cd_surrogate                 = build_grid_surrogate(xy, CD_data)
+            e_surrogate                  = build_grid_surrogate(xy, e_data)
+        else:
+            # Gaussian Process New
+            regr_cl                      = gaussian_process.GaussianProcessRegressor()
+            regr_cd                      = gaussian_process.GaussianProcessRegressor()
+            regr_e                       = gaussian_process.GaussianProcessRegressor()
+            
+            cl_surrogate                 = regr_cl.fit(xy, CL_data)
+            cd_surrogate                 = regr_cd.fit(xy, CD_data)
+            e_surrogate                  = regr_e.fit(xy, e_data)
         
         self.surrogates.lift_coefficient = cl_surrogate
         self.surrogates.drag_coefficient = cd_surrogate
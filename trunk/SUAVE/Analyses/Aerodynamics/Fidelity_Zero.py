@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -75,6 +76,7 @@ class Fidelity_Zero(Markup):
         settings.drag_coefficient_increment         = 0.0000
         settings.spoiler_drag_increment             = 0.00 
         settings.maximum_lift_coefficient           = np.inf 
+        settings.lift_includes_compressibility      = False
         
         # vortex lattice configurations
         settings.number_panels_spanwise  = 5
@@ -126,7 +128,8 @@ class Fidelity_Zero(Markup):
         """Initializes the surrogate needed for lift calculation.
 
         Assumptions:
-        None
+        A lift surrogate trained on Mach numbers includes compressibility, so the
+        compressibility correction of the lift leaves it as it is
 
         Source:
         N/A
@@ -135,12 +138,16 @@ class Fidelity_Zero(Markup):
         None
 
         Outputs:
-        None
+        self.settings.lift_includes_compressibility [-]
 
         Properties Used:
         self.geometry
         """                  
-        self.process.compute.lift.inviscid_wings.geometry = self.geometry
-        self.process.compute.lift.inviscid_wings.initialize()
+        lift = self.process.compute.lift
+        self.settings.lift_includes_compressibility = isinstance(lift.inviscid_wings,Vortex_Lattice) \
+            and lift.inviscid_wings.training.Mach is not None
+        
+        lift.inviscid_wings.geometry = self.geometry
+        lift.inviscid_wings.initialize()
         
     finalize = initialize
\ No newline at end of file
@@ -2,7 +2,7 @@
 # Lifting_Line.py
 # 
 # Created:  Aug 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -181,28 +181,19 @@ class Lifting_Line(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
-        
-        wing_CLs = Data.fromkeys(geometry.wings.keys(), np.zeros_like(AoA))
-        # The above performs the function of:
-        #wing_CLs = Data() 
-        #for wing in geometry.wings.values():
-        #    wing_CLs[wing.tag] = np.zeros_like(AoA)
 
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
+        konditions.aerodynamics.angle_of_attack = AoA
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts = calculate_lift_lifting_line(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+        # calculate aerodynamics for table, all angles at once
+        CL, wing_lifts = calculate_lift_lifting_line(konditions, settings, geometry)
+        
+        CL       = CL * np.ones_like(AoA)
+        wing_CLs = Data()
+        for wing in geometry.wings.values():
+            wing_CLs[wing.tag] = wing_lifts[wing.tag] * np.ones_like(AoA)
 
         # store training data
         training.lift_coefficient = CL
@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,12 +15,15 @@ from SUAVE.Core import Data, Units
 
 # Local imports
 from .Aerodynamics import Aerodynamics
-from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
+from SUAVE.Input_Output.SU2.run_SU2_cases import run_SU2_cases, run_SU2_case
+from SUAVE.Methods.Utilities.Surrogates import predict_surrogate, build_grid_surrogate, \
+     Training_Store, training_key, file_digest
 from sklearn.gaussian_process.kernels import ExpSineSquared
 
 # Package imports
 import numpy as np
+import os
 import time
 import pylab as plt
 import sklearn
@@ -66,6 +70,13 @@ class SU2_inviscid(Aerodynamics):
         self.settings.parallel           = False
         self.settings.processors         = 1
         self.settings.maximum_iterations = 1500
+        self.settings.surrogate_type     = 'gaussian' # or 'grid'
+        self.settings.training_cache_directory = None # persistent samples, one entry per training point
+        self.settings.concurrent_cases   = 1 # cases run at once, each in its own folder, sharing the processors
+        self.settings.SU2_binary         = 'SU2_CFD'
+        self.settings.mpi_command        = ['mpirun','-np']
+        self.settings.run_folder         = 'SU2_cases'
+        self.settings.case_timeout       = None # seconds
 
         # Conditions table, used for surrogate model training
         self.training = Data()        
@@ -136,11 +147,9 @@ class SU2_inviscid(Aerodynamics):
         lift_model = surrogates.lift_coefficient
         drag_model = surrogates.drag_coefficient
         
-        # Inviscid lift
+        # Inviscid lift, all the points at once
         data_len = len(AoA)
-        inviscid_lift = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii] = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])]) #sklearn fix
+        inviscid_lift = predict_surrogate(lift_model,[AoA,mach])
             
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_lift
@@ -177,6 +186,8 @@ class SU2_inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.training_cache_directory (optional - store of computed points)
+        self.settings.concurrent_cases (SU2 runs at once, see run_SU2_cases)
         """               
         # Unpack
         geometry = self.geometry
@@ -188,10 +199,6 @@ class SU2_inviscid(Aerodynamics):
         CL   = np.zeros([len(AoA)*len(mach),1])
         CD   = np.zeros([len(AoA)*len(mach),1])
 
-        # Condition input, local, do not keep (k is used to avoid confusion)
-        konditions              = Data()
-        konditions.aerodynamics = Data()
-
         if self.training_file is None:
             # Calculate aerodynamics for table
             table_size = len(AoA)*len(mach)
@@ -200,14 +207,11 @@ class SU2_inviscid(Aerodynamics):
             time0 = time.time()
             for i,_ in enumerate(AoA):
                 for j,_ in enumerate(mach):
-                    
                     xy[count,:] = np.array([AoA[i],mach[j]])
-                    # Set training conditions
-                    konditions.aerodynamics.angle_of_attack = AoA[i]
-                    konditions.aerodynamics.mach            = mach[j]
-                    
-                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
                     count += 1
+                    
+            # Run the points that are not in the training store
+            CL, CD = sample_SU2(xy, settings, geometry)
             
             time1 = time.time()
             
@@ -229,10 +233,12 @@ class SU2_inviscid(Aerodynamics):
         return
 
     def build_surrogate(self):
-        """Builds a surrogate based on sample evalations using a Guassian process.
+        """Builds a surrogate based on sample evalations using a Guassian process,
+        or a tensor product interpolant with settings.surrogate_type = 'grid'.
 
         Assumptions:
-        None
+        The grid surrogate falls back to radial basis functions if the training
+        points are not a rectilinear grid
 
         Source:
         N/A
@@ -248,7 +254,7 @@ class SU2_inviscid(Aerodynamics):
           drag_coefficient <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.surrogate_type
         """  
         # Unpack data
         training  = self.training
@@ -259,12 +265,17 @@ class SU2_inviscid(Aerodynamics):
         xy        = training.grid_points 
         
               
-        # Gaussian Process New
-        gp_kernel_ES = ExpSineSquared(length_scale=1.0, periodicity=1.0, length_scale_bounds=(1e-5,1e5), periodicity_bounds=(1e-5,1e5))
-        regr_cl = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_ES)
-        regr_cd = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_ES)
-        cl_surrogate = regr_cl.fit(xy, CL_data)
-        cd_surrogate = regr_cd.fit(xy, CD_data)  
+        if self.settings.surrogate_type == 'grid':
+            # Monotone cubic interpolation on the training grid
+            cl_surrogate = build_grid_surrogate(xy, CL_data)
+            cd_surrogate = build_grid_surrogate(xy, CD_data)
+        else:
+            # Gaussian Process New
+            gp_kernel_ES = ExpSineSquared(length_scale=1.0, periodicity=1.0, length_scale_bounds=(1e-5,1e5), periodicity_bounds=(1e-5,1e5))
+            regr_cl = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_ES)
+            regr_cd = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_ES)
+            cl_surrogate = regr_cl.fit(xy, CL_data)
+            cd_surrogate = regr_cd.fit(xy, CD_data)  
         
         # KNN
         #regr_cl = neighbors.KNeighborsRegressor(n_neighbors=1,weights='distance')
@@ -288,13 +299,8 @@ class SU2_inviscid(Aerodynamics):
         
         AoA_mesh,mach_mesh = np.meshgrid(AoA_points,mach_points)
         
-        CL_sur = np.zeros(np.shape(AoA_mesh))
-        CD_sur = np.zeros(np.shape(AoA_mesh))        
-        
-        for jj in range(len(AoA_points)):
-            for ii in range(len(mach_points)):
-                CL_sur[ii,jj] = cl_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])
-                CD_sur[ii,jj] = cd_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])  #sklearn fix        
+        CL_sur = np.reshape(predict_surrogate(cl_surrogate,[AoA_mesh,mach_mesh]),np.shape(AoA_mesh))
+        CD_sur = np.reshape(predict_surrogate(cd_surrogate,[AoA_mesh,mach_mesh]),np.shape(AoA_mesh))
 
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
@@ -340,6 +346,8 @@ def call_SU2(conditions,settings,geometry):
       parallel           <boolean>
       processors         [-]
       maximum_iterations [-]
+      SU2_binary         <string>
+      mpi_command        list of the MPI launcher and its process count flag
     geometry.
       tag
       reference_area     [m^2]
@@ -352,25 +360,147 @@ def call_SU2(conditions,settings,geometry):
     N/A
     """      
 
-    half_mesh_flag = settings.half_mesh_flag
     tag            = geometry.tag
-    parallel       = settings.parallel
-    processors     = settings.processors 
-    iters          = settings.maximum_iterations
     
-    SU2_settings = Data()
-    if half_mesh_flag == False:
-        SU2_settings.reference_area  = geometry.reference_area
-    else:
-        SU2_settings.reference_area  = geometry.reference_area/2.
-    SU2_settings.mach_number     = conditions.aerodynamics.mach
-    SU2_settings.angle_of_attack = conditions.aerodynamics.angle_of_attack / Units.deg
-    SU2_settings.maximum_iterations = iters
+    SU2_settings = SU2_case_settings(conditions.aerodynamics.angle_of_attack,conditions.aerodynamics.mach,settings,geometry)
     
     # Build SU2 configuration file
     write_SU2_cfg(tag, SU2_settings)
     
     # Run SU2
-    CL, CD = call_SU2_CFD(tag,parallel,processors)
+    CL, CD = run_SU2_case(tag,settings)
         
     return CL, CD
+
+def SU2_training_store(settings,geometry):
+    """Opens the training store of an SU2 analysis, keyed by the mesh and the settings
+    written to the configuration file.
+
+    Assumptions:
+    The mesh is <tag>.su2 in the working directory. Without it the store is disabled.
+
+    Source:
+    N/A
+
+    Inputs:
+    settings.
+      training_cache_directory <string> None disables the store
+      half_mesh_flag     <boolean>
+      maximum_iterations [-]
+    geometry.
+      tag
+      reference_area     [m^2]
+
+    Outputs:
+    store                <Training_Store>
+
+    Properties Used:
+    N/A
+    """
+
+    store     = Training_Store()
+    directory = settings.training_cache_directory
+    mesh      = geometry.tag + '.su2'
+    if directory is None or not os.path.isfile(mesh):
+        return store
+
+    store.directory = directory
+    store.key       = training_key('SU2_CFD',file_digest(mesh),settings.half_mesh_flag,
+                                   geometry.reference_area,settings.maximum_iterations)
+
+    return store
+
+def SU2_case_settings(AoA,mach,settings,geometry):
+    """Sets the configuration of one SU2 case.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    AoA                  [radians]
+    mach                 [-]
+    settings.
+      half_mesh_flag     <boolean> Determines if a symmetry plane is used
+      maximum_iterations [-]
+    geometry.
+      reference_area     [m^2]
+
+    Outputs:
+    SU2_settings         see write_SU2_cfg
+
+    Properties Used:
+    N/A
+    """
+
+    SU2_settings = Data()
+    if settings.half_mesh_flag == False:
+        SU2_settings.reference_area  = geometry.reference_area
+    else:
+        SU2_settings.reference_area  = geometry.reference_area/2.
+    SU2_settings.mach_number        = mach
+    SU2_settings.angle_of_attack    = AoA / Units.deg
+    SU2_settings.maximum_iterations = settings.maximum_iterations
+
+    return SU2_settings
+
+def sample_SU2(xy,settings,geometry):
+    """Runs SU2 at the training points that are not in the training store, one
+    case at a time or several at once with settings.concurrent_cases. Each result
+    is stored as soon as its case finishes.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    xy                   [radians,-] angles of attack and mach numbers
+    settings             see call_SU2, run_SU2_cases and SU2_training_store
+    geometry.
+      tag
+      reference_area     [m^2]
+
+    Outputs:
+    CL                   [-]
+    CD                   [-]
+
+    Properties Used:
+    N/A
+    """
+
+    store   = SU2_training_store(settings,geometry)
+    CL      = np.zeros([len(xy),1])
+    CD      = np.zeros([len(xy),1])
+    missing = []
+
+    for row, point in enumerate(xy):
+        sample = store.load(point)
+        if sample is None:
+            missing.append(row)
+        else:
+            CL[row], CD[row] = sample.lift_coefficient, sample.drag_coefficient
+
+    def finished(index,coefficients):
+        row    = missing[index]
+        sample = Data()
+        sample.lift_coefficient, sample.drag_coefficient = coefficients
+        store.save(xy[row],sample)
+        CL[row], CD[row] = coefficients
+
+    if settings.concurrent_cases > 1:
+        cases = [SU2_case_settings(xy[row,0],xy[row,1],settings,geometry) for row in missing]
+        run_SU2_cases(geometry.tag,cases,settings,finished)
+    else:
+        # Condition input, local, do not keep (k is used to avoid confusion)
+        konditions              = Data()
+        konditions.aerodynamics = Data()
+        for index, row in enumerate(missing):
+            konditions.aerodynamics.angle_of_attack = xy[row,0]
+            konditions.aerodynamics.mach            = xy[row,1]
+            finished(index,call_SU2(konditions,settings,geometry))
+
+    return CL, CD
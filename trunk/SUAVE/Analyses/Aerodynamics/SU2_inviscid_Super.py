@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,8 +15,10 @@ from SUAVE.Core import Data, Units
 
 # Local imports
 from .Aerodynamics import Aerodynamics
-from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
+from SUAVE.Input_Output.SU2.run_SU2_cases import run_SU2_case
+from SUAVE.Methods.Utilities.Surrogates import predict_surrogate, build_grid_surrogate
+from .SU2_inviscid import sample_SU2
 
 # Package imports
 import numpy as np
@@ -65,6 +68,13 @@ class SU2_inviscid_Super(Aerodynamics):
         self.settings.parallel           = False
         self.settings.processors         = 1
         self.settings.maximum_iterations = 1500
+        self.settings.surrogate_type     = 'gaussian' # or 'grid'
+        self.settings.training_cache_directory = None # persistent samples, one entry per training point
+        self.settings.concurrent_cases   = 1 # cases run at once, each in its own folder, sharing the processors
+        self.settings.SU2_binary         = 'SU2_CFD'
+        self.settings.mpi_command        = ['mpirun','-np']
+        self.settings.run_folder         = 'SU2_cases'
+        self.settings.case_timeout       = None # seconds
 
         # Conditions table, used for surrogate model training
         self.training = Data()        
@@ -136,14 +146,15 @@ class SU2_inviscid_Super(Aerodynamics):
         lift_model_sup = surrogates.lift_coefficient_supersonic
         drag_model = surrogates.drag_coefficient
         
-        # Inviscid lift
+        # Inviscid lift, all the subsonic points and all the supersonic points at once
         data_len = len(AoA)
         inviscid_lift = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            if mach[ii][0] <= 1.:
-                inviscid_lift[ii] = lift_model_sub.predict(np.array([AoA[ii][0],mach[ii][0]]))
-            else:
-                inviscid_lift[ii] = lift_model_sup.predict(np.array([AoA[ii][0],mach[ii][0]]))
+        sub = mach[:,0] <= 1.
+        sup = np.logical_not(sub)
+        if np.any(sub):
+            inviscid_lift[sub] = predict_surrogate(lift_model_sub,[AoA[sub],mach[sub]])
+        if np.any(sup):
+            inviscid_lift[sup] = predict_surrogate(lift_model_sup,[AoA[sup],mach[sup]])
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_lift
         state.conditions.aerodynamics.lift_coefficient                   = inviscid_lift
         state.conditions.aerodynamics.lift_breakdown.compressible_wings  = inviscid_lift
@@ -180,6 +191,8 @@ class SU2_inviscid_Super(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.training_cache_directory (optional - store of computed points)
+        self.settings.concurrent_cases (SU2 runs at once, see run_SU2_cases)
         """                
         # Unpack
         geometry = self.geometry
@@ -191,10 +204,6 @@ class SU2_inviscid_Super(Aerodynamics):
         CL   = np.zeros([len(AoA)*len(mach),1])
         CD   = np.zeros([len(AoA)*len(mach),1])
 
-        # Condition input, local, do not keep (k is used to avoid confusion)
-        konditions              = Data()
-        konditions.aerodynamics = Data()
-
         if self.training_file is None:
             # Calculate aerodynamics for table
             table_size = len(AoA)*len(mach)
@@ -203,14 +212,11 @@ class SU2_inviscid_Super(Aerodynamics):
             time0 = time.time()
             for i,_ in enumerate(AoA):
                 for j,_ in enumerate(mach):
-                    
                     xy[count,:] = np.array([AoA[i],mach[j]])
-                    # Set training conditions
-                    konditions.aerodynamics.angle_of_attack = AoA[i]
-                    konditions.aerodynamics.mach            = mach[j]
-                    
-                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
                     count += 1
+                    
+            # Run the points that are not in the training store
+            CL, CD = sample_SU2(xy, settings, geometry)
             
             time1 = time.time()
             
@@ -232,10 +238,12 @@ class SU2_inviscid_Super(Aerodynamics):
         return
 
     def build_surrogate(self):
-        """Builds a surrogate based on sample evalations using a Guassian process.
+        """Builds a surrogate based on sample evalations using a Guassian process,
+        or a tensor product interpolant with settings.surrogate_type = 'grid'.
 
         Assumptions:
-        None
+        The grid surrogate falls back to radial basis functions if the training
+        points are not a rectilinear grid
 
         Source:
         N/A
@@ -251,7 +259,7 @@ class SU2_inviscid_Super(Aerodynamics):
           drag_coefficient <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.surrogate_type
         """  
         # Unpack data
         training  = self.training
@@ -261,15 +269,21 @@ class SU2_inviscid_Super(Aerodynamics):
         CD_data   = training.coefficients[:,1]
         xy        = training.grid_points 
         
-        import pyKriging
-        
-        # Gaussian Process New
-        regr_cl_sup = gaussian_process.GaussianProcess()
-        regr_cl_sub = gaussian_process.GaussianProcess()
-        cl_surrogate_sup = regr_cl_sup.fit(xy[xy[:,1]>=1.], CL_data[xy[:,1]>=1.])
-        cl_surrogate_sub = regr_cl_sub.fit(xy[xy[:,1]<=1.], CL_data[xy[:,1]<=1.])  
-        regr_cd = gaussian_process.GaussianProcess()
-        cd_surrogate = regr_cd.fit(xy, CD_data)        
+        if self.settings.surrogate_type == 'grid':
+            # Monotone cubic interpolation on the training grid
+            cl_surrogate_sup = build_grid_surrogate(xy[xy[:,1]>=1.], CL_data[xy[:,1]>=1.])
+            cl_surrogate_sub = build_grid_surrogate(xy[xy[:,1]<=1.], CL_data[xy[:,1]<=1.])
+            cd_surrogate     = build_grid_surrogate(xy, CD_data)
+        else:
+            import pyKriging
+            
+            # Gaussian Process New
+            regr_cl_sup = gaussian_process.GaussianProcess()
+            regr_cl_sub = gaussian_process.GaussianProcess()
+            cl_surrogate_sup = regr_cl_sup.fit(xy[xy[:,1]>=1.], CL_data[xy[:,1]>=1.])
+            cl_surrogate_sub = regr_cl_sub.fit(xy[xy[:,1]<=1.], CL_data[xy[:,1]<=1.])  
+            regr_cd = gaussian_process.GaussianProcess()
+            cd_surrogate = regr_cd.fit(xy, CD_data)        
         
         # Gaussian Process New
         #regr_cl = gaussian_process.GaussianProcessRegressor()
@@ -301,16 +315,11 @@ class SU2_inviscid_Super(Aerodynamics):
         
         AoA_mesh,mach_mesh = np.meshgrid(AoA_points,mach_points)
         
-        CL_sur = np.zeros(np.shape(AoA_mesh))
-        CD_sur = np.zeros(np.shape(AoA_mesh))        
-        
-        for jj in range(len(AoA_points)):
-            for ii in range(len(mach_points)):
-                if mach_mesh[ii,jj] >= 1. :
-                    CL_sur[ii,jj] = cl_surrogate_sup.predict(np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]]))
-                else:
-                    CL_sur[ii,jj] = cl_surrogate_sub.predict(np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]]))
-                CD_sur[ii,jj] = cd_surrogate.predict(np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]]))
+        shape  = np.shape(AoA_mesh)
+        CL_sub = np.reshape(predict_surrogate(cl_surrogate_sub,[AoA_mesh,mach_mesh]),shape)
+        CL_sup = np.reshape(predict_surrogate(cl_surrogate_sup,[AoA_mesh,mach_mesh]),shape)
+        CL_sur = np.where(mach_mesh >= 1.,CL_sup,CL_sub)
+        CD_sur = np.reshape(predict_surrogate(cd_surrogate,[AoA_mesh,mach_mesh]),shape)
         
 
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
@@ -357,6 +366,8 @@ def call_SU2(conditions,settings,geometry):
       parallel           <boolean>
       processors         [-]
       maximum_iterations [-]
+      SU2_binary         <string>
+      mpi_command        list of the MPI launcher and its process count flag
     geometry.
       tag
       reference_area     [m^2]
@@ -371,8 +382,6 @@ def call_SU2(conditions,settings,geometry):
 
     half_mesh_flag = settings.half_mesh_flag
     tag            = geometry.tag
-    parallel       = settings.parallel
-    processors     = settings.processors 
     iters          = settings.maximum_iterations
     
     SU2_settings = Data()
@@ -388,6 +397,6 @@ def call_SU2(conditions,settings,geometry):
     write_SU2_cfg(tag, SU2_settings)
     
     # Run SU2
-    CL, CD = call_SU2_CFD(tag,parallel,processors)
+    CL, CD = run_SU2_case(tag,settings)
         
     return CL, CD
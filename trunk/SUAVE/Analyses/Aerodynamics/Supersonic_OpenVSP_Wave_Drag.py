@@ -3,6 +3,7 @@
 # 
 # Created:            T. MacDonald
 # Modified: Apr 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -68,6 +69,7 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         settings.maximum_lift_coefficient           = np.inf
         settings.number_slices                      = 20
         settings.number_rotations                   = 10
+        settings.wave_drag_mach_tolerance           = 0.005
         
         # vortex lattice configurations
         settings.number_panels_spanwise = 5
@@ -107,7 +109,8 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         """Initializes the surrogate needed for lift calculation and removes old volume drag data files.
 
         Assumptions:
-        None
+        The lift surrogate is not trained on Mach numbers, as the compressibility
+        correction of the lift covers supersonic flow
 
         Source:
         N/A
@@ -124,11 +127,16 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         import os
         
         # Remove old volume drag data so that new data can be appended without issues
+        VSP_Methods.clear_wave_drag_cache(self.geometry.tag)
         try:
             os.remove('volume_drag_data_' + self.geometry.tag + '.npy')  
         except:
             pass
         
+        inviscid_wings = self.process.compute.lift.inviscid_wings
+        if isinstance(inviscid_wings,Vortex_Lattice) and inviscid_wings.training.Mach is not None:
+            raise ValueError('The lift surrogate is trained on Mach numbers, which this analysis corrects for itself')
+        
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
         self.process.compute.lift.inviscid_wings.initialize()
         
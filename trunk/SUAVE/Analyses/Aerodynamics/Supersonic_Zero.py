@@ -3,6 +3,7 @@
 # 
 # Created:            T. MacDonald
 # Modified: Nov 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 #
 # Based on Fidelity_Zero
 
@@ -108,7 +109,8 @@ class Supersonic_Zero(Markup):
         """Initializes the surrogate needed for lift calculation.
 
         Assumptions:
-        None
+        The lift surrogate is not trained on Mach numbers, as the compressibility
+        correction of the lift covers supersonic flow
 
         Source:
         N/A
@@ -122,6 +124,10 @@ class Supersonic_Zero(Markup):
         Properties Used:
         self.geometry
         """            
+        inviscid_wings = self.process.compute.lift.inviscid_wings
+        if isinstance(inviscid_wings,Vortex_Lattice) and inviscid_wings.training.Mach is not None:
+            raise ValueError('The lift surrogate is trained on Mach numbers, which this analysis corrects for itself')
+        
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
         self.process.compute.lift.inviscid_wings.initialize()
         
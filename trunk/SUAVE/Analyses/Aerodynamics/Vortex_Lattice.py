@@ -6,6 +6,7 @@
 #           Feb 2016, A. Wendorff
 #           Apr 2017, T. MacDonald
 #           Nov 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -18,7 +19,8 @@ import SUAVE
 from SUAVE.Core import Data
 from SUAVE.Core import Units
 
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice, weissinger_vortex_lattice_batch
+from SUAVE.Methods.Utilities.Surrogates import Grid_Surrogate, training_key, load_training_data, save_training_data
 
 # local imports
 from .Aerodynamics import Aerodynamics
@@ -35,7 +37,13 @@ class Vortex_Lattice(Aerodynamics):
     """This builds a surrogate and computes lift using a basic vortex lattice.
 
     Assumptions:
-    None
+    The surrogate is linear in angle of attack, unless training.Mach is set. Then the
+    vortex lattice is sampled on an (angle of attack, Mach) grid, compressibility is
+    included and the surrogate is interpolated on the grid. The Mach numbers must be
+    subsonic. Fidelity_Zero then leaves the lift as it is in its compressibility correction.
+
+    Samples are reused while the geometry and settings don't change, and are stored
+    on disk when settings.training_cache_directory is set.
 
     Source:
     None
@@ -74,11 +82,16 @@ class Vortex_Lattice(Aerodynamics):
 
         # vortex lattice configurations
         self.settings.number_panels_spanwise = 5
+        
+        # directory of stored training data, None to always sample
+        self.settings.training_cache_directory = None
 
         # conditions table, used for surrogate model training
         self.training = Data()        
         self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
+        self.training.Mach             = None
         self.training.lift_coefficient = None
+        self.training.keys             = Data()
         
         # surrogoate models
         self.surrogates = Data()
@@ -122,12 +135,14 @@ class Vortex_Lattice(Aerodynamics):
         Inputs:
         state.conditions.
           freestream.dynamics_pressure       [-]
+          freestream.mach_number             [-] (only with a Mach surrogate)
           angle_of_attack                    [radians]
 
         Outputs:
         conditions.aerodynamics.lift_breakdown.
           inviscid_wings_lift[wings.*.tag]   [-] CL (wing specific)
           inviscid_wings_lift.total          [-] CL
+          compressible_wings                 [-] CL (only with a Mach surrogate)
         conditions.aerodynamics.
           lift_coefficient_wing              [-] CL (wing specific)
         inviscid_wings_lift                  [-] CL
@@ -162,18 +177,28 @@ class Vortex_Lattice(Aerodynamics):
         
         wings_lift_model = surrogates.lift_coefficient
         
+        # inputs of the surrogates
+        if self.training.Mach is None:
+            inputs = (AoA,)
+        else:
+            inputs = (AoA,conditions.freestream.mach_number)
+        
         # inviscid lift of wings only
         inviscid_wings_lift                                              = Data()
-        inviscid_wings_lift.total                                        = wings_lift_model(AoA)
+        inviscid_wings_lift.total                                        = wings_lift_model(*inputs)
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_wings_lift.total
         state.conditions.aerodynamics.lift_coefficient                   = inviscid_wings_lift.total
         
+        # compressibility is already in the surrogate
+        if self.training.Mach is not None:
+            conditions.aerodynamics.lift_breakdown.compressible_wings    = inviscid_wings_lift.total
+        
         # store model for lift coefficients of each wing
         state.conditions.aerodynamics.lift_coefficient_wing             = Data()        
         for wing in geometry.wings.keys():
             wings_lift_model = surrogates.wing_lift_coefficients[wing]
-            inviscid_wings_lift[wing] = wings_lift_model(AoA)
+            inviscid_wings_lift[wing] = wings_lift_model(*inputs)
             conditions.aerodynamics.lift_breakdown.inviscid_wings_lift[wing] = inviscid_wings_lift[wing]
             state.conditions.aerodynamics.lift_coefficient_wing[wing]        = inviscid_wings_lift[wing]
 
@@ -184,7 +209,8 @@ class Vortex_Lattice(Aerodynamics):
         """Call methods to run vortex lattice for sample point evaluation.
 
         Assumptions:
-        None
+        The influence matrix of each wing is factored once for all the samples
+        Each wing is only sampled again if its geometry, the settings or the grid changed
 
         Source:
         N/A
@@ -196,42 +222,65 @@ class Vortex_Lattice(Aerodynamics):
         self.training.
           lift_coefficient            [-] 
           wing_lift_coefficients      [-] (wing specific)
+          keys                        <string> hash of each wing's samples
 
         Properties Used:
-        self.geometry.wings.*.tag
-        self.settings                 (passed to calculate vortex lattice)
-        self.training.angle_of_attack [radians]
+        self.geometry.
+          reference_area              [m^2]
+          wings.*                     (passed to calculate vortex lattice)
+        self.settings.
+          number_panels_spanwise      [-]
+          training_cache_directory    <string>
+        self.training.
+          angle_of_attack             [radians]
+          Mach                        [-]
         """        
         # unpack
-        geometry = self.geometry
-        settings = self.settings
-        training = self.training
+        geometry  = self.geometry
+        settings  = self.settings
+        training  = self.training
+        directory = settings.training_cache_directory
+        
+        AoA  = np.array(training.angle_of_attack,dtype=float).ravel()
+        Mach = training.Mach
+        if Mach is not None:
+            Mach = np.array(Mach,dtype=float).ravel()
+            if np.any(Mach >= 1.) or np.any(Mach < 0.):
+                raise ValueError('The Mach numbers of the vortex lattice training must be subsonic')
         
-        AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
+        if Mach is None:
+            shape = (len(AoA),)
+        else:
+            shape = (len(AoA),len(Mach))
+        
+        previous = training.get('wing_lift_coefficients',None) or Data()
+        keys     = Data()
+        wing_CLs = Data()
+        CL       = np.zeros(shape)
         
-        wing_CLs = Data() 
         for wing in geometry.wings.values():
-            wing_CLs[wing.tag] = np.zeros_like(AoA)
-
-        # condition input, local, do not keep
-        konditions              = Data()
-        konditions.aerodynamics = Data()
-
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
             
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
+            key = training_key('weissinger_vortex_lattice',wing_training_inputs(wing),
+                               settings.number_panels_spanwise,AoA,Mach)
             
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts = calculate_lift_vortex_lattice(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+            # reuse samples of this run, then of the cache, then run the vortex lattice
+            if training.keys.get(wing.tag,None) == key and wing.tag in previous:
+                wing_CL = previous[wing.tag]
+            else:
+                data = load_training_data(directory,key)
+                if data is None:
+                    data = sample_wing_vortex_lattice(AoA,Mach,settings,wing)
+                    save_training_data(directory,key,data)
+                wing_CL = data.lift_coefficient
+                
+            keys[wing.tag]     = key
+            wing_CLs[wing.tag] = wing_CL
+            CL = CL + wing_CL * wing.areas.reference / geometry.reference_area
 
         # store training data
-        training.lift_coefficient = CL
+        training.lift_coefficient       = CL
         training.wing_lift_coefficients = wing_CLs
+        training.keys                   = keys
 
         return
 
@@ -239,7 +288,7 @@ class Vortex_Lattice(Aerodynamics):
         """Build a surrogate using sample evaluation results.
 
         Assumptions:
-        None
+        Linear in angle of attack, or interpolated on the grid with a Mach surrogate
 
         Source:
         N/A
@@ -249,13 +298,14 @@ class Vortex_Lattice(Aerodynamics):
 
         Outputs:
         self.surrogates.
-          lift_coefficient       <np.poly1d>
-          wing_lift_coefficients <np.poly1d> (multiple surrogates)
+          lift_coefficient       <np.poly1d> or <Grid_Surrogate>
+          wing_lift_coefficients <np.poly1d> or <Grid_Surrogate> (multiple surrogates)
 
         Properties Used:
         self.
           training.
             angle_of_attack        [radians]
+            Mach                   [-]
             lift_coefficient       [-]
             wing_lift_coefficients [-] (wing specific)
         """        
@@ -264,6 +314,19 @@ class Vortex_Lattice(Aerodynamics):
         AoA_data = training.angle_of_attack
         CL_data  = training.lift_coefficient
         wing_CL_data = training.wing_lift_coefficients
+        
+        # tensor product interpolants on the (AoA, Mach) grid
+        if training.Mach is not None:
+            axes = [AoA_data,training.Mach]
+            
+            wing_cl_surrogates = Data()
+            for wing in wing_CL_data.keys():
+                wing_cl_surrogates[wing] = Grid_Surrogate().fit(axes,wing_CL_data[wing])
+                
+            self.surrogates.lift_coefficient       = Grid_Surrogate().fit(axes,CL_data)
+            self.surrogates.wing_lift_coefficients = wing_cl_surrogates
+            
+            return
 
         # pack for surrogate model
         X_data = np.array([AoA_data]).T
@@ -327,3 +390,117 @@ def calculate_lift_vortex_lattice(conditions,settings,geometry):
         wing_lifts[wing.tag] = wing_lift_coeff
 
     return total_lift_coeff, wing_lifts
+
+def sample_wing_vortex_lattice(angles,mach,settings,wing):
+    """Runs the vortex lattice of one wing on a grid of angles of attack and Mach numbers.
+
+    Assumptions:
+    Compressibility is included with the Prandtl-Glauert rule when Mach numbers are given
+
+    Source:
+    N/A
+
+    Inputs:
+    angles                          [radians]
+    mach                            [-] or None
+    settings                        (passed to vortex lattice method)
+    wing                            (passed to vortex lattice method)
+
+    Outputs:
+    data.
+      lift_coefficient              [-] of shape (angles,) or (angles,mach)
+      drag_coefficient              [-] of shape (angles,) or (angles,mach)
+
+    Properties Used:
+    N/A
+    """ 
+    
+    if mach is None:
+        CL, CD = weissinger_vortex_lattice_batch(angles,settings,wing)
+    else:
+        AoA, M = np.meshgrid(angles,mach,indexing='ij')
+        CL, CD = weissinger_vortex_lattice_batch(AoA.ravel(),settings,wing,M.ravel())
+        CL = np.reshape(CL,AoA.shape)
+        CD = np.reshape(CD,AoA.shape)
+    
+    data = Data()
+    data.lift_coefficient = np.array(CL,dtype=float)
+    data.drag_coefficient = np.array(CD,dtype=float)
+    
+    return data
+
+def wing_training_inputs(wing):
+    """Gathers the properties of a wing that the vortex lattice depends on, used to
+    identify its training samples.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    wing                            (see weissinger_vortex_lattice)
+
+    Outputs:
+    inputs                          <Data>
+
+    Properties Used:
+    N/A
+    """ 
+    
+    inputs = Data()
+    inputs.span            = wing.spans.projected
+    inputs.root_chord      = wing.chords.root
+    inputs.tip_chord       = wing.chords.tip
+    inputs.sweep           = wing.sweeps.quarter_chord
+    inputs.root_twist      = wing.twists.root
+    inputs.tip_twist       = wing.twists.tip
+    inputs.symmetric       = bool(wing.symmetric)
+    inputs.vertical        = bool(wing.vertical)
+    inputs.reference_area  = wing.areas.reference
+    inputs.segments        = [[segment.root_chord_percent,
+                               segment.twist,
+                               segment.sweeps.quarter_chord,
+                               segment.percent_span_location] for segment in wing.Segments.values()]
+    
+    return inputs
+
+def calculate_lift_vortex_lattice_batch(angles,settings,geometry):
+    """Calculate the total vehicle lift coefficient and specific wing coefficients (with specific wing reference areas)
+    using a vortex lattice method, at several angles of attack.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    angles                          [radians]
+    settings                        (passed to vortex lattice method)
+    geometry.reference_area         [m^2]
+    geometry.wings.*.reference_area (each wing is also passed to the vortex lattice method)
+
+    Outputs:
+    total_lift_coeff                [-] one per angle
+    wing_lifts                      [-] one per angle (wing specific)
+
+    Properties Used:
+    N/A
+    """            
+
+    # unpack
+    vehicle_reference_area = geometry.reference_area
+
+    # iterate over wings
+    total_lift_coeff = np.zeros_like(angles,dtype=float)
+    wing_lifts = Data()
+
+    for wing in geometry.wings.values():
+
+        [wing_lift_coeff,wing_drag_coeff] = weissinger_vortex_lattice_batch(angles,settings,wing)
+        total_lift_coeff += wing_lift_coeff * wing.areas.reference / vehicle_reference_area
+        wing_lifts[wing.tag] = wing_lift_coeff
+
+    return total_lift_coeff, wing_lifts
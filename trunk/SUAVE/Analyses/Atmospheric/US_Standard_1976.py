@@ -4,6 +4,7 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,7 +22,7 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
 from SUAVE.Core.Arrays import atleast_2d_col
 
 
@@ -62,13 +63,19 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # interpolate a table of the standard atmosphere instead of the layer equations
+        self.use_lookup_table     = False
+        self.lookup_table_spacing = 10. * Units.m
     
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
-        """Computes atmospheric values.
+        """Computes atmospheric values. Any number of altitudes can be given at once.
 
         Assumptions:
         US 1976 Standard Atmosphere
+        With use_lookup_table the pressure and temperature are interpolated from a table,
+        linear in temperature and in the log of pressure
 
         Source:
         U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
@@ -93,32 +100,25 @@ class US_Standard_1976(Atmospheric):
             altitude                             [m]
             temperature                          [K]
             pressure                             [Pa]
+          use_lookup_table                       [boolean]
+          lookup_table_spacing                   [m]
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
-        Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
-        
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
+        layers    = self.layer_data()
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = layers.altitude[0]
+        zmax = layers.altitude[-1]   
         
         # convert geometric to geopotential altitude
-        zs = zs/(1 + zs/Rad)
+        zs = zs/(1 + zs/layers.radius)
         
         # check ranges
         if np.amin(zs) < zmin:
@@ -128,36 +128,12 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
-        
-        T   = T0 - dz*alpha + delta_isa
+        if self.use_lookup_table:
+            p,T = self.interpolate_table(zs)
+        else:
+            p,T = compute_layers(layers,zs)
+        
+        T   = T + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T,p,var_gamma)
         mu  = gas.compute_absolute_viscosity(T)
@@ -171,6 +147,180 @@ class US_Standard_1976(Atmospheric):
         atmo_data.dynamic_viscosity = mu
         
         return atmo_data
+    
+    def layer_data(self):
+        """Finds the constants of each layer. They are found again only when the breaks,
+        fluid properties or planet are changed, which is also when the properties are
+        checked against the standard ones.
+
+        Assumptions:
+        Arrays of the breaks are replaced, not changed in place
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        layers.
+          altitude                               [m]    breaks in geopotential altitude
+          temperature                            [K]    at the base of each layer
+          pressure                               [Pa]   at the base of each layer
+          lapse_rate                             [K/m]
+          exponent                               [-]    g/(lapse_rate*R)
+          isothermal                             [boolean]
+          gravity                                [m/s^2]
+          gas_constant                           [J/(kg*K)]
+          radius                                 [m]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          planet.mean_radius                     [m]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        gas    = self.fluid_properties
+        planet = self.planet
+        breaks = self.breaks
+        key    = (id(gas),id(planet),id(breaks.altitude),id(breaks.temperature),id(breaks.pressure),
+                  gas.gas_specific_constant,planet.sea_level_gravity,planet.mean_radius)
+        
+        layers = self.get('layers',None)
+        if layers is not None and layers.key == key:
+            return layers
+        
+        # check properties
+        if not gas == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')      
+        
+        z = np.array(breaks.altitude,dtype=float)
+        T = np.array(breaks.temperature,dtype=float)
+        
+        layers = Data()
+        layers.key          = key
+        layers.altitude     = z
+        layers.temperature  = T
+        layers.pressure     = np.array(breaks.pressure,dtype=float)
+        layers.lapse_rate   = -np.diff(T)/np.diff(z)
+        layers.isothermal   = layers.lapse_rate == 0.
+        layers.gravity      = planet.sea_level_gravity
+        layers.gas_constant = gas.gas_specific_constant
+        layers.radius       = planet.mean_radius
+        
+        rate = np.where(layers.isothermal,1.,layers.lapse_rate)
+        layers.exponent     = layers.gravity/(rate*layers.gas_constant)
+        layers.table        = None
+        
+        self.layers = layers
+        
+        return layers
+    
+    def interpolate_table(self,zs):
+        """Interpolates the pressure and temperature from a table of the standard
+        atmosphere, built the first time it is needed.
+
+        Assumptions:
+        Evenly spaced geopotential altitudes
+
+        Source:
+        N/A
+
+        Inputs:
+        zs                                       [m]    geopotential altitude, inside the breaks
+
+        Output:
+        p                                        [Pa]
+        T                                        [K]    without the temperature deviation
+
+        Properties Used:
+        self.lookup_table_spacing                [m]
+        """
+        
+        layers  = self.layer_data()
+        spacing = self.lookup_table_spacing
+        table   = layers.table
+        
+        if table is None or table.spacing != spacing:
+            zmin = layers.altitude[0]
+            zmax = layers.altitude[-1]
+            n    = int(np.ceil((zmax-zmin)/spacing)) + 1
+            z    = atleast_2d_col(np.linspace(zmin,zmax,n))
+            p,T  = compute_layers(layers,z)
+            
+            table = Data()
+            table.spacing     = spacing
+            table.step        = z[1,0] - z[0,0]
+            table.altitude    = z[:,0]
+            table.log_p       = np.log(p[:,0])
+            table.temperature = T[:,0]
+            layers.table      = table
+        
+        x = (zs - table.altitude[0])/table.step
+        i = np.clip(x.astype(int),0,len(table.altitude)-2)
+        w = x - i
+        
+        log_p = table.log_p[i]       + w*(table.log_p[i+1]       - table.log_p[i])
+        T     = table.temperature[i] + w*(table.temperature[i+1] - table.temperature[i])
+        
+        return np.exp(log_p), T
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Atmospheric
+def compute_layers(layers,zs):
+    """Finds the pressure and temperature of the standard atmosphere in each layer.
+
+    Assumptions:
+    The altitudes are inside the breaks. Points on a break use the layer above it.
+
+    Source:
+    U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+    Inputs:
+    layers                                       [Data()] from layer_data
+    zs                                           [m]      geopotential altitude
+
+    Output:
+    p                                            [Pa]
+    T                                            [K]      without the temperature deviation
+
+    Properties Used:
+    N/A
+    """
+    
+    # find the layer of each point
+    i = np.searchsorted(layers.altitude,zs,side='right') - 1
+    i = np.clip(i,0,len(layers.altitude)-2)
+    
+    z0    = layers.altitude[i]
+    T0    = layers.temperature[i]
+    p0    = layers.pressure[i]
+    alpha = layers.lapse_rate[i]
+    
+    # interpolate the breaks
+    dz = zs-z0
+    T  = T0 - dz*alpha
+    
+    isothermal = layers.isothermal[i]
+    if np.any(isothermal):
+        p = np.empty_like(dz)
+        adiabatic = ~isothermal
+        p[isothermal] = p0[isothermal] * np.exp(-1.*dz[isothermal]*layers.gravity/(layers.gas_constant*T0[isothermal]))
+        p[adiabatic]  = p0[adiabatic]  * (T[adiabatic]/T0[adiabatic]) ** layers.exponent[i[adiabatic]]
+    else:
+        p = p0 * (T/T0) ** layers.exponent[i]
+    
+    return p, T
 
 
 # ----------------------------------------------------------------------
@@ -0,0 +1,320 @@
+## @ingroup Analyses-Mission
+# Batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import copy
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+from SUAVE.Methods import Missions as Methods
+from .Mission import Mission
+
+from SUAVE.Methods.Missions.Segments.converge_root import converge_root
+from SUAVE.Methods.Missions.Segments.Common.Sub_Segments import sequential_sub_segments
+from SUAVE.Methods.Missions.Segments.Common.Batch import converge_batch, iterate_batch
+from SUAVE.Methods.Missions.Segments.Common.Control_Points import is_adaptive
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Batch(Mission):
+    """ Solves several variants of a mission together. Each variant is a copy of the
+        base mission with a few values changed, for example the cruise distance or the
+        takeoff weight. The variants are advanced in lockstep so the atmosphere,
+        aerodynamics and propulsion analyses run once per iteration for all of them,
+        and the root solve is block diagonal.
+
+        Assumptions:
+        The base mission is a Sequential_Segments or an All_At_Once mission.
+        Analyses that aren't changed by a variant are shared by all the variants.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.tag      = 'batch'
+        self.mission  = None
+        self.variants = []
+
+    def append_variant(self,variant):
+        """ Adds a variant. The keys are paths relative to the mission, for example
+            'segments.cruise.distance', and the values are what they are set to.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            variant  [Data()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.variants.append(variant)
+        return
+
+    def evaluate(self,state=None):
+        """ Builds and solves all the variants
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            missions  [Mission.Container()]
+
+            Properties Used:
+            None
+        """
+
+        base     = self.mission
+        missions = [build_variant(base,variant) for variant in self.variants]
+
+        if not missions:
+            pass
+        elif base.process.converge is sequential_sub_segments:
+            evaluate_sequential(missions)
+        elif is_root_solved(base):
+            evaluate_all_at_once(missions)
+        else:
+            for mission in missions:
+                mission.evaluate()
+
+        # later batches and solves of the base mission reuse the jacobian structure
+        if missions:
+            keep_jacobian(base,missions[0])
+
+        results = Mission.Container()
+        for i,(variant,mission) in enumerate(zip(self.variants,missions)):
+            tag = variant.get('tag','variant_%i' % i)
+            mission.tag = tag
+            results[tag] = mission
+
+        return results
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+def build_variant(mission,variant):
+    """ Copies a mission and applies the changes of a variant. The analyses are not
+        copied unless the variant changes them.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mission  [Mission()]
+        variant  [Data()]
+
+        Outputs:
+        mission  [Mission()]
+
+        Properties Used:
+        None
+    """
+
+    # the analyses touched by this variant
+    changed = []
+    for path in variant.keys():
+        keys = path.split('.')
+        if 'analyses' in keys[:-1]:
+            index = keys.index('analyses')
+            changed.append(id(mission.deep_get(keys[:index+2])))
+
+    # share everything else
+    memo = {}
+    def share(segment):
+        for analysis in segment.analyses.values():
+            if not id(analysis) in changed:
+                memo[id(analysis)] = analysis
+        for sub_segment in segment.get('segments',Data()).values():
+            share(sub_segment)
+    share(mission)
+
+    mission = copy.deepcopy(mission,memo)
+
+    for path,value in variant.items():
+        if path == 'tag': continue
+        mission.deep_set(path,value)
+
+    return mission
+
+## @ingroup Analyses-Mission
+def keep_jacobian(segment,solved):
+    """ Copies the jacobian structure found by a solved variant back to the base mission
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        segment  [Segment()]
+        solved   [Segment()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+    segment.state.numerics.jacobian.update(solved.state.numerics.jacobian)
+    for tag,sub_segment in segment.get('segments',Data()).items():
+        keep_jacobian(sub_segment,solved.segments[tag])
+    return
+
+## @ingroup Analyses-Mission
+def is_root_solved(segment):
+    """ Checks if a segment is converged only with converge_root
+
+        Assumptions:
+        Segments that choose their own number of control points are solved one at a time
+
+        Source:
+        N/A
+
+        Inputs:
+        segment  [Segment()]
+
+        Outputs:
+        boolean
+
+        Properties Used:
+        None
+    """
+    converge = segment.process.converge
+    return isinstance(converge,Process) and list(converge.values()) == [converge_root] \
+           and not is_adaptive(segment)
+
+## @ingroup Analyses-Mission
+def evaluate_batch(segments):
+    """ Runs the process of a segment for several variants in lockstep
+
+        Assumptions:
+        All segments have the same process structure.
+
+        Source:
+        N/A
+
+        Inputs:
+        segments  [list]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+
+    for segment in segments:
+        segment.process.initialize(segment)
+
+    converge_batch(segments)
+    iterate_batch(segments)
+
+    for segment in segments:
+        segment.process.finalize(segment)
+
+    return
+
+## @ingroup Analyses-Mission
+def evaluate_sequential(missions):
+    """ Solves the variants of a Sequential_Segments mission one segment at a time
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        missions  [list]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+
+    for mission in missions:
+        Methods.Segments.Common.Sub_Segments.expand_sub_segments(mission)
+
+    for tag,segment in missions[0].segments.items():
+        segments = [mission.segments[tag] for mission in missions]
+        if is_root_solved(segment):
+            evaluate_batch(segments)
+        else:
+            for segment in segments:
+                segment.evaluate()
+
+    for mission in missions:
+        mission.process.finalize(mission)
+
+    return
+
+## @ingroup Analyses-Mission
+def evaluate_all_at_once(missions):
+    """ Solves the variants of an All_At_Once mission together
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        missions  [list]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+
+    evaluate_batch(missions)
+
+    return
@@ -0,0 +1,266 @@
+## @ingroup Analyses-Mission
+# Parallel.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import multiprocessing
+from warnings import warn
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Analysis
+from .Mission import Mission
+from .Batch import Batch, build_variant
+
+# the base mission kept by each worker process
+_worker_mission = None
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Parallel(Batch):
+    """ Solves independent variants of a mission in a pool of worker processes. The base
+        mission is pickled once for each worker, after that only the variants are sent.
+        The analyses of the base mission stay in the worker, so surrogates built on the
+        first variant are reused for the rest.
+
+        Assumptions:
+        The variants don't depend on each other.
+        The base mission can be pickled, otherwise the variants are solved in this process.
+        The results hold the solved states, the analyses are not sent back.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.tag               = 'parallel'
+        self.number_of_workers = None
+
+    def evaluate(self,state=None):
+        """ Solves all the variants, in the same order they were appended
+
+            Assumptions:
+            number_of_workers of None uses every available core, 1 solves in this process
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            missions  [Mission.Container()]
+
+            Properties Used:
+            None
+        """
+
+        base     = self.mission
+        variants = list(self.variants)
+        workers  = self.number_of_workers
+        if workers is None:
+            workers = available_cores()
+        workers  = min(workers,len(variants))
+
+        missions = None
+        if workers > 1:
+            missions = evaluate_pool(base,variants,workers)
+        if missions is None:
+            missions = [evaluate_variant(base,variant) for variant in variants]
+
+        results = Mission.Container()
+        for i,(variant,mission) in enumerate(zip(variants,missions)):
+            tag = variant.get('tag','variant_%i' % i)
+            mission.tag  = tag
+            results[tag] = mission
+
+        return results
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+def available_cores():
+    """ The number of cores this process may run on
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        cores  [int]
+
+        Properties Used:
+        None
+    """
+    if hasattr(os,'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+## @ingroup Analyses-Mission
+def evaluate_pool(mission,variants,workers):
+    """ Solves the variants in a pool of worker processes
+
+        Assumptions:
+        Returns None if the mission can't be pickled or the pool can't be started
+
+        Source:
+        N/A
+
+        Inputs:
+        mission   [Mission()]
+        variants  [list]
+        workers   [int]
+
+        Outputs:
+        missions  [list] or None
+
+        Properties Used:
+        None
+    """
+
+    try:
+        setup = pickle.dumps(mission,pickle.HIGHEST_PROTOCOL)
+    except Exception as error:
+        warn('mission can not be pickled, solving in process: ' + str(error))
+        return None
+
+    try:
+        pool = multiprocessing.Pool(workers,initializer=initialize_worker,initargs=(setup,))
+    except (OSError,ValueError) as error:
+        warn('worker pool could not be started, solving in process: ' + str(error))
+        return None
+
+    try:
+        missions = pool.map(evaluate_in_worker,variants,chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+    return missions
+
+## @ingroup Analyses-Mission
+def initialize_worker(setup):
+    """ Loads the base mission in a worker process
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        setup  [bytes] the pickled mission
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+    global _worker_mission
+    _worker_mission = pickle.loads(setup)
+    return
+
+## @ingroup Analyses-Mission
+def evaluate_in_worker(variant):
+    """ Solves a variant of the mission kept by this worker
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        variant  [Data()]
+
+        Outputs:
+        mission  [Mission()]
+
+        Properties Used:
+        None
+    """
+    return evaluate_variant(_worker_mission,variant)
+
+## @ingroup Analyses-Mission
+def evaluate_variant(mission,variant):
+    """ Solves one variant and drops its analyses
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mission  [Mission()]
+        variant  [Data()]
+
+        Outputs:
+        mission  [Mission()]
+
+        Properties Used:
+        None
+    """
+    mission = build_variant(mission,variant)
+    mission.evaluate()
+    detach_analyses(mission)
+    return mission
+
+## @ingroup Analyses-Mission
+def detach_analyses(segment):
+    """ Replaces the analyses of a solved segment and its sub segments with empty
+        containers, so only the states are sent back
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        segment  [Segment()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+    segment.analyses = Analysis.Container()
+    for sub_segment in segment.get('segments',Data()).values():
+        detach_analyses(sub_segment)
+    return
@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, A. Wendorff
 #           Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -100,7 +101,8 @@ class Conditions(Data):
             right size.
         
             Assumptions:
-            None
+            Views that already have the right size are kept, these are slices of the
+            merged state of the parent segment
     
             Source:
             N/A
@@ -126,7 +128,9 @@ class Conditions(Data):
             if isinstance(v,Conditions):
                 v.expand_rows(rows)
             # need arrays here
-            elif np.rank(v) == 2:
+            elif np.ndim(v) == 2:
+                if isinstance(v,np.ndarray) and v.base is not None and v.shape[0] == rows:
+                    continue
                 self[k] = np.resize(v,[rows,v.shape[1]])
             #: if type
         #: for each key,value
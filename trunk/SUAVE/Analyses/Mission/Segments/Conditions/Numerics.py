@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -53,9 +54,12 @@ class Numerics(Conditions):
         self.discretization_method = chebyshev_data
         
         self.solver_jacobian                  = "none"
+        self.jacobian_evaluation              = None
         self.tolerance_solution               = 1e-8
         self.tolerance_boundary_conditions    = 1e-8  
         self.converged                        = None
+        self.residual_evaluations             = 0
+        self.warm_start                       = None
         
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
@@ -65,8 +69,16 @@ class Numerics(Conditions):
         self.time = Conditions()
         self.time.control_points = np.empty([0,0])
         self.time.differentiate  = np.empty([0,0])
-        self.time.integrate      = np.empty([0,0]) 
+        self.time.integrate      = np.empty([0,0])
+        self.time.duration       = None
         
+        self.adaptive = Conditions()
+        self.adaptive.enabled                = False
+        self.adaptive.minimum_control_points = 5
+        self.adaptive.maximum_control_points = 33
+        self.adaptive.tolerance              = 1e-4
+        self.adaptive.truncation_error       = None
         
-        
-        
\ No newline at end of file
+        self.jacobian = Conditions()
+        self.jacobian.sparsity = np.empty([0,0],dtype=bool)
+        self.jacobian.colors   = np.empty([0],dtype=int)
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -19,7 +20,7 @@ from .Numerics   import Numerics
 
 import SUAVE
 from SUAVE.Core.Arrays import array_type
-from SUAVE.Core import DataOrdered
+from SUAVE.Core import Data, DataOrdered
 
 # ----------------------------------------------------------------------
 #  State
@@ -69,6 +70,8 @@ class State(Conditions):
         
             Assumptions:
             Doesn't expand initials or numerics
+            Views that already have the right size are kept, these are slices of the
+            merged state of the parent segment
     
             Source:
             N/A
@@ -96,7 +99,9 @@ class State(Conditions):
             elif isinstance(v,Conditions):
                 v.expand_rows(rows)
             # need arrays here
-            elif np.rank(v) == 2:
+            elif np.ndim(v) == 2:
+                if isinstance(v,array_type) and v.base is not None and v.shape[0] == rows:
+                    continue
                 self[k] = np.resize(v,[rows,v.shape[1]])
             #: if type
         #: for each key,value        
@@ -143,14 +148,14 @@ class Container(State):
             None
         """              
         
-        state_out = State()
+        state_out  = State()
+        sub_states = list(self.segments.values())
         
-        for i,(tag,sub_state) in enumerate(self.segments.items()):
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        for key in ['unknowns','conditions','residuals']:
+            if len(sub_states) == 1:
+                state_out[key].update(sub_states[0][key])
+            elif sub_states:
+                state_out[key] = append_conditions([sub_state[key] for sub_state in sub_states],state_out[key].__class__)
             
         return state_out
         
@@ -179,4 +184,42 @@ def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def append_conditions(conditions,klass):
+    """ Stacks the arrays of several conditions, each array is stacked once rather than
+        appended one segment at a time
+
+        Assumptions:
+        Only keeps the arrays and conditions found in all of the conditions
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions [list of Conditions()]
+        klass      [class] type of the stacked conditions
+
+        Outputs:
+        stacked    [klass()]
+
+        Properties Used:
+        None
+    """     
+    
+    stacked = klass()
+    
+    for k,a in conditions[0].items():
+        values = [c[k] for c in conditions if isinstance(c,Data) and k in c]
+        if len(values) < len(conditions):
+            continue
+        
+        # recursion
+        if isinstance(a,Data):
+            if all(isinstance(v,Data) for v in values):
+                stacked[k] = append_conditions(values,klass)
+        elif all(isinstance(v,array_type) for v in values):
+            stacked[k] = np.vstack(values)
+    
+    return stacked
@@ -0,0 +1,193 @@
+## @ingroup Analyses-Mission-Segments-Conditions
+# Warm_Start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# python imports
+import numpy as np
+
+# SUAVE imports
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Warm Start
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments-Conditions
+class Warm_Start(Data):
+    """ Keeps the converged unknowns of each segment, and optionally the solver jacobian,
+        so later solves of the same segment can start from them. The same store is given
+        to every segment through state.numerics.warm_start, entries are kept by segment tag.
+        When several design points are stored the nearest one to design_point is used.
+
+        Assumptions:
+        Segments with the same tag have the same unknowns
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """ This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.tag             = 'warm_start'
+        self.design_point    = None
+        self.keep_jacobian   = True
+        self.maximum_entries = 10
+        self.entries         = Data()
+        self.hits            = 0
+        self.misses          = 0
+
+    def save(self,tag,unknowns,jacobian=None):
+        """ Stores the converged unknowns of a segment at the current design point
+
+            Assumptions:
+            The oldest entry of a segment is dropped when there are too many
+
+            Source:
+            N/A
+
+            Inputs:
+            tag        [string]
+            unknowns   [array]
+            jacobian   [array]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.design_point
+            self.keep_jacobian
+            self.maximum_entries
+        """
+
+        entry = Data()
+        entry.design_point = None
+        if self.design_point is not None:
+            entry.design_point = np.array(self.design_point,dtype=float).ravel()
+        entry.unknowns = np.array(unknowns,dtype=float)
+        entry.jacobian = None
+        if self.keep_jacobian and jacobian is not None:
+            entry.jacobian = np.array(jacobian,dtype=float)
+
+        entries = [e for e in self.entries.get(tag,[]) if not same_point(e.design_point,entry.design_point)]
+        entries.append(entry)
+
+        self.entries[tag] = entries[-self.maximum_entries:]
+
+        return
+
+    def nearest(self,tag,size):
+        """ Finds the stored solution of a segment closest to the current design point
+
+            Assumptions:
+            Distances are relative to the current design point. Without a design point
+            the last solution is used.
+
+            Source:
+            N/A
+
+            Inputs:
+            tag        [string]
+            size       [int] number of unknowns
+
+            Outputs:
+            entry      [Data()] or None
+
+            Properties Used:
+            self.design_point
+        """
+
+        entries = [e for e in self.entries.get(tag,[]) if len(e.unknowns) == size]
+
+        if not entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        if self.design_point is None:
+            return entries[-1]
+
+        point    = np.array(self.design_point,dtype=float).ravel()
+        scale    = np.abs(point)
+        scale[scale==0.] = 1.
+
+        best     = entries[-1]
+        distance = np.inf
+        for entry in entries:
+            if entry.design_point is None or len(entry.design_point) != len(point):
+                continue
+            d = np.linalg.norm((entry.design_point - point)/scale)
+            if d < distance:
+                best     = entry
+                distance = d
+
+        return best
+
+    def reset(self):
+        """ Removes all the stored solutions
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.entries = Data()
+        self.hits    = 0
+        self.misses  = 0
+        return
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def same_point(a,b):
+    """ Checks if two design points are the same
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        a    [array] or None
+        b    [array] or None
+
+        Outputs:
+        boolean
+
+        Properties Used:
+        None
+    """
+    if a is None or b is None:
+        return a is None and b is None
+    return a.shape == b.shape and np.all(a == b)
@@ -9,4 +9,6 @@ from .Conditions   import Conditions
 from .Numerics     import Numerics
 from .Residuals    import Residuals
 from .State        import State
-from .Unknowns     import Unknowns
\ No newline at end of file
+from .Unknowns     import Unknowns
+from .Warm_Start   import Warm_Start
+
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,7 @@
 
 from SUAVE.Analyses import Analysis, Settings, Process
 from .Conditions import State
+from .Conditions.State import append_conditions
 from SUAVE.Core.Arrays import array_type
 import numpy as np
 
@@ -219,15 +221,14 @@ class Segment(Analysis):
             None
         """              
         
-        state_out = State()
+        state_out  = State()
+        sub_states = [sub_seg.state for sub_seg in self.segments.values()]
         
-        for i,(tag,sub_seg) in enumerate(self.segments.items()):
-            sub_state = sub_seg.state
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        for key in ['unknowns','conditions','residuals']:
+            if len(sub_states) == 1:
+                state_out[key].update(sub_states[0][key])
+            elif sub_states:
+                state_out[key] = append_conditions([sub_state[key] for sub_state in sub_states],state_out[key].__class__)
             
         return state_out
 
@@ -3,12 +3,14 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import ContainerOrdered, DataOrdered, Data
+from .Profiler import Profiler
 
 # ----------------------------------------------------------------------
 #  Process
@@ -31,7 +33,7 @@ class Process(ContainerOrdered):
     
     def evaluate(self,*args,**kwarg):
         """This is used to execute the evaluate functions of the analyses
-            stored in the container.
+            stored in the container. Each step is timed when a Profiler is active.
         
                 Assumptions:
                 None
@@ -49,26 +51,42 @@ class Process(ContainerOrdered):
                 N/A
             """        
         
-        results = Data()
+        results  = Data()
+        profiler = Profiler.active
+        
+        if profiler is not None:
+            depth = profiler.open(self,args)
         
         if self.verbose:
             print('process start')
         
-        for tag,step in self.items(): 
+        try:
+            for tag,step in self.items(): 
+            
+                if self.verbose:
+                    print('step :' , tag)
             
-            if self.verbose:
-                print('step :' , tag)
+                #if not callable(step): continue
             
-            #if not callable(step): continue
+                if profiler is not None:
+                    profiler.push(tag)
             
-            if hasattr(step,'evaluate'): 
-                result = step.evaluate(*args,**kwarg)
-            else:
-                result = step(*args,**kwarg)
+                try:
+                    if hasattr(step,'evaluate'): 
+                        result = step.evaluate(*args,**kwarg)
+                    else:
+                        result = step(*args,**kwarg)
+                finally:
+                    if profiler is not None:
+                        profiler.pop()
                 
-            results[tag] = result
+                results[tag] = result
         
-        #: for each step
+            #: for each step
+            
+        finally:
+            if profiler is not None:
+                profiler.close(depth)
         
         if self.verbose:
             print('process end')        
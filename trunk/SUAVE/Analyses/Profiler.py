@@ -0,0 +1,385 @@
+## @ingroup Analyses
+# Profiler.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import json
+import time
+import tracemalloc
+
+from SUAVE.Core import Data, DataOrdered
+
+# ----------------------------------------------------------------------
+#  Profiler
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses
+class Profiler(Data):
+    """ SUAVE.Analyses.Profiler()
+    
+        Times every step run by a Process. The times and number of calls are kept by the
+        path of the step, for example base.converge.sequential_sub_segments.cruise.converge.
+        converge_root.iterate.conditions.aerodynamics.drag.compressibility. When a process
+        of a segment is called directly, the segment tag and the name of the process are
+        added to the path. Only one profiler is active at a time, without one the processes
+        only check that none is active.
+        
+            Assumptions:
+            The time of a step includes the time of its sub steps
+            Memory is traced with tracemalloc, which slows the steps down
+            
+            Source:
+            N/A
+    """
+    
+    # the profiler Process.evaluate reports to
+    active = None
+    
+    def __defaults__(self):
+        """This sets the default values.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        self.tag     = 'profiler'
+        self.memory  = False
+        self.records = {}
+        self._stack  = []
+        self._tracing_started = False
+        
+    def start(self):
+        """Makes this the active profiler
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.memory
+        """
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing_started = True
+        self._stack = []
+        Profiler.active = self
+        return
+        
+    def stop(self):
+        """Stops profiling, the records are kept
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        if Profiler.active is self:
+            Profiler.active = None
+        if self._tracing_started:
+            tracemalloc.stop()
+            self._tracing_started = False
+        return
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self,*exc_info):
+        self.stop()
+        return False
+        
+    def reset(self):
+        """Removes all the records
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        self.records = {}
+        self._stack  = []
+        return
+        
+    def push(self,name,owner=None):
+        """Starts timing a step
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            name    [string]
+            owner   the segment whose process is run, if any
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.memory
+        """
+        stack  = self._stack
+        path   = (stack[-1][0] + (name,)) if stack else (name,)
+        memory = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        # path, owner, start time, start memory, time of sub steps
+        stack.append([path,owner,time.perf_counter(),memory,0.])
+        return
+        
+    def pop(self):
+        """Stops timing the last step and adds it to the records
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.memory
+        """
+        stack = self._stack
+        path,owner,start,memory,children = stack.pop()
+        elapsed = time.perf_counter() - start
+        if self.memory:
+            memory = tracemalloc.get_traced_memory()[0] - memory
+        
+        record = self.records.get(path)
+        if record is None:
+            record = self.records[path] = [0,0.,0.,0]
+        record[0] += 1
+        record[1] += elapsed
+        record[2] += elapsed - children
+        record[3] += memory
+        
+        if stack:
+            stack[-1][4] += elapsed
+        return
+    
+    def open(self,process,args):
+        """Adds the segment tag and the process name to the path when a process of a
+           segment is called directly
+    
+            Assumptions:
+            The segment is the first argument and keeps the process in segment.process
+    
+            Source:
+            N/A
+    
+            Inputs:
+            process  [Process()]
+            args     [tuple] the arguments of the process
+    
+            Outputs:
+            depth    [int] number of steps timed before this process
+    
+            Properties Used:
+            None
+        """
+        
+        depth = len(self._stack)
+        if not args or not isinstance(args[0],Data):
+            return depth
+        owner     = args[0]
+        processes = owner.get('process',None)
+        if not isinstance(processes,DataOrdered):
+            return depth
+        
+        # the whole process of the segment only adds the segment tag
+        name = None
+        if processes is not process:
+            for key,value in processes.items():
+                if value is process:
+                    name = key
+                    break
+            if name is None:
+                return depth
+        
+        # a process run as a step of the whole process is already named by the step
+        if self.owner() is owner:
+            if name is None or self._stack[-1][0][-1] == name:
+                return depth
+        else:
+            self.push(owner.get('tag','segment'),owner)
+        if name is not None:
+            self.push(name,owner)
+        
+        return depth
+    
+    def close(self,depth):
+        """Stops timing the steps pushed by open
+    
+            Assumptions:
+            Steps left open by an exception are closed too
+    
+            Source:
+            N/A
+    
+            Inputs:
+            depth    [int] returned by open
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        while len(self._stack) > depth:
+            self.pop()
+        return
+            
+    def owner(self):
+        """The segment whose process is being run
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            owner    the segment, or None
+    
+            Properties Used:
+            None
+        """
+        for frame in reversed(self._stack):
+            if frame[1] is not None:
+                return frame[1]
+        return None
+        
+    def table(self):
+        """Lists the records, the steps that took longest first
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            rows     [list] of Data() with path, calls, total_time, self_time and memory
+    
+            Properties Used:
+            None
+        """
+        rows = []
+        for path,(calls,total,own,memory) in self.records.items():
+            row = Data()
+            row.path       = '.'.join(path)
+            row.calls      = calls
+            row.total_time = total
+            row.self_time  = own
+            row.memory     = memory
+            rows.append(row)
+        rows.sort(key=lambda row: -row.total_time)
+        return rows
+    
+    def to_json(self,filename=None):
+        """Writes the records as a json list
+    
+            Assumptions:
+            Times are in seconds and memory in bytes
+    
+            Source:
+            N/A
+    
+            Inputs:
+            filename [string] optional
+    
+            Outputs:
+            text     [string]
+    
+            Properties Used:
+            None
+        """
+        keys = ['path','calls','total_time','self_time','memory']
+        text = json.dumps([dict([(k,row[k]) for k in keys]) for row in self.table()],indent=1)
+        if filename is not None:
+            with open(filename,'w') as f:
+                f.write(text)
+        return text
+    
+    def flamegraph(self,filename=None):
+        """Writes the records as folded stacks, one line per path with its own time in
+           microseconds, which flamegraph.pl and speedscope read
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            filename [string] optional
+    
+            Outputs:
+            text     [string]
+    
+            Properties Used:
+            None
+        """
+        lines = []
+        for path,(calls,total,own,memory) in sorted(self.records.items()):
+            lines.append('%s %i' % (';'.join(path),int(round(own*1e6))))
+        text = '\n'.join(lines) + '\n'
+        if filename is not None:
+            with open(filename,'w') as f:
+                f.write(text)
+        return text
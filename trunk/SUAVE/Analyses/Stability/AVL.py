@@ -2,6 +2,7 @@
 # AVL.py
 #
 # Created: Apr 2017, M. Clarke 
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -20,10 +21,12 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_jobs         import run_parallel_analysis
 from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+from SUAVE.Methods.Utilities.Surrogates              import predict_surrogate, build_grid_surrogate
 
 # local imports 
 from .Stability import Stability
@@ -86,6 +89,7 @@ class AVL(Stability):
         self.settings.filenames.err_filename                = sys.stderr
         self.settings.spanwise_vortices                     = None
         self.settings.chordwise_vortices                    = None
+        self.settings.surrogate_type                        = 'gaussian' # or 'grid'
             
         # Conditions table, used for surrogate model training
         self.training                                       = Data()        
@@ -235,18 +239,11 @@ class AVL(Stability):
         static_stability    = Data()
         dynamic_stability   = Data()        
 
-        #Run Analysis
-        data_len            = len(AoA)
-        CM                  = np.zeros([data_len,1])
-        Cm_alpha            = np.zeros([data_len,1])
-        Cn_beta             = np.zeros([data_len,1])
-        NP                  = np.zeros([data_len,1]) 
-
-        for ii,_ in enumerate(AoA):           
-            CM[ii]          = moment_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            Cm_alpha[ii]    = Cm_alpha_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            Cn_beta[ii]     = Cn_beta_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            NP[ii]          = neutral_point_model.predict([np.array([AoA[ii][0],mach[ii][0]])])    #sklearn fix        
+        #Run Analysis, all the points at once
+        CM                  = predict_surrogate(moment_model,[AoA,mach])
+        Cm_alpha            = predict_surrogate(Cm_alpha_model,[AoA,mach])
+        Cn_beta             = predict_surrogate(Cn_beta_model,[AoA,mach])
+        NP                  = predict_surrogate(neutral_point_model,[AoA,mach])
 
         static_stability.CM       = CM
         static_stability.Cm_alpha = Cm_alpha 
@@ -324,6 +321,7 @@ class AVL(Stability):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.number_of_workers (concurrent AVL runs)
         """ 
         # Unpack
         geometry = self.geometry
@@ -345,7 +343,8 @@ class AVL(Stability):
 
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
-                xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
+                xy[i*len(AoA)+j,:] = np.array([AoA[j],mach[i]])
+        all_conditions = []
         for j,_ in enumerate(mach):
             # Set training conditions
             run_conditions = Aerodynamics()
@@ -354,15 +353,26 @@ class AVL(Stability):
             run_conditions.freestream.gravity               = 9.81          
             run_conditions.aerodynamics.angle_of_attack     = AoA
             run_conditions.freestream.mach_number           = mach[j]
+            all_conditions.append(run_conditions)
+            
+        # Run the Mach numbers concurrently, each in its own folder
+        if self.settings.number_of_workers > 1 and not self.regression_flag:
+            all_results = run_parallel_analysis(self,all_conditions)
+        else:
+            all_results = None
             
+        for j,_ in enumerate(mach):
             #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions)
+            if all_results is None:
+                results = self.evaluate_conditions(all_conditions[j])
+            else:
+                results = all_results[j]
 
             # Obtain CM Cm_alpha, Cn_beta and the Neutral Point # Store other variables here as well 
-            CM[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.pitch_moment_coefficient[:,0]
-            Cm_alpha[count*len(mach):(count+1)*len(mach),0] = results.aerodynamics.cm_alpha[:,0]
-            Cn_beta[count*len(mach):(count+1)*len(mach),0]  = results.aerodynamics.cn_beta[:,0]
-            NP[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.neutral_point[:,0]
+            CM[count*len(AoA):(count+1)*len(AoA),0]       = results.aerodynamics.pitch_moment_coefficient[:,0]
+            Cm_alpha[count*len(AoA):(count+1)*len(AoA),0] = results.aerodynamics.cm_alpha[:,0]
+            Cn_beta[count*len(AoA):(count+1)*len(AoA),0]  = results.aerodynamics.cn_beta[:,0]
+            NP[count*len(AoA):(count+1)*len(AoA),0]       = results.aerodynamics.neutral_point[:,0]
 
             count += 1
 
@@ -411,7 +421,7 @@ class AVL(Stability):
           neutral_point                  <Guassian process surrogate>       
 
         Properties Used:
-        No others
+        self.settings.surrogate_type
         """  
         # Unpack data
         training                                    = self.training
@@ -423,16 +433,23 @@ class AVL(Stability):
         NP_data                                     = training.coefficients[:,3]	
         xy                                          = training.grid_points 
 
-        # Gaussian Process New
-        regr_cm                                     = gaussian_process.GaussianProcessRegressor()
-        regr_cm_alpha                               = gaussian_process.GaussianProcessRegressor()
-        regr_cn_beta                                = gaussian_process.GaussianProcessRegressor()
-        regr_np                                     = gaussian_process.GaussianProcessRegressor()
-
-        cm_surrogate                                = regr_cm.fit(xy, CM_data) 
-        cm_alpha_surrogate                          = regr_cm_alpha.fit(xy, Cm_alpha_data) 
-        cn_beta_surrogate                           = regr_cn_beta.fit(xy, Cn_beta_data)
-        neutral_point_surrogate                     = regr_np.fit(xy, NP_data)
+        if self.settings.surrogate_type == 'grid':
+            # Monotone cubic interpolation on the training grid
+            cm_surrogate                            = build_grid_surrogate(xy, CM_data)
+            cm_alpha_surrogate                      = build_grid_surrogate(xy, Cm_alpha_data)
+            cn_beta_surrogate                       = build_grid_surrogate(xy, Cn_beta_data)
+            neutral_point_surrogate                 = build_grid_surrogate(xy, NP_data)
+        else:
+            # Gaussian Process New
+            regr_cm                                 = gaussian_process.GaussianProcessRegressor()
+            regr_cm_alpha                           = gaussian_process.GaussianProcessRegressor()
+            regr_cn_beta                            = gaussian_process.GaussianProcessRegressor()
+            regr_np                                 = gaussian_process.GaussianProcessRegressor()
+    
+            cm_surrogate                            = regr_cm.fit(xy, CM_data) 
+            cm_alpha_surrogate                      = regr_cm_alpha.fit(xy, Cm_alpha_data) 
+            cn_beta_surrogate                       = regr_cn_beta.fit(xy, Cn_beta_data)
+            neutral_point_surrogate                 = regr_np.fit(xy, NP_data)
 
         self.surrogates.moment_coefficient          = cm_surrogate
         self.surrogates.Cm_alpha_moment_coefficient = cm_alpha_surrogate
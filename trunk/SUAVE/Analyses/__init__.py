@@ -7,6 +7,7 @@ from .Analysis  import Analysis
 from .Sizing    import Sizing
 from .Surrogate import Surrogate
 from .Process   import Process
+from .Profiler  import Profiler
 from .Settings  import Settings
 from .Vehicle   import Vehicle
 
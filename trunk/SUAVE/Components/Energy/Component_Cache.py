@@ -0,0 +1,373 @@
+## @ingroup Energy
+# Component_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from .Energy_Component import describe
+
+# ----------------------------------------------------------------------
+#  Component Cache
+# ----------------------------------------------------------------------
+## @ingroup Energy
+class Component_Cache(Data):
+    """Keeps the last results of each component of a network with the fingerprint of
+    what they were computed from, so a component runs again only when something it
+    depends on has changed. When only the throttle changes, as in most iterations of a
+    mission solve and in engine_out, the cycle is taken from the cache and only the
+    thrust is computed again.
+
+    Set one as the component_cache of a network to use it.
+
+    Assumptions:
+    Components change only their outputs and the conditions. The values they write into
+    the conditions are found by comparing the conditions before and after they run, and
+    are written again when the results are taken from the cache. The conditions carry a
+    version, which changes when the freestream is not the one of the last evaluation
+    and with each component that writes into them. The outputs a component hands on are
+    known by their identity during an evaluation, so the next components don't look at
+    their contents.
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.tag        = 'component_cache'
+        self.entries    = Data()
+        self.stats      = Data()
+        self.described  = {}
+        self.written    = set()
+        self.freestream = None
+        self.changes    = 0
+        self.version    = (0,)
+        self.count      = 0
+
+    def start(self,conditions):
+        """Starts an evaluation of the network. The freestream is compared with the one
+        of the last evaluation, and the arrays known in the last one are forgotten, as
+        they may have been changed in place since.
+
+        Assumptions:
+        Arrays aren't changed in place during an evaluation of the network
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions.freestream           [Data()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.described = {}
+
+        freestream = freestream_snapshot(conditions,self.written)
+        if not same_snapshot(freestream,self.freestream):
+            self.changes   += 1
+            self.freestream = freestream
+        self.version = (self.changes,)
+
+        return
+
+    def evaluate(self,component,conditions,compute):
+        """Runs a component, or takes its results from the cache if its fingerprint is
+        the one they were computed with
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        component       <Energy_Component>
+        conditions      [Data()]
+        compute         <method> of the component
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        tag   = component.tag
+        key   = tag + '.' + compute.__name__
+        entry = dict.get(self.entries,key)
+        stats = dict.get(self.stats,tag)
+        if stats is None:
+            stats = self.stats[tag] = Data(hits=0,misses=0)
+
+        described   = self.described
+        fingerprint = component.fingerprint(conditions,self)
+        if entry is not None and entry[0] == fingerprint:
+            stored, outputs, written, token = entry
+            stats['hits'] += 1
+            component_outputs = component.outputs
+            for name, value in dict.items(outputs):
+                component_outputs[name] = hand_on(value,(token,name),described)
+            if written:
+                for (group, name), value in written.items():
+                    conditions[group][name] = copy_values(value)
+                self.version += (token,)
+            return
+
+        stats['misses'] += 1
+
+        # run the component, and find what it writes into the conditions
+        groups = [(group,conditions.get(group,{})) for group in ['freestream','propulsion']]
+        before = [(group,dict(dict.items(values))) for group, values in groups]
+        compute(conditions)
+
+        written = {}
+        for group, values in before:
+            for name, value in dict.items(conditions.get(group,{})):
+                if values.get(name) is not value:
+                    written[(group,name)] = copy_values(value)
+
+        # the freestream values written by components aren't part of the freestream version
+        names = [name for group, name in written if group == 'freestream' and name not in self.written]
+        if names:
+            self.written.update(names)
+            self.freestream = freestream_snapshot(conditions,self.written)
+
+        self.count += 1
+        token   = (key,self.count)
+        outputs = Data()
+        for name, value in dict.items(component.outputs):
+            outputs[name] = copy_values(value)
+            remember(value,(token,name),described)
+        self.entries[key] = (fingerprint,outputs,written,token)
+        if written:
+            self.version += (token,)
+
+        return
+
+    def hit_rates(self):
+        """Gives the share of the evaluations of each component that were taken from
+        the cache
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        rates           [Data()] of the hit rate of each component by tag
+
+        Properties Used:
+        self.stats
+        """
+        rates = Data()
+        for tag, stats in self.stats.items():
+            rates[tag] = stats.hits/max(stats.hits + stats.misses,1)
+
+        return rates
+
+    def reset(self):
+        """Removes all the stored results and the statistics
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+        """
+        self.entries    = Data()
+        self.stats      = Data()
+        self.described  = {}
+        self.written    = set()
+        self.freestream = None
+        return
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+## @ingroup Energy
+def freestream_snapshot(conditions,written):
+    """Copies the freestream values that components don't write, with all the arrays
+    in one, so it is quick to compare
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions.freestream           [Data()]
+    written         <set> of the names of the freestream values components write
+
+    Outputs:
+    snapshot        (names, other values, array shapes, array values)
+
+    Properties Used:
+    N/A
+    """
+    freestream = conditions.get('freestream',{})
+    names      = [name for name in dict.keys(freestream) if name not in written]
+    values     = [freestream[name] for name in names]
+    arrays     = [value for value in values if type(value) is np.ndarray]
+    others     = [describe(value) for value in values if type(value) is not np.ndarray]
+    shapes     = [array.shape for array in arrays]
+
+    if arrays:
+        arrays = np.concatenate([array.ravel() for array in arrays])
+    else:
+        arrays = np.zeros(0)
+
+    return (names,others,shapes,arrays)
+
+## @ingroup Energy
+def same_snapshot(snapshot,other):
+    """Compares two freestream snapshots
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    snapshot, other     see freestream_snapshot, other may be None
+
+    Outputs:
+    <boolean>
+
+    Properties Used:
+    N/A
+    """
+    if other is None:
+        return False
+
+    names, others, shapes, arrays = snapshot
+
+    return names == other[0] and shapes == other[2] and others == other[1] and bool((arrays == other[3]).all())
+
+## @ingroup Energy
+def remember(value,token,described):
+    """Marks the arrays a component hands on with a token, so the components that take
+    them as inputs describe them without looking at their contents
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    value           an array, a Data of them or anything else, which is not marked
+    token           a description, the same when the value is the same
+    described       <dict> of the arrays described in this evaluation, by identity
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(value,np.ndarray):
+        described[id(value)] = (value,token)
+    elif isinstance(value,Data):
+        for name, item in value.items():
+            remember(item,token + (name,),described)
+
+    return
+
+## @ingroup Energy
+def hand_on(value,token,described):
+    """Copies a stored value for a component to hand on, and marks the arrays in the
+    copy with a token, see remember
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    value           an array, a Data of them or anything else, which is not copied
+    token           a description, the same when the value is the same
+    described       <dict> of the arrays described in this evaluation, by identity
+
+    Outputs:
+    copy
+
+    Properties Used:
+    N/A
+    """
+    if type(value) is np.ndarray:
+        value = value.copy()
+        described[id(value)] = (value,token)
+        return value
+    if isinstance(value,Data):
+        return Data([(name,hand_on(item,token + (name,),described)) for name, item in value.items()])
+
+    return copy_values(value)
+
+## @ingroup Energy
+def copy_values(value):
+    """Copies the arrays in a value, so the ones handed out by the cache can be changed
+    in place without changing the cache
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    value           an array, a Data of them or anything else, which is not copied
+
+    Outputs:
+    copy
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(value,np.ndarray):
+        return value.copy()
+    if isinstance(value,Data):
+        return Data([(name,copy_values(item)) for name, item in value.items()])
+
+    return value
@@ -6,6 +6,7 @@
 #           Sep 2017, P. Goncalves
 #           Jan 2018, W. Maier
 #           Aug 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,7 +15,6 @@
 import SUAVE
 
 import numpy as np
-from scipy.optimize import fsolve
 
 from SUAVE.Core import Data
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
@@ -214,13 +214,9 @@ class Combustor(Energy_Component):
         ar     = self.area_ratio
         
         # Rayleigh flow analysis, constant pressure burner
-            
-        # Initialize arrays
-        M_out  = 1*Pt_in/Pt_in
-        Ptr    = 1*Pt_in/Pt_in
 
         # Isentropic decceleration through divergent nozzle
-        Mach   = fm_solver(ar,Mach[:,0],gamma[:,0])  
+        Mach   = fm_solver(ar,Mach,gamma)  
         
         # Determine max stagnation temperature to thermally choke flow                                     
         Tt4_ray = Tt_in*(1.+gamma*Mach*Mach)**2./((2.*(1.+gamma)*Mach*Mach)*(1.+(gamma-1.)/2.*Mach*Mach))
@@ -230,7 +226,7 @@ class Combustor(Energy_Component):
         Tt4[Tt4_ray <= Tt4] = Tt4_ray[Tt4_ray <= Tt4]
         
         #Rayleigh calculations
-        M_out[:,0], Ptr[:,0] = rayleigh(gamma[:,0],Mach,Tt4[:,0]/Tt_in[:,0]) 
+        M_out, Ptr = rayleigh(gamma,Mach,Tt4/Tt_in) 
         Pt_out     = Ptr*Pt_in
             
         # method to compute combustor properties
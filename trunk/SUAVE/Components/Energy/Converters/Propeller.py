@@ -4,6 +4,7 @@
 # Created:  Jun 2014, E. Botero
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,6 +18,7 @@ import scipy.optimize as opt
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
+from SUAVE.Methods.Propulsion.propeller_map import propeller_map_coefficients
 
 from warnings import warn
 
@@ -66,6 +68,11 @@ class Propeller(Energy_Component):
         self.thrust_angle                                   = 0.0
         self.origin                                         = [[0.0,0.0,0.0]] # [X,Y,Z]
         self.rotation                                       = [[0.0,0.0,0.0]] # [X,Y,Z] rotation of axis relative to
+        self.tolerance                                      = 1e-5  # convergence of the inflow angles
+        self.maximum_iterations                             = 500   # Newton iterations for the inflow angles
+        self.warm_start                                     = False # start from the last solution
+        self.warm_start_tolerance                           = 0.05  # largest relative change of velocity and omega to start from it
+        self.performance_map                                = None  # interpolated where it can be trusted, see build_propeller_map
       
 
                  # vehicle (used in OpenVSP for thrust_angle)
@@ -110,6 +117,13 @@ class Propeller(Energy_Component):
         torque                       [Nm]
         power                        [W]
         Cp                           [-] (coefficient of power)
+        self.outputs.
+          inflow_angle               [radians]
+          inflow_velocity            [m/s]
+          inflow_omega               [radian/s]
+          iterations                 [-]
+          converged                  <boolean>
+          mapped                     <boolean> points taken from the performance map
 
         Properties Used:
         self.prop_attributes.
@@ -124,22 +138,19 @@ class Propeller(Energy_Component):
          drag_reference_reynolds_number [-]
          reynolds_scaling_exponent      [-]
         self.thrust_angle               [radians]
+        self.tolerance                  [radians]
+        self.maximum_iterations         [-]
+        self.warm_start                 <boolean>
+        self.warm_start_tolerance       [-]
+        self.performance_map            (see build_propeller_map)
         """         
            
         #Unpack    
         B        = self.prop_attributes.number_blades
         R        = self.prop_attributes.tip_radius
         Rh       = self.prop_attributes.hub_radius
-        beta     = self.prop_attributes.twist_distribution
         c        = self.prop_attributes.chord_distribution
-        cl_a     = self.prop_attributes.lift_curve_slope
-        cd_coeff = self.prop_attributes.cd_coefficients   
-        re_ref   = self.prop_attributes.drag_reference_reynolds_number
-        x_re     = self.prop_attributes.reynolds_scaling_exponent  
            
-        
-        
-        
         omega1 = self.inputs.omega
         rho    = conditions.freestream.density[:,0,None]
         mu     = conditions.freestream.dynamic_viscosity[:,0,None]
@@ -148,9 +159,6 @@ class Propeller(Energy_Component):
         T      = conditions.freestream.temperature[:,0,None]
         theta  = self.thrust_angle
         
-        BB     = B*B
-        BBB    = BB*B
-            
         # Velocity in the Body frame
         T_body2inertial = conditions.frames.body.transform_to_inertial
         T_inertial2body = orientation_transpose(T_body2inertial)
@@ -164,29 +172,137 @@ class Propeller(Energy_Component):
         # Now just use the aligned velocity
         V = V_thrust[:,0,None]
         
-        nu    = mu/rho
-        tol   = 1e-5 # Convergence tolerance
-        
         omega = omega1*1.0
         omega = np.abs(omega)
-           
-        ######
-        # Enter airfoil data in a better way, there is currently Re and Ma scaling from DAE51 data
-        ######
-
+        
         #Things that don't change with iteration
         N       = len(c) # Number of stations
         chi0    = Rh/R   # Where the propeller blade actually starts
         chi     = np.linspace(chi0,1,N+1)  # Vector of nondimensional radii
         chi     = chi[0:N]
-        lamda   = V/(omega*R)              # Speed ratio
         r       = chi*R                    # Radial coordinate
+        n       = omega/(2.*np.pi)         # Cycles per second
+        D       = 2*R
+        
+        thrust  = np.zeros_like(V)
+        torque  = np.zeros_like(V)
+        Cd      = np.nan*np.ones((len(a),N))
+        Cl      = np.nan*np.ones((len(a),N))
+        
+        # Interpolate the performance map where it can be trusted
+        mapped = np.zeros(len(a),dtype=bool)
+        if self.performance_map is not None:
+            Ct_map, Cp_map, mapped = propeller_map_coefficients(self.performance_map,V,omega,rho,mu,a,R)
+            n_map          = n[mapped]
+            thrust[mapped] = Ct_map*rho[mapped]*(n_map*n_map)*(D*D*D*D)
+            torque[mapped] = Cp_map*rho[mapped]*(n_map*n_map*n_map)*(D*D*D*D*D)/omega[mapped]
+        
+        # Solve the blade elements everywhere else
+        full = ~mapped
+        if np.any(full):
+            thrust[full], torque[full], Cd[full], Cl[full] = \
+                self.solve_blade_elements(V[full],omega[full],rho[full],mu[full],a[full],T[full],r)
+            
+        self.outputs.mapped = mapped
+        
+        power    = torque*omega       
+        Cp       = power/(rho*(n*n*n)*(D*D*D*D*D))
+
+        thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
+        power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
+        
+        thrust[omega1<0.0] = - thrust[omega1<0.0]
+
+        etap     = V*thrust/power     
+        
+        conditions.propulsion.etap = etap
+        
+        # store data
+        results_conditions = Data      
+        conditions.propulsion.acoustic_outputs = results_conditions(
+            number_sections    = N,
+            r0                 = r,
+            airfoil_chord      = c,
+            blades_number      = B,
+            propeller_diameter = D,
+            drag_coefficient   = Cd,
+            lift_coefficient   = Cl,
+            omega              = omega,
+            velocity           = V,
+            thrust             = thrust,
+            power              = power,
+            mid_chord_aligment = self.prop_attributes.mid_chord_aligment
+        )
+        
+        
+        return thrust, torque, power, Cp
+    
+    def solve_blade_elements(self,V,omega,rho,mu,a,T,r):
+        """Solves the blade elements of the propeller for the thrust and the torque.
+
+        Assumptions:
+        per source
+
+        Source:
+        Qprop theory document
+
+        Inputs:
+        V                            [m/s] velocity along the propeller axis
+        omega                        [radian/s]
+        rho                          [kg/m^3]
+        mu                           [kg/(m-s)]
+        a                            [m/s]
+        T                            [K]
+        r                            [m] radius of the blade elements
+
+        Outputs:
+        thrust                       [N]
+        torque                       [Nm]
+        Cd                           [-] at each blade element
+        Cl                           [-] at each blade element
+        self.outputs.
+          inflow_angle               [radians]
+          inflow_velocity            [m/s]
+          inflow_omega               [radian/s]
+          iterations                 [-]
+          converged                  <boolean>
+
+        Properties Used:
+        self.prop_attributes.
+          number_blades                 [-]
+          tip_radius                    [m]
+          twist_distribution            [radians]
+          chord_distribution            [m]
+          lift_curve_slope              [1/radians] (2D lift curve slope of the airfoil)
+          cd_coefficients               [-]
+         drag_reference_reynolds_number [-]
+         reynolds_scaling_exponent      [-]
+        self.tolerance                  [radians]
+        self.maximum_iterations         [-]
+        self.warm_start                 <boolean>
+        self.warm_start_tolerance       [-]
+        """
+        
+        #Unpack    
+        B        = self.prop_attributes.number_blades
+        R        = self.prop_attributes.tip_radius
+        beta     = self.prop_attributes.twist_distribution
+        c        = self.prop_attributes.chord_distribution
+        cl_a     = self.prop_attributes.lift_curve_slope
+        cd_coeff = self.prop_attributes.cd_coefficients   
+        re_ref   = self.prop_attributes.drag_reference_reynolds_number
+        x_re     = self.prop_attributes.reynolds_scaling_exponent  
+        
+        nu    = mu/rho
+        tol   = self.tolerance # Convergence tolerance
+        
+        ######
+        # Enter airfoil data in a better way, there is currently Re and Ma scaling from DAE51 data
+        ######
+
+        #Things that don't change with iteration
+        N       = len(c) # Number of stations
         pi      = np.pi
-        pi2     = pi*pi
-        x       = r*np.multiply(omega,1/V) # Nondimensional distance
-        n       = omega/(2.*pi)            # Cycles per second
-        J       = V/(2.*R*n)    
-        sigma   = np.multiply(B*c,1./(2.*pi*r))   
     
         #I make the assumption that externally-induced velocity at the disk is zero
         #This can be easily changed if needed in the future:
@@ -200,85 +316,44 @@ class Propeller(Energy_Component):
         
         #Things that will change with iteration
         size = (len(a),N)
-    
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
-        
-        ii = 0
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            #va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound
-            
-            #if np.any(Ma> 1.0):
-                #warn('Propeller blade tips are supersonic.', Warning)
-            
-            lamdaw = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-            
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Cl = cl_a*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[alpha>=pi/2] = 0.
-            
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-            
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-            
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-            
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-            
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
+        
+        # Start from the last solution where the operating point has barely changed
+        psi  = np.ones(size)
+        last = self.outputs.get('inflow_angle')
+        warm = np.zeros(len(a),dtype=bool)
+        if self.warm_start and last is not None and np.shape(last) == size:
+            change = np.maximum(np.abs(V - self.outputs.inflow_velocity)/np.maximum(np.abs(V),1e-3),
+                                np.abs(omega - self.outputs.inflow_omega)/np.maximum(omega,1e-3))
+            warm = change[:,0] <= self.warm_start_tolerance
+            psi[warm] = last[warm]
+        
+        # Solve for the inflow angles
+        inputs = (Ua,Ut,U,a*np.ones_like(r),r*np.ones_like(Ua),beta*np.ones_like(Ua),c*np.ones_like(Ua))
+        psi, iterations, converged = solve_inflow(psi,inputs,B,R,cl_a,tol,self.maximum_iterations)
+        
+        # Start over if the warm start ran out of iterations, but not where it stopped at the stall guard
+        if np.any(warm) and not converged and iterations >= self.maximum_iterations:
+            psi, cold_iterations, converged = solve_inflow(np.ones(size),inputs,B,R,cl_a,tol,self.maximum_iterations)
+            iterations += cold_iterations
             
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-                      
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
+        if not converged and iterations >= self.maximum_iterations:
+            warn('Propeller inflow did not converge in ' + str(self.maximum_iterations) + ' iterations.', Warning)
             
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                break
+        self.outputs.inflow_angle    = psi
+        self.outputs.inflow_velocity = V*1.
+        self.outputs.inflow_omega    = omega*1.
+        self.outputs.iterations      = iterations
+        self.outputs.converged       = converged
+        
+        # The flow at the solution
+        flow  = blade_element(psi,*inputs,B=B,R=R,cl_a=cl_a)
+        Wa    = flow.Wa
+        Wt    = flow.Wt
+        alpha = flow.alpha
+        W     = flow.W
+        Ma    = flow.Ma
+        Gamma = flow.Gamma
+        Cl    = flow.Cl
 
         Re      = (W*c)/nu
         
@@ -299,37 +374,268 @@ class Propeller(Energy_Component):
         deltar   = (r[1]-r[0])
         thrust   = rho*B*(np.sum(Gamma*(Wt-epsilon*Wa)*deltar,axis=1)[:,None])
         torque   = rho*B*np.sum(Gamma*(Wa+epsilon*Wt)*r*deltar,axis=1)[:,None]
-        power    = torque*omega       
-       
-        D        = 2*R
-        Cp       = power/(rho*(n*n*n)*(D*D*D*D*D))
-
-        thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
-        power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
         
-        thrust[omega1<0.0] = - thrust[omega1<0.0]
+        return thrust, torque, Cd, Cl
+    
 
-        etap     = V*thrust/power     
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Energy-Converters
+def solve_inflow(psi,inputs,B,R,cl_a,tol=1e-5,maximum_iterations=500):
+    """Solves for the inflow angle at each blade element with a Newton iteration. The
+    elements are independent, so the ones that have settled are left out of later
+    iterations.
+
+    Assumptions:
+    The steps are limited to 0.1 radians. An element has settled once its Newton step
+    is within the tolerance, and keeps the inflow angle from that step.
+
+    Source:
+    Qprop theory document
+
+    Inputs:
+    psi                          [radians] initial inflow angles
+    inputs                       (Ua, Ut, U, a, r, beta, c), see blade_element
+    B                            [-]
+    R                            [m]
+    cl_a                         [1/radians]
+    tol                          [radians]
+    maximum_iterations           [-]
+
+    Outputs:
+    psi                          [radians]
+    iterations                   [-]
+    converged                    <boolean>
+
+    Properties Used:
+    N/A
+    """
+    
+    psi       = psi*1.
+    flat      = psi.reshape(-1)
+    index     = np.arange(flat.size)
+    elements  = [np.ravel(x) for x in inputs]
+    psi_a     = flat*1.
+    converged = False
+    pi        = np.pi
+    
+    # Settled elements that are past the stall limit
+    settled_high = False
+    
+    iterations = 0
+    while iterations < maximum_iterations:
+        iterations += 1
         
-        conditions.propulsion.etap = etap
+        flow    = blade_element(psi_a,*elements,B=B,R=R,cl_a=cl_a)
+        dR_dpsi = inflow_derivative(flow,*elements,B=B,R=R,cl_a=cl_a)
         
-        # store data
-        results_conditions = Data      
-        conditions.propulsion.acoustic_outputs = results_conditions(
-            number_sections    = N,
-            r0                 = r,
-            airfoil_chord      = c,
-            blades_number      = B,
-            propeller_diameter = D,
-            drag_coefficient   = Cd,
-            lift_coefficient   = Cl,
-            omega              = omega,
-            velocity           = V,
-            thrust             = thrust,
-            power              = power,
-            mid_chord_aligment = self.prop_attributes.mid_chord_aligment
-        )
+        # Limit the steps, a full Newton step from far off can land on a spurious root
+        dpsi    = np.clip(-flow.Rsquiggly/dR_dpsi,-0.1,0.1)
+        psi_new = psi_a + dpsi
+        moving  = np.abs(dpsi) > tol
         
+        # If its really not going to converge
+        if np.any(moving) and (settled_high or np.any(psi_new>(pi*85.0/180.))) and np.any(dpsi>0.0):
+            break
         
-        return thrust, torque, power, Cp
-    
\ No newline at end of file
+        psi_a = psi_new
+        
+        # Leave the settled elements out of later iterations
+        if not np.all(moving):
+            flat[index]  = psi_a
+            settled_high = settled_high or np.any(psi_a[~moving]>(pi*85.0/180.))
+            index        = index[moving]
+            psi_a        = psi_a[moving]
+            elements     = [x[moving] for x in elements]
+            
+            if len(index) == 0:
+                converged = True
+                break
+        
+    flat[index] = psi_a
+        
+    return psi, iterations, converged
+
+## @ingroup Components-Energy-Converters
+def blade_element(psi,Ua,Ut,U,a,r,beta,c,B,R,cl_a):
+    """Computes the flow and the circulation residual at blade elements for given
+    inflow angles.
+
+    Assumptions:
+    per source
+
+    Source:
+    Qprop theory document
+
+    Inputs:
+    psi                          [radians] inflow angle
+    Ua                           [m/s] axial velocity
+    Ut                           [m/s] tangential velocity
+    U                            [m/s] total velocity
+    a                            [m/s] speed of sound
+    r                            [m] radius
+    beta                         [radians] twist
+    c                            [m] chord
+    B                            [-] number of blades
+    R                            [m] tip radius
+    cl_a                         [1/radians] lift curve slope
+
+    Outputs:
+    flow.
+      Wa, Wt, W                  [m/s]
+      alpha                      [radians]
+      Ma                         [-]
+      Gamma                      [m^2/s]
+      Cl                         [-]
+      Rsquiggly                  [m^2/s] circulation residual
+      scaled                     <boolean> where the Karman-Tsien scaling applies
+      (intermediate terms used by inflow_derivative)
+
+    Properties Used:
+    N/A
+    """
+    
+    pi      = np.pi
+    sin_psi = np.sin(psi)
+    cos_psi = np.cos(psi)
+    Wa      = 0.5*Ua + 0.5*U*sin_psi
+    Wt      = 0.5*Ut + 0.5*U*cos_psi   
+    #va     = Wa - Ua
+    vt      = Ut - Wt
+    alpha   = beta - np.arctan2(Wa,Wt)
+    W       = (Wa*Wa + Wt*Wt)**0.5
+    Ma      = (W)/a #a is the speed of sound
+    
+    #if np.any(Ma> 1.0):
+        #warn('Propeller blade tips are supersonic.', Warning)
+    
+    lamdaw = r*Wa/(R*Wt)
+    
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+    
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    g            = 4.*lamdaw*R/(pi*B*r)
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+g*g)**0.5
+    
+    # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
+    Cl = cl_a*alpha
+    
+    # By 90 deg, it's totally stalled.
+    Cl[alpha>=pi/2] = 0.
+    Cl_0 = Cl*1.
+    
+    # Scale for Mach, this is Karmen_Tsien, up to its pole
+    scaling = np.ones_like(Cl)
+    scaling[Ma<1.] = (1-Ma[Ma<1.]*Ma[Ma<1.])**0.5+((Ma[Ma<1.]*Ma[Ma<1.])/(1+(1-Ma[Ma<1.]*Ma[Ma<1.])**0.5))*Cl[Ma<1.]/2
+    scaled  = (Ma<1.) & (scaling>0.)
+    Cl[scaled] = Cl[scaled]/scaling[scaled]
+    
+    # If the blade segments are supersonic or past the pole, don't scale
+    
+    Rsquiggly = Gamma - 0.5*W*c*Cl
+    
+    flow = Data()
+    flow.sin_psi      = sin_psi
+    flow.cos_psi      = cos_psi
+    flow.Wa           = Wa
+    flow.Wt           = Wt
+    flow.vt           = vt
+    flow.alpha        = alpha
+    flow.W            = W
+    flow.Ma           = Ma
+    flow.lamdaw       = lamdaw
+    flow.f            = f
+    flow.piece        = piece
+    flow.F            = F
+    flow.g            = g
+    flow.Gamma        = Gamma
+    flow.Cl_0         = Cl_0
+    flow.Cl           = Cl
+    flow.Rsquiggly    = Rsquiggly
+    flow.scaled       = scaled
+    
+    return flow
+
+## @ingroup Components-Energy-Converters
+def inflow_derivative(flow,Ua,Ut,U,a,r,beta,c,B,R,cl_a):
+    """Computes the derivative of the circulation residual with respect to the inflow
+    angle.
+
+    Assumptions:
+    The chain rule through the terms of blade_element, with the same limiters and the
+    same Karman-Tsien scaling
+
+    Source:
+    Qprop theory document
+
+    Inputs:
+    flow                         see blade_element
+    Ua, Ut, U, a, r, beta, c     see blade_element
+    B                            [-]
+    R                            [m]
+    cl_a                         [1/radians]
+
+    Outputs:
+    dR_dpsi                      [m^2/s]
+
+    Properties Used:
+    N/A
+    """
+    
+    pi     = np.pi
+    Wa     = flow.Wa
+    Wt     = flow.Wt
+    W      = flow.W
+    Ma     = flow.Ma
+    lamdaw = flow.lamdaw
+    f      = flow.f
+    piece  = flow.piece
+    F      = flow.F
+    g      = flow.g
+    Cl_0   = flow.Cl_0
+    Cl     = flow.Cl
+    
+    # The velocities
+    dWa_dpsi = 0.5*U*flow.cos_psi
+    dWt_dpsi = -0.5*U*flow.sin_psi
+    dvt_dpsi = -dWt_dpsi
+    dW_dpsi  = (Wa*dWa_dpsi + Wt*dWt_dpsi)/W
+    
+    # The circulation from the tip loss
+    dlamdaw_dpsi = r*(dWa_dpsi*Wt - Wa*dWt_dpsi)/(R*Wt*Wt)
+    dlamdaw_dpsi[lamdaw<=0.] = 0.
+    dpiece_dpsi  = piece*f*dlamdaw_dpsi/lamdaw
+    dF_dpsi      = -2.*dpiece_dpsi/(pi*(1.-piece*piece)**0.5)
+    dF_dpsi[piece==0.] = 0.
+    dg_dpsi      = g*dlamdaw_dpsi/lamdaw
+    dg_dpsi[lamdaw<=0.] = 0.
+    root         = (1.+g*g)**0.5
+    dGamma_dpsi  = (4.*pi*r/B)*((dvt_dpsi*F + flow.vt*dF_dpsi)*root + flow.vt*F*g*dg_dpsi/root)
+    
+    # The lift, with the Karman-Tsien scaling where it applies
+    dalpha_dpsi = -(Wt*dWa_dpsi - Wa*dWt_dpsi)/(W*W)
+    dCl_0_dpsi  = cl_a*dalpha_dpsi
+    dCl_0_dpsi[flow.alpha>=pi/2] = 0.
+    dCl_dpsi    = dCl_0_dpsi*1.
+    sub         = flow.scaled
+    M           = Ma[sub]
+    dM          = dW_dpsi[sub]/a[sub]
+    s           = (1.-M*M)**0.5
+    k           = M*M/(1.+s)
+    ds          = -M*dM/s
+    dk          = (2.*M*dM*(1.+s) - M*M*ds)/((1.+s)*(1.+s))
+    D           = s + k*Cl_0[sub]/2.
+    dD          = ds + dk*Cl_0[sub]/2. + k*dCl_0_dpsi[sub]/2.
+    dCl_dpsi[sub] = (dCl_0_dpsi[sub]*D - Cl_0[sub]*dD)/(D*D)
+    
+    dR_dpsi = dGamma_dpsi - 0.5*c*(dW_dpsi*Cl + W*dCl_dpsi)
+    
+    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+    
+    return dR_dpsi
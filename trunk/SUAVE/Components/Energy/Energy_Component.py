@@ -3,11 +3,14 @@
 # 
 # Created:  Aug 2014, E. Botero
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ------------------------------------------------------------
 #  Imports
 # ------------------------------------------------------------
 
+import numpy as np
+
 from SUAVE.Core import Data
 from SUAVE.Components import Physical_Component
 
@@ -48,4 +51,115 @@ class Energy_Component(Physical_Component):
         # function handles for output
         self.outputs = Data()
         
-        return
\ No newline at end of file
+        return
+
+    def evaluate(self,conditions,cache=None,compute=None):
+        """Runs the component, or takes its last results from a cache when nothing it
+        depends on has changed since.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions      [Data()]
+        cache           <Component_Cache> or None to always run the component
+        compute         <method> of the component, the one it is called with by default
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        if compute is None:
+            compute = self.__call__
+
+        if cache is None:
+            return compute(conditions)
+
+        return cache.evaluate(self,conditions,compute)
+
+    def fingerprint(self,conditions,cache):
+        """Describes everything the results of the component depend on, so a cache can
+        tell whether they are still valid. Components that depend on other conditions
+        should extend this.
+
+        Assumptions:
+        The component depends on its inputs, its own attributes and the conditions, but
+        not on its position or mass properties. The conditions are described by the
+        version the cache gives them. Arrays the cache doesn't know are described by
+        their contents, as some are changed in place.
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions      [Data()]
+        cache           <Component_Cache>
+
+        Outputs:
+        fingerprint     <list> of the conditions version and of a description per attribute
+
+        Properties Used:
+        N/A
+        """
+        memo  = cache.described
+        items = [cache.version]
+        for key, value in dict.items(self):
+            if key not in fingerprint_exclusions:
+                items.append((key,describe(value,memo)))
+
+        return items
+
+# attributes of a component that its results don't depend on
+fingerprint_exclusions = set(['outputs','tag','origin','mass_properties','symmetric'])
+
+# ----------------------------------------------------------------------
+#  Fingerprint Helper
+# ----------------------------------------------------------------------
+## @ingroup Energy
+def describe(value,memo=None):
+    """Describes a value for a fingerprint, with the values in it if it is a container
+
+    Assumptions:
+    Objects that aren't plain containers, arrays or plain values, like the working fluid
+    or the fuel, are described by their identity. Arrays in the memo haven't changed
+    since they were described, or since the component that made them handed them on.
+
+    Source:
+    N/A
+
+    Inputs:
+    value     anything
+    memo      <dict> of the arrays already described or handed on, by identity, or None
+
+    Outputs:
+    description, equal for equal values
+
+    Properties Used:
+    N/A
+    """
+    kind = type(value)
+    if kind in plain_values or value is None:
+        return value
+    elif kind is np.ndarray or isinstance(value,(np.ndarray,np.number)):
+        described = memo.get(id(value)) if memo is not None else None
+        if described is None:
+            array     = np.asarray(value)
+            described = (value,(array.shape,array.dtype.str,array.tobytes()))
+            if memo is not None:
+                memo[id(value)] = described
+        return described[1]
+    elif kind is Data or kind is dict:
+        return tuple((k,describe(v,memo)) for k, v in dict.items(value))
+    elif kind is list or kind is tuple:
+        return tuple(describe(v,memo) for v in value)
+
+    # the object is kept with its identity, so the identity isn't given to another one
+    return (id(value),value)
+
+# values described by themselves
+plain_values = set([float,int,bool,str])
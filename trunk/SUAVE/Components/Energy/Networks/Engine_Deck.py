@@ -0,0 +1,229 @@
+## @ingroup Components-Energy-Networks
+# Engine_Deck.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# suave imports
+import SUAVE
+
+# package imports
+import numpy as np
+from SUAVE.Components.Propulsors.Propulsor import Propulsor
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.Surrogates import Grid_Surrogate
+from SUAVE.Methods.Propulsion.engine_deck import load_engine_deck
+
+# ----------------------------------------------------------------------
+#  Network
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Energy-Networks
+class Engine_Deck(Propulsor):
+    """ This interpolates an engine deck made by build_engine_deck from a gas turbine
+        network, in place of the network.
+
+        Set the deck, or the input file it was saved to, and build the surrogate when
+        setting up the vehicle.
+
+        Assumptions:
+        The tables are monotone cubic splines in altitude, Mach number, throttle and
+        deviation from the standard day temperature, exact at the nodes of the deck.
+        Points outside of the deck are held to its edges, except that the thrust and the
+        fuel flow go on linearly in throttle with their slopes at the edge, so a mission
+        solver still sees them respond to the throttle there.
+
+        Source:
+        Fritsch and Carlson, Monotone Piecewise Cubic Interpolation, SIAM J. Numer. Anal., 1980
+    """
+    def __defaults__(self):
+        """ This sets the default values for the network to function.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.nacelle_diameter  = None
+        self.engine_length     = None
+        self.number_of_engines = None
+        self.tag               = 'Engine_Deck'
+        self.input_file        = None
+        self.deck              = None
+        self.surrogates        = None
+        self.thrust_angle      = 0.0
+        self.areas             = Data()
+        self.atmosphere        = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    # manage process with a driver function
+    def evaluate_thrust(self,state):
+        """ Calculate thrust given the current state of the vehicle
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            state.conditions.freestream.
+              altitude                  [m]
+              mach_number               [-]
+              temperature               [K]
+            state.conditions.propulsion.
+              throttle                  [-]
+
+            Outputs:
+            results.thrust_force_vector [newtons]
+            results.vehicle_mass_rate   [kg/s]
+            conditions.propulsion.acoustic_outputs.core, .fan (where the deck has them):
+                exit_static_temperature
+                exit_static_pressure
+                exit_stagnation_temperature
+                exit_stagnation_pressure
+                exit_velocity
+
+            Properties Used:
+            self.deck.throttle
+            self.surrogates
+            self.atmosphere
+            self.thrust_angle
+        """
+
+        if self.surrogates is None:
+            self.build_surrogate()
+        surrogates = self.surrogates
+
+        # Unpack the conditions
+        conditions = state.conditions
+        altitude   = conditions.freestream.altitude
+        mach       = conditions.freestream.mach_number
+        throttle   = conditions.propulsion.throttle
+
+        # The deviation from the standard day, only needed if the deck has more than one
+        if len(self.deck.temperature_deviation) > 1:
+            standard  = self.atmosphere.compute_values(altitude).temperature
+            delta_isa = conditions.freestream.temperature - standard
+        else:
+            delta_isa = 0.*altitude
+
+        # Run all the tables for all the points at once, with the throttle in the deck
+        held   = np.clip(throttle,self.deck.throttle[0],self.deck.throttle[-1])
+        tables = surrogates.tables(altitude,mach,held,delta_isa)
+        
+        # Linear in throttle beyond the deck for the thrust and the fuel flow
+        beyond = throttle - held
+        if np.any(beyond != 0.):
+            slopes = surrogates.tables.gradient(altitude,mach,held,delta_isa)[2]
+            tables[:,:,:2] = tables[:,:,:2] + slopes[:,:,:2]*beyond[:,:,None]
+        
+        F      = tables[:,:,0]
+        mdot   = tables[:,:,1]
+
+        # Save the output
+        results = Data()
+        results.thrust_force_vector = F * [np.cos(self.thrust_angle),0,-np.sin(self.thrust_angle)]
+        results.vehicle_mass_rate   = mdot
+
+        exhaust = Data()
+        for (stream, key), values in zip(surrogates.exhaust,np.rollaxis(tables[:,:,2:],2)):
+            exhaust.setdefault(stream,Data())[key] = values
+        for stream, outputs in exhaust.items():
+            conditions.propulsion.acoustic_outputs[stream] = outputs
+
+        return results
+
+    def build_surrogate(self):
+        """ Fits the interpolants of the deck, reading it from the input file if it
+            isn't set.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            self.deck
+            self.surrogates.
+              tables                   <Grid_Surrogate> of the thrust, the fuel flow rate
+                                       and the exhaust tables stacked
+              exhaust                  <list> of (stream, key) of the stacked exhaust tables
+
+            Properties Used:
+            self.input_file
+        """
+
+        if self.deck is None:
+            self.deck = load_engine_deck(self.input_file)
+        deck = self.deck
+
+        if self.number_of_engines is None:
+            self.number_of_engines = deck.number_of_engines
+
+        axes = [deck.altitude,deck.mach_number,deck.throttle,deck.temperature_deviation]
+
+        # one interpolant for all the tables, so each cell is found once
+        tables  = [deck.thrust,deck.fuel_flow_rate]
+        exhaust = []
+        for stream in deck.exhaust.keys():
+            for key, values in deck.exhaust[stream].items():
+                tables.append(values)
+                exhaust.append((stream,key))
+
+        surrogates = Data()
+        surrogates.tables  = Grid_Surrogate().fit(axes,np.stack(tables,axis=-1),'pchip')
+        surrogates.exhaust = exhaust
+
+        self.surrogates = surrogates
+
+    def engine_out(self,state):
+        """ Lose an engine
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        throttle = state.conditions.propulsion.throttle*1.
+        state.conditions.propulsion.throttle[:] = 1.0
+
+        results = self.evaluate_thrust(state)
+
+        state.conditions.propulsion.throttle[:] = throttle
+
+        results.thrust_force_vector = results.thrust_force_vector/self.number_of_engines*(self.number_of_engines-1)
+        results.vehicle_mass_rate   = results.vehicle_mass_rate/self.number_of_engines*(self.number_of_engines-1)
+
+        return results
+
+    __call__ = evaluate_thrust
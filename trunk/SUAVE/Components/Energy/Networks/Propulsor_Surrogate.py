@@ -2,7 +2,7 @@
 # Propulsor_Surrogate.py
 #
 # Created:  Mar 2017, E. Botero
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +16,7 @@ import numpy as np
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
 
 from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.Surrogates import predict_surrogate, build_grid_surrogate
 import sklearn
 from sklearn import gaussian_process
 from sklearn.gaussian_process.kernels import RationalQuadratic 
@@ -99,16 +100,9 @@ class Propulsor_Surrogate(Propulsor):
         mach       = conditions.freestream.mach_number
         throttle   = conditions.propulsion.throttle
         
-        cond = np.hstack([altitude,mach,throttle])
-        
-        # Run the surrogate for a range of altitudes
-        data_len = len(altitude)
-        sfc = np.zeros([data_len,1])  
-        thr = np.zeros([data_len,1]) 
-        for ii,_ in enumerate(altitude):            
-            sfc[ii] = sfc_surrogate.predict([np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]])])    
-            thr[ii] = thr_surrogate.predict([np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]])])   #This is the fix when sklearn is update.
-
+        # Run the surrogate for all the points at once
+        sfc = predict_surrogate(sfc_surrogate,[altitude,mach,throttle])
+        thr = predict_surrogate(thr_surrogate,[altitude,mach,throttle])
         
         F    = thr
         mdot = thr*sfc*self.number_of_engines
@@ -125,9 +119,10 @@ class Propulsor_Surrogate(Propulsor):
             -Gaussian Processes
             -KNN
             -SVR
+            -Grid, tensor product interpolation of an (altitude, Mach, throttle) grid
     
             Assumptions:
-            None
+            The grid surrogate falls back to radial basis functions if the data is not a rectilinear grid
     
             Source:
             N/A
@@ -183,6 +178,10 @@ class Propulsor_Surrogate(Propulsor):
             regr_sfc = svm.SVR(C=500.)
             sfc_surrogate  = regr_sfc.fit(xy, sfc)
             thr_surrogate  = regr_thr.fit(xy, thr)           
+            
+        elif self.surrogate_type  == 'grid':
+            sfc_surrogate  = build_grid_surrogate(xy, sfc)
+            thr_surrogate  = build_grid_surrogate(xy, thr)
         
         
         # Save the output
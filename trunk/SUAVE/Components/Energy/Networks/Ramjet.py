@@ -3,6 +3,7 @@
 #
 # Created:  Jun 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -53,6 +54,7 @@ class Ramjet(Propulsor):
         self.number_of_engines = 1.0
         self.nacelle_diameter  = 1.0
         self.engine_length     = 1.0
+        self.component_cache   = None
 
     _component_root_map = None
 
@@ -93,6 +95,11 @@ class Ramjet(Propulsor):
         core_nozzle               = self.core_nozzle
         thrust                    = self.thrust
         number_of_engines         = self.number_of_engines
+        cache                     = self.component_cache
+
+        # the conditions may have been changed in place since the last evaluation
+        if cache is not None:
+            cache.start(conditions)
 
         # creating the network by manually linking the different components
 
@@ -100,25 +107,25 @@ class Ramjet(Propulsor):
         ram.inputs.working_fluid                               = self.working_fluid
 
         # flow through the ram
-        ram(conditions)
+        ram.evaluate(conditions,cache)
 
         # link inlet nozzle to ram
         inlet_nozzle.inputs          = ram.outputs
 
         # flow through the inlet nozzle
-        inlet_nozzle(conditions)
+        inlet_nozzle.evaluate(conditions,cache)
 
         # link the combustor to the inlet nozzle
         combustor.inputs             = inlet_nozzle.outputs
 
         # flow through the combustor
-        combustor.compute_rayleigh(conditions)
+        combustor.evaluate(conditions,cache,combustor.compute_rayleigh)
 
         #link the core nozzle to the combustor
         core_nozzle.inputs           = combustor.outputs
 
         # flow through the core nozzle
-        core_nozzle.compute_limited_geometry(conditions)
+        core_nozzle.evaluate(conditions,cache,core_nozzle.compute_limited_geometry)
 
         # compute the thrust using the thrust component
 
@@ -135,7 +142,7 @@ class Ramjet(Propulsor):
         thrust.inputs.flow_through_core                        =  1.0 #scaled constant to turn on core thrust computation
         thrust.inputs.flow_through_fan                         =  0.0 #scaled constant to turn on fan thrust computation
 
-        # compute the thrust
+        # compute the thrust, it reads the throttle so it isn't cached
         thrust(conditions)
 
         # getting the network outputs from the thrust outputs
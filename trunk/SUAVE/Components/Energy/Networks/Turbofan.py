@@ -7,6 +7,7 @@
 #           Aug 2017, E. Botero
 #           Oct 2017, E. Botero
 #           Nov 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -64,6 +65,7 @@ class Turbofan(Propulsor):
         self.bypass_ratio         = 1.0
         self.SFC_adjustment       = 0.0 # Less than 1 is a reduction
         self.OpenVSP_flow_through = False
+        self.component_cache      = None
         
         #areas needed for drag; not in there yet
         self.areas             = Data()
@@ -123,6 +125,11 @@ class Turbofan(Propulsor):
         thrust                    = self.thrust
         bypass_ratio              = self.bypass_ratio
         number_of_engines         = self.number_of_engines
+        cache                     = self.component_cache
+
+        # the conditions may have been changed in place since the last evaluation
+        if cache is not None:
+            cache.start(conditions)
         
         #Creating the network by manually linking the different components
         
@@ -130,42 +137,42 @@ class Turbofan(Propulsor):
         ram.inputs.working_fluid                               = self.working_fluid
         
         #Flow through the ram , this computes the necessary flow quantities and stores it into conditions
-        ram(conditions) 
+        ram.evaluate(conditions,cache)
         
         #link inlet nozzle to ram 
         inlet_nozzle.inputs.stagnation_temperature             = ram.outputs.stagnation_temperature 
         inlet_nozzle.inputs.stagnation_pressure                = ram.outputs.stagnation_pressure
         
         #Flow through the inlet nozzle
-        inlet_nozzle(conditions)
+        inlet_nozzle.evaluate(conditions,cache)
 
         #--link low pressure compressor to the inlet nozzle
         low_pressure_compressor.inputs.stagnation_temperature  = inlet_nozzle.outputs.stagnation_temperature
         low_pressure_compressor.inputs.stagnation_pressure     = inlet_nozzle.outputs.stagnation_pressure
         
         #Flow through the low pressure compressor
-        low_pressure_compressor(conditions)
+        low_pressure_compressor.evaluate(conditions,cache)
 
         #link the high pressure compressor to the low pressure compressor
         high_pressure_compressor.inputs.stagnation_temperature = low_pressure_compressor.outputs.stagnation_temperature
         high_pressure_compressor.inputs.stagnation_pressure    = low_pressure_compressor.outputs.stagnation_pressure
         
         #Flow through the high pressure compressor
-        high_pressure_compressor(conditions)
+        high_pressure_compressor.evaluate(conditions,cache)
         
         #Link the fan to the inlet nozzle
         fan.inputs.stagnation_temperature                      = inlet_nozzle.outputs.stagnation_temperature
         fan.inputs.stagnation_pressure                         = inlet_nozzle.outputs.stagnation_pressure
         
         #flow through the fan
-        fan(conditions)
+        fan.evaluate(conditions,cache)
         
         #link the combustor to the high pressure compressor
         combustor.inputs.stagnation_temperature                = high_pressure_compressor.outputs.stagnation_temperature
         combustor.inputs.stagnation_pressure                   = high_pressure_compressor.outputs.stagnation_pressure
         
         #flow through the high pressor comprresor
-        combustor(conditions)
+        combustor.evaluate(conditions,cache)
 
         # link the shaft power output to the low pressure compressor
         try:
@@ -176,7 +183,7 @@ class Turbofan(Propulsor):
             shaft_power.inputs.total_temperature_reference     = low_pressure_compressor.outputs.stagnation_temperature
             shaft_power.inputs.total_pressure_reference        = low_pressure_compressor.outputs.stagnation_pressure
     
-            shaft_power(conditions)
+            shaft_power.evaluate(conditions,cache)
         except:
             pass
 
@@ -193,7 +200,7 @@ class Turbofan(Propulsor):
         high_pressure_turbine.inputs.bypass_ratio              = 0.0 #set to zero to ensure that fan not linked here
         
         #flow through the high pressure turbine
-        high_pressure_turbine(conditions)
+        high_pressure_turbine.evaluate(conditions,cache)
                 
         #link the low pressure turbine to the high pressure turbine
         low_pressure_turbine.inputs.stagnation_temperature     = high_pressure_turbine.outputs.stagnation_temperature
@@ -218,21 +225,21 @@ class Turbofan(Propulsor):
         low_pressure_turbine.inputs.bypass_ratio               = bypass_ratio
         
         #flow through the low pressure turbine
-        low_pressure_turbine(conditions)
+        low_pressure_turbine.evaluate(conditions,cache)
         
         #link the core nozzle to the low pressure turbine
         core_nozzle.inputs.stagnation_temperature              = low_pressure_turbine.outputs.stagnation_temperature
         core_nozzle.inputs.stagnation_pressure                 = low_pressure_turbine.outputs.stagnation_pressure
         
         #flow through the core nozzle
-        core_nozzle(conditions)
+        core_nozzle.evaluate(conditions,cache)
 
         #link the dan nozzle to the fan
         fan_nozzle.inputs.stagnation_temperature               = fan.outputs.stagnation_temperature
         fan_nozzle.inputs.stagnation_pressure                  = fan.outputs.stagnation_pressure
         
         # flow through the fan nozzle
-        fan_nozzle(conditions)
+        fan_nozzle.evaluate(conditions,cache)
         
         # compute the thrust using the thrust component
         #link the thrust component to the fan nozzle
@@ -256,7 +263,7 @@ class Turbofan(Propulsor):
         thrust.inputs.flow_through_core                        = 1./(1.+bypass_ratio) #scaled constant to turn on core thrust computation
         thrust.inputs.flow_through_fan                         = bypass_ratio/(1.+bypass_ratio) #scaled constant to turn on fan thrust computation        
 
-        #compute the thrust
+        #compute the thrust, it reads the throttle so it isn't cached
         thrust(conditions)
 
         #getting the network outputs from the thrust outputs
@@ -334,16 +341,12 @@ class Turbofan(Propulsor):
             N/A
         """           
         
-        temp_throttle = np.zeros(len(state.conditions.propulsion.throttle))
-        
-        for i in range(0,len(state.conditions.propulsion.throttle)):
-            temp_throttle[i] = state.conditions.propulsion.throttle[i]
-            state.conditions.propulsion.throttle[i] = 1.0
+        temp_throttle = state.conditions.propulsion.throttle*1.
+        state.conditions.propulsion.throttle[:] = 1.0
         
         results = self.evaluate_thrust(state)
         
-        for i in range(0,len(state.conditions.propulsion.throttle)):
-            state.conditions.propulsion.throttle[i] = temp_throttle[i]
+        state.conditions.propulsion.throttle[:] = temp_throttle
         
         results.thrust_force_vector = results.thrust_force_vector/self.number_of_engines*(self.number_of_engines-1)
         results.vehicle_mass_rate   = results.vehicle_mass_rate/self.number_of_engines*(self.number_of_engines-1)
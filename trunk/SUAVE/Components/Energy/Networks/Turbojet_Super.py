@@ -4,6 +4,7 @@
 # Created:  May 2015, T. MacDonald
 # Modified: Aug 2017, E. Botero
 #           Aug 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -58,6 +59,7 @@ class Turbojet_Super(Propulsor):
         self.nacelle_diameter   = 1.0
         self.engine_length      = 1.0
         self.afterburner_active = False
+        self.component_cache    = None
 
     _component_root_map = None
 
@@ -112,6 +114,11 @@ class Turbojet_Super(Propulsor):
         core_nozzle               = self.core_nozzle
         thrust                    = self.thrust
         number_of_engines         = self.number_of_engines        
+        cache                     = self.component_cache
+
+        # the conditions may have been changed in place since the last evaluation
+        if cache is not None:
+            cache.start(conditions)
 
         #Creating the network by manually linking the different components
 
@@ -119,35 +126,35 @@ class Turbojet_Super(Propulsor):
         ram.inputs.working_fluid                               = self.working_fluid
 
         #Flow through the ram , this computes the necessary flow quantities and stores it into conditions
-        ram(conditions)
+        ram.evaluate(conditions,cache)
 
         #link inlet nozzle to ram 
         inlet_nozzle.inputs.stagnation_temperature             = ram.outputs.stagnation_temperature 
         inlet_nozzle.inputs.stagnation_pressure                = ram.outputs.stagnation_pressure
 
         #Flow through the inlet nozzle
-        inlet_nozzle(conditions)
+        inlet_nozzle.evaluate(conditions,cache)
 
         #--link low pressure compressor to the inlet nozzle
         low_pressure_compressor.inputs.stagnation_temperature  = inlet_nozzle.outputs.stagnation_temperature
         low_pressure_compressor.inputs.stagnation_pressure     = inlet_nozzle.outputs.stagnation_pressure
 
         #Flow through the low pressure compressor
-        low_pressure_compressor(conditions)
+        low_pressure_compressor.evaluate(conditions,cache)
 
         #link the high pressure compressor to the low pressure compressor
         high_pressure_compressor.inputs.stagnation_temperature = low_pressure_compressor.outputs.stagnation_temperature
         high_pressure_compressor.inputs.stagnation_pressure    = low_pressure_compressor.outputs.stagnation_pressure
 
         #Flow through the high pressure compressor
-        high_pressure_compressor(conditions)
+        high_pressure_compressor.evaluate(conditions,cache)
 
         #link the combustor to the high pressure compressor
         combustor.inputs.stagnation_temperature                = high_pressure_compressor.outputs.stagnation_temperature
         combustor.inputs.stagnation_pressure                   = high_pressure_compressor.outputs.stagnation_pressure
 
         #flow through the high pressor comprresor
-        combustor(conditions)
+        combustor.evaluate(conditions,cache)
 
         #link the high pressure turbine to the combustor
         high_pressure_turbine.inputs.stagnation_temperature    = combustor.outputs.stagnation_temperature
@@ -158,7 +165,7 @@ class Turbojet_Super(Propulsor):
         high_pressure_turbine.inputs.compressor                = high_pressure_compressor.outputs
 
         #flow through the high pressure turbine
-        high_pressure_turbine(conditions)
+        high_pressure_turbine.evaluate(conditions,cache)
 
         #link the low pressure turbine to the high pressure turbine
         low_pressure_turbine.inputs.stagnation_temperature     = high_pressure_turbine.outputs.stagnation_temperature
@@ -174,7 +181,7 @@ class Turbojet_Super(Propulsor):
         low_pressure_turbine.inputs.bypass_ratio               = 0.0
 
         #flow through the low pressure turbine
-        low_pressure_turbine(conditions)
+        low_pressure_turbine.evaluate(conditions,cache)
         
         if self.afterburner_active == True:
             #link the core nozzle to the afterburner
@@ -183,7 +190,7 @@ class Turbojet_Super(Propulsor):
             afterburner.inputs.nondim_ratio                        = 1.0 + combustor.outputs.fuel_to_air_ratio
             
             #flow through the afterburner
-            afterburner(conditions)
+            afterburner.evaluate(conditions,cache)
 
             #link the core nozzle to the afterburner
             core_nozzle.inputs.stagnation_temperature              = afterburner.outputs.stagnation_temperature
@@ -195,7 +202,7 @@ class Turbojet_Super(Propulsor):
             core_nozzle.inputs.stagnation_pressure                 = low_pressure_turbine.outputs.stagnation_pressure
 
         #flow through the core nozzle
-        core_nozzle(conditions)
+        core_nozzle.evaluate(conditions,cache)
 
         # compute the thrust using the thrust component
         #link the thrust component to the core nozzle
@@ -207,7 +214,7 @@ class Turbojet_Super(Propulsor):
         thrust.inputs.fuel_to_air_ratio                        = combustor.outputs.fuel_to_air_ratio 
         if self.afterburner_active == True:
             # previous fuel ratio is neglected when the afterburner fuel ratio is calculated
-            thrust.inputs.fuel_to_air_ratio += afterburner.outputs.fuel_to_air_ratio
+            thrust.inputs.fuel_to_air_ratio = combustor.outputs.fuel_to_air_ratio + afterburner.outputs.fuel_to_air_ratio
 
         #link the thrust component to the low pressure compressor 
         thrust.inputs.total_temperature_reference              = low_pressure_compressor.outputs.stagnation_temperature
@@ -216,7 +223,7 @@ class Turbojet_Super(Propulsor):
         thrust.inputs.flow_through_core                        =  1.0 #scaled constant to turn on core thrust computation
         thrust.inputs.flow_through_fan                         =  0.0 #scaled constant to turn on fan thrust computation        
 
-        #compute the thrust
+        #compute the thrust, it reads the throttle so it isn't cached
         thrust(conditions)
 
         #getting the network outputs from the thrust outputs
@@ -278,16 +285,12 @@ class Turbojet_Super(Propulsor):
             N/A
         """           
         
-        temp_throttle = np.zeros(len(state.conditions.propulsion.throttle))
-        
-        for i in range(0,len(state.conditions.propulsion.throttle)):
-            temp_throttle[i] = state.conditions.propulsion.throttle[i]
-            state.conditions.propulsion.throttle[i] = 1.0
+        temp_throttle = state.conditions.propulsion.throttle*1.
+        state.conditions.propulsion.throttle[:] = 1.0
         
         results = self.evaluate_thrust(state)
         
-        for i in range(0,len(state.conditions.propulsion.throttle)):
-            state.conditions.propulsion.throttle[i] = temp_throttle[i]
+        state.conditions.propulsion.throttle[:] = temp_throttle
         
         results.thrust_force_vector = results.thrust_force_vector/self.number_of_engines*(self.number_of_engines-1)
         results.vehicle_mass_rate   = results.vehicle_mass_rate/self.number_of_engines*(self.number_of_engines-1)
@@ -18,3 +18,4 @@ from .Battery_Propeller import Battery_Propeller
 from .Lift_Forward_Propulsor import Lift_Forward_Propulsor
 from .Scramjet import Scramjet
 from .Liquid_Rocket import Liquid_Rocket
+from .Engine_Deck import Engine_Deck
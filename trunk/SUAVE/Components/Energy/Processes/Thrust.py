@@ -5,6 +5,7 @@
 # Modified: Feb 2016, T. MacDonald, A. Variyar, M. Vegh
 #           Oct 2017, E. Botero
 #           Sep 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -27,6 +28,9 @@ from SUAVE.Components import Component, Physical_Component, Lofted_Body
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
 
+# looked up once, as going through the units package is slower than the thrust itself
+hour = Units.hour
+
 
 # ----------------------------------------------------------------------
 #  Thrust Process
@@ -184,7 +188,7 @@ class Thrust(Energy_Component):
         Isp              = Fsp*a0*(1.+bypass_ratio)/(f*g)
 
         #Computing the TSFC
-        TSFC             = f*g/(Fsp*a0*(1.+bypass_ratio))*(1.-SFC_adjustment) * Units.hour # 1/s is converted to 1/hr here
+        TSFC             = f*g/(Fsp*a0*(1.+bypass_ratio))*(1.-SFC_adjustment) * hour # 1/s is converted to 1/hr here
      
         #computing the core mass flow
         mdot_core        = mdhc*np.sqrt(Tref/total_temperature_reference)*(total_pressure_reference/Pref)
@@ -194,7 +198,7 @@ class Thrust(Energy_Component):
 
         #fuel flow rate
         a = np.array([0.])        
-        fuel_flow_rate   = np.fmax(FD2*TSFC/g,a)*1./Units.hour
+        fuel_flow_rate   = np.fmax(FD2*TSFC/g,a)*1./hour
 
         #computing the power 
         power            = FD2*u0
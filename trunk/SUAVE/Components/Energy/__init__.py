@@ -6,6 +6,7 @@
 # classes
 from .Energy_Component import Energy_Component
 from .Energy import Energy
+from .Component_Cache import Component_Cache
 
 # packages
 from . import Storages
@@ -2,7 +2,7 @@
 # Data.py
 #
 # Created:  Jun 2016, E. Botero
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -16,8 +16,39 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictget     = dict.get
 objgetattrib = object.__getattribute__
 
+# marks a missing key without raising
+_missing = object()
+
+# names defined on each class, so attribute style access doesn't need a failed lookup
+_class_attributes = {}
+
+def class_attributes(klass):
+    """ The attribute names of a class and its bases, cached per class
+
+        Assumptions:
+        Classes aren't given new attributes after their first instance is set
+
+        Source:
+        N/A
+
+        Inputs:
+        klass
+
+        Outputs:
+        names   [frozenset]
+
+        Properties Used:
+        N/A
+    """
+    names = _class_attributes.get(klass)
+    if names is None:
+        names = frozenset(dir(klass))
+        _class_attributes[klass] = names
+    return names
+
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
@@ -39,7 +70,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks for the key first, if it isn't there treats it as an object
     
             Source:
             N/A
@@ -53,10 +84,10 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,_missing)
+        if v is _missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
@@ -77,12 +108,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
-            self[k] = v
-        else:          
+        if k in class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
             object.__setattr__(self, k, v) 
+        else:
+            self[k] = v
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
@@ -102,12 +131,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
-        else:
+        if k in class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
             object.__delattr__(self, k)
+        else:
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -562,6 +589,7 @@ class Data(dict):
                 will only pack int, float, np.array and np.matrix (max rank 2)
                 if using output = 'matrix', all data values must have 
                 same length (if 1D) or number of rows (if 2D), otherwise is skipped
+                vector packing of float data is done from a cached layout, see array_layout
     
             Source:
             N/A
@@ -579,6 +607,12 @@ class Data(dict):
         
         """
         
+        # vectors are packed with the layout of the last call while the structure holds
+        if output == 'vector':
+            layout = array_layout(self)
+            if not layout is None:
+                return pack_layout(layout)
+        
         # dont require dict to have numpy
         import numpy as np
         from .Arrays import atleast_2d_col, array_type, matrix_type
@@ -606,7 +640,7 @@ class Data(dict):
                     do_pack(v) # recursion!
                     continue
                 elif not isinstance( v, valid_types ): continue
-                elif np.rank(v) > 2: continue
+                elif np.ndim(v) > 2: continue
                 # make column vectors
                 v = atleast_2d_col(v)
                 # handle output type
@@ -661,12 +695,19 @@ class Data(dict):
         """           
 
         
+        # vectors are unpacked with the layout of the last call while the structure holds
+        if getattr(M,'ndim',None) == 1:
+            layout = array_layout(self)
+            if not layout is None and layout[0] == M.shape[0]:
+                unpack_layout(layout,M)
+                return self
+        
         # dont require dict to have numpy
         import numpy as np
         from .Arrays import atleast_2d_col, array_type, matrix_type
         
         # check input type
-        vector = np.rank(M) == 1
+        vector = np.ndim(M) == 1
         
         # valid types for output
         valid_types = ( int, float,
@@ -687,7 +728,7 @@ class Data(dict):
                 elif not isinstance(v,valid_types): continue
                 
                 # get this value's rank
-                rank = np.rank(v)
+                rank = np.ndim(v)
                 
                 # get unpack index
                 index = _index[0]                
@@ -796,6 +837,201 @@ class Data(dict):
     
         return result
 
+# ----------------------------------------------------------------------
+#   Array Layout
+# ----------------------------------------------------------------------        
+
+## @ingroup Core
+def array_layout(data):
+    """ Finds where each value of a Data() goes in its packed vector. The layout is kept
+        with the data and reused until a key, a nested Data() or the shape of a value
+        changes, so the tree only has to be walked once.
+    
+        Assumptions:
+        Only nested Data() of float values and float arrays (max rank 2) are laid out,
+        anything else uses the general packing
+    
+        Source:
+        N/A
+    
+        Inputs:
+        data    - Data()
+        
+        Outputs:
+        layout  - (size, containers, edges, leaves) or None
+    
+        Properties Used:
+        N/A    
+    """
+    
+    layout = objgetattrib(data,'__dict__').get('_array_layout')
+    if not layout is None and layout_valid(layout):
+        return layout
+    
+    layout = build_layout(data)
+    if not layout is None:
+        object.__setattr__(data,'_array_layout',layout)
+    
+    return layout
+
+## @ingroup Core
+def build_layout(data):
+    """ Walks a Data() in packing order and records the size of each nested Data(), the
+        values that are skipped and the offset of each packed value
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        data    - Data()
+        
+        Outputs:
+        layout  - (size, containers, edges, leaves) or None
+    
+        Properties Used:
+        N/A    
+    """
+    
+    import numpy as np
+    
+    containers = []
+    edges      = []
+    leaves     = []
+    index      = [0]
+    
+    def do_build(D):
+        if not isinstance(D,Data): return False
+        containers.append((D,len(D)))
+        for k,v in dict.items(D):
+            start = index[0]
+            if isinstance(v,dict):
+                edges.append((D,k,v))
+                if not do_build(v): return False # recursion!
+            elif isinstance(v,float):
+                leaves.append((D,k,0,(),(),start,start+1))
+                index[0] += 1
+            elif isinstance(v,np.ndarray):
+                if v.ndim > 2:
+                    edges.append((D,k,v))
+                elif type(v) is np.ndarray and v.dtype.char == 'd' and v.ndim:
+                    leaves.append((D,k,v.ndim,v.shape,v.shape[::-1],start,start+v.size))
+                    index[0] += v.size
+                else:
+                    return False
+            elif isinstance(v,int):
+                return False
+            else:
+                edges.append((D,k,v))
+        return True
+    
+    if not do_build(data): return None
+    
+    return (index[0],containers,edges,leaves)
+
+## @ingroup Core
+def layout_valid(layout):
+    """ Checks that a Data() still has the structure its layout was built for
+    
+        Assumptions:
+        Keys are not deleted and added back in a different order
+    
+        Source:
+        N/A
+    
+        Inputs:
+        layout  - (size, containers, edges, leaves)
+        
+        Outputs:
+        valid   - boolean
+    
+        Properties Used:
+        N/A    
+    """
+    
+    import numpy as np
+    
+    size, containers, edges, leaves = layout
+    
+    for D,length in containers:
+        if len(D) != length: return False
+    for D,k,v in edges:
+        if not dictget(D,k,_missing) is v: return False
+    for D,k,rank,shape,tshape,start,stop in leaves:
+        v = dictget(D,k,_missing)
+        if rank == 0:
+            if not isinstance(v,float): return False
+        elif not (type(v) is np.ndarray and v.shape == shape and v.dtype.char == 'd'):
+            return False
+    
+    return True
+
+## @ingroup Core
+def pack_layout(layout):
+    """ Packs the values of a laid out Data() into a new vector
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        layout  - (size, containers, edges, leaves)
+        
+        Outputs:
+        M       - the packed vector
+    
+        Properties Used:
+        N/A    
+    """
+    
+    import numpy as np
+    
+    M = np.empty(layout[0])
+    for D,k,rank,shape,tshape,start,stop in layout[3]:
+        if rank == 2:
+            # column major, same as ravel(order='F')
+            M[start:stop].reshape(tshape)[:,:] = dictgetitem(D,k).T
+        else:
+            M[start:stop] = dictgetitem(D,k)
+    
+    return M
+
+## @ingroup Core
+def unpack_layout(layout,M):
+    """ Copies a packed vector into the values of a laid out Data(), arrays are 
+        updated in place
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        layout  - (size, containers, edges, leaves)
+        M       - the packed vector
+        
+        Outputs:
+        N/A
+    
+        Properties Used:
+        N/A    
+    """
+    
+    for D,k,rank,shape,tshape,start,stop in layout[3]:
+        if rank == 0:
+            D[k] = M[start]
+        elif rank == 1:
+            dictgetitem(D,k)[:] = M[start:stop]
+        else:
+            dictgetitem(D,k).T[:,:] = M[start:stop].reshape(tshape)
+    
+    return
+
 # ----------------------------------------------------------------------
 #   Module Tests
 # ----------------------------------------------------------------------        
@@ -3,6 +3,7 @@
 #
 # Created:  Jul 2016, E. Botero
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
    
 # ----------------------------------------------------------------------
@@ -20,6 +21,9 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
 from warnings import warn
 import numpy as np
 
+from .Data import class_attributes
+objgetattrib = object.__getattribute__
+
 # ----------------------------------------------------------------------
 #   Property Class
 # ----------------------------------------------------------------------   
@@ -702,7 +706,7 @@ class DataOrdered(OrderedDict):
         """        
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
+        if not key in objgetattrib(self,'__dict__') and not key in class_attributes(type(self)):
         #if not self.has_key(key) and not hasattr(self.__class__,key):
             root = dict.__getitem__(self,'_root')
             last = root[0]
@@ -0,0 +1,211 @@
+## @ingroup Input_Output-SU2
+# run_SU2_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+import os
+import tempfile
+import subprocess
+
+from SUAVE.Core import Data, redirect
+from SUAVE.Methods.Utilities.run_jobs import run_jobs
+from .write_SU2_cfg import write_SU2_cfg
+
+## @ingroup Input_Output-SU2
+def run_SU2_cases(tag,cases,settings,callback=None):
+    """Runs several SU2 cases at once, each in its own folder, within a total number
+    of processors.
+
+    Assumptions:
+    The mesh <tag>.su2 is in the working directory and is linked into each folder.
+    Without settings.parallel each case uses one processor, with it the processors
+    are shared evenly between the cases that run at once.
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>  Name of the mesh and of the case files
+    cases                        list of SU2_settings, see write_SU2_cfg
+    settings.
+      concurrent_cases           [-]       Cases run at once
+      parallel                   <boolean> Run each case with MPI
+      processors                 [-]       Total processors
+      SU2_binary                 <string>
+      mpi_command                list of the MPI launcher and its process count flag
+      run_folder                 <string>  Where the case folders are made
+      case_timeout               [s]       None to wait indefinitely
+    callback   (optional)        function(index,(CL,CD)), called as each case finishes
+
+    Outputs:
+    results                      list of (CL,CD), in the order of the cases
+
+    Properties Used:
+    N/A
+    """
+
+    number_of_cases, processors = SU2_partition(settings)
+
+    run_folder = os.path.abspath(settings.run_folder)
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+    mesh = os.path.abspath(tag + '.su2')
+
+    jobs = []
+    for SU2_settings in cases:
+        directory = tempfile.mkdtemp(prefix='SU2_case_',dir=run_folder)
+        with redirect.folder(directory,link=[mesh],force=False):
+            write_SU2_cfg(tag,SU2_settings)
+
+        job = Data()
+        job.command    = SU2_command(tag,processors,settings)
+        job.directory  = directory
+        job.stdin_file = None
+        job.log_file   = 'SU2_log.txt'
+        job.outputs    = [tag + '_history.dat']
+        job.read       = read_SU2_job
+        jobs.append(job)
+
+    return run_jobs(jobs,number_of_cases,settings.case_timeout,callback=callback)
+
+## @ingroup Input_Output-SU2
+def run_SU2_case(tag,settings):
+    """Runs one SU2 case in the working directory, with the same command as the
+    concurrent cases.
+
+    Assumptions:
+    The case file <tag>.cfg is in the working directory. With settings.parallel the
+    case uses all the processors.
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>  Name of the case file
+    settings.
+      parallel                   <boolean>
+      processors                 [-]
+      SU2_binary                 <string>
+      mpi_command                list of the MPI launcher and its process count flag
+
+    Outputs:
+    CL                           [-]
+    CD                           [-]
+
+    Properties Used:
+    N/A
+    """
+
+    if settings.parallel:
+        processors = max(1,int(settings.processors))
+    else:
+        processors = 1
+
+    command = SU2_command(tag,processors,settings)
+    status  = subprocess.call(command)
+    if status != 0:
+        raise RuntimeError('{} failed: exit status {}'.format(' '.join(command),status))
+
+    job = Data()
+    job.directory = os.getcwd()
+    job.outputs   = [tag + '_history.dat']
+
+    return read_SU2_job(job)
+
+## @ingroup Input_Output-SU2
+def SU2_command(tag,processors,settings):
+    """Builds the command that runs an SU2 case.
+
+    Assumptions:
+    A case on more than one processor is started through the MPI launcher
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>  Name of the case file
+    processors                   [-]       Processors of the case
+    settings.
+      SU2_binary                 <string>
+      mpi_command                list of the MPI launcher and its process count flag
+
+    Outputs:
+    command                      list of strings
+
+    Properties Used:
+    N/A
+    """
+
+    command = [settings.SU2_binary,tag + '.cfg']
+    if processors > 1:
+        command = list(settings.mpi_command) + [str(processors)] + command
+
+    return command
+
+## @ingroup Input_Output-SU2
+def SU2_partition(settings):
+    """Splits the processors between the cases that run at once.
+
+    Assumptions:
+    At least one case runs, on at least one processor
+
+    Source:
+    N/A
+
+    Inputs:
+    settings.
+      concurrent_cases           [-]
+      parallel                   <boolean>
+      processors                 [-]
+
+    Outputs:
+    number_of_cases              [-]       Cases run at once
+    processors                   [-]       Processors of each case
+
+    Properties Used:
+    N/A
+    """
+
+    total           = max(1,int(settings.processors))
+    number_of_cases = max(1,min(int(settings.concurrent_cases),total))
+
+    if settings.parallel:
+        processors = total // number_of_cases
+    else:
+        processors = 1
+
+    return number_of_cases, processors
+
+## @ingroup Input_Output-SU2
+def read_SU2_job(job):
+    """Reads the forces of a finished SU2 case from its convergence history.
+
+    Assumptions:
+    The last line of the history is the converged state
+
+    Source:
+    N/A
+
+    Inputs:
+    job.
+      directory                  <string>
+      outputs                    [<tag>_history.dat]
+
+    Outputs:
+    CL                           [-]
+    CD                           [-]
+
+    Properties Used:
+    N/A
+    """
+
+    with open(os.path.join(job.directory,job.outputs[0])) as history:
+        lines = history.readlines()
+
+    final_state = lines[-1].split(',')
+
+    CL = float(final_state[1])
+    CD = float(final_state[2])
+
+    return CL, CD
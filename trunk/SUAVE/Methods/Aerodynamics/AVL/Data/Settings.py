@@ -4,6 +4,7 @@
 # Created:  Dec 2014, T. Momose
 # Modified: Jan 2016, E. Botero
 #           Oct 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -61,6 +62,14 @@ class Settings(Data):
                 self.discretization           = Data()
                 self.number_control_surfaces     = 0
                 
+                # concurrent AVL runs when sampling, each in its own folder under the run folder
+                self.number_of_workers        = 1
+                self.job_timeout              = None # seconds
+                self.job_retries              = 0
+
+                # persistent samples, one entry per training point, None to always run AVL
+                self.training_cache_directory = None
+                
                 self.discretization.defaults  = Data()
                 self.discretization.surfaces  = Data()
                 self.discretization.defaults.wing                             = AVL_Discretization_Settings()
@@ -0,0 +1,174 @@
+## @ingroup Methods-Aerodynamics-AVL
+# run_jobs.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+
+from SUAVE.Core import Data, redirect
+from SUAVE.Methods.Utilities.run_jobs                import run_jobs
+from SUAVE.Methods.Aerodynamics.AVL.read_results     import read_results
+from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
+from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
+from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
+from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
+
+# ----------------------------------------------------------------------
+#  Run Jobs
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AVL
+def run_parallel_analysis(avl_object,run_conditions):
+    """ Runs AVL for several sets of conditions at once, each set in its own
+    directory under the run folder
+
+    Assumptions:
+        The settings are the same for all the sets of conditions
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        run_conditions - list of conditions, as passed to evaluate_conditions
+
+    Outputs:
+        results        - list of conditions with the AVL results, one per input
+
+    Properties Used:
+        avl_object.settings.
+          filenames.run_folder
+          number_of_workers
+          job_timeout         [s]
+          job_retries
+        avl_object.keep_files
+    """
+    settings   = avl_object.settings
+    run_folder = os.path.abspath(settings.filenames.run_folder)
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    jobs = []
+    for conditions in run_conditions:
+        directory = tempfile.mkdtemp(prefix='avl_job_',dir=run_folder)
+        jobs.append(setup_avl_job(avl_object,conditions,directory))
+
+    results = run_jobs(jobs,settings.number_of_workers,settings.job_timeout,settings.job_retries)
+
+    if not avl_object.keep_files:
+        shutil.rmtree(run_folder)
+
+    return results
+
+## @ingroup Methods-Aerodynamics-AVL
+def setup_avl_job(avl_object,run_conditions,directory):
+    """ Writes the geometry, run cases and input deck of one AVL run into a directory
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        run_conditions - conditions, as passed to evaluate_conditions
+        directory      - an empty working directory for this run
+
+    Outputs:
+        job.
+          command      - AVL executable and geometry file
+          directory
+          stdin_file   - the input deck, relative to the directory
+          log_file
+          outputs      - result filenames, relative to the directory
+          cases        - run cases, with the result filenames in the directory
+          read         - function reading the results of a finished job
+
+    Properties Used:
+        avl_object.settings.filenames.
+          avl_bin_name
+          output_template
+          batch_template
+          deck_template
+        avl_object.current_status.batch_index
+    """
+
+    filenames = avl_object.settings.filenames
+
+    # rename default avl aircraft tag
+    filenames.features = avl_object.geometry._base.tag + '.avl'
+
+    # update current status
+    avl_object.current_status.batch_index += 1
+    batch_index                            = avl_object.current_status.batch_index
+    avl_object.current_status.batch_file   = filenames.batch_template.format(batch_index)
+    avl_object.current_status.deck_file    = filenames.deck_template.format(batch_index)
+
+    # control surfaces
+    num_cs = 0
+    for wing in avl_object.geometry.wings:
+        for segment in wing.Segments:
+            num_cs = num_cs + len(wing.Segments[segment].control_surfaces)
+
+    # translate conditions
+    cases = translate_conditions_to_cases(avl_object,run_conditions)
+    for case in cases:
+        cases[case].stability_and_control.number_control_surfaces = num_cs
+        cases[case].result_filename = filenames.output_template.format(case)
+    avl_object.current_status.cases = cases
+
+    # write the input files
+    with redirect.folder(directory,force=False):
+        write_geometry(avl_object)
+        write_run_cases(avl_object)
+        write_input_deck(avl_object)
+
+    job = Data()
+    job.command    = [filenames.avl_bin_name,filenames.features]
+    job.directory  = directory
+    job.stdin_file = avl_object.current_status.deck_file
+    job.log_file   = 'avl_log.txt'
+    job.outputs    = [cases[case].result_filename for case in cases]
+    job.cases      = cases
+    job.read       = read_avl_job
+
+    # the results are read from outside the directory
+    for case in cases:
+        cases[case].result_filename = os.path.join(directory,cases[case].result_filename)
+
+    return job
+
+## @ingroup Methods-Aerodynamics-AVL
+def read_avl_job(job):
+    """ Reads the results of a finished AVL job
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        job            - see setup_avl_job
+
+    Outputs:
+        results        - conditions with the AVL results
+
+    Properties Used:
+        N/A
+    """
+    status = Data()
+    status.current_status = Data()
+    status.current_status.cases = job.cases
+
+    results_avl = read_results(status)
+
+    return translate_results_to_conditions(job.cases,results_avl)
@@ -0,0 +1,65 @@
+## @ingroup Methods-Aerodynamics-AVL
+# training_store.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+
+from SUAVE.Core import redirect
+from SUAVE.Methods.Aerodynamics.AVL.write_geometry import write_geometry
+from SUAVE.Methods.Utilities.Surrogates import Training_Store, training_key, file_digest
+
+# ----------------------------------------------------------------------
+#  AVL Training Store
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AVL
+def avl_training_store(avl_object,*inputs):
+    """ Opens the training store of an AVL analysis, keyed by the AVL geometry file
+    written for the current geometry and discretization
+
+    Assumptions:
+        The geometry file holds everything the results depend on, besides the
+        run conditions of each sample point and the inputs given here
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        inputs         - anything else the samples depend on, see training_key
+
+    Outputs:
+        store          - <Training_Store>, disabled when there is no training cache directory
+
+    Properties Used:
+        avl_object.settings.training_cache_directory
+        avl_object.geometry._base.tag
+    """
+    settings  = avl_object.settings
+    directory = settings.training_cache_directory
+    if directory is None:
+        return Training_Store()
+
+    # export the geometry in a scratch folder
+    settings.filenames.features = avl_object.geometry._base.tag + '.avl'
+    scratch = tempfile.mkdtemp(prefix='avl_geometry_')
+    try:
+        with redirect.folder(scratch,force=False):
+            write_geometry(avl_object)
+        digest = file_digest(os.path.join(scratch,settings.filenames.features))
+    finally:
+        shutil.rmtree(scratch)
+
+    store           = Training_Store()
+    store.directory = directory
+    store.key       = training_key('avl',digest,*inputs)
+
+    return store
@@ -4,4 +4,4 @@
 
 from .aircraft_total import aircraft_total
 from .fuselage_correction import fuselage_correction
-from .weissinger_vortex_lattice import weissinger_vortex_lattice
\ No newline at end of file
+from .weissinger_vortex_lattice import weissinger_vortex_lattice, weissinger_vortex_lattice_batch
\ No newline at end of file
@@ -5,6 +5,7 @@
 # Modified: Apr 2017, T. MacDonald
 #           Oct 2017, E. Botero
 #           Jun 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -13,6 +14,9 @@
 
 # package imports
 import numpy as np 
+import scipy.linalg
+
+from SUAVE.Core import Data
 
 # ----------------------------------------------------------------------
 #  Weissinger Vortex Lattice
@@ -52,149 +56,237 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     Properties Used:
     N/A
     """ 
+    
+    # conditions
+    aoa = conditions.aerodynamics.angle_of_attack
+    
+    if wing.vertical:
+        return 0.0, 0.0
+    
+    CL, CD = weissinger_vortex_lattice_batch(np.atleast_1d(aoa),configuration,wing)
+    
+    return CL[0], CD[0]
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def weissinger_vortex_lattice_batch(angles,configuration,wing,mach=None):
+    """Uses the vortex lattice method to compute the lift coefficient and induced drag component
+    at several angles of attack. The influence matrix only depends on the wing, so it is
+    factored once and all the angles are solved together.
+
+    Assumptions:
+    The Prandtl-Glauert rule scales the incompressible lift by 1/beta and the induced drag
+    by 1/beta^2 when Mach numbers are given
+
+    Source:
+    An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
+
+    Inputs:
+    angles                                  [radians]  vector of angles of attack
+    mach                                    [Unitless] optional, scalar or one per angle
+    wing                                    (see weissinger_vortex_lattice)
+    configuration.number_panels_spanwise    [Unitless]
+
+    Outputs:
+    CL                                      [Unitless] one per angle
+    CD                                      [Unitless] one per angle
+
+    Properties Used:
+    N/A
+    """ 
+    
+    aoa = np.array(angles,dtype=float).ravel()
+    
+    if wing.vertical:
+        return np.zeros_like(aoa), np.zeros_like(aoa)
+    
+    panels = wing_panels(configuration,wing)
+    
+    # factor the influence matrix once
+    A  = influence_matrix(panels)
+    LU = scipy.linalg.lu_factor(A.T)
+    
+    # vortex strength of each panel (rows) at each angle (columns)
+    RHS = np.sin(panels.twist[:,None] + aoa[None,:])
+    T   = scipy.linalg.lu_solve(LU,RHS)
+    
+    sin_aoa = np.sin(aoa)
+    cos_aoa = np.cos(aoa)
+    
+    # Calculating the effective velocty         
+    v   = np.dot(A*0.25/np.pi,T)
+    
+    Lfi = -T * (sin_aoa-v)
+    Lfk =  T * cos_aoa 
+    Lft = -Lfi * sin_aoa + Lfk * cos_aoa
+    Dg  =  Lfi * cos_aoa + Lfk * sin_aoa
+    
+    deltax = np.atleast_1d(panels.deltax)[:,None]
+    L  = deltax * Lft
+    D  = deltax * Dg
+    
+    # Total lift
+    LT = np.sum(L,axis=0)
+    DT = np.sum(D,axis=0)
+    
+    Sref = wing.areas.reference
+    CL = 2*LT/(0.5*Sref)
+    CD = 2*DT/(0.5*Sref)     
+    
+    # compressibility
+    if mach is not None:
+        beta = np.sqrt(1. - np.array(mach,dtype=float)**2)
+        CL   = CL/beta
+        CD   = CD/beta**2
+    
+    return CL, CD
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def wing_panels(configuration,wing):
+    """Places the horseshoe vortices and control points on one half of a wing
+
+    Assumptions:
+    Wing segments are linear in chord and twist between their breaks
+
+    Source:
+    An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
+
+    Inputs:
+    wing                                    (see weissinger_vortex_lattice)
+    configuration.number_panels_spanwise    [Unitless]
+
+    Outputs:
+    panels.
+      ya, yb                                [m] start and end of the horseshoe vortices
+      xa                                    [m] x coordinate of the horseshoe vortices
+      x, y                                  [m] control points
+      twist                                 [radians]
+      deltax                                [m] panel widths
+
+    Properties Used:
+    N/A
+    """ 
 
     #unpack
     span        = wing.spans.projected
     root_chord  = wing.chords.root
     tip_chord   = wing.chords.tip
     sweep       = wing.sweeps.quarter_chord
-    taper       = wing.taper
     twist_rc    = wing.twists.root
     twist_tc    = wing.twists.tip
     sym_para    = wing.symmetric
-    Sref        = wing.areas.reference
-    orientation = wing.vertical
     
     n  = configuration.number_panels_spanwise
     
-    # conditions
-    aoa = conditions.aerodynamics.angle_of_attack
-    
     # chord difference
     dchord = (root_chord-tip_chord)
     if sym_para is True :
         span = span/2
         
     deltax  = span/n    
-    sin_aoa = np.sin(aoa)
-    cos_aoa = np.cos(aoa)
-
-    if orientation == False :
-
-        # Determine if wing segments are defined  
-        n_segments           = len(wing.Segments.keys())
-        segment_vortex_index = np.zeros(n_segments)
-        # If spanwise stations are setup
-        if n_segments>0:
-            # discretizing the wing sections into panels
-            i             = np.arange(0,n)
-            j             = np.arange(0,n+1)
-            y_coordinates = (j)*deltax             
-            segment_chord = np.zeros(n_segments)
-            segment_twist = np.zeros(n_segments)
-            segment_sweep = np.zeros(n_segments)
-            segment_span  = np.zeros(n_segments)
-            segment_chord_x_offset = np.zeros(n_segments)
-            section_stations       = np.zeros(n_segments)
-            
-            # obtain chord and twist at the beginning/end of each segment
-            for i_seg in range(n_segments):                
-                segment_chord[i_seg]    = wing.Segments[i_seg].root_chord_percent*root_chord
-                segment_twist[i_seg]    = wing.Segments[i_seg].twist
-                segment_sweep[i_seg]    = wing.Segments[i_seg].sweeps.quarter_chord
-                section_stations[i_seg] = wing.Segments[i_seg].percent_span_location*span
-                
-                if i_seg == 0:
-                    segment_span[i_seg]           = 0.0
-                    segment_chord_x_offset[i_seg] = 0.25*root_chord # weissinger uses quarter chord as reference
-                else:
-                    segment_span[i_seg]           = wing.Segments[i_seg].percent_span_location*span - wing.Segments[i_seg-1].percent_span_location*span
-                    segment_chord_x_offset[i_seg] = segment_chord_x_offset[i_seg-1] + segment_span[i_seg]*np.tan(segment_sweep[i_seg-1])
-            
-            # shift spanwise vortices onto section breaks 
-            for i_seg in range(n_segments):
-                idx =  (np.abs(y_coordinates-section_stations[i_seg])).argmin()
-                y_coordinates[idx] = section_stations[i_seg]
-            
-            # define y coordinates of horseshoe vortices      
-            ya     = np.atleast_2d(y_coordinates[i])           
-            yb     = np.atleast_2d(y_coordinates[i+1])          
-            deltax = y_coordinates[i+1] - y_coordinates[i]
-            xa     = np.zeros(n)
-            x      = np.zeros(n)
-            y      = np.zeros(n)
-            twist_distri   = np.zeros(n)
-            section_length = np.zeros(n)
-            
-            # define coordinates of horseshoe vortices and control points
-            i_seg = 0
-            for idx in range(n):
-                twist_distri[idx]   =  segment_twist[i_seg] + ((yb[0][idx] - deltax[idx]/2 - section_stations[i_seg]) * (segment_twist[i_seg+1] - segment_twist[i_seg])/segment_span[i_seg+1])     
-                section_length[idx] =  segment_chord[i_seg] + ((yb[0][idx] - deltax[idx]/2 - section_stations[i_seg]) * (segment_chord[i_seg+1] - segment_chord[i_seg])/segment_span[i_seg+1])
-                xa[idx]             = segment_chord_x_offset[i_seg] + (yb[0][idx] - deltax[idx]/2 - section_stations[i_seg])*np.tan(segment_sweep[i_seg])                                                    # computer quarter chord points for each horseshoe vortex
-                x[idx]              = segment_chord_x_offset[i_seg] + (yb[0][idx] - deltax[idx]/2 - section_stations[i_seg])*np.tan(segment_sweep[i_seg])  + 0.5*section_length[idx]                         # computer three-quarter chord control points for each horseshoe vortex
-                y[idx]              = (yb[0][idx] -  deltax[idx]/2)                
-                
-                if y_coordinates[idx] == wing.Segments[i_seg+1].percent_span_location*span: 
-                    i_seg += 1                    
-                if y_coordinates[idx+1] == span:
-                    continue
-                                  
-            ya = np.atleast_2d(ya)  # y coordinate of start of horseshoe vortex on panel
-            yb = np.atleast_2d(yb)  # y coordinate of end horseshoe vortex on panel
-            xa = np.atleast_2d(xa)  # x coordinate of horseshoe vortex on panel
-            x  = np.atleast_2d(x)   # x coordinate of control points on panel
-            y  = np.atleast_2d(y)   # y coordinate of control points on panel
-            
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))  
-   
-        else:   # no segments defined on wing 
-            # discretizing the wing sections into panels 
-            i              = np.arange(0,n)
-            section_length = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
-            twist_distri   = twist_rc + i/float(n)*(twist_tc-twist_rc)
-            
-            ya   = np.atleast_2d((i)*deltax)                                                  # y coordinate of start of horseshoe vortex on panel
-            yb   = np.atleast_2d((i+1)*deltax)                                                # y coordinate of end horseshoe vortex on panel
-            xa   = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.25*section_length) # x coordinate of horseshoe vortex on panel
-            x    = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length) # x coordinate of control points on panel
-            y    = np.atleast_2d(((i+1)*deltax-deltax/2))                                     # y coordinate of control points on panel 
-                    
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))                                  
-                
-        
-        A = (whav(x,y,xa.T,ya.T)-whav(x,y,xa.T,yb.T)\
-            -whav(x,y,xa.T,-ya.T)+whav(x,y,xa.T,-yb.T))*0.25/np.pi
     
-        # Vortex strength computation by matrix inversion
-        T = np.linalg.solve(A.T,RHS.T).T
+    # Determine if wing segments are defined  
+    n_segments = len(wing.Segments.keys())
+    
+    # If spanwise stations are setup
+    if n_segments>0:
+        # discretizing the wing sections into panels
+        i             = np.arange(0,n)
+        j             = np.arange(0,n+1)
+        y_coordinates = (j)*deltax             
         
-        # Calculating the effective velocty         
-        A_v = A*0.25/np.pi*T
-        v   = np.sum(A_v,axis=1)
+        # obtain chord and twist at the beginning/end of each segment
+        segments         = list(wing.Segments.values())
+        segment_chord    = np.array([segment.root_chord_percent for segment in segments])*root_chord
+        segment_twist    = np.array([segment.twist for segment in segments],dtype=float)
+        segment_sweep    = np.array([segment.sweeps.quarter_chord for segment in segments],dtype=float)
+        section_stations = np.array([segment.percent_span_location for segment in segments])*span
         
-        Lfi = -T * (sin_aoa-v)
-        Lfk =  T * cos_aoa 
-        Lft = -Lfi * sin_aoa + Lfk * cos_aoa
-        Dg  =  Lfi * cos_aoa + Lfk * sin_aoa
-            
-        L  = deltax * Lft
-        D  = deltax * Dg
+        segment_span      = np.zeros(n_segments)
+        segment_span[1:]  = np.diff(section_stations)
+        segment_chord_x_offset     = np.zeros(n_segments)
+        segment_chord_x_offset[1:] = np.cumsum(segment_span[1:]*np.tan(segment_sweep[:-1]))
+        segment_chord_x_offset    += 0.25*root_chord # weissinger uses quarter chord as reference
         
-        # Total lift
-        LT = np.sum(L)
-        DT = np.sum(D)
-    
-        CL = 2*LT/(0.5*Sref)
-        CD = 2*DT/(0.5*Sref)     
+        # shift spanwise vortices onto section breaks 
+        for station in section_stations:
+            y_coordinates[np.abs(y_coordinates-station).argmin()] = station
         
-    else:
+        # define y coordinates of horseshoe vortices      
+        ya     = y_coordinates[i]
+        yb     = y_coordinates[i+1]
+        deltax = yb - ya
         
-        CL = 0.0
-        CD = 0.0    
-
+        # the segment of each panel, the panel after one starting on the next break moves on
+        seg   = np.zeros(n,dtype=int)
+        start = 0
+        for i_seg in range(1,n_segments):
+            hits = np.flatnonzero(ya[start:] == section_stations[i_seg])
+            if not len(hits):
+                break
+            start = start + hits[0] + 1
+            seg[start:] += 1
+        
+        # define coordinates of horseshoe vortices and control points
+        dy             = yb - deltax/2 - section_stations[seg]
+        twist_distri   = segment_twist[seg] + dy * (segment_twist[seg+1] - segment_twist[seg])/segment_span[seg+1]
+        section_length = segment_chord[seg] + dy * (segment_chord[seg+1] - segment_chord[seg])/segment_span[seg+1]
+        xa             = segment_chord_x_offset[seg] + dy*np.tan(segment_sweep[seg])   # quarter chord points for each horseshoe vortex
+        x              = xa + 0.5*section_length                                       # three-quarter chord control points for each horseshoe vortex
+        y              = yb - deltax/2
         
-    return CL, CD 
+    else:   # no segments defined on wing 
+        # discretizing the wing sections into panels 
+        i              = np.arange(0,n)
+        section_length = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
+        twist_distri   = twist_rc + i/float(n)*(twist_tc-twist_rc)
+        
+        ya   = (i)*deltax                                                  # y coordinate of start of horseshoe vortex on panel
+        yb   = (i+1)*deltax                                                # y coordinate of end horseshoe vortex on panel
+        xa   = ((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.25*section_length # x coordinate of horseshoe vortex on panel
+        x    = ((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length # x coordinate of control points on panel
+        y    = ((i+1)*deltax-deltax/2)                                     # y coordinate of control points on panel 
+    
+    panels = Data()
+    panels.ya     = ya
+    panels.yb     = yb
+    panels.xa     = xa
+    panels.x      = x
+    panels.y      = y
+    panels.twist  = twist_distri*np.ones(n)
+    panels.deltax = deltax
+    
+    return panels
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def influence_matrix(panels):
+    """Finds the influence of each horseshoe vortex, and its mirror image, on each control point
+
+    Assumptions:
+    None
+
+    Source:
+    An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
+
+    Inputs:
+    panels                                  (see wing_panels)
+
+    Outputs:
+    A                                       [1/m]
+
+    Properties Used:
+    N/A
+    """ 
+    
+    x  = np.atleast_2d(panels.x)
+    y  = np.atleast_2d(panels.y)
+    xa = np.atleast_2d(panels.xa).T
+    ya = np.atleast_2d(panels.ya).T
+    yb = np.atleast_2d(panels.yb).T
+    
+    A = (whav(x,y,xa,ya)-whav(x,y,xa,yb)\
+        -whav(x,y,xa,-ya)+whav(x,y,xa,-yb))*0.25/np.pi
+    
+    return A
 
 # ----------------------------------------------------------------------
 #   Helper Functions
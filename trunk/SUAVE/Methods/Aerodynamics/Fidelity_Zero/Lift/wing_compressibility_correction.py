@@ -5,6 +5,7 @@
 # Modified: Feb 2014, A. Variyar, T. Lukaczyk, T. Orra 
 #           Apr 2014, A. Variyar
 #           Jan 2015, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -22,12 +23,14 @@ def wing_compressibility_correction(state,settings,geometry):
 
     Assumptions:
     subsonic
+    The lift is not corrected again when it already includes compressibility
 
     Source:
     https://stanford.edu/~cantwell/AA200_Course_Material/AA200_Course_Notes/
     
     Inputs:
     settings.fuselage_lift_correction  [-]
+    settings.lift_includes_compressibility [-] (optional)
     state.conditions.
       freestream.mach_number           [-]
       aerodynamics.angle_of_attack     [radians]
@@ -49,11 +52,15 @@ def wing_compressibility_correction(state,settings,geometry):
     AoA            = state.conditions.aerodynamics.angle_of_attack
     wings_lift     = state.conditions.aerodynamics.lift_coefficient
     
-    # compressibility correction
-    compress_corr = 1./(np.sqrt(1.-Mc**2.))
-    
-    # correct lift
-    wings_lift_comp = wings_lift * compress_corr
+    # a lift surrogate trained on Mach numbers is already corrected
+    if settings.get('lift_includes_compressibility',False):
+        wings_lift_comp = wings_lift
+    else:
+        # compressibility correction
+        compress_corr = 1./(np.sqrt(1.-Mc**2.))
+        
+        # correct lift
+        wings_lift_comp = wings_lift * compress_corr
     
     state.conditions.aerodynamics.lift_breakdown.compressible_wings = wings_lift_comp
     state.conditions.aerodynamics.lift_coefficient= wings_lift_comp
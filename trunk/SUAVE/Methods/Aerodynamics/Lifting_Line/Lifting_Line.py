@@ -2,7 +2,7 @@
 # Lifting_Line.py
 # 
 # Created:  Aug 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 #           
 
 # ----------------------------------------------------------------------
@@ -10,6 +10,12 @@
 # ----------------------------------------------------------------------
 
 import numpy as np
+import scipy.linalg
+
+from SUAVE.Core import Data
+
+# stations and factored matrices by wing geometry
+_stations = {}
 
 # ----------------------------------------------------------------------
 #  The Function
@@ -61,26 +67,150 @@ def lifting_line(conditions,settings,geometry):
         pass
         
     # Unpack fo'real
-    b           = wing.spans.projected
     S           = wing.areas.reference
     AR          = wing.aspect_ratio
     MAC         = wing.chords.mean_aerodynamic
+    alpha       = conditions.aerodynamics.angle_of_attack
+    
+    # One angle of attack per row
+    alpha = np.reshape(alpha,(-1,1))
+    
+    # Need to set to something
+    azl   = 0. # 2-D 
+    
+    # The stations and the factored matrix only depend on the geometry
+    stations = lifting_line_stations(settings,wing)
+    b        = stations.span
+    n        = stations.n
+    thetan   = stations.thetan
+    etam     = stations.etam
+    c        = stations.chords
+    ageo     = stations.twists
+    k        = stations.k
+
+    # Left hand side vectors, one column per angle of attack
+    LHS = (k*np.sin(thetan)*(alpha+ageo-azl)).T
+        
+    # The Fourier Coefficients
+    A = scipy.linalg.lu_solve(stations.factors,LHS).T
+    
+    # The 3-D Coefficient of lift
+    CL = A[:,0]*np.pi*AR
+    
+    # Find the sectional coefficients of lift
+    Cl = b*np.cumsum(4*A*np.sin(n*thetan),axis=1)/c
+    
+    # induced alpha
+    alpha_i = np.cumsum(n*A*np.sin(n*A)/np.sin(thetan),axis=1)
+    
+    # Sectional vortex drag
+    Cdv = Cl*alpha_i
+    
+    # Total vortex drag
+    CDv = np.sum(Cdv*AR*etam,axis=1)
+    
+    #############
+    # Profile drag of a 2-D section
+    # This is currently stubbed out. If the 2-D sectional data is known it can be added to get viscous drag
+    Cdn = 0.00
+    #############
+    
+    # Find the profile drag
+    CDp = np.sum(Cdn*c*etam)/MAC
+    
+    CD  = CDv + CDp
+   
+    return CL, CD
+
+## @ingroup Methods-Aerodynamics-Lifting_line
+def lifting_line_stations(settings,wing):
+    """Finds the spanwise stations of a wing and factors the matrix of the Fourier
+    coefficients. These only depend on the geometry, so they are computed once for each
+    geometry and reused.
+
+    Assumptions:
+    Chord and twist vary linearly between segments
+
+    Source:
+    Traub, L. W., Botero, E., Waghela, R., Callahan, R., & Watson, A. (2015). Effect of Taper Ratio at Low Reynolds Number. Journal of Aircraft.
+
+    Inputs:
+    wing.
+      tag
+      spans.projected                       [m]
+      chords.root                           [m]
+      chords.tip                            [m]
+      twists.root                           [radians]
+      twists.tip                            [radians]
+      taper                                 [Unitless]
+      Segments.*.
+        percent_span_location               [Unitless]
+        root_chord_percent                  [Unitless]
+        twist                               [radians]
+    settings.number_of_stations             [int]
+
+    Outputs:
+    stations.
+      span                                  [m]
+      n                                     [Unitless]
+      thetan                                [radians]
+      etam                                  [Unitless]
+      chords                                [m]
+      twists                                [radians]
+      k                                     [1/m]
+      factors                               LU factors of the matrix
+
+    Properties Used:
+    N/A
+    """
+
+    segments = [(float(seg.percent_span_location),float(seg.root_chord_percent),float(seg.twist)) \
+                for seg in wing.Segments.values()]
+
+    key = (wing.tag, int(settings.number_of_stations), float(wing.spans.projected), float(wing.chords.root),
+           float(wing.chords.tip), float(wing.twists.root), float(wing.twists.tip), float(wing.taper),
+           tuple(segments))
+
+    if not key in _stations:
+        # keep the cache small during optimizations that visit many geometries
+        if len(_stations) >= 256:
+            _stations.clear()
+        _stations[key] = compute_stations(settings,wing,segments)
+
+    return _stations[key]
+
+## @ingroup Methods-Aerodynamics-Lifting_line
+def compute_stations(settings,wing,segments):
+    """Computes the spanwise stations of a wing and factors the matrix of the Fourier
+    coefficients, see lifting_line_stations
+
+    Assumptions:
+    Chord and twist vary linearly between segments
+
+    Source:
+    Traub, L. W., Botero, E., Waghela, R., Callahan, R., & Watson, A. (2015). Effect of Taper Ratio at Low Reynolds Number. Journal of Aircraft.
+
+    Inputs:
+    settings.number_of_stations             [int]
+    wing                                    see lifting_line_stations
+    segments                                list of (span location, chord ratio, twist)
+
+    Outputs:
+    stations                                see lifting_line_stations
+
+    Properties Used:
+    N/A
+    """
+
+    b           = wing.spans.projected
     taper       = wing.taper
     tip_twist   = wing.twists.root
     root_twist  = wing.twists.tip 
     root_chord  = wing.chords.root
-    tip_chord   = wing.chords.tip      
     r           = settings.number_of_stations # Number of divisions
-    alpha       = conditions.aerodynamics.angle_of_attack
-    
-    # Make sure alpha is 2D
-    alpha = np.atleast_2d(alpha)
-    
-    repeats = np.size(alpha)
     
     # Need to set to something
     cla   = 2 * np.pi # 2-D lift curve slope
-    azl   = 0. # 2-D 
 
     # Start doing calculations
     N      = r-1                        # number of spanwise divisions
@@ -91,34 +221,22 @@ def lifting_line(conditions,settings,geometry):
     etam   = np.pi*np.sin(thetan)/(2*r) # Useful mulitplier
     
     # Project the spanwise y locations into the chords
-    segment_keys = wing.Segments.keys()
-    n_segments   = len(segment_keys)
     # If spanwise stations are setup
-    if n_segments>0:
+    if len(segments)>0:
+        X, L, T = [np.array(values) for values in zip(*segments)]
+        
+        # The last segment runs to the tip
+        if X[-1] != 1.0:
+            X = np.append(X,1.0)
+            L = np.append(L,wing.chords.tip/wing.chords.root)
+            T = np.append(T,wing.twists.tip)
+            
         c    = np.ones_like(etan) * wing.chords.root
         ageo = np.ones_like(etan) * wing.twists.root 
-        for i_seg in range(n_segments):
             
-            # Figure out where the segment starts
-            X1 = wing.Segments[segment_keys[i_seg]].percent_span_location
-            L1 = wing.Segments[segment_keys[i_seg]].root_chord_percent
-            T1 = wing.Segments[segment_keys[i_seg]].twist 
-
-            if i_seg == n_segments-1 and X1 != 1.0:
-                X2 = 1.0
-                L2 = wing.chords.tip/wing.chords.root
-                T2 = wing.twists.tip
-            else:
-                X2 = wing.Segments[segment_keys[i_seg+1]].percent_span_location
-                L2 = wing.Segments[segment_keys[i_seg+1]].root_chord_percent
-                T2 = wing.Segments[segment_keys[i_seg+1]].twist
-                
-                
-            bools  =  np.logical_and(etan>X1,etan<X2)
-                
-            c[bools]    = (L1 + (etan[bools]-X1)*(L2-L1)/(X2-X1)) * root_chord
-            ageo[bools] = (T1 + (etan[bools]-X1)*(T2-T1)/(X2-X1))
-                
+        bools       = np.logical_and(etan>=X[0],etan<=X[-1])
+        c[bools]    = np.interp(etan[bools],X,L) * root_chord
+        ageo[bools] = np.interp(etan[bools],X,T)
 
     # Spanwise stations are not setup
     else:
@@ -130,46 +248,44 @@ def lifting_line(conditions,settings,geometry):
         ageo = (tip_twist-root_twist)*etan+root_twist
 
     k = c*cla/(4.*b) # Grouped term 
-
     
     n_trans = np.atleast_2d(n).T
         
     # Right hand side matrix
     RHS = (np.sin(n_trans*thetan)*(np.sin(thetan)+n_trans*k))
     
-    # Expand out for all the angles of attack
-    RHS2 = np.tile(RHS.T, (repeats,1,1))
-
-    # Left hand side vector    
-    LHS = k*np.sin(thetan)*(alpha+ageo-azl)
-        
-    # The Fourier Coefficients
-    A = np.linalg.solve(RHS2,LHS)
-    
-    # The 3-D Coefficient of lift
-    CL = A[:,0]*np.pi*AR
-    
-    # Find the sectional coefficients of lift
-    Cl = b*np.cumsum(4*A*np.sin(n*thetan),axis=1)/c
-    
-    # induced alpha
-    alpha_i = np.cumsum(n*A*np.sin(n*A)/np.sin(thetan),axis=1)
-    
-    # Sectional vortex drag
-    Cdv = Cl*alpha_i
+    stations = Data()
+    stations.span    = b
+    stations.n       = n
+    stations.thetan  = thetan
+    stations.etam    = etam
+    stations.chords  = c
+    stations.twists  = ageo
+    stations.k       = k
+    stations.factors = scipy.linalg.lu_factor(RHS.T)
     
-    # Total vortex drag
-    CDv = np.sum(Cdv*AR*etam,axis=1)
-    
-    #############
-    # Profile drag of a 2-D section
-    # This is currently stubbed out. If the 2-D sectional data is known it can be added to get viscous drag
-    Cdn = 0.00
-    #############
-    
-    # Find the profile drag
-    CDp = np.sum(Cdn*c*etam)/MAC
-    
-    CD  = CDv + CDp
-   
-    return CL, CD
\ No newline at end of file
+    return stations
+
+## @ingroup Methods-Aerodynamics-Lifting_line
+def clear_lifting_line_stations():
+    """Removes the stored stations and factored matrices of all wings
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    _stations.clear()
+
+    return
@@ -2,4 +2,5 @@
 # Functions to perform lifting line calculations
 # @ingroup Methods-Aerodynamics
 
-from .Lifting_Line import lifting_line
\ No newline at end of file
+from .Lifting_Line import lifting_line
+from .Lifting_Line import lifting_line_stations, clear_lifting_line_stations
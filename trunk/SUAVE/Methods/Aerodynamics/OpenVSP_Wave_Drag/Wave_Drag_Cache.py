@@ -0,0 +1,349 @@
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+# Wave_Drag_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from SUAVE.Core import Data
+
+# caches by geometry tag and OpenVSP settings
+_caches = {}
+
+# tag of the model currently loaded in OpenVSP
+_loaded = [None]
+
+# ----------------------------------------------------------------------
+#  Wave Drag Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+class Wave_Drag_Cache(Data):
+    """Keeps the volume wave drag of one geometry computed by OpenVSP at each Mach
+    number in memory. Mach numbers between two cached stations closer than the
+    tolerance are interpolated. Mach numbers that are missing are computed together,
+    with the model read once, and the table is written to disk in the background.
+
+    Assumptions:
+    The volume wave drag varies smoothly with Mach number between close stations
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.tag            = None
+        self.reference_area = None
+        self.num_slices     = 20
+        self.num_rots       = 10
+        self.mach_tolerance = 0.
+        self.filename       = None
+        self.mach           = np.zeros(0)
+        self.wave_drag      = np.zeros(0)
+        self.computed       = 0
+        self.writer         = None
+
+    def load(self):
+        """Reads the table written by an earlier run, if there is one.
+
+        Assumptions:
+        Rows with a negative Mach number are placeholders and are skipped
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.filename
+        """
+        if self.filename is None or not os.path.isfile(self.filename):
+            return
+
+        try:
+            table = np.atleast_2d(np.load(self.filename))
+        except (IOError,OSError,ValueError):
+            return
+
+        table = table[table[:,0] > 0.]
+        self.add(table[:,0],table[:,1])
+
+    def add(self,mach,wave_drag):
+        """Adds stations to the table, keeping it sorted by Mach number.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mach                     [-]
+        wave_drag                [-]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        mach      = np.concatenate([self.mach,np.ravel(mach)])
+        wave_drag = np.concatenate([self.wave_drag,np.ravel(wave_drag)])
+
+        mach, index    = np.unique(mach,return_index=True)
+        self.mach      = mach
+        self.wave_drag = wave_drag[index]
+
+    def lookup(self,mach):
+        """Finds Mach numbers in the table.
+
+        Assumptions:
+        Only interpolates, never extrapolates
+
+        Source:
+        N/A
+
+        Inputs:
+        mach                     [-] 1-D array
+
+        Outputs:
+        wave_drag                [-] nan where the table can't answer
+
+        Properties Used:
+        self.mach_tolerance
+        """
+        mach      = np.asarray(mach,dtype=float)
+        wave_drag = np.full(np.shape(mach),np.nan)
+        stations  = self.mach
+        if len(stations) == 0:
+            return wave_drag
+
+        upper = np.clip(np.searchsorted(stations,mach),0,len(stations)-1)
+        lower = np.clip(upper-1,0,len(stations)-1)
+
+        # exact matches
+        exact = stations[upper] == mach
+        wave_drag[exact] = self.wave_drag[upper[exact]]
+
+        # between two close stations
+        gap     = stations[upper] - stations[lower]
+        between = (~exact) & (stations[lower] < mach) & (mach < stations[upper]) & (gap <= self.mach_tolerance + 1e-12)
+        if np.any(between):
+            l, u = lower[between], upper[between]
+            weight = (mach[between] - stations[l])/gap[between]
+            wave_drag[between] = self.wave_drag[l] + (self.wave_drag[u] - self.wave_drag[l])*weight
+
+        return wave_drag
+
+    def evaluate(self,mach):
+        """Gives the volume wave drag at Mach numbers, computing the ones that are
+        missing from the table.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mach                     [-] 1-D array
+
+        Outputs:
+        wave_drag                [-]
+
+        Properties Used:
+        N/A
+        """
+        mach      = np.asarray(mach,dtype=float)
+        wave_drag = self.lookup(mach)
+        missing   = np.isnan(wave_drag)
+
+        if np.any(missing):
+            self.compute(np.unique(mach[missing]))
+            wave_drag[missing] = self.lookup(mach[missing])
+            self.flush()
+
+        return wave_drag
+
+    def compute(self,mach):
+        """Runs the OpenVSP wave drag analysis at each Mach number and adds the results
+        to the table.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mach                     [-] 1-D array
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.tag
+        self.reference_area      [m^2]
+        self.num_slices
+        self.num_rots
+        """
+        import vsp
+
+        # Read the model only if another one has been loaded since
+        model = (self.tag,self.num_slices,self.num_rots)
+        if _loaded[0] != model:
+            vsp.ClearVSPModel()
+            vsp.ReadVSPFile(self.tag+'.vsp3')
+            vsp.SetIntAnalysisInput('WaveDrag', 'NumSlices', [self.num_slices])
+            vsp.SetIntAnalysisInput('WaveDrag', 'NumRotSects', [self.num_rots])
+            _loaded[0] = model
+
+        wave_drag = np.zeros(len(mach))
+        for ii, M in enumerate(mach):
+            vsp.SetDoubleAnalysisInput('WaveDrag', 'Mach', [float(M)])
+            ridwd         = vsp.ExecAnalysis('WaveDrag')
+            cd_w          = vsp.GetDoubleResults(ridwd,'CDWave')
+            wave_drag[ii] = cd_w[0]*100./self.reference_area # default ref area in VSP doesn't seem to have an easy change
+
+        self.computed += len(mach)
+        self.add(mach,wave_drag)
+
+    def flush(self,wait=False):
+        """Writes the table to disk in a background thread.
+
+        Assumptions:
+        The file is written next to its final name and then renamed, so it is never
+        read partially written. Writes happen in order.
+
+        Source:
+        N/A
+
+        Inputs:
+        wait                     <boolean> block until the file is written
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.filename
+        """
+        if self.filename is None:
+            return
+
+        previous = self.writer
+        table    = np.vstack([self.mach,self.wave_drag]).T
+        filename = os.path.abspath(self.filename)
+
+        def write():
+            if previous is not None:
+                previous.join()
+            handle, temporary = tempfile.mkstemp(suffix='.npy',dir=os.path.dirname(filename))
+            with os.fdopen(handle,'wb') as stream:
+                np.save(stream,table)
+            os.replace(temporary,filename)
+
+        self.writer = threading.Thread(target=write)
+        self.writer.start()
+
+        if wait:
+            self.writer.join()
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def wave_drag_cache(geometry,num_slices=20,num_rots=10,mach_tolerance=0.):
+    """Gives the wave drag cache of a geometry, creating it the first time
+
+    Assumptions:
+    The OpenVSP model is <tag>.vsp3 in the working directory
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.
+      reference_area         [m^2]
+      tag                    <string>
+    num_slices               [-]
+    num_rots                 [-]
+    mach_tolerance           [-] largest gap between interpolated stations
+
+    Outputs:
+    cache                    <Wave_Drag_Cache>
+
+    Properties Used:
+    N/A
+    """
+    key = (geometry.tag,int(num_slices),int(num_rots),float(geometry.reference_area))
+
+    if not key in _caches:
+        cache = Wave_Drag_Cache()
+        cache.tag            = geometry.tag
+        cache.reference_area = geometry.reference_area
+        cache.num_slices     = int(num_slices)
+        cache.num_rots       = int(num_rots)
+        cache.filename       = 'volume_drag_data_' + geometry.tag + '.npy'
+        cache.load()
+        _caches[key] = cache
+
+    cache = _caches[key]
+    cache.mach_tolerance = mach_tolerance
+
+    return cache
+
+## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
+def clear_wave_drag_cache(tag=None):
+    """Removes the wave drag caches of a geometry, or all of them
+
+    Assumptions:
+    Pending writes are finished first
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                      <string> None for all geometries
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    for key in list(_caches.keys()):
+        if tag is None or key[0] == tag:
+            cache = _caches.pop(key)
+            if cache.writer is not None:
+                cache.writer.join()
+
+    _loaded[0] = None
+
+    return
@@ -3,4 +3,5 @@
 # @ingroup Methods-Aerodynamics
 
 from .wave_drag_volume import wave_drag_volume
-from .compressibility_drag_total import compressibility_drag_total
\ No newline at end of file
+from .compressibility_drag_total import compressibility_drag_total
+from .Wave_Drag_Cache import Wave_Drag_Cache, wave_drag_cache, clear_wave_drag_cache
@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2014, T. MacDonald
 # Modified: Jun 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -36,6 +37,7 @@ def compressibility_drag_total(state,settings,geometry):
     Inputs:
     settings.number_slices
     settings.number_rotations
+    settings.wave_drag_mach_tolerance
     state.conditions.aerodynamics.
       lift_breakdown.compressible_wings      [-]
     state.conditions.freestream.mach_number  [-]
@@ -58,10 +60,11 @@ def compressibility_drag_total(state,settings,geometry):
     configuration    = settings
     number_slices    = settings.number_slices
     number_rotations = settings.number_rotations
+    mach_tolerance   = settings.wave_drag_mach_tolerance
     
     wings          = geometry.wings
     fuselages      = geometry.fuselages
-    propulsor_name = geometry.propulsors.keys()[0] #obtain the key for the propulsor for assignment purposes
+    propulsor_name = list(geometry.propulsors.keys())[0] #obtain the key for the propulsor for assignment purposes
     propulsor      = geometry.propulsors[propulsor_name]
 
     Mc             = conditions.freestream.mach_number
@@ -110,24 +113,8 @@ def compressibility_drag_total(state,settings,geometry):
         drag99_total  = drag99_total + drag99
         drag105_total = drag105_total + cdc_l
         
-    try:
-        old_array = np.load('volume_drag_data_' + geometry.tag + '.npy')
-        file_exists = True
-    except:
-        file_exists = False
-        old_array = np.array([[-1,-1]]) 
-          
-    if np.any(old_array[:,0]==1.05):
-        cd_c_v = np.array([[float(old_array[old_array[:,0]==1.05,1])]])
-    else:    
-        cd_c_v = wave_drag_volume(conditions,geometry, True)
-    
-    if file_exists:
-        pass
-    else:
-        new_save_row = np.array([[1.05,cd_c_v]])
-        np.save('volume_drag_data_' + geometry.tag + '.npy', new_save_row)    
-    
+    cd_c_v = wave_drag_volume(conditions,geometry,True,num_slices=number_slices,num_rots=number_rotations,
+                              mach_tolerance=mach_tolerance)
 
     drag105 = drag105_total + cd_c_v*np.ones(np.shape(Mc))
     drag99  = drag99_total
@@ -154,7 +141,8 @@ def compressibility_drag_total(state,settings,geometry):
     # Only the supsonic results are returned with nonzero values
 
         
-    cd_c_v = wave_drag_volume(conditions, geometry, False,num_slices=number_slices,num_rots=number_rotations)
+    cd_c_v = wave_drag_volume(conditions, geometry, False,num_slices=number_slices,num_rots=number_rotations,
+                              mach_tolerance=mach_tolerance)
         
     cd_c[Mc >= 1.05] = cd_c_l[Mc >= 1.05] + cd_c_v[Mc >= 1.05]
 
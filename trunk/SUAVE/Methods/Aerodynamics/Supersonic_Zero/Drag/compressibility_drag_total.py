@@ -5,6 +5,7 @@
 # Modified: Jun 2017, T. MacDonald
 #           Jul 2017, T. MacDonald
 #           Aug 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,6 +22,9 @@ import copy
 # package imports
 import numpy as np
 
+# wave drag at Mach 1.05, by wing geometry
+_anchors = {}
+
 # ----------------------------------------------------------------------
 #  Compressibility Drag Total
 # ----------------------------------------------------------------------
@@ -74,59 +78,65 @@ def compressibility_drag_total(state,settings,geometry):
     Sref_main = geometry.reference_area
     
 
+    # Get main fuselage data - note that name of fuselage is important here
+    # This should be changed to be general 
+    main_fuselage = fuselages['fuselage']
+
+    # Get the lift coefficient of the wing.
+    # Note that this is not the total CL
+    cl = conditions.aerodynamics.lift_breakdown.compressible_wings
+
+    # Mach regimes, each wing only computes the rows of each regime
+    subsonic   = Mc[:,0] <= 0.99
+    transonic  = np.logical_and(Mc[:,0] > 0.99, Mc[:,0] < 1.05)
+    supersonic = Mc[:,0] >= 1.05
+
     # Iterate through wings
     for k in wings.keys():
         
         wing = wings[k]
 
         # initialize array to correct length
-        cd_c = np.array([[0.0]] * len(Mc))
-        mcc = np.array([[0.0]] * len(Mc))
-        MDiv = np.array([[0.0]] * len(Mc))     
-
-
-        # Get main fuselage data - note that name of fuselage is important here
-        # This should be changed to be general 
-        main_fuselage = fuselages['fuselage']
-
-        # Get number of engines data
-        num_engines = propulsor.number_of_engines
-
-        # Get the lift coefficient of the wing.
-        # Note that this is not the total CL
-        cl = conditions.aerodynamics.lift_breakdown.compressible_wings
-
-        # Calculate compressibility drag at Mach 0.99 and 1.05 for interpolation between
-        (drag99,a,b) = drag_div(np.array([[0.99]] * len(Mc)),wing,k,cl,Sref_main)
-        (drag105,a,b,cd_c_l_105,cd_c_v_105) = wave_drag(conditions, 
-                                  configuration, 
-                                  main_fuselage, 
-                                  propulsor, 
-                                  wing, 
-                                  num_engines,k,Sref_main,True)
+        cd_c   = np.array([[0.0]] * len(Mc))
+        mcc    = np.array([[0.0]] * len(Mc))
+        MDiv   = np.array([[0.0]] * len(Mc))     
+        cd_c_l = np.array([[0.0]] * len(Mc)) # lift wave drag
+        cd_c_v = np.array([[0.0]] * len(Mc)) # vol wave drag
+
+        # Lift coefficient used for the lift wave drag of this wing
+        if wing.vertical:
+            wing_cl = np.zeros_like(Mc)
+        else:
+            wing_cl = conditions.aerodynamics.lift_breakdown.inviscid_wings_lift[wing.tag]
 
         # For subsonic mach numbers, use drag divergence correlations to find the drag
-        (cd_c[Mc[:,0] <= 0.99],mcc[Mc[:,0] <= 0.99], MDiv[Mc[:,0] <= 0.99]) = drag_div(Mc[Mc[:,0] <= 0.99],wing,k,cl[Mc[:,0] <= 0.99],Sref_main)
-
-        # For mach numbers close to 1, use an interpolation to avoid intensive calculations
-        cd_c[Mc > 0.99] = drag99[Mc > 0.99] + (drag105[Mc > 0.99]-drag99[Mc > 0.99])*(Mc[Mc > 0.99]-0.99)/(1.05-0.99)
+        if np.any(subsonic):
+            (cd_c[subsonic],mcc[subsonic], MDiv[subsonic]) = drag_div(Mc[subsonic],wing,k,cl[subsonic],Sref_main)
+
+        # For mach numbers close to 1, use an interpolation between Mach 0.99 and 1.05 to avoid intensive calculations
+        if np.any(transonic):
+            M          = Mc[transonic]
+            (drag99,a,b) = drag_div(np.array([[0.99]] * len(M)),wing,k,cl[transonic],Sref_main)
+            (cd_c_l_105_per_cl2,cd_c_v_105) = wave_drag_anchors(configuration,wing,Sref_main)
+            cd_c_l_105 = cd_c_l_105_per_cl2*wing_cl[transonic]**2
+            drag105    = cd_c_l_105 + cd_c_v_105
+            
+            cd_c[transonic]   = drag99 + (drag105-drag99)*(M-0.99)/(1.05-0.99)
+            
+            # assume compressibility drag at .99 is due to volume wave drag
+            cd_c_l[transonic] = 0. + (cd_c_l_105)*(M-0.99)/(1.05-0.99)
+            cd_c_v[transonic] = drag99 + (cd_c_v_105-drag99)*(M-0.99)/(1.05-0.99)
 
         # Use wave drag equations at supersonic values. The cutoff for this function is 1.05
-        # Only the supsonic results are returned with nonzero values
-        (cd_c_sup,mcc_sup,MDiv_sup,cd_c_l,cd_c_v) = wave_drag(conditions, 
-                                                configuration, 
-                                                main_fuselage, 
-                                                propulsor, 
-                                                wing, 
-                                                num_engines,k,Sref_main,False)
-        
-        # assume compressibility drag at .99 is due to volume wave drag
-        c_inds = np.logical_and((Mc > 0.99),(Mc < 1.05))     
-        cd_c_l[c_inds] = 0. + (cd_c_l_105[c_inds])*(Mc[c_inds]-0.99)/(1.05-0.99)
-        cd_c_v[c_inds] = drag99[c_inds] + (cd_c_v_105[c_inds]-drag99[c_inds])*(Mc[c_inds]-0.99)/(1.05-0.99)
-
-        # Incorporate supersonic results into total compressibility drag coefficient
-        (cd_c[Mc >= 1.05],mcc[Mc >= 1.05], MDiv[Mc >= 1.05]) = (cd_c_sup[Mc >= 1.05],mcc_sup[Mc >= 1.05],MDiv_sup[Mc >= 1.05])
+        if np.any(supersonic):
+            supersonic_conditions = wave_drag_conditions(Mc[supersonic],wing_cl[supersonic],wing.tag)
+            cd_lift_wave   = wave_drag_lift(supersonic_conditions,configuration,wing)
+            cd_volume_wave = wave_drag_volume(supersonic_conditions,configuration,wing)
+            
+            # Convert coefficient to full aircraft value
+            cd_c[supersonic]   = (cd_lift_wave + cd_volume_wave)*wing.areas.reference/Sref_main
+            cd_c_l[supersonic] = cd_lift_wave*wing.areas.reference/Sref_main
+            cd_c_v[supersonic] = cd_volume_wave*wing.areas.reference/Sref_main
 
         # Dump data to conditions
         wing_results = Data(
@@ -346,6 +356,109 @@ def wave_drag(conditions,configuration,main_fuselage,propulsor,wing,num_engines,
 
     return (cd_c,mcc,MDiv,cd_c_l,cd_c_v)
 
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wave_drag_anchors(configuration,wing,Sref_main):
+    """Computes the wave drag of a wing at Mach 1.05, the upper end of the transonic
+    interpolation. These only depend on the wing geometry, so they are computed once
+    for each geometry and reused.
+
+    Assumptions:
+    Lift wave drag is proportional to the square of the wing lift coefficient
+
+    Source:
+    adg.stanford.edu (Stanford AA241 A/B Course Notes)
+
+    Inputs:
+    configuration
+    wing.
+      tag
+      vertical                               [Boolean]
+      thickness_to_chord                     [Unitless]
+      total_length                           [m]
+      areas.reference                        [m^2]
+    Sref_main (main reference area)          [m^2]
+
+    Outputs:
+    cd_c_l_105   (per unit lift coefficient squared)  [Unitless]
+    cd_c_v_105                                        [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    key = (wing.tag, bool(wing.vertical), float(wing.thickness_to_chord), float(wing.total_length),
+           float(wing.areas.reference), float(Sref_main))
+
+    if not key in _anchors:
+        conditions = wave_drag_conditions(np.array([[1.05]]),np.array([[1.0]]),wing.tag)
+        cd_c_l_105 = wave_drag_lift(conditions,configuration,wing)[0,0]*wing.areas.reference/Sref_main
+        cd_c_v_105 = wave_drag_volume(conditions,configuration,wing)[0,0]*wing.areas.reference/Sref_main
+
+        # keep the cache small during optimizations that visit many geometries
+        if len(_anchors) >= 256:
+            _anchors.clear()
+        _anchors[key] = (cd_c_l_105,cd_c_v_105)
+
+    return _anchors[key]
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wave_drag_conditions(mach,wing_cl,tag):
+    """Packs the conditions read by the wave drag functions for a subset of the points
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    mach                                     [Unitless]
+    wing_cl                                  [Unitless]
+    tag           (tag for wing)             [String]
+
+    Outputs:
+    conditions.
+      freestream.mach_number                 [Unitless]
+      aerodynamics.lift_coefficient          [Unitless]
+      aerodynamics.lift_breakdown.inviscid_wings_lift[tag]   [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.freestream.mach_number = mach
+    conditions.aerodynamics = Data()
+    conditions.aerodynamics.lift_coefficient = wing_cl
+    conditions.aerodynamics.lift_breakdown = Data()
+    conditions.aerodynamics.lift_breakdown.inviscid_wings_lift = Data()
+    conditions.aerodynamics.lift_breakdown.inviscid_wings_lift[tag] = wing_cl
+
+    return conditions
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def clear_wave_drag_anchors():
+    """Removes all the cached wave drag anchors
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    _anchors.clear()
+    return
+
 ## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
 def wave_drag_body_of_rev(total_length,Rmax,Sref):
     """Use wave drag to determine compressibility drag a body of revolution
@@ -0,0 +1,539 @@
+## @ingroup Methods-Missions-Segments-Common
+# Batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions, State
+from SUAVE.Components.Energy.Networks import Battery_Ducted_Fan, Battery_Propeller, Dual_Battery_Ducted_Fan, \
+     Lift_Forward_Propulsor, Solar, Solar_Low_Fidelity
+
+from .Aerodynamics import update_altitude, update_atmosphere, update_freestream, update_aerodynamics, update_stability
+from .Frames       import update_orientations, update_forces
+from .Weights      import update_gravity
+from .Energy       import update_thrust
+from .Sub_Segments import update_sub_segments
+from .Jacobian     import step_size, column_coloring
+
+# networks that integrate stored energy over the segment, these can't be stacked
+stateful_networks = (Battery_Ducted_Fan, Battery_Propeller, Dual_Battery_Ducted_Fan,
+                     Lift_Forward_Propulsor, Solar, Solar_Low_Fidelity)
+
+# ----------------------------------------------------------------------
+#  Converge Batch
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def converge_batch(segments):
+    """ Solves the same segment for several mission variants at once. The residuals of
+        each variant only depend on its own unknowns, so the jacobian is block diagonal
+        and every finite difference column is shared by all the variants.
+
+        Assumptions:
+        All segments have the same unknowns and residuals structure.
+        Newton steps with Broyden updates of each block, the blocks are refreshed
+        when a step fails to reduce the residuals. Only steps that reduce the residuals
+        are taken. Variants the batch can't solve are handed to their own converge
+        process from the initial guess.
+
+        Source:
+        N/A
+
+        Inputs:
+            segments                                    [list]
+            segment.state.numerics.tolerance_solution   [Unitless]
+
+        Outputs:
+            segment.state.unknowns                      [Data]
+            segment.state.numerics.converged            [Unitless]
+            segment.state.numerics.residual_evaluations [Unitless]
+
+        Properties Used:
+        N/A
+
+    """
+
+    K        = len(segments)
+    numerics = [segment.state.numerics for segment in segments]
+    xtol     = numerics[0].tolerance_solution
+    max_iter = 100
+
+    for numeric in numerics:
+        numeric.residual_evaluations = 0
+
+    def function(xs,active):
+        members = [segments[k] for k in active]
+        for k in active:
+            segments[k].state.unknowns.unpack_array(xs[k])
+            numerics[k].residual_evaluations += 1
+        iterate_batch(members)
+        return [segments[k].state.residuals.pack_array() for k in active]
+
+    # initial guess
+    x      = [segment.state.unknowns.pack_array() for segment in segments]
+    x0     = [xk*1. for xk in x]
+    active = list(range(K))
+    R      = function(x,active)
+    J      = jacobian_batch(x,R,function,active,segments)
+    fresh  = np.ones(K,dtype=bool)
+    alpha  = np.ones(K)
+
+    converged = np.zeros(K,dtype=bool)
+    failed    = np.zeros(K,dtype=bool)
+    for k in active:
+        converged[k] = not np.any(R[k])
+        failed[k]    = not (np.all(np.isfinite(R[k])) and np.all(np.isfinite(J[k])))
+    active = [k for k in active if not (converged[k] or failed[k])]
+
+    iteration = 0
+    while active and iteration < max_iter:
+        iteration += 1
+
+        # newton steps of each block
+        dx = [None]*K
+        xt = list(x)
+        for k in active:
+            dx[k] = -alpha[k] * np.linalg.lstsq(J[k],R[k],rcond=None)[0]
+            xt[k] = x[k] + dx[k]
+        Rt = dict(zip(active,function(xt,active)))
+
+        refresh = []
+        for k in active:
+            if np.linalg.norm(Rt[k]) < np.linalg.norm(R[k]):
+                # accept, broyden update of this block
+                dR    = Rt[k] - R[k]
+                dx2   = np.dot(dx[k],dx[k])
+                if dx2 > 0.:
+                    J[k] += np.outer(dR - np.dot(J[k],dx[k]),dx[k]) / dx2
+                x[k]  = xt[k]
+                R[k]  = Rt[k]
+                fresh[k] = False
+                alpha[k] = 1.
+                if np.linalg.norm(dx[k]) <= xtol * np.linalg.norm(x[k]) or not np.any(R[k]):
+                    converged[k] = True
+            elif fresh[k] and alpha[k] >= 1./16.:
+                # the jacobian is good, shorten the step
+                alpha[k] = alpha[k] / 2.
+            elif fresh[k]:
+                # no shorter step lowers the residuals, this is only a solution if the full
+                # newton step is within the tolerance, the solo process takes the others
+                if np.linalg.norm(dx[k]) / alpha[k] <= xtol * np.linalg.norm(x[k]):
+                    converged[k] = True
+                else:
+                    failed[k] = True
+            else:
+                refresh.append(k)
+
+        # new jacobian blocks where broyden went stale
+        if refresh:
+            Rr = function(x,refresh)
+            for k,r in zip(refresh,Rr):
+                R[k] = r
+            Jr = jacobian_batch(x,R,function,refresh,segments)
+            for k in refresh:
+                J[k]     = Jr[k]
+                fresh[k] = True
+                failed[k] = not (np.all(np.isfinite(R[k])) and np.all(np.isfinite(J[k])))
+
+        active = [k for k in active if not (converged[k] or failed[k])]
+
+    # leave every state at its solution
+    function(x,list(range(K)))
+
+    # the variants left over are solved on their own
+    for k,segment in enumerate(segments):
+        numerics[k].converged = bool(converged[k])
+        if not converged[k]:
+            evaluations = numerics[k].residual_evaluations
+            segment.state.unknowns.unpack_array(x0[k])
+            segment.process.converge(segment)
+            numerics[k].residual_evaluations += evaluations
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def jacobian_batch(x,R,function,active,segments):
+    """ Finite difference jacobian blocks for a batch of segments, every evaluation
+        perturbs the same columns of all the active variants
+
+        Assumptions:
+        The sparsity pattern found on the first call holds, it is stored in the numerics
+        of each segment like the colored jacobian of converge_root.
+
+        Source:
+        N/A
+
+        Inputs:
+            x             [list of arrays]
+            R             [list of arrays]
+            function      [function]
+            active        [list]
+            segments      [list]
+
+        Outputs:
+            J             [list of arrays]
+
+        Properties Used:
+        N/A
+
+    """
+
+    K        = len(segments)
+    n        = len(x[active[0]])
+    m        = len(R[active[0]])
+    jacobian = segments[active[0]].state.numerics.jacobian
+    h        = [step_size(xk) if xk is not None else None for xk in x]
+    J        = [None]*K
+    for k in active:
+        J[k] = np.zeros((m,n))
+
+    # one column at a time until the structure is known
+    if jacobian.sparsity.shape != (m,n):
+        colors   = np.arange(n)
+        sparsity = np.ones((m,n),dtype=bool)
+    else:
+        colors   = jacobian.colors
+        sparsity = jacobian.sparsity
+
+    for color in np.unique(colors):
+        cols = np.where(colors==color)[0]
+        xt   = list(x)
+        for k in active:
+            xt[k] = x[k]*1.
+            xt[k][cols] += h[k][cols]
+        Rt = function(xt,active)
+        for k,r in zip(active,Rt):
+            J[k][:,cols] = sparsity[:,cols] * (r - R[k])[:,None] / h[k][cols]
+
+    # the union of the patterns is valid for every variant
+    if jacobian.sparsity.shape != (m,n):
+        sparsity = np.zeros((m,n),dtype=bool)
+        for k in active:
+            sparsity = sparsity | (J[k] != 0.)
+        colors = column_coloring(sparsity)
+        for segment in segments:
+            segment.state.numerics.jacobian.sparsity = sparsity
+            segment.state.numerics.jacobian.colors   = colors
+
+    return J
+
+# ----------------------------------------------------------------------
+#  Iterate Batch
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def iterate_batch(segments):
+    """ Runs the iterate process of several segments in lockstep
+
+        Assumptions:
+        All segments have the same process structure.
+
+        Source:
+        N/A
+
+        Inputs:
+            segments         [list]
+
+        Outputs:
+            N/A
+
+        Properties Used:
+        N/A
+
+    """
+
+    lockstep_process([segment.process.iterate for segment in segments],segments)
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def lockstep_process(processes,segments,stack=None):
+    """ Walks the same process of several segments step by step. Steps that only act on
+        each control point with analyses shared by all segments are run once on the
+        stacked conditions, the rest are run for each segment.
+
+        Assumptions:
+        All segments have the same process structure.
+
+        Source:
+        N/A
+
+        Inputs:
+            processes        [list of Process]
+            segments         [list]
+            stack            [Data] the stacked segment, if conditions are already stacked
+
+        Outputs:
+            stack            [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    top = stack is None
+    if top:
+        stack = Data()
+        stack.segment = None
+
+    for key,step in processes[0].items():
+        steps = [process[key] for process in processes]
+
+        if step is None:
+            continue
+
+        elif isinstance(step,Process):
+            lockstep_process(steps,segments,stack)
+
+        elif step is update_sub_segments:
+            unstack_segments(stack,segments)
+            for tag in segments[0].segments.keys():
+                subs = [segment.segments[tag] for segment in segments]
+                lockstep_process([sub.process.initialize for sub in subs],subs)
+                lockstep_process([sub.process.iterate    for sub in subs],subs)
+                lockstep_process([sub.process.finalize   for sub in subs],subs)
+
+        elif len(segments) > 1 and is_stackable(step,segments,stack.segment is not None):
+            if stack.segment is None:
+                stack.segment = stack_segments(segments)
+            step(stack.segment)
+
+        else:
+            unstack_segments(stack,segments)
+            for segment_step,segment in zip(steps,segments):
+                if hasattr(segment_step,'evaluate'):
+                    segment_step.evaluate(segment)
+                else:
+                    segment_step(segment)
+
+    if top:
+        unstack_segments(stack,segments)
+
+    return stack
+
+## @ingroup Methods-Missions-Segments-Common
+def is_stackable(step,segments,stacked):
+    """ Checks if a step can be evaluated once for all the segments
+
+        Assumptions:
+        Only the common pointwise steps are stacked, and only when all segments
+        share the analyses used by that step. Steps without analyses are too cheap
+        to stack on their own, they are only stacked if the conditions already are.
+
+        Source:
+        N/A
+
+        Inputs:
+            step             [function]
+            segments         [list]
+            stacked          [boolean]
+
+        Outputs:
+            stackable        [boolean]
+
+        Properties Used:
+        N/A
+
+    """
+
+    def shared(key):
+        analyses = [segment.analyses[key] for segment in segments]
+        return all([analysis is analyses[0] for analysis in analyses])
+
+    if step in (update_altitude, update_freestream, update_orientations, update_forces):
+        return stacked
+
+    elif step is update_atmosphere:
+        deviations = [segment.temperature_deviation for segment in segments]
+        return shared('atmosphere') and all([dT == deviations[0] for dT in deviations])
+
+    elif step is update_gravity:
+        return shared('planet')
+
+    elif step is update_aerodynamics:
+        return shared('aerodynamics')
+
+    elif step is update_stability:
+        return shared('stability')
+
+    elif step is update_thrust:
+        if not shared('energy'):
+            return False
+        for network in segments[0].analyses.energy.network.values():
+            if isinstance(network,stateful_networks):
+                return False
+        return True
+
+    return False
+
+# ----------------------------------------------------------------------
+#  Stack Conditions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def stack_segments(segments):
+    """ Builds a segment whose conditions are all the segment conditions stacked by rows
+
+        Assumptions:
+        The analyses and scalars of the first segment are used.
+
+        Source:
+        N/A
+
+        Inputs:
+            segments         [list]
+
+        Outputs:
+            stacked          [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    sizes = [segment.state._size for segment in segments]
+
+    stacked = Data()
+    stacked.tag                   = segments[0].tag
+    stacked.analyses              = segments[0].analyses
+    stacked.temperature_deviation = segments[0].temperature_deviation
+    stacked.sizes                 = sizes
+    stacked.state                 = State()
+    stacked.state._size           = sum(sizes)
+    stacked.state.numerics        = segments[0].state.numerics
+    stacked.state.conditions      = stack_conditions([segment.state.conditions for segment in segments],stacked.state._size)
+    stacked.conditions            = stacked.state.conditions
+
+    # remember what was gathered, to only scatter what changed
+    stacked.gathered = gathered_arrays(stacked.conditions)
+
+    return stacked
+
+## @ingroup Methods-Missions-Segments-Common
+def stack_conditions(conditions,rows):
+    """ Stacks conditions by rows
+
+        Assumptions:
+        Values that aren't arrays of rank 2 or more are taken from the first conditions
+
+        Source:
+        N/A
+
+        Inputs:
+            conditions       [list of Conditions]
+            rows             [int]
+
+        Outputs:
+            stacked          [Conditions]
+
+        Properties Used:
+        N/A
+
+    """
+
+    stacked = Conditions()
+    stacked._size = rows
+
+    for key,value in conditions[0].items():
+        values = [condition[key] for condition in conditions if key in condition]
+        if len(values) != len(conditions):
+            continue
+        if isinstance(value,Data):
+            stacked[key] = stack_conditions(values,rows)
+        elif isinstance(value,np.ndarray) and value.ndim >= 2 and all([v.shape[1:] == value.shape[1:] for v in values]):
+            stacked[key] = np.vstack(values)
+        else:
+            stacked[key] = value
+
+    return stacked
+
+## @ingroup Methods-Missions-Segments-Common
+def gathered_arrays(conditions):
+    """ Records the identity of each value in the stacked conditions
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+            conditions       [Conditions]
+
+        Outputs:
+            gathered         [dict]
+
+        Properties Used:
+        N/A
+
+    """
+
+    gathered = {}
+    def do_gather(D,path):
+        for key,value in D.items():
+            if isinstance(value,Data):
+                do_gather(value,path+(key,))
+            else:
+                gathered[path+(key,)] = id(value)
+    do_gather(conditions,())
+
+    return gathered
+
+## @ingroup Methods-Missions-Segments-Common
+def unstack_segments(stack,segments):
+    """ Hands the rows of the stacked conditions back to each segment as views
+
+        Assumptions:
+        Arrays with as many rows as the stack are split, other values that
+        changed are given to every segment.
+
+        Source:
+        N/A
+
+        Inputs:
+            stack.segment    [Data]
+            segments         [list]
+
+        Outputs:
+            N/A
+
+        Properties Used:
+        N/A
+
+    """
+
+    stacked = stack.segment
+    if stacked is None:
+        return
+    stack.segment = None
+
+    rows     = stacked.state._size
+    bounds   = np.cumsum([0] + stacked.sizes)
+    gathered = stacked.gathered
+
+    def do_scatter(D,targets,path):
+        for key,value in D.items():
+            key_path = path + (key,)
+            if isinstance(value,Data):
+                for target in targets:
+                    if not key in target:
+                        target[key] = value.__class__()
+                do_scatter(value,[target[key] for target in targets],key_path)
+            elif isinstance(value,np.ndarray) and value.ndim >= 1 and value.shape[0] == rows:
+                for i,target in enumerate(targets):
+                    target[key] = value[bounds[i]:bounds[i+1]]
+            elif gathered.get(key_path,None) != id(value):
+                for target in targets:
+                    target[key] = value
+
+    do_scatter(stacked.conditions,[segment.state.conditions for segment in segments],())
+
+    return
@@ -0,0 +1,160 @@
+## @ingroup Methods-Missions-Segments-Common
+# Control_Points.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, chebyshev_coefficients, chebyshev_interpolate
+
+# ----------------------------------------------------------------------
+#  Truncation Error
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def truncation_error(segment):
+    """ Estimates the spectral truncation error of a solved segment from the last two
+        Chebyshev coefficients of the unknowns and of the aircraft mass
+    
+        Assumptions:
+        The segment uses chebyshev_data. The error of each column is relative to the largest
+        value in the column, columns that are zero everywhere are skipped.
+        
+        Source:
+        Trefethen, "Spectral Methods in MATLAB", 2000
+        
+        Inputs:
+            state.numerics.number_control_points [int]
+            state.unknowns                       [Data]
+            state.conditions.weights.total_mass  [kilogram]
+            
+        Outputs:
+            error                                [Unitless]
+
+        Properties Used:
+        N/A
+    """    
+    
+    N       = segment.state.numerics.number_control_points
+    columns = [value for value in segment.state.unknowns.values() if is_resolved(value,N)]
+    
+    mass = segment.state.conditions.get('weights',Data()).get('total_mass',None)
+    if is_resolved(mass,N):
+        columns.append(mass)
+    
+    if not columns or N < 3:
+        return 0.
+    
+    error = 0.
+    for values in columns:
+        values = values.reshape(N,-1)
+        scale  = np.max(np.abs(values),axis=0)
+        keep   = scale > 0.
+        if not np.any(keep):
+            continue
+        a      = chebyshev_coefficients(values[:,keep])
+        tail   = np.abs(a[-1]) + np.abs(a[-2])
+        error  = max(error,np.max(tail/scale[keep]))
+    
+    return error
+
+# ----------------------------------------------------------------------
+#  Set Control Points
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def set_control_points(segment,N):
+    """ Changes the number of control points of a segment. The unknowns are interpolated
+        onto the new points and the segment is initialized again.
+    
+        Assumptions:
+        The segment uses chebyshev_data. Unknowns that are not one row per control point
+        are kept as they are.
+        
+        Source:
+        N/A
+        
+        Inputs:
+            state.numerics.number_control_points [int]
+            state.unknowns                       [Data]
+            N                                    [int]
+            
+        Outputs:
+            state.numerics.number_control_points [int]
+            state.unknowns                       [Data]
+
+        Properties Used:
+        N/A
+    """    
+    
+    numerics = segment.state.numerics
+    unknowns = segment.state.unknowns
+    N_old    = numerics.number_control_points
+    
+    resampled = Data()
+    for key,value in unknowns.items():
+        if is_resolved(value,N_old):
+            resampled[key] = chebyshev_interpolate(value,N)
+    
+    numerics.number_control_points = N
+    segment.process.initialize(segment)
+    
+    # initialize may reset some of the guesses, the interpolated ones are better
+    for key,value in resampled.items():
+        unknowns[key] = value
+    
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def is_adaptive(segment):
+    """ Checks if the number of control points of a segment is chosen by its error
+    
+        Assumptions:
+        Only segments without sub segments using chebyshev_data are refined
+        
+        Source:
+        N/A
+        
+        Inputs:
+            state.numerics.adaptive.enabled      [boolean]
+            state.numerics.discretization_method [function]
+            
+        Outputs:
+            boolean
+
+        Properties Used:
+        N/A
+    """    
+    numerics = segment.state.numerics
+    adaptive = numerics.get('adaptive',None)
+    return bool(adaptive is not None and adaptive.enabled                   \
+                and numerics.discretization_method is chebyshev_data       \
+                and not segment.get('segments',None))
+
+## @ingroup Methods-Missions-Segments-Common
+def is_resolved(value,N):
+    """ Checks if an array has one row per control point
+    
+        Assumptions:
+        None
+        
+        Source:
+        N/A
+        
+        Inputs:
+            value   [array]
+            N       [int]
+            
+        Outputs:
+            boolean
+
+        Properties Used:
+        N/A
+    """    
+    return isinstance(value,np.ndarray) and value.ndim in (1,2) and value.shape[0] == N and value.size > 0
@@ -0,0 +1,229 @@
+## @ingroup Methods-Missions-Segments-Common
+# Jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Evaluate Jacobian
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def evaluate_jacobian(unknowns,residuals,function,segment):
+    """ Builds the Jacobian of the segment residuals with respect to the unknowns
+
+        Assumptions:
+        The sparsity pattern found on the first call holds for the remainder of the solve.
+        Control points only couple through the differentiation and integration operators,
+        so most columns touch a small set of rows and can be perturbed together.
+
+        Source:
+        Curtis, Powell and Reid, "On the estimation of sparse Jacobian matrices", 1974
+
+        Inputs:
+            unknowns                               [array]
+            residuals                              [array]   residuals evaluated at unknowns
+            function                               [function] maps unknowns to residuals
+            segment.state.numerics:
+                solver_jacobian                    [string]  "colored" or "analytic"
+                jacobian_evaluation                [function] analytic partials, only for "analytic"
+                jacobian.sparsity                  [boolean array]
+                jacobian.colors                    [int array]
+
+        Outputs:
+            J                                      [array]
+            segment.state.numerics:
+                jacobian.sparsity                  [boolean array]
+                jacobian.colors                    [int array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    # unpack
+    numerics = segment.state.numerics
+    method   = numerics.solver_jacobian
+    jacobian = numerics.jacobian
+
+    m = len(residuals)
+    n = len(unknowns)
+
+    # analytic partials, missing entries are flagged with NaN
+    if method == 'analytic':
+        J = np.array(numerics.jacobian_evaluation(segment),dtype=float)
+        if J.shape != (m,n):
+            raise ValueError('analytic jacobian has shape %s, expected %s' % (str(J.shape),str((m,n))))
+        missing = np.any(np.isnan(J),axis=0)
+        if not np.any(missing):
+            return J
+    elif method == 'colored':
+        J       = np.zeros((m,n))
+        missing = np.ones(n,dtype=bool)
+    else:
+        raise ValueError('solver_jacobian "%s" is not supported' % method)
+
+    # detect the structure once, the dense differences double as the first jacobian
+    if jacobian.sparsity.shape != (m,n):
+        J_full = finite_difference(unknowns,residuals,function,np.where(missing)[0])
+        J[:,missing] = J_full[:,missing]
+
+        sparsity = J != 0.
+        jacobian.sparsity = sparsity
+        jacobian.colors   = column_coloring(sparsity)
+
+        return J
+
+    # only perturb the columns that are still unknown
+    colors   = np.where(missing,jacobian.colors,-1)
+    J_color  = colored_finite_difference(unknowns,residuals,function,jacobian.sparsity,colors)
+    J[:,missing] = J_color[:,missing]
+
+    return J
+
+# ----------------------------------------------------------------------
+#  Finite Difference
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def finite_difference(unknowns,residuals,function,columns):
+    """ Forward differences of the residuals, perturbing one column at a time
+
+        Assumptions:
+        Uses the same step size as MINPACK with the default epsfcn
+
+        Source:
+        N/A
+
+        Inputs:
+            unknowns      [array]
+            residuals     [array]
+            function      [function]
+            columns       [int array] the columns to compute
+
+        Outputs:
+            J             [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    h = step_size(unknowns)
+    J = np.zeros((len(residuals),len(unknowns)))
+
+    for j in columns:
+        x     = unknowns*1.
+        x[j] += h[j]
+        J[:,j] = (function(x) - residuals)/h[j]
+
+    return J
+
+## @ingroup Methods-Missions-Segments-Common
+def colored_finite_difference(unknowns,residuals,function,sparsity,colors):
+    """ Forward differences of the residuals, perturbing every column of a color at once
+
+        Assumptions:
+        Columns sharing a color have no rows in common in the sparsity pattern
+
+        Source:
+        Curtis, Powell and Reid, "On the estimation of sparse Jacobian matrices", 1974
+
+        Inputs:
+            unknowns      [array]
+            residuals     [array]
+            function      [function]
+            sparsity      [boolean array]
+            colors        [int array] negative colors are skipped
+
+        Outputs:
+            J             [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    h = step_size(unknowns)
+    J = np.zeros((len(residuals),len(unknowns)))
+
+    for color in np.unique(colors[colors>=0]):
+        cols    = np.where(colors==color)[0]
+        x       = unknowns*1.
+        x[cols] += h[cols]
+        dR      = function(x) - residuals
+        J[:,cols] = sparsity[:,cols] * dR[:,None] / h[cols]
+
+    return J
+
+## @ingroup Methods-Missions-Segments-Common
+def column_coloring(sparsity):
+    """ Groups the columns of a sparsity pattern that have no rows in common
+
+        Assumptions:
+        Greedy ordering, columns with the most nonzeros are colored first
+
+        Source:
+        N/A
+
+        Inputs:
+            sparsity      [boolean array]
+
+        Outputs:
+            colors        [int array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    m,n    = sparsity.shape
+    colors = -np.ones(n,dtype=int)
+    used   = np.zeros((0,m),dtype=bool)
+
+    order  = np.argsort(-np.sum(sparsity,axis=0),kind='mergesort')
+
+    for j in order:
+        rows  = sparsity[:,j]
+        free  = np.where(~np.any(used & rows,axis=1))[0]
+        if len(free):
+            color = free[0]
+        else:
+            color = len(used)
+            used  = np.vstack([used,np.zeros((1,m),dtype=bool)])
+        used[color] |= rows
+        colors[j]    = color
+
+    return colors
+
+## @ingroup Methods-Missions-Segments-Common
+def step_size(unknowns):
+    """ The forward difference step for each unknown
+
+        Assumptions:
+        Matches MINPACK with epsfcn at machine precision
+
+        Source:
+        N/A
+
+        Inputs:
+            unknowns      [array]
+
+        Outputs:
+            h             [array]
+
+        Properties Used:
+        N/A
+
+    """
+    eps = np.sqrt(np.finfo(float).eps)
+    h   = eps * np.abs(unknowns)
+    h[h==0.] = eps
+
+    return h
@@ -3,12 +3,14 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core.Arrays import atleast_2d_col 
+from SUAVE.Methods.Utilities.Chebyshev import cached_operators
 
 # ----------------------------------------------------------------------
 #  Initialize Differentials
@@ -19,7 +21,7 @@ def initialize_differentials_dimensionless(segment):
     """ Discretizes the differential operators
     
         Assumptions:
-        N/A
+        The operators of each method are built once for each number of points and shared
         
         Inputs:
             state.numerics:
@@ -31,6 +33,7 @@ def initialize_differentials_dimensionless(segment):
                 control_points        [array]
                 differentiate         [array]
                 integrate             [array]
+            numerics.time.duration    [seconds] cleared so the time operators are scaled again
 
         Properties Used:
         N/A
@@ -41,7 +44,7 @@ def initialize_differentials_dimensionless(segment):
     # unpack
     numerics = segment.state.numerics
     N                     = numerics.number_control_points
-    discretization_method = numerics.discretization_method
+    discretization_method = cached_operators(numerics.discretization_method)
     
     # get operators
     x,D,I = discretization_method(N,**numerics)
@@ -51,6 +54,7 @@ def initialize_differentials_dimensionless(segment):
     numerics.dimensionless.control_points = x
     numerics.dimensionless.differentiate  = D
     numerics.dimensionless.integrate      = I    
+    numerics.time.duration                = None
     
     return
 
@@ -63,7 +67,7 @@ def update_differentials_time(segment):
     """ Scales the differential operators (integrate and differentiate) based on mission time
     
         Assumptions:
-        N/A
+        The operators are only scaled again when the segment duration changes
         
         Inputs:
             numerics.dimensionless:           
@@ -77,6 +81,7 @@ def update_differentials_time(segment):
                 control_points        [array]
                 differentiate         [array]
                 integrate             [array]
+                duration              [seconds]
 
         Properties Used:
         N/A
@@ -92,6 +97,11 @@ def update_differentials_time(segment):
     # rescale time
     time = segment.state.conditions.frames.inertial.time
     T    = time[-1] - time[0]
+    
+    # nothing to do if the duration hasn't changed
+    if numerics.time.get('duration',None) == float(T):
+        return
+    
     t    = x * T
     
     # rescale operators
@@ -102,6 +112,7 @@ def update_differentials_time(segment):
     numerics.time.control_points = t
     numerics.time.differentiate  = D
     numerics.time.integrate      = I
+    numerics.time.duration       = float(T)
 
     return
     
\ No newline at end of file
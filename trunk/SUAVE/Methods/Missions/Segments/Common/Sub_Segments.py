@@ -5,11 +5,14 @@
 # Modified: Jan 2016, E. Botero
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+import numpy as np
+
 from SUAVE.Analyses import Process
 from SUAVE.Core import Data
 
@@ -138,10 +141,12 @@ def sequential_sub_segments(segment):
 ## @ingroup Methods-Missions-Segments-Common
 def merge_sub_segment_states(segment):
     
-    """ Merges all of the sub segment states back into the main state
+    """ Merges all of the sub segment states back into the main state. The merged arrays
+        are kept between iterations and the sub segment arrays become slices of them, so
+        only the values the sub segments replaced are copied.
     
         Assumptions:
-        N/A
+        The merged arrays are overwritten in place on every merge
         
         Inputs:
         N/A
@@ -154,7 +159,111 @@ def merge_sub_segment_states(segment):
                                 
     """       
 
-    segment.state.update(segment.merged())
+    sub_states = [sub_segment.state for sub_segment in segment.segments.values()]
+    
+    if len(sub_states) < 2:
+        segment.state.update(segment.merged())
+        return
+    
+    for key in ['unknowns','conditions','residuals']:
+        merge_conditions(segment.state[key],[sub_state[key] for sub_state in sub_states],segment.state[key].__class__)
+        
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def merge_conditions(merged,conditions,klass):
+    """ Stacks the arrays of the sub segment conditions into the merged conditions
+    
+        Assumptions:
+        Only the arrays and conditions found in all the sub segments are merged
+        
+        Inputs:
+        merged     [Conditions()]
+        conditions [list of Conditions()]
+        klass      [class] type of any new merged conditions
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """      
+    
+    for k,a in conditions[0].items():
+        values = [c[k] for c in conditions if isinstance(c,Data) and k in c]
+        if len(values) < len(conditions):
+            continue
+        
+        # recursion
+        if isinstance(a,Data):
+            if not all(isinstance(v,Data) for v in values): 
+                continue
+            if not isinstance(merged.get(k),Data):
+                merged[k] = klass()
+            merge_conditions(merged[k],values,klass)
+            
+        elif all(isinstance(v,np.ndarray) for v in values):
+            merge_arrays(merged,k,conditions,values)
+            
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def merge_arrays(merged,k,conditions,values):
+    """ Copies the arrays of the sub segments into the merged array, it is only
+        allocated when the sizes change
+    
+        Assumptions:
+        Same stacking as np.vstack
+        
+        Inputs:
+        merged     [Conditions()]
+        k          [string] key of the arrays
+        conditions [list of Conditions()]
+        values     [list of arrays]
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    shape = values[0].shape[1:]
+    dtype = values[0].dtype
+    rows  = 0
+    for v in values:
+        if v.ndim < 2 or v.shape[1:] != shape or v.dtype != dtype or type(v) is not np.ndarray:
+            merged[k] = np.vstack(values)
+            return
+        rows += v.shape[0]
+    
+    stack = merged.get(k)
+    if not (type(stack) is np.ndarray and stack.shape == (rows,) + shape and stack.dtype == dtype):
+        stack     = np.vstack(values)
+        merged[k] = stack
+        copy      = False
+    else:
+        copy      = True
+        address   = stack.__array_interface__['data'][0]
+        
+    start = 0
+    for c,v in zip(conditions,values):
+        n     = v.shape[0]
+        if copy and v.base is stack and v.strides == stack.strides and \
+           v.__array_interface__['data'][0] == address + start * stack.strides[0]:
+            # already a slice of the merged array
+            start = start + n
+            continue
+        view  = stack[start:start+n]
+        start = start + n
+        if copy:
+            view[...] = v
+        # the sub segment works in the merged array from now on
+        c[k] = view
+    
+    return
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
@@ -194,4 +303,4 @@ def unpack_subsegments(segment):
             
     return
             
-            
\ No newline at end of file
+            
@@ -7,4 +7,7 @@ from . import Aerodynamics
 from . import Energy
 from . import Frames
 from . import Numerics
+from . import Jacobian
+from . import Batch
+from . import Control_Points
 from . import Weights
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,7 +12,10 @@
 import scipy.optimize
 import numpy as np
 
+from SUAVE.Core import Data
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Methods.Missions.Segments.Common.Jacobian import evaluate_jacobian, finite_difference
+from SUAVE.Methods.Missions.Segments.Common.Control_Points import truncation_error, set_control_points, is_adaptive
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -20,6 +24,60 @@ from SUAVE.Core.Arrays import array_type
 ## @ingroup Methods-Missions-Segments
 def converge_root(segment):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
+    With state.numerics.adaptive.enabled the segment is solved on a few control points first,
+    and solved again on more points, starting from the interpolated solution, until the
+    truncation error estimated from the Chebyshev coefficients is small enough.
+
+    Assumptions:
+    The number of control points grows as 2N-1, so the coarse points are reused
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.adaptive.enabled                [boolean]
+    state.numerics.adaptive.minimum_control_points [int]
+    state.numerics.adaptive.maximum_control_points [int]
+    state.numerics.adaptive.tolerance              [Unitless]
+
+    Outputs:
+    state.numerics.number_control_points           [int]
+    state.numerics.adaptive.truncation_error       [Unitless]
+    state.numerics.residual_evaluations            [Unitless] summed over the solves
+
+    Properties Used:
+    N/A
+    """
+    
+    if not is_adaptive(segment):
+        solve_root(segment)
+        return
+    
+    numerics = segment.state.numerics
+    adaptive = numerics.adaptive
+    
+    N = adaptive.minimum_control_points
+    if N != numerics.number_control_points:
+        set_control_points(segment,N)
+    solve_root(segment)
+    evaluations = numerics.residual_evaluations
+    
+    while numerics.converged:
+        adaptive.truncation_error = truncation_error(segment)
+        if adaptive.truncation_error <= adaptive.tolerance or N >= adaptive.maximum_control_points:
+            break
+        N = min(2*N-1,adaptive.maximum_control_points)
+        set_control_points(segment,N)
+        solve_root(segment)
+        evaluations += numerics.residual_evaluations
+        
+    numerics.residual_evaluations = evaluations
+        
+    return
+
+## @ingroup Methods-Missions-Segments
+def solve_root(segment):
+    """Solves the segment on its current control points.
 
     Assumptions:
     N/A
@@ -31,27 +89,102 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string]   "none", "colored" or "analytic"
+    state.numerics.warm_start          [Warm_Start] optional store of converged solutions
 
     Outputs:
     state.unknowns                     [Any]
     segment.state.numerics.converged   [Unitless]
+    segment.state.numerics.residual_evaluations [Unitless]
 
     Properties Used:
     N/A
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    unknowns   = segment.state.unknowns.pack_array()
+    numerics   = segment.state.numerics
+    warm_start = numerics.warm_start
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    # the root finder always asks for the jacobian where it just was, the state holds that evaluation
+    last = Data()
+    last.jacobian          = None
+    last.jacobian_unknowns = None
+    last.seed              = None
+    numerics.residual_evaluations = 0
+    
+    def function(x):
+        return iterate(x,segment)
+    
+    def jacobian(x,segment):
+        if last.jacobian_unknowns is not None and np.all(last.jacobian_unknowns == x):
+            return last.jacobian
+        if last.seed is not None and np.all(last.seed.unknowns == x):
+            # the stored jacobian of a warm start
+            last.jacobian_unknowns = x*1.
+            last.jacobian          = last.seed.jacobian
+            last.seed              = None
+            return last.jacobian
+        if np.any(segment.state.unknowns.pack_array() != x):
+            iterate(x,segment)
+        x0 = segment.state.unknowns.pack_array()
+        R0 = segment.state.residuals.pack_array()
+        last.jacobian_unknowns = x*1.
+        if numerics.solver_jacobian in (None,'none'):
+            last.jacobian = finite_difference(x0,R0,function,range(len(x)))
+        else:
+            last.jacobian = evaluate_jacobian(x0,R0,function,segment)
+        return last.jacobian
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         full_output=1)
+    options = Data()
+    if not numerics.solver_jacobian in (None,'none'):
+        options.fprime = jacobian
+    
+    # start from a stored solution
+    guess = unknowns
+    if warm_start is not None:
+        entry = warm_start.nearest(segment.tag,len(unknowns))
+        if entry is not None:
+            guess = entry.unknowns*1.
+            if entry.jacobian is not None and entry.jacobian.shape == (len(guess),len(guess)):
+                last.seed          = Data()
+                last.seed.unknowns = guess
+                last.seed.jacobian = entry.jacobian
+                options.fprime     = jacobian
+    
+    solution,infodict,ier,msg = root_finder( iterate,
+                                             guess,
+                                             args = segment,
+                                             xtol = numerics.tolerance_solution,
+                                             full_output=1,
+                                             **options)
+    
+    # one more try from the initial guess with the default finite differences
+    if ier!=1 and (guess is not unknowns or 'fprime' in options):
+        fallback = []
+        if guess is not unknowns:
+            fallback.append('from the initial guess instead of the warm start')
+        if 'fprime' in options:
+            fallback.append('with finite differences instead of the ' + str(numerics.solver_jacobian) + ' jacobian')
+            del options.fprime
+        if not numerics.solver_jacobian in (None,'none'):
+            # the structure found may have missed entries that were zero at the initial guess
+            numerics.jacobian.sparsity = np.empty([0,0],dtype=bool)
+        print("Segment " + segment.tag + " is solved again " + ' and '.join(fallback))
+        last.seed = None
+        solution,infodict,ier,msg = root_finder( iterate,
+                                                 unknowns,
+                                                 args = segment,
+                                                 xtol = numerics.tolerance_solution,
+                                                 full_output=1)
+    
+    # the differences leave the state at a perturbed point
+    if 'fprime' in options and np.any(segment.state.unknowns.pack_array() != solution):
+        iterate(solution,segment)
 
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -59,7 +192,8 @@ def converge_root(segment):
         segment.state.numerics.converged = False
     else:
         segment.state.numerics.converged = True
-         
+        if warm_start is not None:
+            warm_start.save(segment.tag,solution,final_jacobian(infodict,len(solution)))
                             
     return
     
@@ -84,6 +218,7 @@ def iterate(unknowns, segment):
 
     Outputs:
     residuals                     [Unitless]
+    state.numerics.residual_evaluations [Unitless]
 
     Properties Used:
     N/A
@@ -93,8 +228,44 @@ def iterate(unknowns, segment):
     else:
         segment.state.unknowns = unknowns
         
+    segment.state.numerics.residual_evaluations += 1
     segment.process.iterate(segment)
     
     residuals = segment.state.residuals.pack_array()
         
-    return residuals 
\ No newline at end of file
+    return residuals
+
+## @ingroup Methods-Missions-Segments
+def final_jacobian(infodict,n):
+    """Rebuilds the jacobian approximation the root finder ended with.
+
+    Assumptions:
+    MINPACK returns the QR factors of its final approximate jacobian
+
+    Source:
+    N/A
+
+    Inputs:
+    infodict['fjac']              [array]
+    infodict['r']                 [array]
+    n                             [int]
+
+    Outputs:
+    jacobian                      [array] or None
+
+    Properties Used:
+    N/A
+    """       
+    
+    if not ('fjac' in infodict and 'r' in infodict):
+        return None
+    
+    q = np.asarray(infodict['fjac'])
+    r = np.asarray(infodict['r'])
+    if q.shape != (n,n) or r.size != n*(n+1)//2:
+        return None
+    
+    R = np.zeros((n,n))
+    R[np.triu_indices(n)] = r
+    
+    return np.dot(q.T,R)
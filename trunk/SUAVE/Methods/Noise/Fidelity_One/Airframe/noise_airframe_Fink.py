@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -145,20 +146,19 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     #         Computing atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
+    atmo_data = analyses.atmosphere.compute_values(altitude)
         
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
+    #unpack    
+    sound_speed[:] =    atmo_data.speed_of_sound[:,0]
+    density[:]     =    atmo_data.density[:,0]
+    viscosity[:]   =    atmo_data.dynamic_viscosity[:,0]*10.7639 #units converstion - m2 to ft2
+    temperature[:] =    atmo_data.temperature[:,0]
         
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
+    #Mach number
+    M[:] = velocity/np.sqrt(1.4*287*temperature)
     
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw[:] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
     
 
     #Units conversion - knots to ft/s
@@ -4,6 +4,7 @@
 # Created:  May 2015, C. Ilario
 # Modified: Nov 2015, C. Ilario
 #           Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -146,14 +147,13 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
     # Computing atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(Altitude[id])        
+    atmo_data = analyses.atmosphere.compute_values(Altitude)        
     
-        sound_ambient[id]       =   np.float(atmo_data.speed_of_sound)
-        density_ambient[id]     =   np.float(atmo_data.density)
-        viscosity[id]           =   np.float(atmo_data.dynamic_viscosity)
-        temperature_ambient[id] =   np.float(atmo_data.temperature)
-        pressure_amb[id]        =   np.float(atmo_data.pressure)
+    sound_ambient[:]       =   atmo_data.speed_of_sound[:,0]
+    density_ambient[:]     =   atmo_data.density[:,0]
+    viscosity[:]           =   atmo_data.dynamic_viscosity[:,0]
+    temperature_ambient[:] =   atmo_data.temperature[:,0]
+    pressure_amb[:]        =   atmo_data.pressure[:,0]
     
     #Base parameters necessary input for the noise code
     pressure_isa = 101325 #[Pa]
@@ -3,6 +3,7 @@
 #
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -25,7 +26,7 @@ def flight_trajectory(configs,turbofan,analyses):
             It is possible to simulate the three certification points (sideline, flyover, approach) and also a constant altitute flight path. 
 
             Inputs:
-                    configs
+                    configs                           - configs.flight.throttle is the engine throttle along the trajectory
                     turbofan
 
             Outputs: 
@@ -52,6 +53,7 @@ def flight_trajectory(configs,turbofan,analyses):
     flyover  = configs.flight.flyover
     sideline = configs.flight.sideline
     constant_flight = configs.flight.constant_flight
+    throttle = configs.flight.throttle
        
     #Necessary input for determination of noise trajectory    
     dt = 0.5*Units.s  #time step for noise calculation - Certification requirement
@@ -93,7 +95,7 @@ def flight_trajectory(configs,turbofan,analyses):
             
             
          #Determine the engine performance parameter for the velocity and altitute    
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)  
+        engine_data = engine_performnace(altitute,velocity,throttle,turbofan,analyses)  
         
     #----------------------------------------
     # APPROACH NOISE TRAJECTORY
@@ -136,7 +138,7 @@ def flight_trajectory(configs,turbofan,analyses):
             time[i] = time[i-1]+dt
             
         #Determine the engine performance parameter for the velocity and altitute    
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
+        engine_data = engine_performnace(altitute,velocity,throttle,turbofan,analyses)
         
     #----------------------------------------
     # FLYOVER NOISE TRAJECTORY
@@ -178,7 +180,7 @@ def flight_trajectory(configs,turbofan,analyses):
             time[i]     = time[i-1]+dt
             
         #Determine the engine performance parameter for the velocity and altitute    
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
+        engine_data = engine_performnace(altitute,velocity,throttle,turbofan,analyses)
         
     #----------------------------------------
     # SIDELINE NOISE TRAJECTORY
@@ -226,7 +228,7 @@ def flight_trajectory(configs,turbofan,analyses):
             time[i] = time[i-1]+dt
 
         #Determine the engine performance parameter for the velocity and altitute
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
+        engine_data = engine_performnace(altitute,velocity,throttle,turbofan,analyses)
     
     return(time,altitute,dist,theta,phi,engine_data)
 
@@ -234,13 +236,14 @@ def flight_trajectory(configs,turbofan,analyses):
 #   Engine Performance
 # ---------------------------------------------------------------------- 
 
-def engine_performnace(altitude,velocity,turbofan,analyses):
-    """ SUAVE.Methods.Noise.Fidelity_One.engine_performnace(altitude,velocity,turbofan):
+def engine_performnace(altitude,velocity,throttle,turbofan,analyses):
+    """ SUAVE.Methods.Noise.Fidelity_One.engine_performnace(altitude,velocity,throttle,turbofan):
             This routine generates the engine performance parameter for each point on the noise trajectory. 
 
             Inputs:
                     altitute
                     velocity
+                    throttle
                     turbofan
 
             Outputs: 
@@ -253,44 +256,47 @@ def engine_performnace(altitude,velocity,turbofan,analyses):
                 pressure_secondary      -        Core nozzle jet stagnation pressure [Pa]
 
             Assumptions:
-                               ."""
+                None"""
     
     
     #Calculation of the Aircraft Mach number
     mach_number = velocity/340.3
-    
-    #Number of discrete points on the flight trajectory
-    n_steps = np.size(altitude)
-    
-    #Defining the necessary arrays for the engine performance procedure
-    velocity_primary      = np.zeros(n_steps)
-    temperature_primary   = np.zeros(n_steps)
-    pressure_primary      = np.zeros(n_steps)
-    velocity_secondary    = np.zeros(n_steps)
-    temperature_secondary = np.zeros(n_steps)
-    pressure_secondary    = np.zeros(n_steps)
 
-    #size the turbofan
+    #call the atmospheric model once for all the points on the trajectory
+    altitude  = np.reshape(altitude,(-1,1))
+    ones      = np.ones_like(altitude)
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    p         = atmo_data.pressure
+    T         = atmo_data.temperature
+
+    #setup the conditions at all the points
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(len(altitude))
+    conditions.freestream.altitude                    = altitude * 1.
+    conditions.freestream.mach_number                 = mach_number * ones
+    conditions.freestream.velocity                    = velocity * ones
+    conditions.freestream.pressure                    = p
+    conditions.freestream.temperature                 = T
+    conditions.freestream.density                     = atmo_data.density
+    conditions.freestream.dynamic_viscosity           = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound              = atmo_data.speed_of_sound
+    conditions.freestream.isentropic_expansion_factor = turbofan.working_fluid.compute_gamma(T,p)
+    conditions.freestream.Cp                          = turbofan.working_fluid.compute_cp(T,p)
+    conditions.freestream.R                           = turbofan.working_fluid.gas_specific_constant
+    conditions.propulsion.throttle                    = throttle * ones
+
+    state = SUAVE.Core.Data()
+    state.conditions = conditions
+
+    #run the engine at all the points at once
+    turbofan(state)
+
+    velocity_primary      = np.ravel(turbofan.core_nozzle.outputs.velocity)
+    temperature_primary   = np.ravel(turbofan.core_nozzle.outputs.stagnation_temperature)
+    pressure_primary      = np.ravel(turbofan.core_nozzle.outputs.stagnation_pressure)
+
+    velocity_secondary    = np.ravel(turbofan.fan_nozzle.outputs.velocity)
+    temperature_secondary = np.ravel(turbofan.fan_nozzle.outputs.stagnation_temperature)
+    pressure_secondary    = np.ravel(turbofan.fan_nozzle.outputs.stagnation_pressure)
 
-    for i in range (0,n_steps):
-        
-        atmo_data = analyses.atmosphere.compute_values(altitude[i])
-         
-         #call the atmospheric model to get the conditions at the specified altitude
-        atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
-        conditions = atmosphere.compute_values(altitude[i])
-        
-        #setup conditions
-        conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
-        
-        turbofan(conditions)
-      
-        velocity_primary[i]        = np.float(turbofan.core_nozzle.outputs.velocity)
-        temperature_primary[i]     = np.float(turbofan.core_nozzle.outputs.stagnation_temperature)
-        pressure_primary[i]        = np.float(turbofan.core_nozzle.outputs.stagnation_pressure)
-    
-        velocity_secondary[i]      = np.float(turbofan.fan_nozzle.outputs.velocity)
-        temperature_secondary[i]   = np.float(turbofan.fan_nozzle.outputs.stagnation_temperature)
-        pressure_secondary[i]      = np.float(turbofan.fan_nozzle.outputs.stagnation_pressure) 
-        
     return (velocity_primary,temperature_primary,pressure_primary,velocity_secondary,temperature_secondary,pressure_secondary)
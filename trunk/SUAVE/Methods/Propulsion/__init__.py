@@ -15,4 +15,6 @@ from .fm_solver import fm_solver
 from .rayleigh import rayleigh
 from .nozzle_calculations import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle
 from . import electric_motor_sizing
-from .liquid_rocket_sizing import liquid_rocket_sizing
\ No newline at end of file
+from .liquid_rocket_sizing import liquid_rocket_sizing
+from .propeller_map import build_propeller_map, propeller_coefficients, propeller_map_coefficients
+from .engine_deck import build_engine_deck, engine_state, save_engine_deck, load_engine_deck
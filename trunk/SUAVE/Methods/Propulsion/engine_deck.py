@@ -0,0 +1,246 @@
+## @ingroup Methods-Propulsion
+# engine_deck.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import copy
+import os
+import tempfile
+
+import numpy as np
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Build Engine Deck
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def build_engine_deck(network,altitude,mach_number,throttle,temperature_deviation=[0.],atmosphere=None,
+                      planet=None):
+    """Evaluates a sized network on every combination of altitude, Mach number, throttle
+    and deviation from the standard day temperature, all in one call, and tabulates the
+    thrust, the fuel flow and the exhaust of the nozzles.
+
+    Assumptions:
+    The network is sized and evaluated on a copy, so the network itself is not changed.
+    The exhaust is the acoustic output of the network where it has one, otherwise it is
+    taken from the core and fan nozzles.
+
+    Source:
+    N/A
+
+    Inputs:
+    network                      <Turbofan>, <Turbojet_Super> or a network like them
+    altitude                     [m] 1-D array
+    mach_number                  [-] 1-D array
+    throttle                     [-] 1-D array
+    temperature_deviation        [K] 1-D array
+    atmosphere                   <Atmospheric analysis>, US_Standard_1976 by default
+    planet                       <Planet>, Earth by default
+
+    Outputs:
+    deck.
+      tag                        <string>
+      number_of_engines          [-]
+      altitude                   [m]
+      mach_number                [-]
+      throttle                   [-]
+      temperature_deviation      [K]
+      thrust                     [N] for all the engines, one value per grid node
+      fuel_flow_rate             [kg/s] for all the engines, one value per grid node
+      exhaust.core, exhaust.fan.
+        exit_static_temperature     [K]
+        exit_static_pressure        [Pa]
+        exit_stagnation_temperature [K]
+        exit_stagnation_pressure    [Pa]
+        exit_velocity               [m/s]
+
+    Properties Used:
+    N/A
+    """
+
+    axes  = [np.array(axis,dtype=float).ravel() for axis in [altitude,mach_number,throttle,temperature_deviation]]
+    shape = tuple(len(axis) for axis in axes)
+    grid  = [np.reshape(node,(-1,1)) for node in np.meshgrid(*axes,indexing='ij')]
+
+    engine = copy.deepcopy(network)
+    state  = engine_state(engine,*grid,atmosphere=atmosphere,planet=planet)
+    H      = grid[0]
+
+    # all the nodes at once
+    results = engine.evaluate_thrust(state)
+
+    deck = Data()
+    deck.tag                   = network.tag
+    deck.number_of_engines     = network.number_of_engines
+    deck.altitude              = axes[0]
+    deck.mach_number           = axes[1]
+    deck.throttle              = axes[2]
+    deck.temperature_deviation = axes[3]
+    deck.thrust                = np.reshape(results.thrust_force_vector[:,0],shape)
+    deck.fuel_flow_rate        = np.reshape(results.vehicle_mass_rate,shape)
+    deck.exhaust               = Data()
+
+    acoustic_outputs = state.conditions.propulsion.get('acoustic_outputs',Data())
+    for stream in ['core','fan']:
+        exhaust = acoustic_outputs.get(stream)
+        nozzle  = engine.get(stream + '_nozzle')
+        if not exhaust and nozzle is not None:
+            exhaust = Data()
+            exhaust.exit_static_temperature     = nozzle.outputs.static_temperature
+            exhaust.exit_static_pressure        = nozzle.outputs.static_pressure
+            exhaust.exit_stagnation_temperature = nozzle.outputs.stagnation_temperature
+            exhaust.exit_stagnation_pressure    = nozzle.outputs.stagnation_pressure
+            exhaust.exit_velocity               = nozzle.outputs.velocity
+        if exhaust:
+            deck.exhaust[stream] = Data()
+            for key, values in exhaust.items():
+                deck.exhaust[stream][key] = np.reshape(values*np.ones_like(H),shape)
+
+    return deck
+
+## @ingroup Methods-Propulsion
+def engine_state(network,altitude,mach_number,throttle,temperature_deviation=0.,atmosphere=None,planet=None):
+    """Sets up the state of a gas turbine network at a given flight condition, for
+    evaluating it outside of a mission.
+
+    Assumptions:
+    The flight conditions are given as columns, or scalars broadcast against them
+
+    Source:
+    N/A
+
+    Inputs:
+    network                      <Turbofan>, <Turbojet_Super> or a network like them
+    altitude                     [m]
+    mach_number                  [-]
+    throttle                     [-]
+    temperature_deviation        [K]
+    atmosphere                   <Atmospheric analysis>, US_Standard_1976 by default
+    planet                       <Planet>, Earth by default
+
+    Outputs:
+    state.conditions             <Aerodynamics conditions> with the freestream and throttle set
+
+    Properties Used:
+    network.working_fluid
+    """
+
+    if atmosphere is None:
+        atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    if planet is None:
+        planet = SUAVE.Attributes.Planets.Earth()
+
+    H, M, eta, dT = np.broadcast_arrays(*[np.reshape(x,(-1,1)) for x in [altitude,mach_number,throttle,temperature_deviation]])
+    working_fluid = network.working_fluid
+
+    atmo_data = atmosphere.compute_values(H*1.,dT)
+    p   = atmo_data.pressure
+    T   = atmo_data.temperature
+    a   = atmo_data.speed_of_sound
+
+    # setup conditions
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(len(H))
+
+    # freestream conditions
+    conditions.freestream.altitude                    = H*1.
+    conditions.freestream.mach_number                 = M*1.
+    conditions.freestream.pressure                    = p
+    conditions.freestream.temperature                 = T
+    conditions.freestream.density                     = atmo_data.density
+    conditions.freestream.dynamic_viscosity           = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound              = a
+    conditions.freestream.velocity                    = M*a
+    conditions.freestream.gravity                     = planet.compute_gravity(H)
+    conditions.freestream.isentropic_expansion_factor = working_fluid.compute_gamma(T,p)
+    conditions.freestream.Cp                          = working_fluid.compute_cp(T,p)
+    conditions.freestream.R                           = working_fluid.gas_specific_constant
+    conditions.propulsion.throttle                    = eta*1.
+
+    state            = Data()
+    state.numerics   = Data()
+    state.conditions = conditions
+
+    return state
+
+## @ingroup Methods-Propulsion
+def save_engine_deck(deck,filename):
+    """Writes an engine deck to a compressed numpy archive.
+
+    Assumptions:
+    The file is written to a temporary name and renamed, so a reader never sees part of it
+
+    Source:
+    N/A
+
+    Inputs:
+    deck                         see build_engine_deck
+    filename                     <string> ends in .npz
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    arrays = Data()
+    arrays.tag               = np.array(deck.tag)
+    arrays.number_of_engines = np.array(deck.number_of_engines)
+    for key in ['altitude','mach_number','throttle','temperature_deviation','thrust','fuel_flow_rate']:
+        arrays[key] = deck[key]
+    for stream, exhaust in deck.exhaust.items():
+        for key, values in exhaust.items():
+            arrays['exhaust.' + stream + '.' + key] = values
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    handle, path = tempfile.mkstemp(suffix='.npz',dir=directory)
+    with os.fdopen(handle,'wb') as stream:
+        np.savez_compressed(stream,**arrays)
+    os.replace(path,filename)
+
+    return
+
+## @ingroup Methods-Propulsion
+def load_engine_deck(filename):
+    """Reads an engine deck written by save_engine_deck.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename                     <string>
+
+    Outputs:
+    deck                         see build_engine_deck
+
+    Properties Used:
+    N/A
+    """
+
+    deck = Data()
+    deck.exhaust = Data()
+
+    with np.load(filename) as arrays:
+        for key in arrays.files:
+            names = key.split('.')
+            if len(names) == 3:
+                deck.exhaust.setdefault(names[1],Data())[names[2]] = arrays[key]
+            else:
+                deck[key] = arrays[key]
+
+    deck.tag               = str(deck.tag)
+    deck.number_of_engines = float(deck.number_of_engines)
+
+    return deck
@@ -3,13 +3,14 @@
 #
 # Created:  Sep 2017, P Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from scipy.optimize import fsolve
+from SUAVE.Methods.Utilities import safeguarded_newton
 
 # ----------------------------------------------------------------------
 #  fm_solver
@@ -22,34 +23,40 @@ def fm_solver(area_ratio, M0, gamma):
     """Function that takes in an area ratio and a Mach number associated to
     one of the areas and outputs the missing Mach number.
 
+    Assumptions:
+    The missing Mach number is on the same side of sonic as the given one. Where the
+    area ratio is below the sonic one, the flow is choked and the Mach number is one.
+
     Inputs:
     M           [-]
     gamma       [-]
     area_ratio  [-]
 
     Outputs:
-    M1          [-]
+    M1          [-] of the broadcast shape of the inputs, at least 1-D
 
     Source:
     https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
     """
-    # Area-Mach Function
-    func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
 
-    # Initializing the array
-    M1_guess = np.ones_like(M0)
+    M0, area_ratio, gamma = np.broadcast_arrays(np.atleast_1d(M0),area_ratio,gamma)
+
+    # Area-Mach Function and its derivative
+    def func(M1):
+        T1      = 1.+(gamma-1.)/2.*M1*M1
+        ratio   = M0/M1*(T1/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.)))
+        dratio  = ratio*(M1*M1-1.)/(M1*T1)
+        return ratio-area_ratio, dratio
 
     # Separating supersonic and subsonic solutions
-    i_low = M0 < 1.0
     i_high = M0 >= 1.0
 
-    # Subsonic solution initialization
-    M1_guess[i_low]= 0.1
-
-    # Supersonic solution initialization
-    M1_guess[i_high]= 1.1
+    # Subsonic solution initialization, supersonic solution initialization
+    M1_guess = np.where(i_high,1.1,0.1)
+    lower    = np.where(i_high,1.0,0.0)
+    upper    = np.where(i_high,100.,1.0)
 
     # Solving
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1 = safeguarded_newton(func,M1_guess,lower,upper)
 
     return M1
@@ -2,10 +2,10 @@
 # nozzle_calculations.py
 # 
 # Created:  Sep 2017, P. Goncalves
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 import numpy as np
-from scipy.optimize import fsolve
+from SUAVE.Methods.Utilities import safeguarded_newton
 
 # ----------------------------------------------------------------------
 #  nozzle calculations
@@ -33,15 +33,10 @@ def exit_Mach_shock(area_ratio, gamma, Pt_out, P0):
     Me            [dimensionless]      
     
     """
-    func = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
-
-    #Initializing the array
-    Me_initial_guess = np.ones_like(Pt_out) 
-    i_sol = Me_initial_guess < 10.0
-    Me_initial_guess[i_sol] = 0.1
-
-    # Solving for Me
-    Me = fsolve(func,Me_initial_guess)
+    # The relation is a quadratic in Me^2, with one positive root
+    C  = (Pt_out/P0)*(1./area_ratio)/(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))
+    k  = (gamma-1.)/2.
+    Me = np.atleast_1d(np.sqrt(2.*C*C/(1.+np.sqrt(1.+4.*k*C*C))))
         
     return Me
         
@@ -61,16 +56,24 @@ def mach_area(area_ratio, gamma, subsonic):
     subsonic      [Boolean]
     
     Outputs:
-    Me            [dimensionless]  
+    Me            [dimensionless] of the broadcast shape of the inputs, at least 1-D
     
     """
-    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))[:,0]
+    area_ratio, gamma = np.broadcast_arrays(np.atleast_1d(area_ratio), gamma)
+    
+    # Area-Mach function and its derivative
+    def func(Me):
+        T   = 1.+((gamma-1.)/2.)*Me**2.
+        A   = (1./Me)*(((2./(gamma+1.))*T)**((gamma+1.)/(2.*(gamma-1.))))
+        dA  = A*(Me*Me-1.)/(Me*T)
+        return A - area_ratio, dA
+    
     if subsonic:
-        Me_initial_guess = 0.01
+        Me_initial_guess, lower, upper = 0.01, 0.0, 1.0
     else:
-        Me_initial_guess = 2.0         
+        Me_initial_guess, lower, upper = 2.0, 1.0, 100.
         
-    Me = fsolve(func,Me_initial_guess, factor = 0.1)
+    Me = safeguarded_newton(func,Me_initial_guess*np.ones_like(area_ratio),lower,upper)
 
     return Me
 
@@ -0,0 +1,242 @@
+## @ingroup Methods-Propulsion
+# propeller_map.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import copy
+import itertools
+import warnings
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.Surrogates import Grid_Surrogate, training_key, load_training_data, save_training_data
+
+# ----------------------------------------------------------------------
+#  Build Propeller Map
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def build_propeller_map(propeller,advance_ratio,tip_mach,tip_reynolds_number,temperature=288.15,tolerance=0.01,
+                        inflow_tolerance=1e-8,directory=None):
+    """Solves a propeller over a grid of advance ratio, tip Mach number and tip Reynolds
+    number and stores the thrust and power coefficients as a tensor product interpolant.
+    Each cell of the grid is checked against the full solution at its center, and the
+    cells where the interpolant is off by more than the tolerance are marked so that
+    Propeller.spin solves those points in full.
+
+    Assumptions:
+    The propeller geometry is fixed. The coefficients don't depend on temperature, which
+    only enters through the Mach scaling of the skin friction. Points outside the grid are
+    solved in full.
+
+    Source:
+    N/A
+
+    Inputs:
+    propeller                    <Propeller>
+    advance_ratio                [-] 1-D array, J = V/(n*D)
+    tip_mach_number              [-] 1-D array, omega*R/a
+    tip_reynolds_number          [-] 1-D array, rho*omega*R*D/mu
+    temperature                  [K]
+    tolerance                    [-] largest error at the cell centers, relative to the
+                                     largest coefficient on the map
+    inflow_tolerance             [radians] convergence of the inflow angles on the map, tight
+                                     enough that the coefficients are smooth
+    directory                    <string> where maps are stored between runs, None to not store them
+
+    Outputs:
+    performance_map.
+      advance_ratio              [-]
+      tip_mach                   [-]
+      log_tip_reynolds_number    [-]
+      thrust_coefficient         <Grid_Surrogate> Ct = T/(rho*n^2*D^4)
+      power_coefficient          <Grid_Surrogate> Cp = P/(rho*n^3*D^5)
+      trusted                    <boolean> array, one per cell
+      temperature                [K]
+      tolerance                  [-]
+
+    Properties Used:
+    N/A
+    """
+
+    axes = [np.array(advance_ratio,dtype=float).ravel(),
+            np.array(tip_mach,dtype=float).ravel(),
+            np.log10(np.array(tip_reynolds_number,dtype=float).ravel())]
+
+    key  = training_key('propeller_map',propeller.prop_attributes,axes,float(temperature),inflow_tolerance)
+    data = load_training_data(directory,key)
+
+    if data is None:
+        nodes   = np.meshgrid(*axes,indexing='ij')
+        centers = np.meshgrid(*[(axis[1:]+axis[:-1])/2. for axis in axes],indexing='ij')
+
+        data = Data()
+        data.thrust_coefficient, data.power_coefficient = \
+            propeller_coefficients(propeller,nodes[0],nodes[1],10**nodes[2],temperature,inflow_tolerance)
+        data.center_thrust_coefficient, data.center_power_coefficient = \
+            propeller_coefficients(propeller,centers[0],centers[1],10**centers[2],temperature,inflow_tolerance)
+        save_training_data(directory,key,data)
+
+    performance_map = Data()
+    performance_map.advance_ratio           = axes[0]
+    performance_map.tip_mach                = axes[1]
+    performance_map.log_tip_reynolds_number = axes[2]
+    performance_map.temperature             = float(temperature)
+    performance_map.tolerance               = tolerance
+    performance_map.thrust_coefficient      = Grid_Surrogate().fit(axes,data.thrust_coefficient,'pchip')
+    performance_map.power_coefficient       = Grid_Surrogate().fit(axes,data.power_coefficient,'pchip')
+
+    # compare the interpolant with the full solution at the center of each cell
+    centers  = np.meshgrid(*[(axis[1:]+axis[:-1])/2. for axis in axes],indexing='ij')
+    trusted  = np.ones(np.shape(centers[0]),dtype=bool)
+    for name in ['thrust_coefficient','power_coefficient']:
+        exact   = data['center_' + name]
+        scale   = np.nanmax(np.abs(data[name]))
+        error   = np.abs(performance_map[name](*centers) - exact)/scale
+        trusted = trusted & (error <= tolerance)
+
+    # cells with a node that couldn't be solved
+    for corner in itertools.product([0,1],repeat=3):
+        index = tuple(slice(k,len(axis)-1+k) for k, axis in zip(corner,axes))
+        trusted = trusted & np.isfinite(data.thrust_coefficient[index]) & np.isfinite(data.power_coefficient[index])
+
+    performance_map.trusted = trusted
+
+    return performance_map
+
+## @ingroup Methods-Propulsion
+def propeller_coefficients(propeller,advance_ratio,tip_mach,tip_reynolds_number,temperature=288.15,inflow_tolerance=None):
+    """Solves a propeller in full at operating points given by their similarity parameters
+
+    Assumptions:
+    Unit density, full throttle and the flow along the propeller axis
+
+    Source:
+    N/A
+
+    Inputs:
+    propeller                    <Propeller>
+    advance_ratio                [-] array
+    tip_mach                     [-] array of the same shape
+    tip_reynolds_number          [-] array of the same shape
+    temperature                  [K]
+    inflow_tolerance             [radians] None for the tolerance of the propeller
+
+    Outputs:
+    Ct                           [-] thrust coefficient, array of the same shape, nan where
+                                     the inflow doesn't converge
+    Cp                           [-] power coefficient, array of the same shape, nan where
+                                     the inflow doesn't converge
+
+    Properties Used:
+    N/A
+    """
+
+    shape = np.shape(advance_ratio)
+    J     = np.ravel(advance_ratio)
+    Mt    = np.ravel(tip_mach)
+    Re    = np.ravel(tip_reynolds_number)
+    Ct    = np.nan*np.ones(len(J))
+    Cp    = np.nan*np.ones(len(J))
+
+    prop = copy.deepcopy(propeller)
+    prop.performance_map = None
+    prop.warm_start      = False
+    prop.thrust_angle    = 0.
+    if inflow_tolerance is not None:
+        prop.tolerance   = inflow_tolerance
+
+    R     = prop.prop_attributes.tip_radius
+    D     = 2.*R
+    a     = np.sqrt(1.4*287.0528*temperature)
+    ones  = np.ones((1,1))
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.propulsion = Data()
+    conditions.frames     = Data()
+    conditions.frames.body     = Data()
+    conditions.frames.inertial = Data()
+    conditions.freestream.density                = ones
+    conditions.freestream.speed_of_sound         = a*ones
+    conditions.freestream.temperature            = temperature*ones
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(1,1,1))
+    conditions.propulsion.throttle               = ones
+
+    # one point at a time, as the inflow iteration stops for all the points together
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for i in range(len(J)):
+            omega = Mt[i]*a/R
+            n     = omega/(2.*np.pi)
+            V     = J[i]*n*D
+            conditions.freestream.dynamic_viscosity    = omega*R*D/Re[i]*ones
+            conditions.frames.inertial.velocity_vector = np.array([[V,0.,0.]])
+            prop.inputs.omega = omega*ones
+
+            thrust, torque, power, Cp_i = prop.spin(conditions)
+
+            # points without a solution are left out of the map
+            if prop.outputs.converged:
+                Ct[i] = thrust[0,0]/(n*n*D**4)
+                Cp[i] = Cp_i[0,0]
+
+    return np.reshape(Ct,shape), np.reshape(Cp,shape)
+
+## @ingroup Methods-Propulsion
+def propeller_map_coefficients(performance_map,V,omega,rho,mu,a,R):
+    """Interpolates the thrust and power coefficients of a propeller map at operating
+    points, and tells which points the map can be trusted at
+
+    Assumptions:
+    Points outside the grid, in cells that failed the accuracy check or with a non
+    positive rotation rate are not trusted
+
+    Source:
+    N/A
+
+    Inputs:
+    performance_map              see build_propeller_map
+    V                            [m/s] velocity along the propeller axis, column
+    omega                        [radian/s] column
+    rho                          [kg/m^3] column
+    mu                           [kg/(m-s)] column
+    a                            [m/s] column
+    R                            [m] tip radius
+
+    Outputs:
+    Ct                           [-] at the trusted points
+    Cp                           [-] at the trusted points
+    trusted                      <boolean> one per point
+
+    Properties Used:
+    N/A
+    """
+
+    D     = 2.*R
+    valid = (omega[:,0] > 0.) & (rho[:,0] > 0.) & (mu[:,0] > 0.)
+    omega = np.where(omega > 0.,omega,1.)
+    n     = omega/(2.*np.pi)
+
+    points = [(V/(n*D))[:,0], (omega*R/a)[:,0], np.log10(np.abs(rho*omega*R*D/mu))[:,0]]
+    axes   = [performance_map.advance_ratio,performance_map.tip_mach,performance_map.log_tip_reynolds_number]
+
+    # the cell of each point
+    trusted = valid*1
+    cells   = []
+    for point, axis in zip(points,axes):
+        trusted = trusted & (point >= axis[0]) & (point <= axis[-1])
+        cells.append(np.clip(np.searchsorted(axis,point,side='right')-1,0,len(axis)-2))
+    trusted = (trusted > 0) & performance_map.trusted[tuple(cells)]
+
+    points = [point[trusted] for point in points]
+    Ct     = performance_map.thrust_coefficient(*points)
+    Cp     = performance_map.power_coefficient(*points)
+
+    return Ct[:,None], Cp[:,None], trusted
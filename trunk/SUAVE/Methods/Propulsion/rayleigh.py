@@ -3,10 +3,11 @@
 # 
 # Created:  Aug 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 import numpy as np
 
-from scipy.optimize import fsolve
+from SUAVE.Methods.Utilities import safeguarded_newton
 
 # ----------------------------------------------------------------------
 #  rayleigh
@@ -20,6 +21,11 @@ def rayleigh(gamma, M0, TtR):
     to the Rayleigh flow equation. The function also outputs the stagnation
     pressure ratio
     
+    Assumptions:
+    The output (input) Mach number is on the same side of sonic as the given one.
+    Where the temperature ratio is beyond the one that chokes the flow, the Mach
+    number is one.
+    
     Inputs:
     M       [dimensionless]
     gamma   [dimensionless]
@@ -31,25 +37,27 @@ def rayleigh(gamma, M0, TtR):
     
     """
 
-    func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
-
-    #Initializing the array
-    M1_guess = np.ones_like(M0)
+    gamma, M0, TtR = np.broadcast_arrays(gamma, np.atleast_1d(M0), TtR)
+    
+    # Rayleigh function, relative to the given Mach number, and its derivative
+    R0   = M0*M0*(1.+(gamma-1.)/2.*M0*M0)/(1.+gamma*M0*M0)**2.
+    def func(M1):
+        R1  = M1*M1*(1.+(gamma-1.)/2.*M1*M1)/(1.+gamma*M1*M1)**2.
+        dR1 = 2.*M1*(1.-M1*M1)/(1.+gamma*M1*M1)**3.
+        return R1/R0-TtR, dR1/R0
     
     # Separating supersonic and subsonic solutions
-    i_low = M0 <= 1.0
     i_high = M0 > 1.0
 
-    #--Subsonic solution Guess
-    M1_guess[i_low]= .01
-    
-    #--Supersonic solution Guess
-    M1_guess[i_high]= 1.1
+    #--Subsonic solution Guess, supersonic solution Guess
+    M1_guess = np.where(i_high,1.1,.01)
+    lower    = np.where(i_high,1.0,0.0)
+    upper    = np.where(i_high,100.,1.0)
 
     # Find Mach number
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1 = safeguarded_newton(func,M1_guess,lower,upper)
     
     #Calculate stagnation pressure ratio
     Ptr = ((1.+gamma*M0*M0)/(1.+gamma*M1*M1)*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**(gamma/(gamma-1.)))
 
-    return M1, Ptr
\ No newline at end of file
+    return M1, Ptr
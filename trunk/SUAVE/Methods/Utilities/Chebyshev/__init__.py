@@ -2,4 +2,6 @@
 # These functions provide methods for discrete derivative and integral calculations.
 # @ingroup Methods-Utilities
 from .chebyshev_data import chebyshev_data
-from .linear_data import linear_data
\ No newline at end of file
+from .linear_data import linear_data
+from .operator_cache import cached_operators, clear_operator_cache
+from .chebyshev_interpolation import chebyshev_coefficients, chebyshev_interpolate
@@ -5,11 +5,14 @@
 
 import numpy as np
 
+from .operator_cache import cached_operators
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Utilities-Chebyshev
+@cached_operators
 def chebyshev_data(N = 16, integration = True, **options):
     """Calculates the differentiation and integration matricies
     using chebyshev's pseudospectral algorithm, based on cosine
@@ -23,7 +26,7 @@ def chebyshev_data(N = 16, integration = True, **options):
     A full example is available in the function code.
 
     Assumptions:
-    None
+    The operators are built once for each N and shared, the arrays are read-only
 
     Source:
     N/A
@@ -134,4 +137,4 @@ if __name__ == '__main__':
     plt.plot(y,int_f)    
     plt.ylabel('int(f(y))')
     plt.xlabel('y')
-    plt.show()
\ No newline at end of file
+    plt.show()
\ No newline at end of file
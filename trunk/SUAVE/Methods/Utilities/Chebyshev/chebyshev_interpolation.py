@@ -0,0 +1,86 @@
+## @ingroup Methods-Utilities-Chebyshev
+# chebyshev_interpolation.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def chebyshev_coefficients(f):
+    """Finds the Chebyshev series through values at the control points of
+    chebyshev_data.
+
+    Assumptions:
+    The values are at the cosine spaced points of chebyshev_data, in the same order
+
+    Source:
+    Trefethen, "Spectral Methods in MATLAB", 2000
+
+    Inputs:
+    f                      [-]        values, 1-d vector or 2-d column array with N rows
+
+    Outputs:
+    a                      [-]        series coefficients, same shape as f
+
+    Properties Used:
+    N/A
+    """
+
+    f = np.asarray(f,dtype=float)
+    N = f.shape[0]
+    if N < 2:
+        return f*1.
+
+    # x = 0.5*(1-t) so the points are t_j = cos(pi j/(N-1))
+    k = np.arange(N)
+    C = np.cos(np.pi*np.outer(k,k)/(N-1))
+
+    w = np.ones(N)
+    w[[0,-1]] = 0.5
+
+    a = 2./(N-1) * np.dot(C*w,f)
+    a[[0,-1]] *= 0.5
+
+    return a
+
+## @ingroup Methods-Utilities-Chebyshev
+def chebyshev_interpolate(f,N):
+    """Evaluates the Chebyshev series through values at the control points of
+    chebyshev_data on a different number of control points.
+
+    Assumptions:
+    The values are at the cosine spaced points of chebyshev_data, in the same order
+
+    Source:
+    N/A
+
+    Inputs:
+    f                      [-]        values, 1-d vector or 2-d column array
+    N                      [-]        new number of points
+
+    Outputs:
+    f_new                  [-]        values at the N new points
+
+    Properties Used:
+    N/A
+    """
+
+    f = np.asarray(f,dtype=float)
+    if f.shape[0] < 2:
+        return np.resize(f,(N,)+f.shape[1:])
+
+    a = chebyshev_coefficients(f)
+
+    t = np.cos(np.pi*np.arange(N)/max(N-1,1))
+    T = np.cos(np.outer(np.arccos(np.clip(t,-1.,1.)),np.arange(f.shape[0])))
+
+    return np.dot(T,a)
@@ -5,11 +5,14 @@
 
 import numpy as np
 
+from .operator_cache import cached_operators
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Utilities-Chebyshev
+@cached_operators
 def linear_data(N = 16, integration = True, **options):
     """Calculates the differentiation and integration matricies
     using chebyshev's pseudospectral algorithm, based on linearly
@@ -24,7 +27,7 @@ def linear_data(N = 16, integration = True, **options):
     the chebyshev_data.py (same folder)
 
     Assumptions:
-    None
+    The operators are built once for each N and shared, the arrays are read-only
 
     Source:
     N/A
@@ -88,4 +91,4 @@ def linear_data(N = 16, integration = True, **options):
         I = None
         
     # done!
-    return x, D, I
\ No newline at end of file
+    return x, D, I
\ No newline at end of file
@@ -0,0 +1,80 @@
+## @ingroup Methods-Utilities-Chebyshev
+# operator_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import functools
+
+# operators already built, by (method, N, integration)
+_operators = {}
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def cached_operators(method):
+    """Wraps a discretization method so the operators for each number of points are
+    only built once per process. The arrays returned are shared, so they are read-only.
+
+    Assumptions:
+    The operators only depend on N and integration, other options are passed to the
+    method the first time but are not part of the key
+
+    Source:
+    N/A
+
+    Inputs:
+    method                 <function> method(N,integration,**options) returning x, D, I
+
+    Outputs:
+    cached                 <function> same call signature as method
+
+    Properties Used:
+    N/A
+    """
+
+    if getattr(method,'cached',False):
+        return method
+
+    @functools.wraps(method)
+    def cached(N = 16, integration = True, **options):
+        key = (method,int(N),bool(integration))
+        if not key in _operators:
+            operators = method(N,integration,**options)
+            for array in operators:
+                if array is not None:
+                    array.setflags(write=False)
+            _operators[key] = tuple(operators)
+        return _operators[key]
+
+    cached.cached = True
+
+    return cached
+
+## @ingroup Methods-Utilities-Chebyshev
+def clear_operator_cache():
+    """Removes all the cached operators
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    _operators.clear()
+    return
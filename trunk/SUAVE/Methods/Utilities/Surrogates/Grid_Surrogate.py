@@ -0,0 +1,380 @@
+## @ingroup Methods-Utilities-Surrogates
+# Grid_Surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Grid Surrogate
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+class Grid_Surrogate(Data):
+    """A tensor product interpolant of data sampled on a rectilinear grid. It is called
+    with one array per axis, e.g. CL = surrogate(AoA,Mach), and returns an array of the
+    broadcast shape of the inputs. predict(X) gives the scikit-learn interface. Several
+    tables on the same grid can be stacked along extra trailing dimensions of the values,
+    which are then kept after the shape of the inputs.
+
+    The method is 'linear' (multilinear) or 'pchip', a tensor product cubic Hermite
+    interpolant whose slopes are limited so the data stays monotone along each axis.
+
+    Assumptions:
+    Points outside the grid are held to the nearest data, so the derivatives there are zero
+    Each lookup is a binary search on each axis, and the data of each cell is gathered at once
+
+    Source:
+    Fritsch and Carlson, Monotone Piecewise Cubic Interpolation, SIAM J. Numer. Anal., 1980
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.method      = 'linear'
+        self.axes        = None
+        self.values       = None
+        self.derivatives  = None
+        self.coefficients = None
+
+    def fit(self,axes,values,method=None):
+        """Stores the grid and the sampled values, and the node derivatives of a
+        pchip interpolant.
+
+        Assumptions:
+        Each axis is strictly increasing
+
+        Source:
+        N/A
+
+        Inputs:
+        axes     <list> of 1-D arrays, one per dimension
+        values   [-] array of shape (len(axes[0]),len(axes[1]),...), followed by any
+                     dimensions of stacked tables
+        method   <string> 'linear' or 'pchip', defaults to self.method
+
+        Outputs:
+        self
+
+        Properties Used:
+        N/A
+        """
+        if method is not None:
+            self.method = method
+        if not self.method in ['linear','pchip']:
+            raise ValueError("unknown method '%s'" % self.method)
+
+        axes   = [np.array(axis,dtype=float).ravel() for axis in axes]
+        values = np.array(values,dtype=float)
+        shape  = tuple(len(axis) for axis in axes)
+
+        if values.shape[:len(axes)] != shape:
+            raise ValueError('values have shape %s, the grid is %s' % (values.shape,shape))
+        for axis in axes:
+            if np.any(np.diff(axis) <= 0.):
+                raise ValueError('grid axes must be strictly increasing')
+
+        self.axes   = axes
+        self.values = values
+
+        # derivatives at the nodes, one array for each set of axes given by the bits of the index
+        derivatives = [values]
+        if self.method == 'pchip':
+            for mask in range(1,2**len(axes)):
+                k     = mask.bit_length() - 1
+                lower = derivatives[mask - 2**k]
+                derivatives.append(pchip_slopes(axes[k],lower,k))
+        self.derivatives = derivatives
+
+        # the data of every derivative order at each node, after the grid dimensions
+        orders = tuple(2 if (self.method == 'pchip' and len(axis) > 1) else 1 for axis in axes)
+        coefficients = np.zeros(shape + orders + values.shape[len(axes):])
+        for order in np.ndindex(*orders):
+            mask = sum(bit*2**k for k, bit in enumerate(order))
+            coefficients[(slice(None),)*len(axes) + order] = derivatives[mask]
+        self.coefficients = coefficients
+
+        return self
+
+    def __call__(self,*points):
+        """Interpolates the sampled values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points   [-] one array per axis, broadcast against each other
+
+        Outputs:
+        result   [-] array of the broadcast shape of points, then the stacked dimensions
+
+        Properties Used:
+        self.axes
+        self.coefficients
+        """
+        shape, terms = self.terms(points)
+        return np.reshape(self.combine(terms),shape + self.values.shape[len(self.axes):])
+
+    def gradient(self,*points):
+        """Derivatives of the interpolant with respect to each input.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points   [-] one array per axis, broadcast against each other
+
+        Outputs:
+        gradient <list> one array per axis, of the broadcast shape of points, then the
+                 stacked dimensions
+
+        Properties Used:
+        self.axes
+        self.coefficients
+        """
+        shape, terms = self.terms(points)
+        shape = shape + self.values.shape[len(self.axes):]
+        return [np.reshape(self.combine(terms,k),shape) for k in range(len(self.axes))]
+
+    def predict(self,X):
+        """Interpolates at the rows of a matrix, like a scikit-learn regressor.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        X        [-] array of shape (points,dimensions)
+
+        Outputs:
+        y        [-] array of shape (points,)
+
+        Properties Used:
+        N/A
+        """
+        X = np.atleast_2d(X)
+        return self(*X.T)
+
+    def terms(self,points):
+        """Finds the cell of each point and the weights of its nodes on each axis.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points   [-] one array per axis
+
+        Outputs:
+        shape    <tuple> broadcast shape of the points
+        terms    <list> for each axis, the index of the first node of the cell, and the
+                 weights of the node data and their derivatives, each of shape
+                 (points, nodes of the cell, derivative orders)
+
+        Properties Used:
+        self.axes
+        self.method
+        """
+        axes = self.axes
+
+        if len(points) != len(axes):
+            raise ValueError('expected %i inputs, got %i' % (len(axes),len(points)))
+
+        points = np.broadcast_arrays(*[np.asarray(p,dtype=float) for p in points])
+        shape  = points[0].shape
+
+        terms = []
+        for axis, p in zip(axes,points):
+            p = p.ravel()
+
+            if len(axis) == 1:
+                i = np.zeros(p.shape,dtype=int)
+                terms.append((i,np.ones(p.shape + (1,1)),np.zeros(p.shape + (1,1))))
+                continue
+
+            # binary search of the cell, held to the ends
+            inside = (p >= axis[0]) & (p <= axis[-1])
+            p = np.clip(p,axis[0],axis[-1])
+            i = np.clip(np.searchsorted(axis,p,side='right') - 1,0,len(axis)-2)
+            h = axis[i+1] - axis[i]
+            t = (p - axis[i])/h
+            dt_dp = inside/h
+
+            if self.method == 'linear':
+                w  = np.empty(p.shape + (2,1))
+                dw = np.empty(p.shape + (2,1))
+                w[:,0,0]  = 1. - t
+                w[:,1,0]  = t
+                dw[:,0,0] = -dt_dp
+                dw[:,1,0] = dt_dp
+            else:
+                t2 = t*t
+                t3 = t2*t
+                w  = np.empty(p.shape + (2,2))
+                dw = np.empty(p.shape + (2,2))
+                w[:,0,0]  = 2.*t3 - 3.*t2 + 1.
+                w[:,0,1]  = (t3 - 2.*t2 + t)*h
+                w[:,1,0]  = -2.*t3 + 3.*t2
+                w[:,1,1]  = (t3 - t2)*h
+                dw[:,0,0] = (6.*t2 - 6.*t)*dt_dp
+                dw[:,0,1] = (3.*t2 - 4.*t + 1.)*h*dt_dp
+                dw[:,1,0] = (-6.*t2 + 6.*t)*dt_dp
+                dw[:,1,1] = (3.*t2 - 2.*t)*h*dt_dp
+            terms.append((i,w,dw))
+
+        return shape, terms
+
+    def combine(self,terms,derivative=None):
+        """Gathers the node data of the cell of each point and sums it with the weights
+        of each axis in turn.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        terms      (see terms)
+        derivative <int> axis to differentiate along, None for the values
+
+        Outputs:
+        result     [-] array of one row per point, then the stacked dimensions
+
+        Properties Used:
+        self.coefficients
+        """
+        dimensions = len(terms)
+
+        # the nodes of each cell, as (points, nodes on each axis, orders on each axis, ...)
+        index = []
+        for k, (i,w,dw) in enumerate(terms):
+            nodes = [len(i)] + [1]*dimensions
+            nodes[k+1] = w.shape[1]
+            index.append(np.reshape(i[:,None] + np.arange(w.shape[1]),nodes))
+        result = self.coefficients[tuple(index)]
+
+        # sum over the nodes and orders of one axis at a time
+        for k, (i,w,dw) in enumerate(terms):
+            weight = dw if k == derivative else w
+            result = np.moveaxis(result,dimensions - k + 1,2)
+            result = np.einsum('pno...,pno->p...',result,weight)
+
+        return result
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+def pchip_slopes(x,values,axis):
+    """Slopes of a monotone piecewise cubic Hermite interpolant along one axis of an array,
+    the same as scipy.interpolate.PchipInterpolator.
+
+    Assumptions:
+    Two points give a straight line
+
+    Source:
+    Fritsch and Carlson, Monotone Piecewise Cubic Interpolation, SIAM J. Numer. Anal., 1980
+
+    Inputs:
+    x        [-] strictly increasing nodes
+    values   [-] array with len(x) entries along axis
+    axis     <int>
+
+    Outputs:
+    slopes   [-] array of the shape of values
+
+    Properties Used:
+    N/A
+    """
+    y = np.moveaxis(values,axis,0)
+    n = len(x)
+
+    if n == 1:
+        return np.zeros_like(values)
+
+    extra = (slice(None),) + (None,)*(y.ndim-1)
+    h     = np.diff(x)[extra]
+    delta = np.diff(y,axis=0)/h
+
+    if n == 2:
+        return np.moveaxis(np.concatenate([delta,delta]),0,axis)
+
+    slopes = np.zeros_like(y)
+
+    # weighted harmonic mean inside, zero at extrema
+    w1 = 2.*h[1:] + h[:-1]
+    w2 = h[1:] + 2.*h[:-1]
+    same_sign = np.sign(delta[:-1])*np.sign(delta[1:]) > 0
+    with np.errstate(divide='ignore',invalid='ignore'):
+        mean = (w1 + w2)/(w1/delta[:-1] + w2/delta[1:])
+    slopes[1:-1] = np.where(same_sign,mean,0.)
+
+    # shape preserving three point ends
+    slopes[0]  = pchip_end_slope(h[0] ,h[1] ,delta[0] ,delta[1])
+    slopes[-1] = pchip_end_slope(h[-1],h[-2],delta[-1],delta[-2])
+
+    return np.moveaxis(slopes,0,axis)
+
+## @ingroup Methods-Utilities-Surrogates
+def pchip_end_slope(h0,h1,delta0,delta1):
+    """One sided three point slope at an end of a pchip interpolant.
+
+    Assumptions:
+    None
+
+    Source:
+    Moler, Numerical Computing with MATLAB, 2004
+
+    Inputs:
+    h0, h1          [-] widths of the end interval and the next one
+    delta0, delta1  [-] secant slopes of the end interval and the next one
+
+    Outputs:
+    slope           [-]
+
+    Properties Used:
+    N/A
+    """
+    slope = ((2.*h0 + h1)*delta0 - h0*delta1)/(h0 + h1)
+
+    wrong_sign = np.sign(slope) != np.sign(delta0)
+    overshoot  = (np.sign(delta0) != np.sign(delta1)) & (np.abs(slope) > np.abs(3.*delta0))
+
+    slope = np.where(overshoot,3.*delta0,slope)
+    slope = np.where(wrong_sign,0.,slope)
+
+    return slope
@@ -0,0 +1,135 @@
+## @ingroup Methods-Utilities-Surrogates
+# Rbf_Surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.interpolate
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Rbf Surrogate
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+class Rbf_Surrogate(Data):
+    """A radial basis function interpolant of scattered data, with the interface of
+    Grid_Surrogate.
+
+    Assumptions:
+    Each input is scaled to [0,1] over the training data, so inputs of different
+    magnitude (e.g. altitude and Mach) have the same weight in the distances
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.function    = 'thin_plate'
+        self.lower       = None
+        self.scale       = None
+        self.interpolant = None
+
+    def fit(self,X,y):
+        """Builds the interpolant.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        X        [-] array of shape (points,dimensions)
+        y        [-] one value per point
+
+        Outputs:
+        self
+
+        Properties Used:
+        self.function
+        """
+        X = np.atleast_2d(np.array(X,dtype=float))
+        y = np.array(y,dtype=float).ravel()
+
+        lower = np.min(X,axis=0)
+        scale = np.max(X,axis=0) - lower
+        scale[scale == 0.] = 1.
+
+        columns = (X - lower)/scale
+
+        self.lower       = lower
+        self.scale       = scale
+        self.interpolant = scipy.interpolate.Rbf(*(list(columns.T) + [y]),function=self.function)
+
+        return self
+
+    def __call__(self,*points):
+        """Interpolates the training data.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        points   [-] one array per input, broadcast against each other
+
+        Outputs:
+        result   [-] array of the broadcast shape of points
+
+        Properties Used:
+        self.lower
+        self.scale
+        self.interpolant
+        """
+        points = np.broadcast_arrays(*[np.asarray(p,dtype=float) for p in points])
+        shape  = points[0].shape
+        scaled = [(p.ravel() - l)/s for p, l, s in zip(points,self.lower,self.scale)]
+
+        return np.reshape(self.interpolant(*scaled),shape)
+
+    def predict(self,X):
+        """Interpolates at the rows of a matrix, like a scikit-learn regressor.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        X        [-] array of shape (points,dimensions)
+
+        Outputs:
+        y        [-] array of shape (points,)
+
+        Properties Used:
+        N/A
+        """
+        X = np.atleast_2d(X)
+        return self(*X.T)
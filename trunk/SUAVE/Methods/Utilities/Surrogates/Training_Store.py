@@ -0,0 +1,142 @@
+## @ingroup Methods-Utilities-Surrogates
+# Training_Store.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from SUAVE.Core import Data
+from .training_cache import training_key, load_training_data, save_training_data
+
+# ----------------------------------------------------------------------
+#  Training Store
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+class Training_Store(Data):
+    """A persistent store of training samples with one entry per sample point. The
+    entries of a geometry and set of run settings are kept in a folder named by their
+    content hash, so a table that was partly computed resumes where it stopped and an
+    enlarged table only computes its new points.
+
+    Assumptions:
+    Each entry is written to a temporary file and renamed, so processes sharing the
+    store never read a partial entry. Two processes computing the same point both
+    write it, and either result is kept.
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.directory = None # root of the store, None disables it
+        self.key       = None # see training_key
+
+    def folder(self):
+        """Gives the folder holding the entries of this key.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        folder   <string> None if the store is disabled
+
+        Properties Used:
+        self.directory
+        self.key
+        """
+        if self.directory is None or self.key is None:
+            return None
+
+        return os.path.join(self.directory,self.key)
+
+    def load(self,point):
+        """Loads the entry of a sample point.
+
+        Assumptions:
+        Points are matched exactly
+
+        Source:
+        N/A
+
+        Inputs:
+        point    [-] the inputs of the sample, e.g. angle of attack and Mach number
+
+        Outputs:
+        data     <Data> of arrays, None if the point has not been computed
+
+        Properties Used:
+        N/A
+        """
+        return load_training_data(self.folder(),self.point_key(point))
+
+    def save(self,point,data):
+        """Stores the entry of a sample point.
+
+        Assumptions:
+        All the values of data are numeric
+
+        Source:
+        N/A
+
+        Inputs:
+        point    [-] the inputs of the sample
+        data     <Data> the results of the sample
+
+        Outputs:
+        filename <string> None if the store is disabled
+
+        Properties Used:
+        N/A
+        """
+        return save_training_data(self.folder(),self.point_key(point),data)
+
+    def point_key(self,point):
+        """Names the entry of a sample point.
+
+        Assumptions:
+        Lists, tuples and arrays of the same values name the same entry
+
+        Source:
+        N/A
+
+        Inputs:
+        point    [-] the inputs of the sample
+
+        Outputs:
+        key      <string> see training_key
+
+        Properties Used:
+        N/A
+        """
+        return training_key(np.array(point,dtype=np.float64).ravel())
@@ -0,0 +1,9 @@
+## @defgroup Methods-Utilities-Surrogates Surrogates
+# These functions build fast surrogates of sampled analyses and cache their training data.
+# @ingroup Methods-Utilities
+from .Grid_Surrogate import Grid_Surrogate, pchip_slopes
+from .Rbf_Surrogate import Rbf_Surrogate
+from .build_grid_surrogate import build_grid_surrogate, rectilinear_grid
+from .training_cache import training_key, hash_value, file_digest, load_training_data, save_training_data
+from .Training_Store import Training_Store
+from .predict_surrogate import predict_surrogate, stack_inputs, is_gaussian_process, gaussian_process_mean
@@ -0,0 +1,97 @@
+## @ingroup Methods-Utilities-Surrogates
+# build_grid_surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from .Grid_Surrogate import Grid_Surrogate
+from .Rbf_Surrogate  import Rbf_Surrogate
+
+# ----------------------------------------------------------------------
+#  Build Grid Surrogate
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+def build_grid_surrogate(X,y,method='pchip'):
+    """Builds a tensor product interpolant when the training points form a rectilinear
+    grid, and a radial basis function interpolant when they are scattered.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    X        [-] training points, array of shape (points,dimensions)
+    y        [-] one value per point
+    method   <string> 'pchip' or 'linear', see Grid_Surrogate
+
+    Outputs:
+    surrogate <Grid_Surrogate> or <Rbf_Surrogate>
+
+    Properties Used:
+    N/A
+    """
+
+    grid = rectilinear_grid(X,y)
+
+    if grid is None:
+        return Rbf_Surrogate().fit(X,y)
+
+    axes, values = grid
+
+    return Grid_Surrogate().fit(axes,values,method)
+
+## @ingroup Methods-Utilities-Surrogates
+def rectilinear_grid(X,y):
+    """Checks if training points are every combination of a set of values on each axis,
+    each exactly once, and arranges the data on that grid.
+
+    Assumptions:
+    Axes with a single value are kept as axes of length one
+
+    Source:
+    N/A
+
+    Inputs:
+    X        [-] training points, array of shape (points,dimensions)
+    y        [-] one value per point
+
+    Outputs:
+    axes     <list> sorted unique values of each input
+    values   [-] array of shape (len(axes[0]),len(axes[1]),...)
+    or None when the points are not a rectilinear grid
+
+    Properties Used:
+    N/A
+    """
+
+    X = np.atleast_2d(np.array(X,dtype=float))
+    y = np.array(y,dtype=float).ravel()
+
+    if X.shape[0] != len(y):
+        raise ValueError('%i points and %i values' % (X.shape[0],len(y)))
+
+    axes  = [np.unique(column) for column in X.T]
+    shape = tuple(len(axis) for axis in axes)
+
+    if int(np.prod(shape)) != len(y):
+        return None
+
+    index  = tuple(np.searchsorted(axis,column) for axis, column in zip(axes,X.T))
+    filled = np.zeros(shape,dtype=bool)
+    filled[index] = True
+    if not np.all(filled):
+        return None
+
+    values = np.zeros(shape)
+    values[index] = y
+
+    return axes, values
@@ -0,0 +1,132 @@
+## @ingroup Methods-Utilities-Surrogates
+# predict_surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import atleast_2d_col
+
+# ----------------------------------------------------------------------
+#  Predict Surrogate
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+def predict_surrogate(model,inputs,dtype=np.float64):
+    """Evaluates a fitted surrogate at every point with one call, instead of calling
+    predict once per control point.
+
+    Assumptions:
+    The model follows the scikit-learn regressor interface, model.predict(X)
+    Fitted Gaussian processes are evaluated directly from their kernel and their
+    precomputed weight vector, skipping the input validation of predict
+
+    Source:
+    N/A
+
+    Inputs:
+    model       <regressor>
+    inputs      <list> of arrays, one per input dimension, each with one value per point
+    dtype       <numpy dtype> precision of the inputs, e.g. np.float32
+
+    Outputs:
+    result      [-] column array of shape (points,1)
+
+    Properties Used:
+    N/A
+    """
+
+    X = stack_inputs(inputs,dtype)
+
+    if is_gaussian_process(model):
+        y = gaussian_process_mean(model,X)
+    else:
+        y = model.predict(X)
+
+    return np.reshape(np.array(y,dtype=np.float64),(X.shape[0],-1))
+
+## @ingroup Methods-Utilities-Surrogates
+def stack_inputs(inputs,dtype=np.float64):
+    """Stacks one array per input dimension into an (points,dimensions) matrix.
+
+    Assumptions:
+    All inputs have the same number of values
+
+    Source:
+    N/A
+
+    Inputs:
+    inputs      <list> of arrays, each a vector or a column
+    dtype       <numpy dtype>
+
+    Outputs:
+    X           [-] array of shape (points,dimensions)
+
+    Properties Used:
+    N/A
+    """
+
+    columns = [atleast_2d_col(np.ravel(x)) for x in inputs]
+
+    return np.ascontiguousarray(np.hstack(columns),dtype=dtype)
+
+## @ingroup Methods-Utilities-Surrogates
+def is_gaussian_process(model):
+    """Checks if a model is a fitted scikit-learn Gaussian process regressor.
+
+    Assumptions:
+    Checked by its fitted attributes, so scikit-learn isn't imported here
+
+    Source:
+    N/A
+
+    Inputs:
+    model       <regressor>
+
+    Outputs:
+    <boolean>
+
+    Properties Used:
+    N/A
+    """
+
+    return all(hasattr(model,name) for name in ['kernel_','X_train_','alpha_'])
+
+## @ingroup Methods-Utilities-Surrogates
+def gaussian_process_mean(model,X):
+    """Evaluates the mean of a fitted Gaussian process as the product of the kernel
+    between the points and the training data with the weight vector of the fit.
+
+    Assumptions:
+    None
+
+    Source:
+    Rasmussen and Williams, Gaussian Processes for Machine Learning, Algorithm 2.1
+
+    Inputs:
+    model       <GaussianProcessRegressor> fitted
+    X           [-] array of shape (points,dimensions)
+
+    Outputs:
+    y           [-] mean prediction at each point
+
+    Properties Used:
+    N/A
+    """
+
+    X_train = model.X_train_
+    if X.dtype != X_train.dtype:
+        X_train = X_train.astype(X.dtype)
+
+    K = model.kernel_(X,X_train)
+    y = np.dot(K,model.alpha_)
+
+    # undo the normalization of the training data
+    y = y*getattr(model,'_y_train_std',1.) + getattr(model,'_y_train_mean',0.)
+
+    return y
@@ -0,0 +1,207 @@
+## @ingroup Methods-Utilities-Surrogates
+# training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import tempfile
+
+import numpy as np
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Training Key
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+def training_key(*inputs):
+    """Builds a content hash of everything a set of training samples depends on, so
+    identical geometries and settings give the same key in any run.
+
+    Assumptions:
+    Inputs are made of Data, dicts, lists, tuples, arrays, numbers, strings, booleans
+    and None. Keys of Data and dicts are sorted, so their order doesn't matter.
+
+    Source:
+    N/A
+
+    Inputs:
+    inputs      (any number of the types above)
+
+    Outputs:
+    key         <string> hexadecimal sha1 digest
+
+    Properties Used:
+    N/A
+    """
+
+    sha = hashlib.sha1()
+    for value in inputs:
+        hash_value(sha,value)
+
+    return sha.hexdigest()
+
+## @ingroup Methods-Utilities-Surrogates
+def hash_value(sha,value):
+    """Adds a value to a running hash, tagging each item with its type so that
+    different structures with the same contents don't collide.
+
+    Assumptions:
+    Numbers are hashed as float64, so 1 and 1.0 hash the same
+
+    Source:
+    N/A
+
+    Inputs:
+    sha         <hashlib object>
+    value       (see training_key)
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(value,dict):
+        sha.update(b'd%d' % len(value))
+        for key in sorted(value.keys()):
+            hash_value(sha,str(key))
+            hash_value(sha,value[key])
+    elif isinstance(value,(list,tuple)):
+        sha.update(b'l%d' % len(value))
+        for item in value:
+            hash_value(sha,item)
+    elif value is None:
+        sha.update(b'n')
+    elif isinstance(value,(bool,np.bool_)):
+        sha.update(b'b1' if value else b'b0')
+    elif isinstance(value,str):
+        sha.update(b's%d:' % len(value))
+        sha.update(value.encode('utf-8'))
+    else:
+        array = np.ascontiguousarray(value,dtype=np.float64)
+        sha.update(b'a' + repr(array.shape).encode('utf-8'))
+        sha.update(array.tobytes())
+
+    return
+
+## @ingroup Methods-Utilities-Surrogates
+def file_digest(filename):
+    """Hashes the contents of a file, e.g. an exported geometry or mesh, so it can be
+    part of a training key.
+
+    Assumptions:
+    The file is read in blocks, so large meshes are not held in memory
+
+    Source:
+    N/A
+
+    Inputs:
+    filename    <string>
+
+    Outputs:
+    digest      <string> hexadecimal sha1 digest
+
+    Properties Used:
+    N/A
+    """
+
+    sha = hashlib.sha1()
+    with open(filename,'rb') as stream:
+        for block in iter(lambda: stream.read(1 << 20),b''):
+            sha.update(block)
+
+    return sha.hexdigest()
+
+# ----------------------------------------------------------------------
+#  Load and Save
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Surrogates
+def load_training_data(directory,key):
+    """Loads training samples stored under a key
+
+    Assumptions:
+    Files that can't be read are treated as missing
+
+    Source:
+    N/A
+
+    Inputs:
+    directory   <string> the cache directory, None disables the cache
+    key         <string> see training_key
+
+    Outputs:
+    data        <Data> of arrays, None if there is no entry
+
+    Properties Used:
+    N/A
+    """
+
+    if directory is None:
+        return None
+
+    filename = os.path.join(directory,key + '.npz')
+    if not os.path.isfile(filename):
+        return None
+
+    try:
+        with np.load(filename,allow_pickle=False) as archive:
+            data = Data()
+            for name in archive.files:
+                data[name] = archive[name]
+    except (IOError,OSError,ValueError):
+        return None
+
+    return data
+
+## @ingroup Methods-Utilities-Surrogates
+def save_training_data(directory,key,data):
+    """Stores training samples under a key. The file is written next to its final name
+    and then renamed, so other processes never read a partial entry.
+
+    Assumptions:
+    All the values of data are numeric arrays
+
+    Source:
+    N/A
+
+    Inputs:
+    directory   <string> the cache directory, None disables the cache
+    key         <string> see training_key
+    data        <Data> of arrays
+
+    Outputs:
+    filename    <string> None if the cache is disabled
+
+    Properties Used:
+    N/A
+    """
+
+    if directory is None:
+        return None
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory,exist_ok=True)
+
+    filename = os.path.join(directory,key + '.npz')
+
+    handle, temporary = tempfile.mkstemp(suffix='.npz',dir=directory)
+    try:
+        with os.fdopen(handle,'wb') as stream:
+            np.savez(stream,**dict(data.items()))
+        os.replace(temporary,filename)
+    except:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    return filename
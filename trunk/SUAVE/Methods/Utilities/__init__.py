@@ -4,5 +4,8 @@
 # @ingroup Methods
 from . import Chebyshev
 from . import soft_max
+from .safeguarded_newton import safeguarded_newton
 #import Utilities
-from . import latin_hypercube_sampling
\ No newline at end of file
+from . import latin_hypercube_sampling
+from . import Surrogates
+from . import run_jobs
\ No newline at end of file
@@ -0,0 +1,125 @@
+## @ingroup Methods-Utilities
+# run_jobs.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import subprocess
+import concurrent.futures
+
+# ----------------------------------------------------------------------
+#  Run Jobs
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def run_jobs(jobs,number_of_workers=1,timeout=None,retries=0,callback=None):
+    """ Runs external jobs concurrently, at most number_of_workers at a time, and
+    collects their results in the order of the jobs
+
+    Assumptions:
+        Each job has its own directory, so jobs don't share any files
+        Jobs are only started when a worker is free
+
+    Source:
+        None
+
+    Inputs:
+        jobs              - list of jobs, see run_job
+        number_of_workers - concurrent processes
+        timeout           - [s] per attempt, None to wait indefinitely
+        retries           - attempts after a failure
+        callback          - optional function(index,result), called as each job finishes
+
+    Outputs:
+        results           - list of the results of each job
+
+    Properties Used:
+        N/A
+    """
+    workers = max(1,int(number_of_workers))
+    results = [None]*len(jobs)
+    queue   = list(enumerate(jobs))[::-1]
+    pending = {}
+    failed  = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending or (queue and not failed):
+            while queue and not failed and len(pending) < workers:
+                index, job = queue.pop()
+                pending[executor.submit(run_job,job,timeout,retries)] = index
+
+            done, _ = concurrent.futures.wait(pending,return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    results[index] = future.result()
+                except RuntimeError as error:
+                    failed.append('job {}: {}'.format(index,error))
+                    continue
+                if callback is not None:
+                    callback(index,results[index])
+
+    if failed:
+        raise RuntimeError('jobs failed\n' + '\n'.join(failed))
+
+    return results
+
+## @ingroup Methods-Utilities
+def run_job(job,timeout=None,retries=0):
+    """ Runs one job in its directory and reads the results
+
+    Assumptions:
+        Output files of a failed attempt are removed before retrying
+
+    Source:
+        None
+
+    Inputs:
+        job.
+          command         - executable and arguments
+          directory       - working directory
+          stdin_file      - file sent to the standard input, None for no input
+          log_file        - file receiving the standard output and error
+          outputs         - files created by the job
+          read            - function(job) returning the results
+        timeout           - [s] per attempt
+        retries           - attempts after a failure
+
+    Outputs:
+        results           - whatever job.read returns
+
+    Properties Used:
+        N/A
+    """
+    errors = []
+
+    for attempt in range(retries+1):
+        for name in job.outputs:
+            filename = os.path.join(job.directory,name)
+            if os.path.exists(filename):
+                os.remove(filename)
+        try:
+            stdin = subprocess.DEVNULL
+            if job.stdin_file is not None:
+                stdin = open(os.path.join(job.directory,job.stdin_file),'rb')
+            try:
+                with open(os.path.join(job.directory,job.log_file),'wb') as log:
+                    process = subprocess.run(job.command,cwd=job.directory,stdin=stdin,stdout=log,
+                                             stderr=subprocess.STDOUT,timeout=timeout)
+            finally:
+                if job.stdin_file is not None:
+                    stdin.close()
+            if process.returncode != 0:
+                raise RuntimeError('exit status {}'.format(process.returncode))
+            return job.read(job)
+        except subprocess.TimeoutExpired:
+            errors.append('timed out after {} s'.format(timeout))
+        except (RuntimeError,IOError,OSError,ValueError,IndexError) as error:
+            errors.append(str(error))
+
+    raise RuntimeError('{} failed in {}: {}'.format(' '.join(job.command),job.directory,'; '.join(errors)))
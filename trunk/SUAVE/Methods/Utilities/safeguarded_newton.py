@@ -0,0 +1,70 @@
+## @ingroup Methods-Utilities
+# safeguarded_newton.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  safeguarded_newton Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def safeguarded_newton(function,initial_guess,lower_bound,upper_bound,tolerance=1e-12,maximum_iterations=100):
+    """Finds the roots of many independent scalar equations at once, one per element,
+    with Newton steps kept inside a bracket that shrinks around each root. A step that
+    would leave the bracket is replaced by bisection.
+
+    Assumptions:
+    Each equation is monotone between its bounds, so the sign of the function times its
+    derivative tells which side of the root a point is on. Where there is no root between
+    the bounds, the solution goes to the bound nearest to it.
+
+    Source:
+    Press et al., Numerical Recipes, 3rd ed., 2007, section 9.4
+
+    Inputs:
+    function           <function> of x, returning the residual and its derivative, both
+                                  elementwise and of the shape of x
+    initial_guess      [-] array, or a value broadcast against the bounds
+    lower_bound        [-] array or value
+    upper_bound        [-] array or value
+    tolerance          [-] relative change of x to stop at
+    maximum_iterations [-]
+
+    Outputs:
+    x                  [-] array of the broadcast shape of the guess and bounds, at least 1-D
+
+    Properties Used:
+    N/A
+    """
+
+    x, lower, upper = [np.array(value,dtype=float) for value in \
+                       np.broadcast_arrays(np.atleast_1d(initial_guess),lower_bound,upper_bound)]
+
+    with np.errstate(divide='ignore',invalid='ignore',over='ignore'):
+        for iteration in range(maximum_iterations):
+            f, df = function(x)
+
+            # the root is below the points where the function moves away from zero
+            slope = f*df
+            upper = np.where(slope > 0.,x,upper)
+            lower = np.where(slope < 0.,x,lower)
+
+            # Newton steps, bisecting where they leave the bracket
+            x_new   = x - f/df
+            outside = ~((x_new > lower) & (x_new < upper))
+            x_new   = np.where(outside,(lower+upper)/2.,x_new)
+            x_new   = np.where(f == 0.,x,x_new)
+
+            converged = np.all(np.abs(x_new-x) <= tolerance*np.abs(x))
+            x = x_new
+            if converged:
+                break
+
+    return x
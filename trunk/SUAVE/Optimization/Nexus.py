@@ -4,6 +4,7 @@
 # Created:  Jul 2015, E. Botero 
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,7 +13,7 @@
 # suave imports
 import SUAVE 
 from SUAVE.Core import Data, DataOrdered
-from SUAVE.Analyses import Process
+from SUAVE.Analyses import Process, Profiler
 from copy import deepcopy
 from . import helper_functions as help_fun
 import numpy as np
@@ -124,12 +125,27 @@ class Nexus(Data):
         
         self.evaluation_count += 1
         
-        for key,step in nexus.procedure.items():
-            if hasattr(step,'evaluate'):
-                self = step.evaluate(nexus)
-            else:
-                nexus = step(nexus)
-            self = nexus
+        # time the steps when profiling
+        profiler = Profiler.active
+        if profiler is not None:
+            profiler.push(nexus.get('tag','nexus'))
+        
+        try:
+            for key,step in nexus.procedure.items():
+                if profiler is not None:
+                    profiler.push(key)
+                try:
+                    if hasattr(step,'evaluate'):
+                        self = step.evaluate(nexus)
+                    else:
+                        nexus = step(nexus)
+                    self = nexus
+                finally:
+                    if profiler is not None:
+                        profiler.pop()
+        finally:
+            if profiler is not None:
+                profiler.pop()
                 
         # Store to cache
         self.last_inputs   = deepcopy(self.optimization_problem.inputs)